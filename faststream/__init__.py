@@ -1,5 +1,8 @@
 """A Python framework for building services interacting with Apache Kafka, RabbitMQ, NATS and Redis."""
 
+from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
+from faststream._internal.logger import LogQueue
 from faststream._internal.testing.app import TestApp
 from faststream._internal.utils import apply_types
 from faststream.annotations import ContextRepo, Logger
@@ -12,6 +15,7 @@ from faststream.specification import AsyncAPI
 
 __all__ = (
     "AckPolicy",
+    "AdaptiveConcurrency",
     "AsyncAPI",
     "BaseMiddleware",
     "BatchPublishCommand",
@@ -21,6 +25,7 @@ __all__ = (
     "ExceptionMiddleware",
     "FastStream",
     "Header",
+    "LogQueue",
     "Logger",
     "NoCast",
     "Path",
@@ -29,6 +34,7 @@ __all__ = (
     "Response",
     "SourceType",
     "StreamMessage",
+    "SyncExecutor",
     "TestApp",
     "apply_types",
 )
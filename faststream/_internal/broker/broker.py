@@ -1,7 +1,10 @@
+import logging
+import time
 from abc import abstractmethod
-from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING, Any, Generic, Optional
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
 
+import anyio
 from fast_depends import Provider
 from typing_extensions import Self
 
@@ -11,6 +14,7 @@ from faststream._internal.types import (
     ConnectionType,
     MsgType,
 )
+from faststream.exceptions import SetupError
 
 from .pub_base import BrokerPublishMixin
 from .registrator import Registrator
@@ -20,10 +24,15 @@ if TYPE_CHECKING:
 
     from faststream._internal.context.repository import ContextRepo
     from faststream._internal.di import FastDependsConfig
+    from faststream._internal.endpoint.publisher import PublisherUsecase
+    from faststream._internal.endpoint.subscriber import SubscriberUsecase
     from faststream._internal.producer import ProducerProto
     from faststream.specification.schema import BrokerSpec
 
 
+EndpointT = TypeVar("EndpointT")
+
+
 class BrokerUsecase(
     Registrator[MsgType, BrokerConfigType],
     BrokerPublishMixin[MsgType],
@@ -50,6 +59,10 @@ class BrokerUsecase(
         )
         self.specification = specification
 
+        if config.start_concurrency < 1:
+            msg = "`start_concurrency` should be greater than 0"
+            raise SetupError(msg)
+
         self.running = False
 
         self._connection_kwargs = connection_kwargs
@@ -88,15 +101,89 @@ class BrokerUsecase(
         self.config.fd_config = config | self.config.fd_config
 
     async def start(self) -> None:
+        started_at = time.perf_counter()
+
         # TODO: filter by already running handlers after TestClient refactor
-        for sub in self.subscribers:
-            await sub.start()
+        for stage in self._subscribers_start_stages():
+            await self._run_concurrently(stage, self._start_subscriber)
 
-        for pub in self.publishers:
-            await pub.start()
+        await self._run_concurrently(self.publishers, self._start_publisher)
 
         self.running = True
 
+        if self.subscribers:
+            self.config.logger.log(
+                f"{len(self.subscribers)} subscribers started in "
+                f"{time.perf_counter() - started_at:.3f}s",
+                logging.DEBUG,
+            )
+
+    def _subscribers_start_stages(
+        self,
+    ) -> Iterable[Sequence["SubscriberUsecase[MsgType]"]]:
+        """Groups of subscribers to start one after another.
+
+        Subscribers of a group are started concurrently, so a broker should
+        put subscribers depending on objects declared by others to a later one.
+        """
+        return (self.subscribers,)
+
+    async def _start_subscriber(self, sub: "SubscriberUsecase[MsgType]") -> None:
+        started_at = time.perf_counter()
+        await sub.start()
+        self.config.logger.log(
+            f"`{sub.specification.call_name}` started in "
+            f"{time.perf_counter() - started_at:.3f}s",
+            logging.DEBUG,
+            extra=sub.get_log_context(None),
+        )
+
+    async def _start_publisher(self, pub: "PublisherUsecase") -> None:
+        await pub.start()
+
+    async def _stop_subscriber(self, sub: "SubscriberUsecase[MsgType]") -> None:
+        stopped_at = time.perf_counter()
+        await sub.stop()
+        self.config.logger.log(
+            f"`{sub.specification.call_name}` stopped in "
+            f"{time.perf_counter() - stopped_at:.3f}s",
+            logging.DEBUG,
+            extra=sub.get_log_context(None),
+        )
+
+    async def _run_concurrently(
+        self,
+        endpoints: Iterable[EndpointT],
+        func: Callable[[EndpointT], Awaitable[None]],
+    ) -> None:
+        """Call `func` for endpoints limited by the `start_concurrency` option.
+
+        All calls are completed before the first error is raised.
+        """
+        limit = self.config.broker_config.start_concurrency
+
+        if limit == 1:
+            for endpoint in endpoints:
+                await func(endpoint)
+            return
+
+        limiter = anyio.CapacityLimiter(limit)
+        errors: list[Exception] = []
+
+        async def run(endpoint: EndpointT) -> None:
+            async with limiter:
+                try:
+                    await func(endpoint)
+                except Exception as e:
+                    errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for endpoint in endpoints:
+                tg.start_soon(run, endpoint)
+
+        if errors:
+            raise errors[0]
+
     def _setup_logger(self) -> None:
         for sub in self.subscribers:
             log_context = sub.get_log_context(None)
@@ -124,8 +211,8 @@ class BrokerUsecase(
         exc_tb: Optional["TracebackType"] = None,
     ) -> None:
         """Closes the object."""
-        for sub in self.subscribers:
-            await sub.stop()
+        await self._run_concurrently(self.subscribers, self._stop_subscriber)
+        await self.config.logger.flush()
 
         self.running = False
 
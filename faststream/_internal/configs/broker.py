@@ -12,6 +12,7 @@ from faststream._internal.producer import ProducerProto, ProducerUnset
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import BrokerMiddleware, CustomCallable
     from faststream.middlewares import AckPolicy
@@ -36,6 +37,22 @@ class BrokerConfig:
     graceful_timeout: float | None = None
     ack_policy: "AckPolicy" = field(default_factory=lambda: EMPTY)
     extra_context: dict[str, Any] = field(default_factory=dict)
+    executor: Optional["SyncExecutor"] = None
+
+    # number of subscribers and publishers started or stopped concurrently
+    start_concurrency: int = 1
+
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # started subscribers compile their pipelines again on any option change
+        super().__setattr__("_revision", self.__dict__.get("_revision", 0) + 1)
+
+    @property
+    def revision(self) -> Any:
+        """Value changed by any option change."""
+        return self._revision
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id: {id(self)})"
@@ -67,6 +84,7 @@ ConfigType = Union["ConfigComposition[Any]", "BrokerConfigType", BrokerConfig]
 class ConfigComposition(Generic[BrokerConfigType]):  # noqa: PLR0904
     def __init__(self, config: BrokerConfigType) -> None:
         self.configs: tuple[ConfigType, ...] = (config,)
+        self._revision = 0
 
     @property
     def broker_config(self) -> "BrokerConfigType":
@@ -78,9 +96,16 @@ class ConfigComposition(Generic[BrokerConfigType]):  # noqa: PLR0904
 
     def add_config(self, config: "ConfigType") -> None:
         self.configs = (config, *self.configs)
+        self._revision += 1
 
     def reset(self) -> None:
         self.configs = (self.configs[-1],)
+        self._revision += 1
+
+    @property
+    def revision(self) -> Any:
+        """Value changed by any option change of the configs chain."""
+        return (self._revision, *(c.revision for c in self.configs))
 
     # broker priority options
     @property
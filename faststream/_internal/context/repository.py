@@ -1,4 +1,4 @@
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from typing import Any
@@ -116,6 +116,23 @@ class ContextRepo:
         finally:
             self.reset_local(key, token)
 
+    @contextmanager
+    def scopes(self, values: Iterable[tuple[str, Any]]) -> Iterator[None]:
+        """Sets multiple local variables at once and resets them in reverse order on exit.
+
+        Args:
+            values: Pairs of local variable keys and values to set
+
+        Yields:
+            None
+        """
+        tokens = [(key, self.set_local(key, value)) for key, value in values]
+        try:
+            yield
+        finally:
+            for key, token in reversed(tokens):
+                self.reset_local(key, token)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get the value associated with a key.
 
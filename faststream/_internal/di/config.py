@@ -1,7 +1,8 @@
 import inspect
 from collections.abc import Awaitable, Callable, Mapping, Reversible, Sequence
+from contextlib import suppress
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, get_origin
 
 from fast_depends import Provider, dependency_provider
 from fast_depends.core import CallModel, build_call_model
@@ -9,6 +10,7 @@ from fast_depends.core import CallModel, build_call_model
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.utils import apply_types, to_async
+from faststream.message.utils import is_json_content_type
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
     from fast_depends.use import InjectWrapper
 
     from faststream._internal.basic_types import Decorator
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream.message import StreamMessage
 
 
@@ -66,11 +69,15 @@ class FastDependsConfig:
         *,
         dependencies: Sequence["Dependant"] = (),
         call_decorators: Reversible["Decorator"] = (),
+        executor: Optional["SyncExecutor"] = None,
+        validate_json: bool = False,
     ) -> BuiltDependant:
         for d in reversed((*call_decorators, *self.call_decorators)):
             call = d(call)
 
-        wrapped_call: Callable[..., Awaitable[Any]] = to_async(call)
+        wrapped_call: Callable[..., Awaitable[Any]] = (
+            executor.to_async(call) if executor is not None else to_async(call)
+        )
 
         if self.get_dependent:
             dependent = self.get_dependent(wrapped_call, dependencies)
@@ -92,6 +99,11 @@ class FastDependsConfig:
             wrapped_call = _unwrap_message_to_fast_depends_decorator(
                 wrapped_call,
                 dependent,
+                json_validator=(
+                    _build_json_validator(dependent, self._serializer)
+                    if validate_json and self.use_fastdepends
+                    else None
+                ),
             )
 
         return BuiltDependant(
@@ -101,9 +113,93 @@ class FastDependsConfig:
         )
 
 
+def _build_json_validator(
+    dependent: "CallModel",
+    serializer: Optional["SerializerProto"],
+) -> Callable[[bytes], Any] | None:
+    """Build a validator of JSON bytes right into the single handler argument type.
+
+    It skips the intermediate Python objects of `json.loads` result. Serializer
+    validates the already built object again, but it is cheap for models.
+
+    Pydantic JSON mode accepts other inputs than the python one in strict mode
+    (e.g. strings for `datetime` fields), so strict schemas and serializers
+    with a custom config are validated the regular way.
+    """
+    if serializer is None or len(params := dependent.flat_params) != 1:
+        return None
+
+    option = params[0]
+    if option.kind is inspect.Parameter.VAR_POSITIONAL:
+        return None
+
+    annotation = option.field_type
+
+    with suppress(ImportError):
+        from fast_depends.pydantic import PydanticSerializer
+        from pydantic import BaseModel, TypeAdapter
+
+        if isinstance(serializer, PydanticSerializer):
+            if serializer.config:
+                return None
+
+            validator: Callable[[bytes], Any]
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                schema, validator = (
+                    annotation.__pydantic_core_schema__,
+                    annotation.model_validate_json,
+                )
+
+            elif get_origin(annotation) is not None:
+                adapter = TypeAdapter(annotation)
+                schema, validator = adapter.core_schema, adapter.validate_json
+
+            else:
+                return None
+
+            return None if _is_strict_schema(schema) else validator
+
+    with suppress(ImportError):
+        import msgspec
+        from fast_depends.msgspec import MsgSpecSerializer
+
+        if (
+            isinstance(serializer, MsgSpecSerializer)
+            and isinstance(annotation, type)
+            and issubclass(annotation, msgspec.Struct)
+        ):
+            return msgspec.json.Decoder(annotation, dec_hook=serializer.dec_hook).decode
+
+    return None
+
+
+def _is_strict_schema(schema: Any) -> bool:
+    """Whether any part of the pydantic core schema is validated in strict mode."""
+    if isinstance(schema, Mapping):
+        return schema.get("strict") is True or any(
+            map(_is_strict_schema, schema.values())
+        )
+
+    if isinstance(schema, list | tuple):
+        return any(map(_is_strict_schema, schema))
+
+    return False
+
+
+def _json_body(message: "StreamMessage[Any]") -> bytes | None:
+    """JSON data the default decoder would load, if the message has such one."""
+    body = message.body
+
+    if isinstance(body, bytes) and is_json_content_type(message.content_type):
+        return body
+
+    return None
+
+
 def _unwrap_message_to_fast_depends_decorator(
     func: Callable[..., Any],
     dependent: "CallModel",
+    json_validator: Callable[[bytes], Any] | None = None,
 ) -> Callable[["StreamMessage[Any]"], Awaitable[Any]]:
     dependant_params = dependent.flat_params
     if len(dependant_params) <= 1:
@@ -128,6 +224,23 @@ def _unwrap_message_to_fast_depends_decorator(
             msg = f"Couldn't unpack `{msg}` to multiple values."
             raise ValueError(msg)
 
+    elif json_validator is not None:
+
+        async def decode_wrapper(message: "StreamMessage[Any]") -> Any:
+            msg = EMPTY
+
+            # the decode cache is left for the decoder, so `message.decode()` keeps
+            # returning its result and already decoded messages are not loaded twice
+            if not message._is_decoded() and (data := _json_body(message)) is not None:
+                with suppress(Exception):
+                    msg = json_validator(data)
+
+            if msg is EMPTY:
+                # regular way raises the serializer error or decodes other data
+                msg = await message.decode()
+
+            return await func(msg)
+
     else:
 
         async def decode_wrapper(message: "StreamMessage[Any]") -> Any:
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from faststream._internal.di import FastDependsConfig
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberUsecase
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream.message import StreamMessage
 
 
@@ -95,11 +96,15 @@ class HandlerCallWrapper(Generic[P_HandlerParams, T_HandlerReturn]):
         dependencies: Sequence["Dependant"],
         _call_decorators: Reversible["Decorator"],
         config: "FastDependsConfig",
+        executor: Optional["SyncExecutor"] = None,
+        validate_json: bool = False,
     ) -> "CallModel":
         dependent = config.build_call(
             self._original_call,
             dependencies=dependencies,
             call_decorators=_call_decorators,
+            executor=executor,
+            validate_json=validate_json,
         )
         self._original_call = dependent.original_call
         self._wrapped_call = dependent.wrapped_call
@@ -1,5 +1,5 @@
 from collections import UserList
-from collections.abc import Iterable, Reversible
+from collections.abc import Hashable, Iterable, Reversible, Sequence
 from functools import partial
 from inspect import unwrap
 from typing import (
@@ -10,7 +10,11 @@ from typing import (
     cast,
 )
 
+from fast_depends.utils import is_coroutine_callable
+
+from faststream._internal.constants import EMPTY
 from faststream._internal.types import MsgType
+from faststream._internal.utils.functions import to_async
 from faststream.exceptions import IgnoredException, SetupError
 from faststream.specification.asyncapi.utils import to_camelcase
 
@@ -20,11 +24,16 @@ if TYPE_CHECKING:
     from faststream._internal.basic_types import AsyncFuncAny, Decorator
     from faststream._internal.di import FastDependsConfig
     from faststream._internal.endpoint.call_wrapper import HandlerCallWrapper
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         AsyncCallable,
         AsyncFilter,
+        AsyncFilterKey,
         CustomCallable,
+        Filter,
+        FilterKey,
         SubscriberMiddleware,
+        SyncFilterKey,
     )
     from faststream.message import StreamMessage
 
@@ -33,12 +42,14 @@ class HandlerItem(Generic[MsgType]):
     """A class representing handler overloaded item."""
 
     __slots__ = (
+        "_original_filter",
         "dependant",
         "dependencies",
         "filter",
         "handler",
         "item_decoder",
         "item_parser",
+        "key",
     )
 
     dependant: Any | None
@@ -47,16 +58,19 @@ class HandlerItem(Generic[MsgType]):
         self,
         *,
         handler: "HandlerCallWrapper[..., Any]",
-        filter: "AsyncFilter[Any]",
+        filter: "Filter[Any]",
         item_parser: Optional["CustomCallable"],
         item_decoder: Optional["CustomCallable"],
         dependencies: Iterable["Dependant"],
+        key: Hashable = EMPTY,
     ) -> None:
         self.handler = handler
-        self.filter = filter
+        self._original_filter = filter
+        self.filter: AsyncFilter[Any] = to_async(filter)
         self.item_parser = item_parser
         self.item_decoder = item_decoder
         self.dependencies = dependencies
+        self.key = key
         self.dependant = None
 
     def __repr__(self) -> str:
@@ -72,15 +86,25 @@ class HandlerItem(Generic[MsgType]):
         config: "FastDependsConfig",
         broker_dependencies: Iterable["Dependant"],
         _call_decorators: Reversible["Decorator"],
+        executor: Optional["SyncExecutor"] = None,
+        validate_json: bool = False,
     ) -> None:
         if self.dependant is None:
             self.item_parser = parser
             self.item_decoder = decoder
 
+        self.filter = (
+            executor.to_async(self._original_filter, threads_only=True)
+            if executor is not None
+            else to_async(self._original_filter)
+        )
+
         self.dependant = self.handler.set_wrapped(
             dependencies=(*broker_dependencies, *self.dependencies),
             _call_decorators=_call_decorators,
             config=config,
+            executor=executor,
+            validate_json=validate_json,
         )
 
     @property
@@ -101,12 +125,12 @@ class HandlerItem(Generic[MsgType]):
         caller = unwrap(self.handler._original_call)
         return getattr(caller, "__doc__", None)
 
-    async def is_suitable(
+    async def parse(
         self,
         msg: MsgType,
         cache: dict[Any, Any],
-    ) -> Optional["StreamMessage[MsgType]"]:
-        """Check is message suite for current filter."""
+    ) -> "StreamMessage[MsgType]":
+        """Parse message by the item parser or get it from the cache."""
         if not (parser := cast("AsyncCallable | None", self.item_parser)) or not (
             decoder := cast("AsyncCallable | None", self.item_decoder)
         ):
@@ -120,6 +144,15 @@ class HandlerItem(Generic[MsgType]):
 
         # NOTE: final decoder will be set for success filter
         message.set_decoder(decoder)
+        return message
+
+    async def is_suitable(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any],
+    ) -> Optional["StreamMessage[MsgType]"]:
+        """Check is message suite for current filter."""
+        message = await self.parse(msg, cache)
 
         if await self.filter(message):
             return message
@@ -180,3 +213,58 @@ class CallsCollection(UserList[HandlerItem[MsgType]]):
         return "\n".join(
             f"{to_camelcase(h.name)}: {h.description or ''}" for h in self.data
         )
+
+
+class HandlersIndex(Generic[MsgType]):
+    """Handlers grouped by their `key` to select them by a dict lookup.
+
+    Handlers without a key are checked for each message in the registration
+    order together with the handlers selected by the message key.
+    """
+
+    __slots__ = ("_fallback", "_filter_key", "_index", "_is_async", "_key_item")
+
+    def __init__(
+        self,
+        calls: Sequence[HandlerItem[MsgType]],
+        filter_key: "FilterKey[StreamMessage[MsgType]]",
+    ) -> None:
+        self._filter_key = filter_key
+        # sync functions are called inline to not pay a threadpool hop per message
+        self._is_async = is_coroutine_callable(filter_key)
+
+        keyed = [c for c in calls if c.key is not EMPTY]
+        # the message key is taken from the message parsed by the first keyed handler
+        self._key_item = keyed[0]
+
+        self._fallback = tuple(c for c in calls if c.key is EMPTY)
+        self._index: dict[Hashable, tuple[HandlerItem[MsgType], ...]] = {
+            key: tuple(c for c in calls if c.key is EMPTY or c.key == key)
+            for key in dict.fromkeys(c.key for c in keyed)
+        }
+
+    @classmethod
+    def build(
+        cls,
+        calls: Sequence[HandlerItem[MsgType]],
+        filter_key: Optional["FilterKey[StreamMessage[MsgType]]"],
+    ) -> Optional["HandlersIndex[MsgType]"]:
+        if filter_key is None or all(c.key is EMPTY for c in calls):
+            return None
+        return cls(calls, filter_key)
+
+    async def select(
+        self,
+        msg: MsgType,
+        cache: dict[Any, Any],
+    ) -> Sequence[HandlerItem[MsgType]]:
+        """Get handlers to check for the message."""
+        message = await self._key_item.parse(msg, cache)
+
+        key: Hashable
+        if self._is_async:
+            key = await cast("AsyncFilterKey[Any]", self._filter_key)(message)
+        else:
+            key = cast("SyncFilterKey[Any]", self._filter_key)(message)
+
+        return self._index.get(key, self._fallback)
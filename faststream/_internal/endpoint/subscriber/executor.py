@@ -0,0 +1,181 @@
+import asyncio
+import importlib
+import pickle  # noqa: S403  # only to check picklability
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from fast_depends.utils import is_coroutine_callable
+
+from faststream._internal.endpoint.call_wrapper import HandlerCallWrapper
+from faststream._internal.utils.functions import to_async
+from faststream.exceptions import SetupError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    """Calls statistics of a `SyncExecutor`."""
+
+    # calls submitted to the executor and not finished yet
+    pending: int = 0
+    max_pending: int = 0
+
+    # successfully finished calls and their total waiting for a free worker time
+    calls: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.wait_time / self.calls if self.calls else 0.0
+
+
+class SyncExecutor:
+    """`executor` option to run sync handlers, filters, parsers and decoders.
+
+    By default, sync callables are run in the shared anyio threadpool. With
+    this option they are submitted to the `pool` executor instead, for example
+    a sized `ThreadPoolExecutor` or a `ProcessPoolExecutor` for CPU-bound
+    handlers. Only handlers are submitted to a process pool, filters, parsers
+    and decoders are still run in the shared threadpool then. Handlers and
+    their arguments should be picklable.
+
+    Without `pool`, sync callables are called right in the event loop, which is
+    the fastest way for trivial ones.
+
+    The executor is not shut down by FastStream, its owner should do it.
+    """
+
+    def __init__(self, pool: "Executor | None" = None) -> None:
+        self.pool = pool
+        self.stats = ExecutorStats()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.pool!r})"
+
+    @property
+    def uses_processes(self) -> bool:
+        return isinstance(self.pool, ProcessPoolExecutor)
+
+    def to_async(
+        self,
+        func: Callable[..., T] | Callable[..., Awaitable[T]],
+        *,
+        threads_only: bool = False,
+    ) -> Callable[..., Awaitable[T]]:
+        """Make a sync function asynchronous running it in the executor.
+
+        With `threads_only` the function is run in the shared threadpool
+        instead of a process pool.
+        """
+        if is_coroutine_callable(func):
+            return cast("Callable[..., Awaitable[T]]", func)
+
+        sync_func = cast("Callable[..., T]", func)
+
+        if self.uses_processes:
+            if threads_only:
+                return to_async(sync_func)
+
+            target = _picklable(sync_func)
+        else:
+            target = sync_func
+
+        @wraps(sync_func)
+        async def to_async_wrapper(*args: Any, **kwargs: Any) -> T:
+            return await self.run(target, *args, **kwargs)
+
+        return to_async_wrapper
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        if self.pool is None:
+            self._record(0.0)
+            return func(*args, **kwargs)
+
+        stats = self.stats
+        stats.pending += 1
+        stats.max_pending = max(stats.pending, stats.max_pending)
+
+        submitted_at = time.monotonic()
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                self.pool,
+                partial(_timed_call, func, *args, **kwargs),
+            )
+
+        finally:
+            stats.pending -= 1
+
+        # monotonic clock is system-wide, so it is valid for other processes too
+        self._record(started_at - submitted_at)
+        return result
+
+    def _record(self, wait_time: float) -> None:
+        stats = self.stats
+        stats.calls += 1
+        stats.wait_time += wait_time
+        stats.max_wait_time = max(wait_time, stats.max_wait_time)
+
+
+class _HandlerReference:
+    """Handler replaced by its `HandlerCallWrapper` in the module.
+
+    Pickled by the module and qualified names and resolved to the wrapper in
+    the worker process, as such function can not be pickled itself.
+    """
+
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, module: str, qualname: str) -> None:
+        self.module = module
+        self.qualname = qualname
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return _resolve(importlib.import_module(self.module), self.qualname)(
+            *args, **kwargs
+        )
+
+
+def _resolve(obj: Any, qualname: str) -> Any:
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _picklable(func: Callable[..., T]) -> Callable[..., T]:
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if module in sys.modules and qualname is not None:
+        try:
+            wrapper = _resolve(sys.modules[module], qualname)
+        except AttributeError:
+            pass
+        else:
+            if isinstance(wrapper, HandlerCallWrapper) and wrapper._original_call is func:
+                return cast("Callable[..., T]", _HandlerReference(module, qualname))
+
+    try:
+        pickle.dumps(func)
+    except Exception as e:
+        msg = (
+            f"`{func!r}` can't be run in a process pool, as it is not picklable. "
+            "Use a module-level function."
+        )
+        raise SetupError(msg) from e
+
+    return func
+
+
+def _timed_call(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> tuple[float, T]:
+    # module-level to be picklable for process pools
+    return time.monotonic(), func(*args, **kwargs)
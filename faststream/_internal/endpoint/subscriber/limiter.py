@@ -0,0 +1,169 @@
+import asyncio
+from collections import deque
+from contextlib import suppress
+
+from faststream.exceptions import SetupError
+
+
+class AdaptiveConcurrency:
+    """`max_workers` option to adapt the workers limit to the handler latency.
+
+    The subscriber starts with `min_workers` concurrent handlers and adjusts the
+    limit using AIMD: after each window of `limit` processed messages the limit
+    is increased by one if their average latency is lower than
+    `latency_tolerance` times the baseline one, otherwise it is multiplied by
+    `backoff_ratio`. The baseline is the lowest average latency of the last
+    `baseline_windows` windows, so it follows lasting latency changes.
+    """
+
+    __slots__ = (
+        "backoff_ratio",
+        "baseline_windows",
+        "latency_tolerance",
+        "max_workers",
+        "min_workers",
+    )
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        min_workers: int = 1,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.75,
+        baseline_windows: int = 100,
+    ) -> None:
+        if not 1 <= min_workers <= max_workers:
+            msg = "`min_workers` should be between 1 and `max_workers`"
+            raise SetupError(msg)
+
+        if latency_tolerance < 1:
+            msg = "`latency_tolerance` should be greater or equal than 1"
+            raise SetupError(msg)
+
+        if not 0 < backoff_ratio < 1:
+            msg = "`backoff_ratio` should be between 0 and 1"
+            raise SetupError(msg)
+
+        if baseline_windows < 1:
+            msg = "`baseline_windows` should be greater than 0"
+            raise SetupError(msg)
+
+        self.max_workers = max_workers
+        self.min_workers = min_workers
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.baseline_windows = baseline_windows
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.max_workers}, "
+            f"min_workers={self.min_workers}, "
+            f"latency_tolerance={self.latency_tolerance}, "
+            f"backoff_ratio={self.backoff_ratio}, "
+            f"baseline_windows={self.baseline_windows})"
+        )
+
+
+def workers_limit(max_workers: int | AdaptiveConcurrency) -> int:
+    """The highest number of messages processed concurrently by the `max_workers` option."""
+    if isinstance(max_workers, AdaptiveConcurrency):
+        return max_workers.max_workers
+    return max_workers
+
+
+class ConcurrencyLimiter:
+    """Semaphore with a mutable limit.
+
+    Each `acquire` call should be followed by exactly one `release` one.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @classmethod
+    def build(cls, max_workers: int | AdaptiveConcurrency) -> "ConcurrencyLimiter":
+        if isinstance(max_workers, AdaptiveConcurrency):
+            return AdaptiveConcurrencyLimiter(max_workers)
+        return cls(max_workers)
+
+    @property
+    def adaptive(self) -> bool:
+        return False
+
+    async def acquire(self) -> None:
+        while self.active >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+            try:
+                await waiter
+
+            except BaseException:
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+
+                # pass the wake up to the next waiter
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_up()
+
+                raise
+
+        self.active += 1
+
+    def release(self, latency: float | None = None) -> None:
+        """Release the slot acquired for a message processed in `latency` seconds."""
+        self.active -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free = self.limit - self.active
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class AdaptiveConcurrencyLimiter(ConcurrencyLimiter):
+    """AIMD controlled concurrency limiter."""
+
+    def __init__(self, config: AdaptiveConcurrency) -> None:
+        super().__init__(config.min_workers)
+
+        self.min_limit = config.min_workers
+        self.max_limit = config.max_workers
+        self.latency_tolerance = config.latency_tolerance
+        self.backoff_ratio = config.backoff_ratio
+
+        # average latencies of the last windows to find the baseline one
+        self._windows: deque[float] = deque(maxlen=config.baseline_windows)
+        self._window_size = 0
+        self._window_latency = 0.0
+
+    @property
+    def adaptive(self) -> bool:
+        return True
+
+    def release(self, latency: float | None = None) -> None:
+        if latency is not None:
+            self._window_size += 1
+            self._window_latency += latency
+
+            if self._window_size >= self.limit:
+                self._adjust(self._window_latency / self._window_size)
+                self._window_size = 0
+                self._window_latency = 0.0
+
+        super().release()
+
+    def _adjust(self, latency: float) -> None:
+        self._windows.append(latency)
+        baseline = min(self._windows)
+
+        if latency > baseline * self.latency_tolerance:
+            self.limit = max(self.min_limit, int(self.limit * self.backoff_ratio))
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any, Generic
 
@@ -6,6 +7,7 @@ import anyio
 
 from faststream._internal.types import MsgType
 
+from .limiter import AdaptiveConcurrency, ConcurrencyLimiter, workers_limit
 from .supervisor import TaskCallbackSupervisor
 from .usecase import SubscriberUsecase
 
@@ -50,18 +52,23 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
     def __init__(
         self,
         *args: Any,
-        max_workers: int,
+        max_workers: int | AdaptiveConcurrency,
         **kwargs: Any,
     ) -> None:
-        self.max_workers = max_workers
+        self.max_workers = workers_limit(max_workers)
 
         self.send_stream, self.receive_stream = anyio.create_memory_object_stream(
-            max_buffer_size=max_workers,
+            max_buffer_size=self.max_workers,
         )
-        self.limiter = anyio.Semaphore(max_workers)
+        self.limiter = ConcurrencyLimiter.build(max_workers)
 
         super().__init__(*args, **kwargs)
 
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of messages allowed to be processed concurrently."""
+        return self.limiter.limit
+
     def start_consume_task(self) -> None:
         self.add_task(self._serve_consume_queue)
 
@@ -77,11 +84,18 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
                 tg.start_soon(self._consume_msg, msg)
 
     async def _consume_msg(self, msg: "MsgType") -> None:
-        """Proxy method to call `self.consume` with semaphore block."""
-        async with self.limiter:
+        """Proxy method to call `self.consume` and release the slot taken by `_put_msg`."""
+        started_at = time.perf_counter()
+        try:
             await self.consume(msg)
+        finally:
+            self.limiter.release(time.perf_counter() - started_at)
 
     async def _put_msg(self, msg: "MsgType") -> None:
         """Proxy method to put msg into in-memory queue with semaphore block."""
-        async with self.limiter:
+        await self.limiter.acquire()
+        try:
             await self.send_stream.send(msg)
+        except BaseException:
+            self.limiter.release()
+            raise
@@ -1,7 +1,5 @@
 from abc import abstractmethod
-from collections.abc import AsyncIterator, Callable, Iterable, Sequence
-from contextlib import AbstractContextManager, AsyncExitStack
-from itertools import chain
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Sequence
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -14,17 +12,18 @@ from typing import (
 
 from typing_extensions import Self, overload, override
 
+from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.usecase import Endpoint
 from faststream._internal.endpoint.utils import ParserComposition
-from faststream._internal.parser import BatchCodecProto
+from faststream._internal.middlewares import BaseMiddleware
+from faststream._internal.parser import BatchCodecProto, is_json_decoder
 from faststream._internal.types import (
     AsyncCallable,
     MsgType,
     P_HandlerParams,
     T_HandlerReturn,
 )
-from faststream._internal.utils.functions import FakeContext, to_async
-from faststream.exceptions import StopConsume, SubscriberNotFound
+from faststream.exceptions import SetupError, StopConsume, SubscriberNotFound
 from faststream.middlewares import AcknowledgementMiddleware
 from faststream.middlewares.logging import CriticalLogMiddleware
 from faststream.response import ensure_response
@@ -32,28 +31,30 @@ from faststream.response import ensure_response
 from .call_item import (
     CallsCollection,
     HandlerItem,
+    HandlersIndex,
 )
-from .utils import MultiLock, default_filter
+from .utils import InFlightTracker, default_filter
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import Decorator
     from faststream._internal.configs import SubscriberUsecaseConfig
+    from faststream._internal.context import ContextRepo
     from faststream._internal.endpoint.call_wrapper import HandlerCallWrapper
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
-        AsyncFilter,
         BrokerMiddleware,
         CustomCallable,
         Filter,
+        FilterKey,
     )
     from faststream.message import StreamMessage
-    from faststream.middlewares import BaseMiddleware
     from faststream.response import Response
     from faststream.specification.schema import SubscriberSpec
 
+    from .executor import SyncExecutor
     from .specification import SubscriberSpecification
 
 
@@ -62,12 +63,183 @@ class _CallOptions(NamedTuple):
     decoder: Optional["CustomCallable"]
     dependencies: Iterable["Dependant"]
     codec: Optional["CodecProto"] = None
+    filter_key: Optional["FilterKey[Any]"] = None
+    executor: Optional["SyncExecutor"] = None
+
+
+class _ProcessingPipeline(Generic[MsgType]):
+    """Message processing of a subscriber compiled at its start.
+
+    Middleware factories, the handlers index and the FastDepends context are
+    resolved once, and middlewares are exited without an `AsyncExitStack`.
+    Middleware scopes not overriding `BaseMiddleware` ones are left out of the
+    consume and publish chains. Middlewares are still made per message, as
+    they keep the message state.
+
+    The pipeline is compiled again when the subscriber config revision changes.
+    """
+
+    __slots__ = (
+        "context",
+        "handlers_index",
+        "middlewares",
+        "response_publishers",
+        "revision",
+        "subscriber",
+    )
+
+    def __init__(
+        self,
+        subscriber: "SubscriberUsecase[MsgType]",
+        *,
+        middlewares: tuple["BrokerMiddleware[Any]", ...],
+        response_publishers: Callable[
+            ["StreamMessage[MsgType]"], Iterable["PublisherProto"]
+        ],
+    ) -> None:
+        config = subscriber._outer_config
+
+        self.subscriber = subscriber
+        self.middlewares = middlewares
+        self.response_publishers = response_publishers
+        self.context: ContextRepo = config.fd_config.context
+        self.handlers_index = HandlersIndex.build(
+            subscriber.calls,
+            subscriber._call_options.filter_key,
+        )
+        self.revision = config.revision
+
+    async def __call__(self, msg: MsgType) -> "Response":
+        subscriber = self.subscriber
+        config = subscriber._outer_config
+        context = self.context
+
+        # Enter context before middlewares
+        with (
+            subscriber.lock,
+            context.scopes((
+                ("handler_", subscriber),
+                *config.extra_context.items(),
+                ("logger", config.logger.logger.logger),
+            )),
+        ):
+            middlewares: list[BaseMiddleware] = []
+            for base_m in self.middlewares:
+                middleware = base_m(msg, context=context)
+                middlewares.append(middleware)
+                await middleware.__aenter__()
+
+            try:
+                h, message = await self._find_handler(msg)
+            except Exception as e:
+                # Suitable handler was not found or
+                # parsing/decoding exception occurred
+                await _exit_middlewares(middlewares, e)
+                return ensure_response(None)
+
+            with context.scopes((
+                ("log_context", subscriber.get_log_context(message)),
+                ("message", message),
+            )):
+                try:
+                    result_msg = await self._call(h, message, middlewares[::-1])
+                except BaseException as e:
+                    await _exit_middlewares(middlewares, e)
+                    return ensure_response(None)
+
+                # Middlewares should be exited before scope release
+                await _exit_middlewares(middlewares, None)
+
+            # Return data for tests
+            return result_msg
+
+    async def _find_handler(
+        self,
+        msg: MsgType,
+    ) -> tuple[HandlerItem[MsgType], "StreamMessage[MsgType]"]:
+        cache: dict[Any, Any] = {}
+
+        calls: Sequence[HandlerItem[MsgType]] = self.subscriber.calls
+        if self.handlers_index is not None:
+            calls = await self.handlers_index.select(msg, cache)
+
+        for h in calls:
+            if (message := await h.is_suitable(msg, cache)) is not None:
+                return h, message
+
+        error_msg = f"There is no suitable handler for {msg=}"
+        raise SubscriberNotFound(error_msg)
+
+    async def _call(
+        self,
+        h: HandlerItem[MsgType],
+        message: "StreamMessage[MsgType]",
+        middlewares: Sequence[BaseMiddleware],
+    ) -> "Response":
+        result_msg = ensure_response(
+            await h.call(
+                message=message,
+                # consumer middlewares
+                _extra_middlewares=[
+                    m.consume_scope
+                    for m in middlewares
+                    if type(m).consume_scope is not BaseMiddleware.consume_scope
+                ],
+            ),
+        )
+
+        if not result_msg.correlation_id:
+            result_msg.correlation_id = message.correlation_id
+
+        publishers = h.handler._publishers
+        if response_publishers := self.response_publishers(message):
+            publishers = [*response_publishers, *publishers]
+
+        if publishers:
+            publish_middlewares = [
+                m.publish_scope
+                for m in middlewares
+                if type(m).publish_scope is not BaseMiddleware.publish_scope
+            ]
+            for p in publishers:
+                await p._publish(
+                    result_msg.as_publish_command(),
+                    _extra_middlewares=publish_middlewares,
+                )
+
+        return result_msg
+
+
+async def _exit_middlewares(
+    middlewares: Sequence[BaseMiddleware],
+    exc: BaseException | None,
+) -> None:
+    """Exit middlewares in reverse order as `AsyncExitStack` does.
+
+    Raises the exception if no middleware suppressed it.
+    """
+    for m in reversed(middlewares):
+        try:
+            if exc is None:
+                suppressed = await m.__aexit__(None, None, None)
+            else:
+                suppressed = await m.__aexit__(type(exc), exc, exc.__traceback__)
+
+        except BaseException as e:  # noqa: PERF203
+            exc = e
+
+        else:
+            if suppressed:
+                exc = None
+
+    if exc is not None:
+        raise exc
 
 
 class SubscriberUsecase(Endpoint, Generic[MsgType]):
     """A class representing an asynchronous handler."""
 
-    lock: "AbstractContextManager[Any]"
+    lock: InFlightTracker
     extra_watcher_options: dict[str, Any]
     graceful_timeout: float | None
 
@@ -98,12 +270,18 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         )
 
         self._call_decorators: tuple[Decorator, ...] = ()
+        self._pipeline: _ProcessingPipeline[MsgType] | None = None
 
         self.running = False
-        self.lock = FakeContext()
+        self.lock = InFlightTracker()
 
         self.extra_watcher_options = {}
 
+    @property
+    def in_flight_tracker(self) -> InFlightTracker:
+        """Tracker of messages being processed by the subscriber."""
+        return self.lock
+
     @property
     def _broker_middlewares(self) -> Sequence["BrokerMiddleware[MsgType]"]:
         return self._outer_config.broker_middlewares
@@ -122,7 +300,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
     async def start(self) -> None:
         """Private method to start subscriber by broker."""
-        self.lock = MultiLock()
+        self.lock = InFlightTracker()
 
         self._build_fastdepends_model()
 
@@ -154,10 +332,16 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         So, the final parser object is
         >>> ParserComposition(P0_parser or P1_parser or P2_parser, self._parser)
         """
+        executor = self._executor
+
         if parser := (
             item_parser or self._call_options.parser or self._outer_config.broker_parser
         ):
-            async_parser: AsyncCallable = ParserComposition(parser, self._parser)
+            async_parser: AsyncCallable = ParserComposition(
+                parser,
+                self._parser,
+                executor=executor,
+            )
         else:
             async_parser = self._parser
 
@@ -188,7 +372,11 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             else:
                 async_decoder = codec.decode
         elif decoder:
-            async_decoder = ParserComposition(decoder, self._decoder)
+            async_decoder = ParserComposition(
+                decoder,
+                self._decoder,
+                executor=executor,
+            )
         else:
             async_decoder = self._decoder
 
@@ -206,10 +394,26 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                 config=self._outer_config.fd_config,
                 broker_dependencies=self._outer_config.broker_dependencies,
                 _call_decorators=self._call_decorators,
+                executor=self._executor,
+                # such decoder only loads JSON, so it can be done by the handler model
+                validate_json=is_json_decoder(async_decoder),
             )
 
             call.handler.refresh(with_mock=False)
 
+        self._pipeline = self._compile_pipeline()
+
+    def _compile_pipeline(self) -> _ProcessingPipeline[MsgType]:
+        return _ProcessingPipeline(
+            self,
+            middlewares=self.__build__middlewares_stack(),
+            response_publishers=self.__get_response_publisher,
+        )
+
+    @property
+    def _executor(self) -> Optional["SyncExecutor"]:
+        return self._call_options.executor or self._outer_config.executor
+
     def _post_start(self) -> None:
         self.running = True
 
@@ -223,8 +427,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         self.running = False
 
         # Wait for already consumed messages to be processed
-        if isinstance(self.lock, MultiLock):
-            await self.lock.wait_release(self._outer_config.graceful_timeout)
+        await self.lock.wait_release(self._outer_config.graceful_timeout)
 
     def add_call(
         self,
@@ -233,12 +436,16 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         decoder_: Optional["CustomCallable"],
         dependencies_: Iterable["Dependant"],
         codec_: Optional["CodecProto"] = None,
+        filter_key_: Optional["FilterKey[Any]"] = None,
+        executor_: Optional["SyncExecutor"] = None,
     ) -> Self:
         self._call_options = _CallOptions(
             parser=parser_,
             decoder=decoder_,
             dependencies=dependencies_,
             codec=codec_,
+            filter_key=filter_key_,
+            executor=executor_,
         )
         return self
 
@@ -248,6 +455,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         func: Callable[P_HandlerParams, T_HandlerReturn],
         *,
         filter: "Filter[Any]" = default_filter,
+        key: Hashable = EMPTY,
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -259,6 +467,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         func: None = None,
         *,
         filter: "Filter[Any]" = default_filter,
+        key: Hashable = EMPTY,
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -273,6 +482,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         func: Callable[P_HandlerParams, T_HandlerReturn] | None = None,
         *,
         filter: "Filter[Any]" = default_filter,
+        key: Hashable = EMPTY,
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         dependencies: Iterable["Dependant"] = (),
@@ -283,8 +493,16 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             "HandlerCallWrapper[P_HandlerParams, T_HandlerReturn]",
         ],
     ]:
+        if key is not EMPTY:
+            if self._call_options.filter_key is None:
+                msg = "You should set subscriber `filter_key` to use handler `key`."
+                raise SetupError(msg)
+
+            if not isinstance(key, Hashable):
+                msg = f"Handler `key` should be hashable, got {key!r}."
+                raise SetupError(msg)
+
         total_deps = (*self._call_options.dependencies, *dependencies)
-        async_filter: AsyncFilter[StreamMessage[MsgType]] = to_async(filter)
 
         def real_wrapper(
             func: Callable[P_HandlerParams, T_HandlerReturn],
@@ -295,10 +513,11 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             self.calls.add_call(
                 HandlerItem[MsgType](
                     handler=handler,
-                    filter=async_filter,
+                    filter=filter,
                     item_parser=parser,
                     item_decoder=decoder,
                     dependencies=total_deps,
+                    key=key,
                 ),
             )
 
@@ -334,85 +553,12 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
     async def process_message(self, msg: MsgType) -> "Response":
         """Execute all message processing stages."""
-        context = self._outer_config.fd_config.context
-        logger_state = self._outer_config.logger
-
-        async with AsyncExitStack() as stack:
-            stack.enter_context(self.lock)
-
-            # Enter context before middlewares
-            stack.enter_context(context.scope("handler_", self))
-            stack.enter_context(context.scope("logger", logger_state.logger.logger))
-            for k, v in self._outer_config.extra_context.items():
-                stack.enter_context(context.scope(k, v))
-
-            # enter all middlewares
-            middlewares: list[BaseMiddleware] = []
-            for base_m in self.__build__middlewares_stack():
-                middleware = base_m(msg, context=context)
-                middlewares.append(middleware)
-                await middleware.__aenter__()
-
-            cache: dict[Any, Any] = {}
-            parsing_error: Exception | None = None
-            for h in self.calls:
-                try:
-                    message = await h.is_suitable(msg, cache)
-                except Exception as e:
-                    parsing_error = e
-                    break
-
-                if message is not None:
-                    stack.enter_context(
-                        context.scope("log_context", self.get_log_context(message)),
-                    )
-                    stack.enter_context(context.scope("message", message))
-
-                    # Middlewares should be exited before scope release
-                    for m in middlewares:
-                        stack.push_async_exit(m.__aexit__)
-
-                    result_msg = ensure_response(
-                        await h.call(
-                            message=message,
-                            # consumer middlewares
-                            _extra_middlewares=(
-                                m.consume_scope for m in middlewares[::-1]
-                            ),
-                        ),
-                    )
+        if (
+            pipeline := self._pipeline
+        ) is None or pipeline.revision != self._outer_config.revision:
+            pipeline = self._pipeline = self._compile_pipeline()
 
-                    if not result_msg.correlation_id:
-                        result_msg.correlation_id = message.correlation_id
-
-                    for p in chain(
-                        self.__get_response_publisher(message),
-                        h.handler._publishers,
-                    ):
-                        await p._publish(
-                            result_msg.as_publish_command(),
-                            _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
-                            ),
-                        )
-
-                    # Return data for tests
-                    return result_msg
-
-            # Suitable handler was not found or
-            # parsing/decoding exception occurred
-            for m in middlewares:
-                stack.push_async_exit(m.__aexit__)
-
-            # Reraise it to catch in tests
-            if parsing_error:
-                raise parsing_error
-
-            error_msg = f"There is no suitable handler for {msg=}"
-            raise SubscriberNotFound(error_msg)
-
-        # An error was raised and processed by some middleware
-        return ensure_response(None)
+        return await pipeline(msg)
 
     def __build__middlewares_stack(self) -> tuple["BrokerMiddleware[MsgType]", ...]:
         logger_state = self._outer_config.logger
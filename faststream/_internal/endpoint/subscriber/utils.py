@@ -1,5 +1,5 @@
 import asyncio
-from contextlib import suppress
+import time
 from typing import TYPE_CHECKING, Any, Optional
 
 import anyio
@@ -16,16 +16,19 @@ async def default_filter(msg: "StreamMessage[Any]") -> bool:
     return not msg.processed
 
 
-class MultiLock:
-    """A class representing a multi lock.
+class InFlightTracker:
+    """A class tracking messages being processed by a subscriber.
 
-    This lock can be acquired multiple times.
-    `wait_release` method waits for all locks will be released.
+    It can be entered multiple times and counts active entries.
+    `wait_release` method waits for all of them will be released.
     """
 
     def __init__(self) -> None:
         """Initialize a new instance of the class."""
-        self.queue: asyncio.Queue[None] = asyncio.Queue()
+        self._in_flight = 0
+        self._high_water_mark = 0
+        self._drain_time = 0.0
+        self._released: asyncio.Event | None = None
 
     def __enter__(self) -> Self:
         """Enter the context."""
@@ -42,30 +45,56 @@ class MultiLock:
         self.release()
 
     def acquire(self) -> None:
-        """Acquire lock."""
-        self.queue.put_nowait(None)
+        """Register a new message in processing."""
+        if not self._in_flight and self._released is not None:
+            self._released.clear()
+
+        self._in_flight += 1
+        self._high_water_mark = max(self._high_water_mark, self._in_flight)
 
     def release(self) -> None:
-        """Release lock."""
-        with suppress(asyncio.QueueEmpty, ValueError):
-            self.queue.get_nowait()
-            self.queue.task_done()
+        """Unregister a processed message."""
+        if self._in_flight:
+            self._in_flight -= 1
+
+        if not self._in_flight and self._released is not None:
+            self._released.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of messages being processed."""
+        return self._in_flight
 
     @property
-    def qsize(self) -> int:
-        """Return the size of the queue."""
-        return self.queue.qsize()
+    def high_water_mark(self) -> int:
+        """Return the maximum number of messages processed at the same time."""
+        return self._high_water_mark
+
+    @property
+    def drain_time(self) -> float:
+        """Return seconds the last `wait_release` call was waiting for."""
+        return self._drain_time
 
     @property
     def empty(self) -> bool:
-        """Return whether the queue is empty."""
-        return self.queue.empty()
+        """Return whether there are no messages in processing."""
+        return not self._in_flight
 
     async def wait_release(self, timeout: float | None = None) -> None:
-        """Wait for the queue to be released.
+        """Wait for all messages to be processed.
 
         Using for graceful shutdown.
         """
-        if timeout:
+        if not timeout or not self._in_flight:
+            return
+
+        # shared by all waiters to wake them up at once
+        if self._released is None:
+            self._released = asyncio.Event()
+
+        started_at = time.monotonic()
+        try:
             with anyio.move_on_after(timeout):
-                await self.queue.join()
+                await self._released.wait()
+        finally:
+            self._drain_time = time.monotonic() - started_at
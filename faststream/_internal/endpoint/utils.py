@@ -9,6 +9,7 @@ from faststream._internal.utils.functions import return_input, to_async
 from faststream.message.source_type import SourceType
 
 if TYPE_CHECKING:
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         AsyncCallable,
         CustomCallable,
@@ -53,6 +54,7 @@ class ParserComposition:
         self,
         custom_func: Optional["CustomCallable"],
         default_func: "AsyncCallable",
+        executor: Optional["SyncExecutor"] = None,
     ) -> None:
         self.custom_func = custom_func
         self.default_func = default_func
@@ -60,16 +62,23 @@ class ParserComposition:
         if custom_func is None:
             self.wrapped_func = default_func
         else:
+            make_async = (
+                partial(executor.to_async, threads_only=True)
+                if executor is not None
+                else to_async
+            )
             original_params = inspect.signature(custom_func).parameters
 
             if len(original_params) == 1:
-                self.wrapped_func = to_async(
+                self.wrapped_func = make_async(
                     cast("SyncCallable | AsyncCallable", custom_func)
                 )
 
             else:
                 name = tuple(original_params.items())[1][0]
-                self.wrapped_func = partial(to_async(custom_func), **{name: default_func})
+                self.wrapped_func = partial(
+                    make_async(custom_func), **{name: default_func}
+                )
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.wrapped_func(*args, **kwargs)
@@ -2,7 +2,7 @@ import asyncio
 import inspect
 from collections.abc import Awaitable, Callable, Iterable
 from contextlib import AsyncExitStack
-from functools import wraps
+from functools import partial, wraps
 from itertools import dropwhile
 from typing import (
     TYPE_CHECKING,
@@ -217,47 +217,68 @@ def make_fastapi_execution(
     """Creates a FastAPI application."""
     is_coroutine = asyncio.iscoroutinefunction(dependent.call)
 
+    # FastAPI uses exit stacks for generator dependencies only, so without
+    # them all messages share the same stack never entered
+    uses_exit_stack = _has_generator_dependency(dependent)
+    shared_stack = AsyncExitStack()
+
     async def app(
         request: "StreamMessage",
         raw_message: "NativeMessage[Any]",  # to support BackgroundTasks by middleware
     ) -> Response:
         """Consume StreamMessage and return user function result."""
-        async with AsyncExitStack() as stack:
-            kwargs = {}
-            if FASTAPI_V121:
-                request.scope["fastapi_inner_astack"] = stack
+        overrides_provider = fastapi_config.dependency_overrides_provider
+
+        if uses_exit_stack or getattr(overrides_provider, "dependency_overrides", None):
+            # overrides can bring generator dependencies
+            async with AsyncExitStack() as stack:
                 function_stack = AsyncExitStack()
                 await stack.enter_async_context(function_stack)
-                request.scope["fastapi_function_astack"] = function_stack
+                return await execute(request, raw_message, stack, function_stack)
 
-            if FASTAPI_V106:
-                kwargs = {"async_exit_stack": stack}
+        return await execute(request, raw_message, shared_stack, shared_stack)
 
-            else:
-                request.scope["fastapi_astack"] = stack
+    async def execute(
+        request: "StreamMessage",
+        raw_message: "NativeMessage[Any]",
+        stack: AsyncExitStack,
+        function_stack: AsyncExitStack,
+    ) -> Response:
+        kwargs = {}
+        if FASTAPI_V121:
+            request.scope["fastapi_inner_astack"] = stack
+            request.scope["fastapi_function_astack"] = function_stack
 
-            request.scope["app"] = fastapi_config.application
+        if FASTAPI_V106:
+            kwargs = {"async_exit_stack": stack}
 
-            solved_result = await solve_faststream_dependency(
-                request=request,
-                dependant=dependent,
-                dependency_overrides_provider=fastapi_config.dependency_overrides_provider,
-                **kwargs,
-            )
+        else:
+            request.scope["fastapi_astack"] = stack
 
-            raw_message.background = solved_result.background_tasks  # type: ignore[attr-defined]
+        request.scope["app"] = fastapi_config.application
 
-            if solved_result.errors:
-                raise_fastapi_validation_error(solved_result.errors, request._body)  # type: ignore[arg-type]
+        solved_result = await solve_faststream_dependency(
+            request=request,
+            dependant=dependent,
+            dependency_overrides_provider=fastapi_config.dependency_overrides_provider,
+            **kwargs,
+        )
 
-            function_result = await run_endpoint_function(
-                dependant=dependent,
-                values=solved_result.values,
-                is_coroutine=is_coroutine,
-            )
+        raw_message.background = solved_result.background_tasks  # type: ignore[attr-defined]
+
+        if solved_result.errors:
+            raise_fastapi_validation_error(solved_result.errors, request._body)  # type: ignore[arg-type]
+
+        function_result = await run_endpoint_function(
+            dependant=dependent,
+            values=solved_result.values,
+            is_coroutine=is_coroutine,
+        )
 
-            response = ensure_response(function_result)
+        response = ensure_response(function_result)
 
+        # serialization without a response model keeps these values as they are
+        if response_field is not None or type(response.body) not in _PLAIN_TYPES:
             response.body = await serialize_response(
                 response_content=response.body,
                 field=response_field,
@@ -270,9 +291,29 @@ def make_fastapi_execution(
                 is_coroutine=is_coroutine,
             )
 
-            return response
-
-        msg = "unreachable"
-        raise AssertionError(msg)
+        return response
 
     return app
+
+
+_PLAIN_TYPES = frozenset((type(None), str, int, float, bool))
+
+
+def _has_generator_dependency(dependent: "FastAPIDependant") -> bool:
+    return any(
+        _is_generator_callable(d.call) or _has_generator_dependency(d)
+        for d in dependent.dependencies
+    )
+
+
+def _is_generator_callable(call: Any) -> bool:
+    while isinstance(call, partial):
+        call = call.func
+
+    if inspect.isclass(call):
+        return False
+
+    return any(
+        inspect.isgeneratorfunction(c) or inspect.isasyncgenfunction(c)
+        for c in (call, getattr(call, "__call__", None))  # noqa: B004
+    )
@@ -1,9 +1,11 @@
 from .logging import logger
 from .params_storage import DefaultLoggerStorage, LoggerParamsStorage
+from .queue import LogQueue
 from .state import LoggerState, make_logger_state
 
 __all__ = (
     "DefaultLoggerStorage",
+    "LogQueue",
     "LoggerParamsStorage",
     "LoggerState",
     "logger",
@@ -1,10 +1,13 @@
 from abc import abstractmethod
 from collections.abc import Mapping
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.basic_types import LoggerProto
 from faststream.exceptions import IncorrectState
 
+if TYPE_CHECKING:
+    from .queue import LogQueue
+
 
 class LoggerObject(LoggerProto):
     logger: Optional["LoggerProto"]
@@ -104,3 +107,33 @@ class RealLoggerObject(LoggerObject):
             extra=extra,
             exc_info=exc_info,
         )
+
+
+class QueuedLoggerObject(RealLoggerObject):
+    """Real logger proxy emitting logs by a `LogQueue` background thread."""
+
+    def __init__(self, logger: "LoggerProto", log_queue: "LogQueue") -> None:
+        super().__init__(logger)
+        self.log_queue = log_queue
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(logger={self.logger}, log_queue={self.log_queue})"
+        )
+
+    def log(
+        self,
+        level: int,
+        msg: Any,
+        /,
+        *,
+        exc_info: Any = None,
+        extra: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.log_queue.put(
+            self.logger,
+            level,
+            msg,
+            extra=extra,
+            exc_info=exc_info,
+        )
@@ -0,0 +1,163 @@
+import logging
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from faststream.exceptions import SetupError
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import LoggerProto
+
+
+class LogQueue:
+    """`log_queue` option to emit broker logs from a background thread.
+
+    Log records are made in the event loop and put to a bounded queue, so slow
+    log handlers don't block message processing. Logs overflowing the queue
+    are dropped, except errors. They are emitted right away instead.
+
+    Per-message "Received"/"Processed" logs can also be shed by `sample_rate`
+    (a part of messages to log) or `rate_limit` (messages per second to log).
+    All shed logs are counted by the `dropped` attribute.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        *,
+        sample_rate: float = 1.0,
+        rate_limit: float | None = None,
+    ) -> None:
+        if max_size < 1:
+            msg = "`max_size` should be greater than 0."
+            raise SetupError(msg)
+
+        if not 0 <= sample_rate <= 1:
+            msg = "`sample_rate` should be between 0 and 1."
+            raise SetupError(msg)
+
+        if rate_limit is not None and rate_limit <= 0:
+            msg = "`rate_limit` should be greater than 0."
+            raise SetupError(msg)
+
+        self.max_size = max_size
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit
+
+        # number of log records shed by sampling or queue overflow
+        self.dropped = 0
+
+        self._queue: queue.Queue[Callable[[], None]] = queue.Queue(max_size)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+        # token bucket of the rate limit, allowing bursts up to one second
+        self._tokens = rate_limit or 0.0
+        self._last_refill = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_size={self.max_size}, "
+            f"sample_rate={self.sample_rate}, rate_limit={self.rate_limit})"
+        )
+
+    def sample(self, logs: int = 2) -> bool:
+        """Whether to log a message; its shed `logs` are counted otherwise."""
+        if (self.sample_rate < 1 and random.random() >= self.sample_rate) or (  # noqa: S311
+            self.rate_limit is not None and not self._take_token()
+        ):
+            self.dropped += logs
+            return False
+
+        return True
+
+    def _take_token(self) -> bool:
+        assert self.rate_limit
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.rate_limit,
+            self._tokens + (now - self._last_refill) * self.rate_limit,
+        )
+        self._last_refill = now
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    def put(
+        self,
+        logger: "LoggerProto",
+        level: int,
+        msg: Any,
+        *,
+        exc_info: BaseException | None = None,
+        extra: Mapping[str, Any] | None = None,
+    ) -> None:
+        emit: Callable[[], None]
+        if isinstance(logger, logging.Logger):
+            if not logger.isEnabledFor(level):
+                return
+
+            # the record is made here to keep its creation time
+            record = logger.makeRecord(
+                logger.name,
+                level,
+                "(unknown file)",
+                0,
+                msg,
+                (),
+                (type(exc_info), exc_info, exc_info.__traceback__) if exc_info else None,
+                extra=extra,
+            )
+            emit = partial(logger.handle, record)
+
+        else:
+            emit = partial(logger.log, level, msg, exc_info=exc_info, extra=extra)
+
+        self._ensure_thread()
+
+        try:
+            self._queue.put_nowait(emit)
+        except queue.Full:
+            if level >= logging.ERROR:
+                self._emit(emit)
+            else:
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait for all queued logs to be emitted."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._process,
+                        name="faststream-log-queue",
+                        daemon=True,
+                    )
+                    self._thread.start()
+
+    def _process(self) -> None:
+        while True:
+            emit = self._queue.get()
+            try:
+                self._emit(emit)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _emit(emit: Callable[[], None]) -> None:
+        # logging errors shouldn't stop the queue
+        with suppress(Exception):
+            emit()
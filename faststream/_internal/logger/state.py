@@ -1,10 +1,13 @@
 import logging
 from typing import TYPE_CHECKING, Any, Optional
 
+from fast_depends.utils import run_in_threadpool
+
 from .logger_proxy import (
     EmptyLoggerObject,
     LoggerObject,
     NotSetLoggerObject,
+    QueuedLoggerObject,
     RealLoggerObject,
 )
 from .params_storage import (
@@ -18,11 +21,14 @@ if TYPE_CHECKING:
     from faststream._internal.basic_types import LoggerProto
     from faststream._internal.context import ContextRepo
 
+    from .queue import LogQueue
+
 
 def make_logger_state(
     logger: Optional["LoggerProto"],
     log_level: int,
     default_storage_cls: type["DefaultLoggerStorage"],
+    log_queue: Optional["LogQueue"] = None,
 ) -> "LoggerState":
     storage = make_logger_storage(
         logger=logger,
@@ -32,6 +38,7 @@ def make_logger_state(
     return LoggerState(
         log_level=log_level,
         storage=storage,
+        log_queue=log_queue,
     )
 
 
@@ -40,9 +47,11 @@ class LoggerState:
         self,
         log_level: int = logging.INFO,
         storage: Optional["LoggerParamsStorage"] = None,
+        log_queue: Optional["LogQueue"] = None,
     ) -> None:
         self.log_level = log_level
         self.params_storage = storage or EmptyLoggerStorage()
+        self.log_queue = log_queue
 
         self.logger: LoggerObject = NotSetLoggerObject()
 
@@ -69,9 +78,22 @@ class LoggerState:
             exc_info=exc_info,
         )
 
+    def sample_message(self) -> bool:
+        """Whether to log the current message "Received"/"Processed" logs."""
+        return self.log_queue is None or self.log_queue.sample()
+
+    async def flush(self) -> None:
+        """Wait for queued logs to be emitted."""
+        if self.log_queue is not None:
+            await run_in_threadpool(self.log_queue.flush)
+
     def _setup(self, context: "ContextRepo", /) -> None:
         if not self.logger:
             if logger := self.params_storage.get_logger(context=context):
-                self.logger = RealLoggerObject(logger)
+                self.logger = (
+                    QueuedLoggerObject(logger, self.log_queue)
+                    if self.log_queue is not None
+                    else RealLoggerObject(logger)
+                )
             else:
                 self.logger = EmptyLoggerObject()
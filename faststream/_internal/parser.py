@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 
 from faststream.message.utils import decode_message, encode_message
@@ -11,6 +11,23 @@ if TYPE_CHECKING:
     from faststream.message import StreamMessage
 
 MsgType = TypeVar("MsgType")
+DecoderT = TypeVar("DecoderT", bound=Callable[..., Any])
+
+JSON_DECODER_MARKER = "__faststream_json_decoder__"
+
+
+def mark_json_decoder(decoder: DecoderT) -> DecoderT:
+    """Mark a decoder which only loads the message body like `decode_message` does.
+
+    Such decoders let the handler model validate JSON bodies directly.
+    Overridden methods of marked ones are not marked.
+    """
+    setattr(decoder, JSON_DECODER_MARKER, True)
+    return decoder
+
+
+def is_json_decoder(decoder: object) -> bool:
+    return getattr(decoder, JSON_DECODER_MARKER, False) is True
 
 
 class ParserProto(Protocol[MsgType]):
@@ -86,6 +103,7 @@ class BatchCodecProto(Protocol):
 
 
 class DefaultCodec:
+    @mark_json_decoder
     async def decode(self, msg: "StreamMessage[Any]") -> "DecodedMessage":
         return decode_message(msg)
 
@@ -0,0 +1,144 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Generic, Protocol, TypeVar
+
+import anyio
+
+from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import IncorrectState
+
+MsgType = TypeVar("MsgType")
+MsgType_co = TypeVar("MsgType_co", covariant=True)
+
+
+class ReplyConsumerProto(Protocol[MsgType_co]):
+    async def getone(self) -> MsgType_co | None: ...
+
+    async def stop(self) -> None: ...
+
+
+class TopicReplyInbox(ABC, Generic[MsgType]):
+    """Per-process reply topic shared by all requests of a broker.
+
+    The topic with a single partition is created by the first request and
+    consumed by a long-lived consumer, which resolves pending requests by
+    the `correlation_id` header of responses, so it should be unique between
+    the requests in flight. The topic is deleted on stop, so only topics of
+    crashed processes are left behind.
+    """
+
+    topic_prefix = "faststream-reply-"
+
+    def __init__(
+        self,
+        *,
+        replication_factor: int = 1,
+        max_in_flight: int = 1024,
+    ) -> None:
+        self.topic = f"{self.topic_prefix}{NUID().next().decode()}"
+        self.replication_factor = replication_factor
+        self.max_in_flight = max_in_flight
+
+        self._futures: dict[str, asyncio.Future[MsgType]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._topic_created = False
+
+        self._lock: anyio.Lock | None = None
+        self._limiter: anyio.Semaphore | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._futures)
+
+    async def start(self) -> None:
+        if self._reader is not None and not self._reader.done():
+            return
+
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if self._reader is not None and not self._reader.done():
+                return
+
+            if not self._topic_created:
+                await self._create_topic()
+                self._topic_created = True
+
+            consumer = await self._start_consumer()
+            self._reader = asyncio.create_task(self._read_responses(consumer))
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+        if self._topic_created:
+            with suppress(Exception):
+                await self._delete_topic()
+            self._topic_created = False
+
+    @asynccontextmanager
+    async def wait_response(
+        self,
+        correlation_id: str,
+    ) -> AsyncIterator["asyncio.Future[MsgType]"]:
+        """Reserve a future for the response with the `correlation_id`."""
+        if self._limiter is None:
+            self._limiter = anyio.Semaphore(self.max_in_flight)
+
+        async with self._limiter:
+            if correlation_id in self._futures:
+                msg = f"Request with `correlation_id={correlation_id}` is already waiting for a response."
+                raise IncorrectState(msg)
+
+            future: asyncio.Future[MsgType] = asyncio.get_running_loop().create_future()
+
+            self._futures[correlation_id] = future
+            try:
+                yield future
+            finally:
+                self._futures.pop(correlation_id, None)
+
+    @abstractmethod
+    async def _create_topic(self) -> None: ...
+
+    @abstractmethod
+    async def _delete_topic(self) -> None: ...
+
+    @abstractmethod
+    async def _start_consumer(self) -> ReplyConsumerProto[MsgType]:
+        """Start a consumer of the reply topic from its beginning."""
+        ...
+
+    @abstractmethod
+    def _get_correlation_id(self, msg: MsgType) -> str | None: ...
+
+    async def _read_responses(self, consumer: ReplyConsumerProto[MsgType]) -> None:
+        try:
+            while True:
+                msg = await consumer.getone()
+                if msg is None:
+                    continue
+
+                correlation_id = self._get_correlation_id(msg)
+                if correlation_id is None:
+                    continue
+
+                future = self._futures.get(correlation_id)
+                if future is not None and not future.done():
+                    future.set_result(msg)
+
+        except Exception as e:
+            # wake up waiting requests, the next one restarts the inbox
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(e)
+
+        finally:
+            with suppress(Exception):
+                await consumer.stop()
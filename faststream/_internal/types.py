@@ -1,4 +1,4 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -41,6 +41,9 @@ PublishCommandType_contra = TypeVar313(
 SyncFilter: TypeAlias = Callable[[StreamMsg], bool]
 AsyncFilter: TypeAlias = Callable[[StreamMsg], Awaitable[bool]]
 Filter: TypeAlias = SyncFilter[StreamMsg] | AsyncFilter[StreamMsg]
+SyncFilterKey: TypeAlias = Callable[[StreamMsg], Hashable]
+AsyncFilterKey: TypeAlias = Callable[[StreamMsg], Awaitable[Hashable]]
+FilterKey: TypeAlias = SyncFilterKey[StreamMsg] | AsyncFilterKey[StreamMsg]
 
 SyncCallable: TypeAlias = Callable[
     [Any],
@@ -47,6 +47,8 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+    from faststream._internal.logger import LogQueue
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
@@ -94,8 +96,13 @@ class KafkaBroker(
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # request args
+        reply_topic_replication_factor: int = 1,
+        reply_max_in_flight: int = 1024,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        start_concurrency: int = 1,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
@@ -113,6 +120,7 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue: Optional["LogQueue"] = None,
         # FastDepends args
         apply_types: bool = True,
         provider: Optional["Provider"] = None,
@@ -202,7 +210,11 @@ class KafkaBroker(
                 explicitly set by the user it will be chosen.
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
+            reply_topic_replication_factor: Replication factor of the per-process `faststream-reply-<id>` topic created by the first `request` call.
+            reply_max_in_flight: Maximum number of requests waiting for responses in the reply topic at the same time. The next requests wait for a free slot.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            start_concurrency: Number of subscribers started or stopped concurrently.
+            executor: Executor to run sync handlers, filters, parsers and decoders of all subscribers.
             ack_policy: Default acknowledgement policy for all subscribers. Individual subscribers can override.
             decoder: Custom decoder object.
             codec: Custom codec object.
@@ -218,6 +230,7 @@ class KafkaBroker(
             tags: AsyncAPI server tags.
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue: Queue to emit logs from a background thread and sample per-message logs.
             apply_types: Whether to use FastDepends or not.
             serializer: Serializer for FastDepends.
             provider: Provider for FastDepends.
@@ -269,6 +282,8 @@ class KafkaBroker(
             config=KafkaBrokerConfig(
                 connection_config=connection_config,
                 client_id=client_id,
+                reply_topic_replication_factor=reply_topic_replication_factor,
+                reply_max_in_flight=reply_max_in_flight,
                 producer=AsyncConfluentFastProducerImpl(
                     parser=parser,
                     decoder=decoder,
@@ -281,6 +296,7 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    log_queue=log_queue,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -290,6 +306,8 @@ class KafkaBroker(
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
+                start_concurrency=start_concurrency,
+                executor=executor,
                 ack_policy=ack_policy,
                 broker_dependencies=dependencies,
                 extra_context={
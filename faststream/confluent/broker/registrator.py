@@ -14,6 +14,10 @@ from typing_extensions import override
 
 from faststream._internal.broker.registrator import Registrator
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.confluent.configs import KafkaBrokerConfig
 from faststream.confluent.publisher.factory import create_publisher
 from faststream.confluent.subscriber.factory import create_subscriber
@@ -23,10 +27,12 @@ from faststream.middlewares import AckPolicy
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.confluent.publisher.usecase import (
         BatchPublisher,
@@ -74,12 +80,15 @@ class KafkaRegistrator(
         on_lost: Callable[..., None] | None = None,
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
@@ -118,12 +127,15 @@ class KafkaRegistrator(
         on_lost: Callable[..., None] | None = None,
         batch: Literal[True] = ...,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
@@ -162,13 +174,16 @@ class KafkaRegistrator(
         on_lost: Callable[..., None] | None = None,
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = ...,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -206,13 +221,16 @@ class KafkaRegistrator(
         on_lost: Callable[..., None] | None = None,
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int | None = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -254,19 +272,22 @@ class KafkaRegistrator(
         on_lost: Callable[..., None] | None = None,
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         persistent: bool = True,
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
     ) -> Union[
         "DefaultSubscriber",
         "BatchSubscriber",
@@ -381,6 +402,8 @@ class KafkaRegistrator(
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch in background and keep in a
+                local buffer. `None` means to fetch messages on demand.
             on_assign: Callback called when partitions are assigned to the consumer
                 during a rebalance. Receives ``(consumer, partitions)`` arguments.
             on_revoke: Callback called when partitions are revoked from the consumer
@@ -391,6 +414,10 @@ class KafkaRegistrator(
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
             codec: Custom codec object.
+            filter_key: Function to get a message key to select handlers
+                registered with the same `key`.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
@@ -433,6 +460,7 @@ class KafkaRegistrator(
                 "on_assign": on_assign,
                 "on_revoke": on_revoke,
                 "on_lost": on_lost,
+                "prefetch": prefetch,
             },
             ack_policy=ack_policy,
             no_reply=no_reply,
@@ -445,7 +473,7 @@ class KafkaRegistrator(
 
         if batch:
             subscriber = cast("BatchSubscriber", subscriber)
-        elif workers > 1:
+        elif workers_limit(workers) > 1:
             subscriber = cast("ConcurrentDefaultSubscriber", subscriber)
         else:
             subscriber = cast("DefaultSubscriber", subscriber)
@@ -456,6 +484,8 @@ class KafkaRegistrator(
             parser_=parser or self._parser,
             decoder_=decoder or self._decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
@@ -7,6 +7,7 @@ from faststream._internal.broker.router import (
     SubscriberRoute,
 )
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.confluent.configs import KafkaBrokerConfig
 from faststream.middlewares import AckPolicy
 
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -118,17 +120,19 @@ class KafkaRoute(SubscriberRoute):
         on_lost: Callable[..., None] | None = None,
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI args
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -241,12 +245,16 @@ class KafkaRoute(SubscriberRoute):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch in background and keep in a
+                local buffer. `None` means to fetch messages on demand.
             on_assign: Callback called when partitions are assigned to the consumer.
             on_revoke: Callback called when partitions are revoked from the consumer.
             on_lost: Callback called when partitions are lost.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy.
@@ -282,11 +290,13 @@ class KafkaRoute(SubscriberRoute):
             on_revoke=on_revoke,
             on_lost=on_lost,
             max_records=max_records,
+            prefetch=prefetch,
             batch=batch,
             # basic args
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             no_reply=no_reply,
             # AsyncAPI args
             title=title,
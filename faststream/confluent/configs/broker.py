@@ -11,6 +11,7 @@ from faststream.confluent.helpers import (
     AsyncConfluentProducer,
     ConfluentFastConfig,
 )
+from faststream.confluent.publisher.inbox import ReplyInbox
 from faststream.confluent.publisher.producer import (
     AsyncConfluentFastProducer,
     FakeConfluentFastProducer,
@@ -44,6 +45,8 @@ class KafkaBrokerConfig(BrokerConfig):
 
     admin: "AdminService" = field(default_factory=AdminService)
     client_id: str | None = SERVICE_NAME
+    reply_topic_replication_factor: int = 1
+    reply_max_in_flight: int = 1024
 
     builder: Callable[..., AsyncConfluentConsumer] = field(init=False)
     producer: "AsyncConfluentFastProducer" = field(
@@ -58,6 +61,11 @@ class KafkaBrokerConfig(BrokerConfig):
         )
 
     async def connect(self) -> "None":
+        await self.admin.connect(
+            self.connection_config,
+            logger=self.logger,
+        )
+
         native_producer = AsyncConfluentProducer(
             config=self.connection_config,
             logger=self.logger,
@@ -66,12 +74,15 @@ class KafkaBrokerConfig(BrokerConfig):
             native_producer,
             serializer=self.fd_config._serializer,
             codec=self.broker_codec or DefaultCodec(),
-        )
-        await self.admin.connect(
-            self.connection_config,
-            logger=self.logger,
+            inbox=ReplyInbox(
+                self.builder,
+                self.admin,
+                replication_factor=self.reply_topic_replication_factor,
+                max_in_flight=self.reply_max_in_flight,
+            ),
         )
 
     async def disconnect(self) -> "None":
+        # producer first to let it clean up the reply topic
         await self.producer.disconnect()
         await self.admin.disconnect()
@@ -22,6 +22,10 @@ from typing_extensions import override
 from faststream.__about__ import SERVICE_NAME
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream._internal.fastapi.router import StreamRouter
 from faststream.confluent.broker import KafkaBroker as KB
 from faststream.middlewares import AckPolicy
@@ -34,6 +38,7 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -88,6 +93,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        reply_topic_replication_factor: int = 1,
+        reply_max_in_flight: int = 1024,
         # broker base args
         graceful_timeout: float | None = 15.0,
         decoder: Optional["CustomCallable"] = None,
@@ -212,6 +219,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
                 explicitly set by the user it will be chosen.
             transactional_id: Transactional ID for the producer.
             transaction_timeout_ms: Transaction timeout in milliseconds.
+            reply_topic_replication_factor: Replication factor of the per-process `faststream-reply-<id>` topic created by the first `request` call.
+            reply_max_in_flight: Maximum number of requests waiting for responses in the reply topic at the same time. The next requests wait for a free slot.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
             decoder: Custom decoder object.
             parser: Custom parser object.
@@ -357,6 +366,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             enable_idempotence=enable_idempotence,
             transactional_id=transactional_id,
             transaction_timeout_ms=transaction_timeout_ms,
+            reply_topic_replication_factor=reply_topic_replication_factor,
+            reply_max_in_flight=reply_max_in_flight,
             # broker args
             graceful_timeout=graceful_timeout,
             decoder=decoder,
@@ -425,10 +436,12 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         on_lost: Callable[..., None] | None = None,
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
@@ -475,11 +488,13 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         on_lost: Callable[..., None] | None = None,
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int = ...,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -525,10 +540,12 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         on_lost: Callable[..., None] | None = None,
         batch: Literal[True] = ...,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
         # Specification args
         title: str | None = None,
@@ -573,11 +590,13 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         on_lost: Callable[..., None] | None = None,
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int | None = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -627,11 +646,13 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         on_lost: Callable[..., None] | None = None,
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int | None = None,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int | None = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -756,6 +777,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch in background and keep in a
+                local buffer. `None` means to fetch messages on demand.
             on_assign: Callback called when partitions are assigned to the consumer
                 during a rebalance. Receives ``(consumer, partitions)`` arguments.
             on_revoke: Callback called when partitions are revoked from the consumer
@@ -765,6 +788,8 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
@@ -878,10 +903,12 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             on_lost=on_lost,
             batch=batch,
             max_records=max_records,
+            prefetch=prefetch,
             # broker args
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             ack_policy=ack_policy,
             no_reply=no_reply,
             title=title,
@@ -901,7 +928,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
 
         if batch:
             return cast("BatchSubscriber", subscriber)
-        if workers > 1:
+        if workers_limit(workers) > 1:
             return cast("ConcurrentDefaultSubscriber", subscriber)
         return cast("DefaultSubscriber", subscriber)
 
@@ -49,10 +49,16 @@ class AdminService:
         )
         return self.admin_client
 
-    def create_topics(self, topics: list[str]) -> list[CreateResult]:
-        create_result = self.client.create_topics(
-            [NewTopic(topic, num_partitions=1, replication_factor=1) for topic in topics],
-        )
+    def create_topics(
+        self,
+        topics: list[str],
+        *,
+        replication_factor: int = 1,
+    ) -> list[CreateResult]:
+        create_result = self.client.create_topics([
+            NewTopic(topic, num_partitions=1, replication_factor=replication_factor)
+            for topic in topics
+        ])
 
         final_results = []
         for topic, f in create_result.items():
@@ -71,3 +77,7 @@ class AdminService:
             final_results.append(result)
 
         return final_results
+
+    def delete_topics(self, topics: list[str]) -> None:
+        for f in self.client.delete_topics(topics).values():
+            f.result()
@@ -1,10 +1,13 @@
 import asyncio
 import logging
+import threading
+from collections import deque
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from functools import partial
 from time import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 import anyio
 from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer
@@ -16,20 +19,10 @@ from faststream.exceptions import SetupError
 from . import config as config_module
 
 if TYPE_CHECKING:
-    from typing_extensions import NotRequired, TypedDict
-
     from faststream._internal.logger import LoggerState
 
     from .admin import AdminService
 
-    class _SendKwargs(TypedDict):
-        value: bytes | str | None
-        key: bytes | str | None
-        headers: list[tuple[str, str | bytes]] | None
-        partition: NotRequired[int]
-        timestamp: NotRequired[int]
-        on_delivery: NotRequired[Callable[..., None]]
-
 
 class _LazyLoggerProxy(logging.Logger):
     """A logger proxy that lazily delegates to LoggerState.
@@ -67,24 +60,58 @@ class AsyncConfluentProducer:
             logger=_LazyLoggerProxy(logger),
         )
 
+        self._loop = asyncio.get_running_loop()
+        self._reports: list[_DeliveryReport] = []
+        self._reports_lock = threading.Lock()
+
         self.__running = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        # delivery callbacks are called by `poll` in this thread
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            name="faststream-confluent-producer-poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
 
-    async def _poll_loop(self) -> None:
+    def _poll_loop(self) -> None:
         while self.__running:
             with suppress(Exception):
-                await call_or_await(self.producer.poll, 0.1)
+                self.producer.poll(0.1)
+
+            # resolve all reports of the poll call by a single loop callback
+            if reports := self._take_reports():
+                with suppress(RuntimeError):  # loop is closed
+                    self._loop.call_soon_threadsafe(_resolve_reports, reports)
+
+    def _take_reports(self) -> list["_DeliveryReport"]:
+        with self._reports_lock:
+            reports, self._reports = self._reports, []
+        return reports
+
+    def _on_delivery(
+        self,
+        waiter: "asyncio.Future[Message | None] | _BatchDelivery",
+        err: Any,
+        msg: Message | None,
+    ) -> None:
+        if not err and msg is not None:
+            err = msg.error()
+
+        with self._reports_lock:
+            self._reports.append((waiter, err, msg))
 
     async def stop(self) -> None:
         """Stop the Kafka producer and flush remaining messages."""
         if self.__running:
             self.__running = False
-            if not self._poll_task.done():
-                self._poll_task.cancel()
             await call_or_await(self.producer.flush)
+            await call_or_await(self._poll_thread.join)
+            _resolve_reports(self._take_reports())
 
     async def flush(self) -> None:
         await call_or_await(self.producer.flush)
+        # `flush` calls delivery callbacks in its own thread
+        _resolve_reports(self._take_reports())
 
     async def send(
         self,
@@ -97,63 +124,47 @@ class AsyncConfluentProducer:
         no_confirm: bool = False,
     ) -> "asyncio.Future[Message | None] | Message | None":
         """Sends a single message to a Kafka topic."""
-        kwargs: _SendKwargs = {
-            "value": value,
-            "key": key,
-            "headers": headers,
-        }
+        result_future: asyncio.Future[Message | None] = self._loop.create_future()
 
-        if partition is not None:
-            kwargs["partition"] = partition
-
-        if timestamp_ms is not None:
-            kwargs["timestamp"] = timestamp_ms
-
-        loop = asyncio.get_running_loop()
-        result_future: asyncio.Future[Message | None] = loop.create_future()
-
-        def ack_callback(err: Any, msg: Message | None) -> None:
-            if err or (msg is not None and (err := msg.error())):
-                loop.call_soon_threadsafe(
-                    result_future.set_exception,
-                    KafkaException(err),
-                )
-            else:
-                loop.call_soon_threadsafe(result_future.set_result, msg)
+        self._produce(
+            topic,
+            value=value,
+            key=key,
+            partition=partition,
+            timestamp_ms=timestamp_ms,
+            headers=headers,
+            on_delivery=partial(self._on_delivery, result_future),
+        )
 
-        kwargs["on_delivery"] = ack_callback
+        if no_confirm:
+            return result_future
+        return await result_future
 
+    def _produce(
+        self,
+        topic: str,
+        *,
+        value: bytes | str | None,
+        key: bytes | str | None,
+        partition: int | None,
+        timestamp_ms: int | None,
+        headers: list[tuple[str, str | bytes]] | None,
+        on_delivery: Callable[[Any, Message | None], None],
+    ) -> None:
         # should be sync to prevent segfault
         # confluent stub expects bytes|None for value/key; we accept str and encode
-        produce_value: bytes | None = (
-            kwargs["value"]
-            if isinstance(kwargs["value"], (bytes, type(None)))
-            else kwargs["value"].encode()
-        )
-        produce_key: bytes | None = (
-            kwargs["key"]
-            if isinstance(kwargs["key"], (bytes, type(None)))
-            else (kwargs["key"].encode() if kwargs["key"] is not None else None)
-        )
-        produce_headers: (
-            dict[str, str | bytes | None] | list[tuple[str, str | bytes | None]] | None
-        ) = cast("Any", kwargs["headers"]) if kwargs.get("headers") is not None else None
         produce_kwargs: dict[str, Any] = {
-            "value": produce_value,
-            "key": produce_key,
-            "headers": produce_headers,
-            "on_delivery": kwargs["on_delivery"],
+            "value": value.encode() if isinstance(value, str) else value,
+            "key": key.encode() if isinstance(key, str) else key,
+            "headers": headers,
+            "on_delivery": on_delivery,
         }
-        if kwargs.get("partition") is not None:
-            produce_kwargs["partition"] = kwargs["partition"]
-        if kwargs.get("timestamp") is not None:
-            produce_kwargs["timestamp"] = kwargs["timestamp"]
+        if partition is not None:
+            produce_kwargs["partition"] = partition
+        if timestamp_ms is not None:
+            produce_kwargs["timestamp"] = timestamp_ms
         self.producer.produce(topic, **produce_kwargs)
 
-        if no_confirm:
-            return result_future
-        return await result_future
-
     def create_batch(self) -> "BatchBuilder":
         """Creates a batch for sending multiple messages."""
         return BatchBuilder()
@@ -167,18 +178,25 @@ class AsyncConfluentProducer:
         no_confirm: bool = False,
     ) -> None:
         """Sends a batch of messages to a Kafka topic."""
-        async with anyio.create_task_group() as tg:
-            for msg in batch._builder:
-                tg.start_soon(
-                    self.send,
-                    topic,
-                    msg["value"],
-                    msg["key"],
-                    partition,
-                    msg["timestamp_ms"],
-                    msg["headers"],
-                    no_confirm,
-                )
+        if not batch._builder:
+            return
+
+        delivery = _BatchDelivery(self._loop.create_future(), len(batch._builder))
+        on_delivery = partial(self._on_delivery, delivery)
+
+        for msg in batch._builder:
+            self._produce(
+                topic,
+                value=msg["value"],
+                key=msg["key"],
+                partition=partition,
+                timestamp_ms=msg["timestamp_ms"],
+                headers=msg["headers"],
+                on_delivery=on_delivery,
+            )
+
+        if not no_confirm:
+            await delivery.future
 
     async def ping(
         self,
@@ -203,6 +221,8 @@ class AsyncConfluentProducer:
 class AsyncConfluentConsumer:
     """An asynchronous Python Kafka client for consuming messages using the "confluent-kafka" package."""
 
+    fetch_timeout = 0.1
+
     def __init__(
         self,
         *topics: str,
@@ -238,6 +258,8 @@ class AsyncConfluentConsumer:
         on_assign: Callable[..., None] | None = None,
         on_revoke: Callable[..., None] | None = None,
         on_lost: Callable[..., None] | None = None,
+        # prefetch options
+        prefetch: int | None = None,
     ) -> None:
         self.admin_client = admin_service
         self.logger_state = logger
@@ -290,6 +312,19 @@ class AsyncConfluentConsumer:
         # https://github.com/ag2ai/faststream/issues/1904#issuecomment-2506990895
         self._thread_pool = ThreadPoolExecutor(max_workers=1)
 
+        self._prefetch = prefetch
+        self._buffer: deque[Message] = deque()
+        # rebalance callbacks drop revoked partitions from the consumer thread
+        self._buffer_lock = threading.Lock()
+        # next offsets of messages returned to the caller - commit them only,
+        # not the consumer positions which include the prefetched messages
+        self._delivered: dict[tuple[str, int], int] = {}
+        self._fetched: asyncio.Event | None = None
+        self._fetch_error: Exception | None = None
+        # assigned partitions are paused while the buffer is full
+        self._paused = False
+        self._fetch_task: asyncio.Task[None] | None = None
+
     @property
     def topics_to_create(self) -> list[str]:
         return list({*self.topics, *(p.topic for p in self.partitions)})
@@ -317,13 +352,23 @@ class AsyncConfluentConsumer:
             )
 
         if self.topics:
+            on_assign, on_revoke, on_lost = (
+                self._on_assign,
+                self._on_revoke,
+                self._on_lost,
+            )
+            if self._prefetch is not None:
+                on_assign = partial(self._pause_assigned, on_assign)
+                on_revoke = partial(self._forget_partitions, on_revoke)
+                on_lost = partial(self._forget_partitions, on_lost)
+
             subscribe_kwargs: dict[str, Any] = {"topics": self.topics}
-            if self._on_assign is not None:
-                subscribe_kwargs["on_assign"] = self._on_assign
-            if self._on_revoke is not None:
-                subscribe_kwargs["on_revoke"] = self._on_revoke
-            if self._on_lost is not None:
-                subscribe_kwargs["on_lost"] = self._on_lost
+            if on_assign is not None:
+                subscribe_kwargs["on_assign"] = on_assign
+            if on_revoke is not None:
+                subscribe_kwargs["on_revoke"] = on_revoke
+            if on_lost is not None:
+                subscribe_kwargs["on_lost"] = on_lost
             await run_in_executor(
                 self._thread_pool,
                 self.consumer.subscribe,
@@ -341,8 +386,28 @@ class AsyncConfluentConsumer:
             msg = "You must provide either `topics` or `partitions` option."
             raise SetupError(msg)
 
+        if self._prefetch is not None:
+            self._fetched = asyncio.Event()
+            self._fetch_task = asyncio.create_task(self._fetch_messages())
+
     async def commit(self, asynchronous: bool = True) -> None:
         """Commits the offsets of all messages returned by the last poll operation."""
+        if self._prefetch is not None:
+            with self._buffer_lock:
+                offsets = [
+                    TopicPartition(topic, partition, offset).to_confluent()
+                    for (topic, partition), offset in self._delivered.items()
+                ]
+            if offsets:
+                await run_in_executor(
+                    self._thread_pool,
+                    lambda: self.consumer.commit(  # type: ignore[call-overload]
+                        offsets=offsets,
+                        asynchronous=asynchronous,
+                    ),
+                )
+            return
+
         await run_in_executor(
             self._thread_pool,
             lambda: self.consumer.commit(asynchronous=asynchronous),  # type: ignore[call-overload]
@@ -350,6 +415,13 @@ class AsyncConfluentConsumer:
 
     async def stop(self) -> None:
         """Stops the Kafka consumer and releases all resources."""
+        if self._fetch_task is not None:
+            self._fetch_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._fetch_task
+            self._fetch_task = None
+            self._buffer.clear()
+
         # NOTE: If we don't explicitly call commit and then close the consumer, the confluent consumer gets stuck.
         # We are doing this to avoid the issue.
         enable_auto_commit = self.config.get("enable.auto.commit", True)
@@ -380,6 +452,11 @@ class AsyncConfluentConsumer:
 
     async def getone(self, timeout: float = 0.1) -> Message | None:
         """Consumes a single message from Kafka."""
+        if self._prefetch is not None:
+            if not self._buffer:
+                await self._wait_fetched(timeout)
+            return self._deliver(1)[0] if self._buffer else None
+
         msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
         return check_msg_error(msg)
 
@@ -389,6 +466,11 @@ class AsyncConfluentConsumer:
         max_records: int | None = 10,
     ) -> tuple[Message, ...]:
         """Consumes a batch of messages from Kafka and groups them by topic and partition."""
+        if self._prefetch is not None:
+            if not self._buffer:
+                await self._wait_fetched(timeout)
+            return self._deliver(max_records or 10)
+
         raw_messages: list[Message | None] = await run_in_executor(
             self._thread_pool,
             cast(
@@ -414,6 +496,171 @@ class AsyncConfluentConsumer:
             topic_partition.to_confluent(),
         )
 
+        if self._prefetch is not None:
+            # drop messages fetched before the seek
+            with self._buffer_lock:
+                self._buffer = deque(
+                    m
+                    for m in self._buffer
+                    if (m.topic(), m.partition()) != (topic, partition)
+                )
+                self._delivered[topic, partition] = offset
+
+    def _forget_partitions(
+        self,
+        callback: Callable[..., None] | None,
+        consumer: Consumer,
+        partitions: list[Any],
+    ) -> None:
+        """Drop prefetched messages and delivered offsets of revoked partitions.
+
+        Called in the consumer thread before the user rebalance callback, so
+        messages of the revoked partitions are neither processed nor committed
+        by this consumer anymore.
+        """
+        revoked = {(p.topic, p.partition) for p in partitions}
+
+        with self._buffer_lock:
+            self._buffer = deque(
+                m for m in self._buffer if (m.topic(), m.partition()) not in revoked
+            )
+            for key in revoked:
+                self._delivered.pop(key, None)
+
+        if callback is not None:
+            callback(consumer, partitions)
+
+    def _pause_assigned(
+        self,
+        callback: Callable[..., None] | None,
+        consumer: Consumer,
+        partitions: list[Any],
+    ) -> None:
+        """Pause partitions assigned while the buffer is full.
+
+        Called in the consumer thread. Partitions are assigned here unless the
+        user callback did it, so the automatic assignment after the callback
+        does not start fetching them.
+        """
+        if callback is not None:
+            callback(consumer, partitions)
+
+        if not self._paused or not partitions:
+            return
+
+        assigned = {(p.topic, p.partition) for p in consumer.assignment()}
+        if any((p.topic, p.partition) not in assigned for p in partitions):
+            if "cooperative" in str(self.config.get("partition.assignment.strategy")):
+                consumer.incremental_assign(partitions)
+            else:
+                consumer.assign(partitions)
+
+        consumer.pause(partitions)
+
+    def _consume(self, free: int) -> list[Message]:
+        """Consume up to `free` messages in the consumer thread.
+
+        With a full buffer it is still called to serve the consumer callbacks.
+        Messages of partitions not paused yet are not returned then: such
+        partitions are paused and rewound to be fetched again after resume.
+        """
+        raw_messages: list[Message] = self.consumer.consume(
+            num_messages=max(free, 1),
+            timeout=self.fetch_timeout,
+        )
+
+        if free > 0 or not raw_messages:
+            return raw_messages
+
+        rewind: dict[tuple[str, int], int] = {}
+        for msg in raw_messages:
+            topic, partition, offset = msg.topic(), msg.partition(), msg.offset()
+            if topic is not None and partition is not None and offset is not None:
+                rewind.setdefault((topic, partition), offset)
+
+        partitions = [
+            TopicPartition(topic, partition, offset).to_confluent()
+            for (topic, partition), offset in rewind.items()
+        ]
+        if partitions:
+            self.consumer.pause(partitions)
+            for tp in partitions:
+                self.consumer.seek(tp)
+
+        return []
+
+    async def _fetch_messages(self) -> None:
+        """Fill the buffer by batches in the consumer thread.
+
+        All assigned partitions are paused while the buffer is full, but
+        `consume` is still called to serve the consumer callbacks and to not
+        exceed `max.poll.interval.ms`. Partitions are resumed when the buffer
+        is drained to the half.
+        """
+        assert self._prefetch
+        assert self._fetched
+
+        while True:
+            free = self._prefetch - len(self._buffer)
+
+            try:
+                if free <= 0 and not self._paused:
+                    self._paused = True
+                    await run_in_executor(
+                        self._thread_pool,
+                        lambda: self.consumer.pause(self.consumer.assignment()),
+                    )
+
+                elif self._paused and len(self._buffer) <= self._prefetch // 2:
+                    self._paused = False
+                    # the assignment could be changed by a rebalance
+                    await run_in_executor(
+                        self._thread_pool,
+                        lambda: self.consumer.resume(self.consumer.assignment()),
+                    )
+
+                raw_messages = await run_in_executor(
+                    self._thread_pool,
+                    self._consume,
+                    free,
+                )
+
+            except Exception as e:
+                # raised to the reader
+                self._fetch_error = e
+                self._fetched.set()
+                await anyio.sleep(self.fetch_timeout)
+                continue
+
+            with self._buffer_lock:
+                self._buffer.extend(
+                    x for x in map(check_msg_error, raw_messages) if x is not None
+                )
+            if self._buffer:
+                self._fetched.set()
+
+    async def _wait_fetched(self, timeout: float) -> None:
+        assert self._fetched
+
+        self._fetched.clear()
+        with anyio.move_on_after(timeout):
+            await self._fetched.wait()
+
+        if self._fetch_error is not None:
+            error, self._fetch_error = self._fetch_error, None
+            raise error
+
+    def _deliver(self, max_records: int) -> tuple[Message, ...]:
+        with self._buffer_lock:
+            messages = tuple(
+                self._buffer.popleft() for _ in range(min(max_records, len(self._buffer)))
+            )
+            for msg in messages:
+                topic, partition, offset = msg.topic(), msg.partition(), msg.offset()
+                if topic is not None and partition is not None and offset is not None:
+                    self._delivered[topic, partition] = offset + 1
+        return messages
+
 
 def check_msg_error(msg: Message | None) -> Message | None:
     """Checks for errors in the consumed message."""
@@ -423,6 +670,50 @@ def check_msg_error(msg: Message | None) -> Message | None:
     return msg
 
 
+_DeliveryReport: TypeAlias = tuple[
+    "asyncio.Future[Message | None] | _BatchDelivery",
+    Any,
+    Message | None,
+]
+
+
+class _BatchDelivery:
+    """Delivery result of all messages of a batch."""
+
+    __slots__ = ("future", "remaining")
+
+    def __init__(self, future: "asyncio.Future[None]", remaining: int) -> None:
+        self.future = future
+        self.remaining = remaining
+
+    def report(self, err: Any) -> None:
+        if self.future.done():
+            return
+
+        if err:
+            self.future.set_exception(KafkaException(err))
+            return
+
+        self.remaining -= 1
+        if not self.remaining:
+            self.future.set_result(None)
+
+
+def _resolve_reports(reports: list[_DeliveryReport]) -> None:
+    for waiter, err, msg in reports:
+        if isinstance(waiter, _BatchDelivery):
+            waiter.report(err)
+
+        elif waiter.done():
+            continue
+
+        elif err:
+            waiter.set_exception(KafkaException(err))
+
+        else:
+            waiter.set_result(msg)
+
+
 class BatchBuilder:
     """A helper class to build a batch of messages to send to Kafka."""
 
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, cast
 
-from faststream.message import StreamMessage, decode_message
+from faststream._internal.parser import mark_json_decoder
+from faststream.message import StreamMessage, decode_batch_message, decode_message
 
 from .message import FAKE_CONSUMER, KafkaMessage
 
@@ -88,6 +89,7 @@ class AsyncConfluentParser:
             is_manual=self.is_manual,
         )
 
+    @mark_json_decoder
     async def decode_message(
         self,
         msg: "StreamMessage[Message]",
@@ -99,8 +101,8 @@ class AsyncConfluentParser:
         self,
         msg: "StreamMessage[tuple[Message, ...]]",
     ) -> "DecodedMessage":
-        """Decode a batch of messages."""
-        return [decode_message(await self.parse_message(m)) for m in msg.raw_message]
+        """Decode a batch of messages by headers already parsed in `parse_batch`."""
+        return decode_batch_message(msg)
 
 
 def _parse_msg_headers(headers: "_HeadersInput") -> dict[str, str]:
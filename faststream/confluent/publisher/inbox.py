@@ -0,0 +1,64 @@
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, cast
+
+from confluent_kafka import OFFSET_BEGINNING
+
+from faststream._internal.reply_inbox import TopicReplyInbox
+from faststream._internal.utils.functions import run_in_executor
+from faststream.confluent.schemas import TopicPartition
+
+if TYPE_CHECKING:
+    from confluent_kafka import Message
+
+    from faststream.confluent.helpers import AdminService, AsyncConfluentConsumer
+
+
+class ReplyInbox(TopicReplyInbox["Message"]):
+    """`TopicReplyInbox` of `AsyncConfluentConsumer`."""
+
+    def __init__(
+        self,
+        builder: Callable[..., "AsyncConfluentConsumer"],
+        admin: "AdminService",
+        *,
+        replication_factor: int = 1,
+        max_in_flight: int = 1024,
+    ) -> None:
+        super().__init__(
+            replication_factor=replication_factor,
+            max_in_flight=max_in_flight,
+        )
+
+        self._builder = builder
+        self._admin = admin
+
+    async def _create_topic(self) -> None:
+        (result,) = await run_in_executor(
+            None,
+            partial(
+                self._admin.create_topics,
+                replication_factor=self.replication_factor,
+            ),
+            [self.topic],
+        )
+        if result.error is not None:
+            raise result.error
+
+    async def _delete_topic(self) -> None:
+        await run_in_executor(None, self._admin.delete_topics, [self.topic])
+
+    async def _start_consumer(self) -> "AsyncConfluentConsumer":
+        consumer = self._builder(
+            partitions=[TopicPartition(self.topic, 0, offset=OFFSET_BEGINNING)],
+            enable_auto_commit=False,
+        )
+        await consumer.start()
+        return consumer
+
+    def _get_correlation_id(self, msg: "Message") -> str | None:
+        headers = cast("list[tuple[str, bytes | None]]", msg.headers() or [])
+        return next(
+            (v.decode() for k, v in headers if k == "correlation_id" and v is not None),
+            None,
+        )
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
 
+import anyio
 from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
@@ -9,6 +10,7 @@ from faststream._internal.producer import ProducerProto
 from faststream.confluent.parser import AsyncConfluentParser
 from faststream.confluent.response import KafkaPublishCommand
 from faststream.exceptions import FeatureNotSupportedException
+from faststream.message import gen_cor_id
 
 from .state import EmptyProducerState, ProducerState, RealProducer
 
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
     from faststream._internal.types import CustomCallable
     from faststream.confluent.helpers.client import AsyncConfluentProducer
 
+    from .inbox import ReplyInbox
+
 
 class AsyncConfluentFastProducer(ProducerProto[KafkaPublishCommand]):
     """A class to represent Kafka producer."""
@@ -31,6 +35,7 @@ class AsyncConfluentFastProducer(ProducerProto[KafkaPublishCommand]):
         producer: "AsyncConfluentProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None: ...
 
     def __bool__(self) -> bool:
@@ -69,6 +74,7 @@ class FakeConfluentFastProducer(AsyncConfluentFastProducer):
         producer: "AsyncConfluentProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None:
         raise NotImplementedError
 
@@ -104,6 +110,7 @@ class AsyncConfluentFastProducerImpl(AsyncConfluentFastProducer):
         self._producer: ProducerState = EmptyProducerState()
         self.serializer: SerializerProto | None = None
         self.codec: CodecProto = DefaultCodec()
+        self._inbox: ReplyInbox | None = None
 
         # NOTE: register default parser to be compatible with request
         default = AsyncConfluentParser()
@@ -115,12 +122,18 @@ class AsyncConfluentFastProducerImpl(AsyncConfluentFastProducer):
         producer: "AsyncConfluentProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None:
         self._producer = RealProducer(producer)
         self.serializer = serializer
         self.codec = codec or DefaultCodec()
+        self._inbox = inbox
 
     async def disconnect(self) -> None:
+        if self._inbox is not None:
+            await self._inbox.stop()
+            self._inbox = None
+
         await self._producer.stop()
         self._producer = EmptyProducerState()
 
@@ -159,6 +172,23 @@ class AsyncConfluentFastProducerImpl(AsyncConfluentFastProducer):
             no_confirm=cmd.no_confirm,
         )
 
+    @override
+    async def request(self, cmd: "KafkaPublishCommand") -> "Message":
+        """Publish a message and wait for the response in the reply topic."""
+        if self._inbox is None:
+            msg = "Kafka `request` requires a connected broker with an admin client."
+            raise FeatureNotSupportedException(msg)
+
+        await self._inbox.start()
+
+        cmd.reply_to = self._inbox.topic
+        cmd.correlation_id = correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with anyio.fail_after(cmd.timeout):
+            async with self._inbox.wait_response(correlation_id) as response:
+                await self.publish(cmd)
+                return await response
+
     @override
     async def publish_batch(self, cmd: "KafkaPublishCommand") -> None:
         """Publish a batch of messages to a topic."""
@@ -4,6 +4,10 @@ from typing import TYPE_CHECKING, Any
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 
@@ -31,7 +35,7 @@ def create_subscriber(
     connection_data: dict[str, Any],
     # Subscriber args
     ack_policy: "AckPolicy",
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
     no_reply: bool,
     config: "KafkaBrokerConfig",
     # Specification args
@@ -45,6 +49,7 @@ def create_subscriber(
         partitions=partitions,
         ack_policy=ack_policy,
         max_workers=max_workers,
+        prefetch=connection_data.get("prefetch"),
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -79,7 +84,7 @@ def create_subscriber(
             max_records=max_records,
         )
 
-    if max_workers > 1:
+    if workers_limit(max_workers) > 1:
         return ConcurrentDefaultSubscriber(
             subscriber_config,
             specification,
@@ -93,9 +98,10 @@ def create_subscriber(
 def _validate_input_for_misconfigure(
     *topics: str,
     ack_policy: "AckPolicy",
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
     group_id: str | None,
     partitions: Iterable["TopicPartition"],
+    prefetch: int | None = None,
 ) -> None:
     effective_ack = AckPolicy.ACK_FIRST if ack_policy is EMPTY else ack_policy
     if effective_ack is AckPolicy.REJECT_ON_ERROR:
@@ -106,7 +112,7 @@ def _validate_input_for_misconfigure(
             stacklevel=4,
         )
 
-    if effective_ack is not AckPolicy.ACK_FIRST and max_workers > 1:
+    if effective_ack is not AckPolicy.ACK_FIRST and workers_limit(max_workers) > 1:
         msg = "Max workers not work with manual commit mode."
         raise SetupError(msg)
 
@@ -121,3 +127,7 @@ def _validate_input_for_misconfigure(
     if not group_id and effective_ack is not AckPolicy.ACK_FIRST:
         msg = "You must use `group_id` with manual commit mode."
         raise SetupError(msg)
+
+    if prefetch is not None and prefetch < 1:
+        msg = "`prefetch` should be greater than 0."
+        raise SetupError(msg)
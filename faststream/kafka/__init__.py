@@ -14,6 +14,7 @@ try:
 
     from .annotations import KafkaMessage
     from .broker import KafkaBroker, KafkaPublisher, KafkaRoute, KafkaRouter
+    from .publisher.producer import BatchRecordMetadata
     from .response import KafkaPublishCommand, KafkaPublishMessage, KafkaResponse
     from .testing import TestKafkaBroker
 
@@ -26,6 +27,7 @@ except ImportError as e:
     raise ImportError(INSTALL_FASTSTREAM_KAFKA) from e
 
 __all__ = (
+    "BatchRecordMetadata",
     "ConsumerRecord",
     "KafkaBroker",
     "KafkaMessage",
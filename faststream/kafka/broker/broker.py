@@ -9,6 +9,7 @@ from typing import (
     Optional,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -28,7 +29,10 @@ from faststream._internal.di import FastDependsConfig
 from faststream._internal.utils.data import filter_by_dict
 from faststream.exceptions import IncorrectState
 from faststream.kafka.configs import KafkaBrokerConfig
-from faststream.kafka.publisher.producer import AioKafkaFastProducerImpl
+from faststream.kafka.publisher.producer import (
+    AioKafkaFastProducerImpl,
+    BatchRecordMetadata,
+)
 from faststream.kafka.response import KafkaPublishCommand
 from faststream.kafka.schemas.params import ConsumerConnectionParams
 from faststream.kafka.security import parse_security
@@ -54,6 +58,8 @@ if TYPE_CHECKING:
         LoggerProto,
         SendableMessage,
     )
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+    from faststream._internal.logger import LogQueue
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
@@ -224,8 +230,13 @@ class KafkaBroker(
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # request args
+        reply_topic_replication_factor: int = 1,
+        reply_max_in_flight: int = 1024,
         # broker base args
         graceful_timeout: float | None = 15.0,
+        start_concurrency: int = 1,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
@@ -243,6 +254,7 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue: Optional["LogQueue"] = None,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -330,8 +342,16 @@ class KafkaBroker(
                 Transactional id for the producer.
             transaction_timeout_ms (int):
                 Transaction timeout in milliseconds.
+            reply_topic_replication_factor (int):
+                Replication factor of the per-process `faststream-reply-<id>` topic created by the first `request` call.
+            reply_max_in_flight (int):
+                Maximum number of requests waiting for responses in the reply topic at the same time. The next requests wait for a free slot.
             graceful_timeout (Optional[float]):
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            start_concurrency (int):
+                Number of subscribers started or stopped concurrently.
+            executor (Optional[SyncExecutor]):
+                Executor to run sync handlers, filters, parsers and decoders of all subscribers.
             ack_policy (AckPolicy):
                 Default acknowledgement policy for all subscribers. Individual subscribers can override.
                 If not set, each broker type uses its built-in default.
@@ -363,6 +383,8 @@ class KafkaBroker(
                 User specified logger to pass into Context and log service messages.
             log_level (int):
                 Service messages log level.
+            log_queue (Optional[LogQueue]):
+                Queue to emit logs from a background thread and sample per-message logs.
             apply_types (bool):
                 Whether to use FastDepends or not.
             serializer (Optional[SerializerProto]):
@@ -439,6 +461,8 @@ class KafkaBroker(
                 client_id=client_id,
                 client_rack=client_rack,
                 consumer_only=consumer_only,
+                reply_topic_replication_factor=reply_topic_replication_factor,
+                reply_max_in_flight=reply_max_in_flight,
                 builder=builder,
                 producer=AioKafkaFastProducerImpl(
                     parser=parser,
@@ -452,6 +476,7 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    log_queue=log_queue,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -461,6 +486,8 @@ class KafkaBroker(
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
+                start_concurrency=start_concurrency,
+                executor=executor,
                 ack_policy=ack_policy,
                 broker_dependencies=dependencies,
                 extra_context={
@@ -676,7 +703,7 @@ class KafkaBroker(
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: Literal[False] = False,
-    ) -> "RecordMetadata": ...
+    ) -> "BatchRecordMetadata": ...
 
     @overload
     async def publish_batch(
@@ -689,7 +716,7 @@ class KafkaBroker(
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: Literal[True] = ...,
-    ) -> "asyncio.Future[RecordMetadata]": ...
+    ) -> "asyncio.Future[BatchRecordMetadata]": ...
 
     @overload
     async def publish_batch(
@@ -702,7 +729,7 @@ class KafkaBroker(
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: bool = False,
-    ) -> asyncio.Future[RecordMetadata] | RecordMetadata: ...
+    ) -> asyncio.Future[BatchRecordMetadata] | BatchRecordMetadata: ...
 
     async def publish_batch(
         self,
@@ -714,8 +741,8 @@ class KafkaBroker(
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: bool = False,
-    ) -> asyncio.Future[RecordMetadata] | RecordMetadata:
-        """Publish a message batch as a single request to broker.
+    ) -> asyncio.Future[BatchRecordMetadata] | BatchRecordMetadata:
+        """Publish a message batch split into record batches by `max_batch_size`.
 
         Args:
             *messages:
@@ -739,8 +766,8 @@ class KafkaBroker(
                 Do not wait for Kafka publish confirmation.
 
         Returns:
-            `asyncio.Future[RecordMetadata]` if no_confirm = True.
-            `RecordMetadata` if no_confirm = False.
+            `asyncio.Future[BatchRecordMetadata]` if no_confirm = True.
+            `BatchRecordMetadata` if no_confirm = False.
         """
         cmd = KafkaPublishCommand(
             *messages,
@@ -754,7 +781,8 @@ class KafkaBroker(
             _publish_type=PublishType.PUBLISH,
         )
 
-        return await self._basic_publish_batch(cmd, producer=self.config.producer)
+        result = await self._basic_publish_batch(cmd, producer=self.config.producer)
+        return cast("asyncio.Future[BatchRecordMetadata] | BatchRecordMetadata", result)
 
     @override
     async def ping(self, timeout: float | None) -> bool:
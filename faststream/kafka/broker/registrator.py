@@ -15,6 +15,10 @@ from typing_extensions import override
 
 from faststream._internal.broker.registrator import Registrator
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.exceptions import SetupError
 from faststream.kafka.configs import KafkaBrokerConfig
 from faststream.kafka.publisher.factory import create_publisher
@@ -27,10 +31,12 @@ if TYPE_CHECKING:
     from aiokafka.coordinator.assignors.abstract import AbstractPartitionAssignor
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.kafka.publisher.usecase import (
         BatchPublisher,
@@ -40,6 +46,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentKeyOrderedSubscriber,
         DefaultSubscriber,
     )
 
@@ -93,7 +100,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -143,7 +153,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -193,7 +206,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = ...,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -243,7 +259,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = ...,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -293,7 +312,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int | None = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -305,6 +327,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyOrderedSubscriber",
     ]: ...
 
     @override
@@ -348,7 +371,10 @@ class KafkaRegistrator(
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int | None = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -360,6 +386,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyOrderedSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -547,8 +574,18 @@ class KafkaRegistrator(
             parser: Parser to map original **ConsumerRecord** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
             codec: Custom codec object.
+            filter_key: Function to get a message key to select handlers
+                registered with the same `key`.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordering:
+                Keep processing order for concurrent workers using a single consumer.
+                `key` runs records with the same key serially, `partition` - records
+                of the same partition. Requires `max_workers` greater than 1.
+                Offsets are committed per partition up to the lowest record
+                still in progress.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -563,6 +600,7 @@ class KafkaRegistrator(
             *topics,
             batch=batch,
             max_workers=workers,
+            ordering=ordering,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
             group_id=group_id,
@@ -608,13 +646,17 @@ class KafkaRegistrator(
             parser_=parser,
             decoder_=decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
         if batch:
             return cast("BatchSubscriber", subscriber)
 
-        if workers > 1:
+        if workers_limit(workers) > 1:
+            if ordering is not None:
+                return cast("ConcurrentKeyOrderedSubscriber", subscriber)
             if subscriber.ack_policy is AckPolicy.ACK_FIRST:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
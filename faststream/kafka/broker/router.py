@@ -15,6 +15,7 @@ from faststream._internal.broker.router import (
     SubscriberRoute,
 )
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.kafka.broker.registrator import KafkaRegistrator
 from faststream.kafka.configs import KafkaBrokerConfig
 from faststream.middlewares import AckPolicy
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -140,13 +142,15 @@ class KafkaRoute(SubscriberRoute):
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI args
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
+        ordering: Literal["key", "partition"] | None = None,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -331,6 +335,8 @@ class KafkaRoute(SubscriberRoute):
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **ConsumerRecord** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             ack_policy: AckPolicy = EMPTY,
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
             title: AsyncAPI subscriber object title.
@@ -339,12 +345,19 @@ class KafkaRoute(SubscriberRoute):
                 Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordering:
+                Keep processing order for concurrent workers using a single consumer.
+                `key` runs records with the same key serially, `partition` - records
+                of the same partition. Requires `max_workers` greater than 1.
+                Offsets are committed per partition up to the lowest record
+                still in progress.
         """
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            ordering=ordering,
             group_id=group_id,
             group_instance_id=group_instance_id,
             client_rack=client_rack,
@@ -376,6 +389,7 @@ class KafkaRoute(SubscriberRoute):
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             no_reply=no_reply,
             ack_policy=ack_policy,
             # AsyncAPI args
@@ -11,6 +11,7 @@ from faststream._internal.configs import BrokerConfig
 from faststream._internal.parser import DefaultCodec
 from faststream._internal.utils.data import filter_by_dict
 from faststream.exceptions import IncorrectState
+from faststream.kafka.publisher.inbox import ReplyInbox
 from faststream.kafka.publisher.producer import (
     AioKafkaFastProducer,
     FakeAioKafkaFastProducer,
@@ -29,6 +30,8 @@ class KafkaBrokerConfig(BrokerConfig):
     client_id: str | None = SERVICE_NAME
     client_rack: str | None = None
     consumer_only: bool = False
+    reply_topic_replication_factor: int = 1
+    reply_max_in_flight: int = 1024
 
     _admin_client: Optional["aiokafka.admin.client.AIOKafkaAdminClient"] = None
 
@@ -41,17 +44,20 @@ class KafkaBrokerConfig(BrokerConfig):
         return self._admin_client
 
     async def connect(self, **connection_kwargs: Any) -> "None":
+        consumer_options, _ = filter_by_dict(
+            ConsumerConnectionParams,
+            connection_kwargs,
+        )
+        # client_rack is consumer-only, so it is not part of connection_kwargs
+        # (which is also used to build the producer); inject it here when set.
+        if self.client_rack is not None:
+            consumer_options["client_rack"] = self.client_rack
+        self.builder = partial(aiokafka.AIOKafkaConsumer, **consumer_options)
+
         # In consumer-only mode the broker neither produces messages nor needs
         # admin permissions, so skip creating those clients to allow callers
         # to use credentials scoped to read-only ACLs.
         if not self.consumer_only:
-            producer = aiokafka.AIOKafkaProducer(**connection_kwargs)
-            await self.producer.connect(
-                producer,
-                serializer=self.fd_config._serializer,
-                codec=self.broker_codec or DefaultCodec(),
-            )
-
             admin_options, _ = filter_by_dict(
                 AdminClientConnectionParams,
                 connection_kwargs,
@@ -62,20 +68,24 @@ class KafkaBrokerConfig(BrokerConfig):
             )
             await self._admin_client.start()
 
-        consumer_options, _ = filter_by_dict(
-            ConsumerConnectionParams,
-            connection_kwargs,
-        )
-        # client_rack is consumer-only, so it is not part of connection_kwargs
-        # (which is also used to build the producer); inject it here when set.
-        if self.client_rack is not None:
-            consumer_options["client_rack"] = self.client_rack
-        self.builder = partial(aiokafka.AIOKafkaConsumer, **consumer_options)
+            producer = aiokafka.AIOKafkaProducer(**connection_kwargs)
+            await self.producer.connect(
+                producer,
+                serializer=self.fd_config._serializer,
+                codec=self.broker_codec or DefaultCodec(),
+                inbox=ReplyInbox(
+                    self.builder,
+                    self._admin_client,
+                    replication_factor=self.reply_topic_replication_factor,
+                    max_in_flight=self.reply_max_in_flight,
+                ),
+            )
 
     async def disconnect(self) -> "None":
+        # producer first to let it clean up the reply topic
+        if not self.consumer_only:
+            await self.producer.disconnect()
+
         if self._admin_client is not None:
             await self._admin_client.close()
             self._admin_client = None
-
-        if not self.consumer_only:
-            await self.producer.disconnect()
@@ -2,7 +2,10 @@ from faststream.exceptions import FastStreamException
 
 
 class BatchBufferOverflowException(FastStreamException):
-    """Exception raised when a buffer overflow occurs when adding a new message to the batches."""
+    """Exception raised when a buffer overflow occurs when adding a new message to the batches.
+
+    All messages are checked before publishing, so nothing is sent if it is raised.
+    """
 
     def __init__(self, message_position: int) -> None:
         self.message_position = message_position
@@ -10,5 +13,6 @@ class BatchBufferOverflowException(FastStreamException):
     def __str__(self) -> str:
         return (
             "The batch buffer is full. The position of the message"
-            f" in the transferred collection at which the overflow occurred: {self.message_position}"
+            f" in the transferred collection at which the overflow occurred: {self.message_position}."
+            " No messages were sent"
         )
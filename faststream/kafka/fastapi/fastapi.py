@@ -25,6 +25,10 @@ from typing_extensions import override
 from faststream.__about__ import SERVICE_NAME
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream._internal.fastapi.router import StreamRouter
 from faststream.kafka.broker.broker import KafkaBroker as KB
 from faststream.middlewares import AckPolicy
@@ -41,6 +45,7 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -53,6 +58,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentKeyOrderedSubscriber,
         DefaultSubscriber,
     )
     from faststream.security import BaseSecurity
@@ -97,6 +103,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         enable_idempotence: bool = False,
         transactional_id: str | None = None,
         transaction_timeout_ms: int = 60 * 1000,
+        reply_topic_replication_factor: int = 1,
+        reply_max_in_flight: int = 1024,
         # broker base args
         graceful_timeout: float | None = 15.0,
         decoder: Optional["CustomCallable"] = None,
@@ -235,6 +243,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             specification: Specification factory to use.
             transactional_id: Transactional ID to use.
             transaction_timeout_ms: Transaction timeout in milliseconds.
+            reply_topic_replication_factor: Replication factor of the per-process `faststream-reply-<id>` topic created by the first `request` call.
+            reply_max_in_flight: Maximum number of requests waiting for responses in the reply topic at the same time. The next requests wait for a free slot.
             loop: Event loop to use.
             sasl_kerberos_service_name: SASL Kerberos service name.
             sasl_kerberos_domain_name: SASL Kerberos domain name.
@@ -335,6 +345,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             enable_idempotence=enable_idempotence,
             transactional_id=transactional_id,
             transaction_timeout_ms=transaction_timeout_ms,
+            reply_topic_replication_factor=reply_topic_replication_factor,
+            reply_max_in_flight=reply_max_in_flight,
             # broker args
             graceful_timeout=graceful_timeout,
             decoder=decoder,
@@ -413,7 +425,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -469,7 +483,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         max_workers: None = None,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -525,7 +541,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int = ...,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -581,7 +599,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int = ...,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = ...,
+        ordering: None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -637,7 +657,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int | None = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -657,6 +679,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyOrderedSubscriber",
     ]: ...
 
     @override
@@ -698,7 +721,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int | None = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -718,6 +743,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyOrderedSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -904,8 +930,16 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **ConsumerRecord** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordering:
+                Keep processing order for concurrent workers using a single consumer.
+                `key` runs records with the same key serially, `partition` - records
+                of the same partition. Requires `max_workers` greater than 1.
+                Offsets are committed per partition up to the lowest record
+                still in progress.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -979,6 +1013,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             group_instance_id=group_instance_id,
             client_rack=client_rack,
             max_workers=max_workers,
+            ordering=ordering,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -1007,6 +1042,7 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             ack_policy=ack_policy,
             no_reply=no_reply,
             title=title,
@@ -1027,7 +1063,9 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         if batch:
             return cast("BatchSubscriber", subscriber)
 
-        if workers > 1:
+        if workers_limit(workers) > 1:
+            if ordering is not None:
+                return cast("ConcurrentKeyOrderedSubscriber", subscriber)
             if ack_policy is AckPolicy.ACK_FIRST:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
@@ -1,3 +1,9 @@
+from .offsets import OffsetTracker, RevokedOffsetsListener, TrackedConsumer
 from .rebalance_listener import make_logging_listener
 
-__all__ = ("make_logging_listener",)
+__all__ = (
+    "OffsetTracker",
+    "RevokedOffsetsListener",
+    "TrackedConsumer",
+    "make_logging_listener",
+)
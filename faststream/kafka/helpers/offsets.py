@@ -0,0 +1,188 @@
+from collections import defaultdict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Optional
+
+import anyio
+from aiokafka import ConsumerRebalanceListener, TopicPartition
+from aiokafka.errors import KafkaError
+
+from faststream._internal.utils.functions import call_or_await
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord
+
+
+class OffsetTracker:
+    """Tracks out-of-order processed records and commits contiguous offsets only.
+
+    Records of a partition may be processed in any order, but the committed
+    offset never moves past the lowest record which is still in flight.
+
+    A nack pauses the record partition and rewinds it only after all its
+    records being processed are finished. Records consumed after the nacked
+    one and not started yet are skipped, as the partition redelivers them.
+    Records already being processed are not stopped, so they are delivered
+    again after the rewind (at-least-once).
+    """
+
+    def __init__(self, consumer: "AIOKafkaConsumer") -> None:
+        self.consumer = consumer
+
+        self._pending: defaultdict[TopicPartition, dict[int, TrackedConsumer]] = (
+            defaultdict(dict)
+        )
+        self._highest: dict[TopicPartition, int] = {}
+        self._committed: dict[TopicPartition, int] = {}
+
+        # number of records being processed per partition
+        self._active: defaultdict[TopicPartition, int] = defaultdict(int)
+        # offsets to rewind partitions to after their active records are finished
+        self._rewinds: dict[TopicPartition, int] = {}
+
+        self._commit_lock = anyio.Lock()
+
+    def register(self, record: "ConsumerRecord") -> "TrackedConsumer":
+        """Mark record as in-flight and return a consumer proxy for its message."""
+        tp = TopicPartition(record.topic, record.partition)
+        tracked = self._pending[tp][record.offset] = TrackedConsumer(self, record)
+        self._highest[tp] = max(self._highest.get(tp, -1), record.offset)
+        # nothing before the first seen record is committed by this tracker
+        self._committed.setdefault(tp, record.offset)
+        return tracked
+
+    def start(self, tracked: "TrackedConsumer") -> bool:
+        """Mark record as being processed.
+
+        Returns `False` if the record should be skipped, because its partition
+        is rewound to an earlier offset.
+        """
+        record = tracked.record
+        tp = TopicPartition(record.topic, record.partition)
+
+        rewind = self._rewinds.get(tp)
+        if tracked.skipped or (rewind is not None and record.offset >= rewind):
+            return False
+
+        self._active[tp] += 1
+        return True
+
+    def finish(self, tracked: "TrackedConsumer") -> None:
+        """Mark record processing as finished and rewind its partition if requested."""
+        record = tracked.record
+        tp = TopicPartition(record.topic, record.partition)
+
+        if tp not in self._active:
+            # partition was revoked while the record was processed
+            return
+
+        self._active[tp] -= 1
+        if not self._active[tp]:
+            del self._active[tp]
+            self._rewind(tp)
+
+    def seek(self, tp: TopicPartition, offset: int) -> None:
+        """Rewind the partition after its active records are finished."""
+        self._rewinds[tp] = min(offset, self._rewinds.get(tp, offset))
+        # do not fetch records to be redelivered
+        self.consumer.pause(tp)
+
+        if tp not in self._active:
+            self._rewind(tp)
+
+    def _rewind(self, tp: TopicPartition) -> None:
+        if (offset := self._rewinds.pop(tp, None)) is None:
+            return
+
+        # the partition redelivers these records, so the consumed ones are skipped
+        for pending_offset, tracked in self._pending[tp].items():
+            if pending_offset >= offset:
+                tracked.skipped = True
+
+        self.consumer.seek(tp, offset)
+        self.consumer.resume(tp)
+
+    def committable(self, tp: TopicPartition) -> int | None:
+        """Return the offset safe to commit for the partition."""
+        if (highest := self._highest.get(tp)) is None:
+            return None
+
+        if pending := self._pending[tp]:
+            return min(pending)
+
+        return highest + 1
+
+    async def done(self, record: "ConsumerRecord") -> None:
+        """Mark record as processed and commit partition progress if it moved."""
+        tp = TopicPartition(record.topic, record.partition)
+        self._pending[tp].pop(record.offset, None)
+
+        async with self._commit_lock:
+            offset = self.committable(tp)
+            if offset is None or offset <= self._committed.get(tp, offset):
+                return
+
+            try:
+                await self.consumer.commit({tp: offset})
+            except KafkaError:
+                # partition was revoked by rebalance, new owner continues from
+                # the last committed offset
+                self.forget({tp})
+            else:
+                self._committed[tp] = offset
+
+    def forget(self, partitions: set[TopicPartition]) -> None:
+        """Drop the state of revoked partitions."""
+        for tp in partitions:
+            self._pending.pop(tp, None)
+            self._highest.pop(tp, None)
+            self._committed.pop(tp, None)
+            self._active.pop(tp, None)
+            self._rewinds.pop(tp, None)
+
+
+class RevokedOffsetsListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Drops the tracked offsets of revoked partitions before the user listener.
+
+    So progress of records consumed before reassignment is never committed
+    over the offsets of the partition new owner.
+    """
+
+    def __init__(
+        self,
+        get_tracker: Callable[[], OffsetTracker | None],
+        listener: Optional["ConsumerRebalanceListener"] = None,
+    ) -> None:
+        self.get_tracker = get_tracker
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        if (tracker := self.get_tracker()) is not None:
+            tracker.forget(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
+
+
+class TrackedConsumer:
+    """Per-record consumer proxy to acknowledge messages through `OffsetTracker`."""
+
+    __slots__ = ("nacked", "record", "skipped", "tracker")
+
+    def __init__(self, tracker: OffsetTracker, record: "ConsumerRecord") -> None:
+        self.tracker = tracker
+        self.record = record
+        self.nacked = False
+        # the record is redelivered by a partition rewind
+        self.skipped = False
+
+    async def commit(self) -> None:
+        await self.tracker.done(self.record)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        # keep record pending to prevent committing over it until redelivery
+        self.nacked = True
+        self.tracker.seek(partition, offset)
@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+from faststream._internal.parser import mark_json_decoder
 from faststream._internal.utils.path import match_path
 from faststream.kafka.message import (
     FAKE_CONSUMER,
@@ -7,7 +8,7 @@ from faststream.kafka.message import (
     KafkaMessage,
     KafkaRawMessage,
 )
-from faststream.message import decode_message
+from faststream.message import decode_batch_message, decode_message
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -53,6 +54,7 @@ class AioKafkaParser:
             consumer=getattr(message, "consumer", self._consumer),
         )
 
+    @mark_json_decoder
     async def decode_message(
         self,
         msg: "StreamMessage[ConsumerRecord]",
@@ -96,8 +98,5 @@ class AioKafkaBatchParser(AioKafkaParser):
         self,
         msg: "StreamMessage[tuple[ConsumerRecord, ...]]",
     ) -> "DecodedMessage":
-        """Decode a batch of messages."""
-        # super() should be here due python can't find it in comprehension
-        super_obj = cast("AioKafkaParser", super())
-
-        return [decode_message(await super_obj.parse_message(m)) for m in msg.raw_message]
+        """Decode a batch of messages by headers already parsed in `parse_batch`."""
+        return decode_batch_message(msg)
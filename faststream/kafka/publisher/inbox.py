@@ -0,0 +1,71 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from aiokafka import TopicPartition
+from aiokafka.admin import NewTopic
+from aiokafka.errors import TopicAlreadyExistsError, for_code
+
+from faststream._internal.reply_inbox import TopicReplyInbox
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord
+    from aiokafka.admin import AIOKafkaAdminClient
+
+
+class ReplyInbox(TopicReplyInbox["ConsumerRecord"]):
+    """`TopicReplyInbox` of `AIOKafkaConsumer`."""
+
+    def __init__(
+        self,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        admin_client: "AIOKafkaAdminClient",
+        *,
+        replication_factor: int = 1,
+        max_in_flight: int = 1024,
+    ) -> None:
+        super().__init__(
+            replication_factor=replication_factor,
+            max_in_flight=max_in_flight,
+        )
+
+        self._builder = builder
+        self._admin_client = admin_client
+
+    async def _create_topic(self) -> None:
+        response = await self._admin_client.create_topics([
+            NewTopic(
+                self.topic,
+                num_partitions=1,
+                replication_factor=self.replication_factor,
+            ),
+        ])
+
+        for _, error_code, *_ in response.topic_errors:
+            if (
+                error_code
+                and (error := for_code(error_code)) is not TopicAlreadyExistsError
+            ):
+                raise error()
+
+    async def _delete_topic(self) -> None:
+        await self._admin_client.delete_topics([self.topic])
+
+    async def _start_consumer(self) -> "AIOKafkaConsumer":
+        consumer = self._builder(
+            auto_offset_reset="earliest",
+            enable_auto_commit=False,
+        )
+        await consumer.start()
+
+        tp = TopicPartition(self.topic, 0)
+        consumer.assign([tp])
+        # resolve the position before any request is sent
+        await consumer.position(tp)
+
+        return consumer
+
+    def _get_correlation_id(self, msg: "ConsumerRecord") -> str | None:
+        return next(
+            (v.decode() for k, v in msg.headers if k == "correlation_id"),
+            None,
+        )
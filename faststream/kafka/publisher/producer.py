@@ -1,6 +1,10 @@
+import asyncio
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Union
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
+import anyio
+from aiokafka.structs import RecordMetadata
 from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
@@ -11,19 +15,20 @@ from faststream.kafka.exceptions import BatchBufferOverflowException
 from faststream.kafka.message import KafkaMessage
 from faststream.kafka.parser import AioKafkaParser
 from faststream.kafka.response import KafkaPublishCommand
+from faststream.message import gen_cor_id
 
 from .state import EmptyProducerState, ProducerState, RealProducer
 
 if TYPE_CHECKING:
-    import asyncio
-
-    from aiokafka import AIOKafkaProducer
-    from aiokafka.structs import RecordMetadata
+    from aiokafka import AIOKafkaProducer, ConsumerRecord
+    from aiokafka.producer.message_accumulator import BatchBuilder
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import CustomCallable
 
+    from .inbox import ReplyInbox
+
 
 class AioKafkaFastProducer(ProducerProto[KafkaPublishCommand]):
     async def connect(
@@ -31,6 +36,7 @@ class AioKafkaFastProducer(ProducerProto[KafkaPublishCommand]):
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None: ...
 
     async def disconnect(self) -> None: ...
@@ -71,6 +77,7 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         decoder: Optional["CustomCallable"],
     ) -> None:
         self._producer: ProducerState = EmptyProducerState()
+        self._inbox: ReplyInbox | None = None
         self.serializer: SerializerProto | None = None
         self.codec: CodecProto = DefaultCodec()
 
@@ -84,13 +91,19 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None:
         self.serializer = serializer
         self.codec = codec or DefaultCodec()
         await producer.start()
         self._producer = RealProducer(producer)
+        self._inbox = inbox
 
     async def disconnect(self) -> None:
+        if self._inbox is not None:
+            await self._inbox.stop()
+            self._inbox = None
+
         await self._producer.stop()
         self._producer = EmptyProducerState()
 
@@ -135,13 +148,37 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
             return await send_future
         return send_future
 
+    @override
+    async def request(self, cmd: "KafkaPublishCommand") -> "ConsumerRecord":
+        """Publish a message and wait for the response in the reply topic."""
+        if self._inbox is None:
+            msg = "Kafka `request` requires a connected broker with an admin client."
+            raise FeatureNotSupportedException(msg)
+
+        await self._inbox.start()
+
+        cmd.reply_to = self._inbox.topic
+        cmd.correlation_id = correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with anyio.fail_after(cmd.timeout):
+            async with self._inbox.wait_response(correlation_id) as response:
+                await self.publish(cmd)
+                return await response
+
     @override
     async def publish_batch(
         self,
         cmd: "KafkaPublishCommand",
-    ) -> Union["asyncio.Future[RecordMetadata]", "RecordMetadata"]:
-        """Publish a batch of messages to a topic."""
-        batch = self._producer.producer.create_batch()
+    ) -> Union["asyncio.Future[BatchRecordMetadata]", "BatchRecordMetadata"]:
+        """Publish a batch of messages to a topic.
+
+        Messages are split into as many record batches as required by the
+        producer `max_batch_size`. Keyed messages are grouped by their partition
+        if no explicit partition is set. All record batches are built before
+        sending, so a message too large for a record batch is raised before
+        anything is sent. Then they are sent without waiting for each other.
+        """
+        producer = self._producer.producer
 
         headers_to_send = cmd.headers_to_publish()
 
@@ -155,6 +192,20 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
                 for body in cmd.batch_bodies
             ]
 
+        get_partition = _get_partitioner(producer)
+        route_by_key = (
+            get_partition is not None
+            and cmd.partition is None
+            and any(cmd.key_for(i) is not None for i in range(len(encoded_batch)))
+        )
+        if route_by_key:
+            # make sure topic metadata is available for partitioner
+            await producer.partitions_for(cmd.destination)
+
+        # record batches in the creation order, the first one has the first message
+        batches: list[tuple[int | None, BatchBuilder]] = []
+        open_batches: dict[int | None, BatchBuilder] = {}
+
         for message_position, (message, content_type) in enumerate(encoded_batch):
             if content_type:
                 final_headers = {
@@ -164,31 +215,104 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
             else:
                 final_headers = headers_to_send.copy()
 
-            metadata = batch.append(
-                key=cmd.key_for(message_position),
-                value=message,
-                timestamp=cmd.timestamp_ms,
-                headers=[(i, j.encode()) for i, j in final_headers.items()],
-            )
-            if metadata is None:
-                raise BatchBufferOverflowException(message_position=message_position)
+            key = cmd.key_for(message_position)
+            headers = [(i, j.encode()) for i, j in final_headers.items()]
+
+            partition = cmd.partition
+            if route_by_key and key is not None:
+                assert get_partition
+                partition = get_partition(cmd.destination, key, message, headers)
+
+            record = {
+                "key": key,
+                "value": message,
+                "timestamp": cmd.timestamp_ms,
+                "headers": headers,
+            }
+
+            batch = open_batches.get(partition)
+            if batch is None or batch.append(**record) is None:
+                # no batch for the partition yet or it is full, roll over to a new one
+                batch = open_batches[partition] = producer.create_batch()
+                batches.append((partition, batch))
+
+                if batch.append(**record) is None:
+                    raise BatchBufferOverflowException(message_position=message_position)
+
+        if not batches:
+            batches.append((cmd.partition, producer.create_batch()))
+
+        futures = [
+            await producer.send_batch(batch, cmd.destination, partition=partition)
+            for partition, batch in batches
+        ]
+
+        send_future = asyncio.ensure_future(_gather_batches(futures))
 
-        send_future = await self._producer.producer.send_batch(
-            batch,
-            cmd.destination,
-            partition=cmd.partition,
-        )
         if not cmd.no_confirm:
             return await send_future
         return send_future
 
 
+class BatchRecordMetadata(RecordMetadata):  # type: ignore[misc]
+    """Delivery metadata of all record batches sent by a `publish_batch` call.
+
+    Fields describe the record batch with the first message of the call, so
+    it can be used as a regular `RecordMetadata`. `batches` holds metadata of
+    all sent record batches in order of their first messages.
+    """
+
+    batches: tuple[RecordMetadata, ...]
+
+    @classmethod
+    def from_batches(cls, batches: Sequence[RecordMetadata]) -> "BatchRecordMetadata":
+        metadata = cls(*batches[0])
+        metadata.batches = tuple(batches)
+        return metadata
+
+
+def _get_partitioner(
+    producer: "AIOKafkaProducer",
+) -> Callable[[str, Any, Any, list[tuple[str, bytes]]], int] | None:
+    """Return the producer partitioner for keyed records, if it is reachable.
+
+    aiokafka has no public API for it, so the private methods of the supported
+    versions (see `aiokafka` pin in `pyproject.toml`) are used. Without them
+    keyed records are sent to the command partition as a single group.
+    """
+    serialize = getattr(producer, "_serialize", None)
+    partition = getattr(producer, "_partition", None)
+    if serialize is None or partition is None:
+        return None
+
+    def get_partition(
+        topic: str,
+        key: Any,
+        value: Any,
+        headers: list[tuple[str, bytes]],
+    ) -> int:
+        serialized_key, serialized_value = serialize(key, value, headers)
+        return cast(
+            "int",
+            partition(topic, None, key, value, serialized_key, serialized_value),
+        )
+
+    return get_partition
+
+
+async def _gather_batches(
+    futures: list["asyncio.Future[RecordMetadata]"],
+) -> BatchRecordMetadata:
+    return BatchRecordMetadata.from_batches(await asyncio.gather(*futures))
+
+
 class FakeAioKafkaFastProducer(AioKafkaFastProducer):
     async def connect(
         self,
         producer: "AIOKafkaProducer",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: Optional["ReplyInbox"] = None,
     ) -> None:
         raise NotImplementedError
 
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from faststream.response.response import PublishCommand
 
     from .config import KafkaPublisherConfig
-    from .producer import AioKafkaFastProducer
+    from .producer import AioKafkaFastProducer, BatchRecordMetadata
 
 
 class LogicPublisher(PublisherUsecase):
@@ -317,7 +317,7 @@ class BatchPublisher(LogicPublisher):
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: Literal[False] = False,
-    ) -> "RecordMetadata": ...
+    ) -> "BatchRecordMetadata": ...
 
     @overload
     async def publish(
@@ -331,7 +331,7 @@ class BatchPublisher(LogicPublisher):
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: Literal[True] = ...,
-    ) -> "asyncio.Future[RecordMetadata]": ...
+    ) -> "asyncio.Future[BatchRecordMetadata]": ...
 
     @overload
     async def publish(
@@ -345,7 +345,7 @@ class BatchPublisher(LogicPublisher):
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: bool = False,
-    ) -> Union["asyncio.Future[RecordMetadata]", "RecordMetadata"]: ...
+    ) -> Union["asyncio.Future[BatchRecordMetadata]", "BatchRecordMetadata"]: ...
 
     @override
     async def publish(
@@ -359,8 +359,8 @@ class BatchPublisher(LogicPublisher):
         reply_to: str = "",
         correlation_id: str | None = None,
         no_confirm: bool = False,
-    ) -> Union["asyncio.Future[RecordMetadata]", "RecordMetadata"]:
-        """Publish a message batch as a single request to broker.
+    ) -> Union["asyncio.Future[BatchRecordMetadata]", "BatchRecordMetadata"]:
+        """Publish a message batch split into record batches by `max_batch_size`.
 
         Args:
             *messages:
@@ -391,8 +391,8 @@ class BatchPublisher(LogicPublisher):
                 Do not wait for Kafka publish confirmation.
 
         Returns:
-            `asyncio.Future[RecordMetadata]` if no_confirm = True.
-            `RecordMetadata` if no_confirm = False.
+            `asyncio.Future[BatchRecordMetadata]` if no_confirm = True.
+            `BatchRecordMetadata` if no_confirm = False.
         """
         cmd = KafkaPublishCommand(
             *messages,
@@ -407,11 +407,15 @@ class BatchPublisher(LogicPublisher):
             _publish_type=PublishType.PUBLISH,
         )
 
-        return await self._basic_publish_batch(
+        result = await self._basic_publish_batch(
             cmd,
             producer=self._outer_config.producer,
             _extra_middlewares=(),
         )
+        return cast(
+            "asyncio.Future[BatchRecordMetadata] | BatchRecordMetadata",
+            result,
+        )
 
     @override
     async def _publish(
@@ -1,9 +1,13 @@
 import warnings
 from collections.abc import Collection, Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 
@@ -13,6 +17,7 @@ from .usecase import (
     BatchSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentKeyOrderedSubscriber,
     DefaultSubscriber,
 )
 
@@ -36,7 +41,8 @@ def create_subscriber(
     partitions: Collection["TopicPartition"],
     # Subscriber args
     ack_policy: "AckPolicy",
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
+    ordering: Literal["key", "partition"] | None,
     no_reply: bool,
     config: "KafkaBrokerConfig",
     # Specification args
@@ -48,6 +54,7 @@ def create_subscriber(
     "BatchSubscriber",
     "ConcurrentDefaultSubscriber",
     "ConcurrentBetweenPartitionsSubscriber",
+    "ConcurrentKeyOrderedSubscriber",
 ]:
     _validate_input_for_misconfigure(
         *topics,
@@ -55,6 +62,8 @@ def create_subscriber(
         partitions=partitions,
         ack_policy=ack_policy,
         max_workers=max_workers,
+        batch=batch,
+        ordering=ordering,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -93,7 +102,16 @@ def create_subscriber(
             max_records=max_records,
         )
 
-    if max_workers > 1:
+    if workers_limit(max_workers) > 1:
+        if ordering is not None:
+            return ConcurrentKeyOrderedSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                ordering=ordering,
+            )
+
         if subscriber_config.ack_first:
             return ConcurrentDefaultSubscriber(
                 subscriber_config,
@@ -107,7 +125,8 @@ def create_subscriber(
             subscriber_config,
             specification,
             calls,
-            max_workers=max_workers,
+            # every worker is a separate consumer, so the limit is fixed
+            max_workers=workers_limit(max_workers),
         )
 
     return DefaultSubscriber(subscriber_config, specification, calls)
@@ -116,9 +135,11 @@ def create_subscriber(
 def _validate_input_for_misconfigure(
     *topics: str,
     ack_policy: "AckPolicy",
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
     pattern: str | None,
     partitions: Iterable["TopicPartition"],
+    batch: bool = False,
+    ordering: Literal["key", "partition"] | None = None,
 ) -> None:
     effective_ack = AckPolicy.ACK_FIRST if ack_policy is EMPTY else ack_policy
     if effective_ack is AckPolicy.REJECT_ON_ERROR:
@@ -129,7 +150,20 @@ def _validate_input_for_misconfigure(
             stacklevel=4,
         )
 
-    if max_workers > 1 and effective_ack is not AckPolicy.ACK_FIRST:
+    if ordering is not None:
+        if ordering not in {"key", "partition"}:
+            msg = f"Unknown ordering mode `{ordering}`, use `key` or `partition`."
+            raise SetupError(msg)
+
+        if batch:
+            msg = "You can't use `ordering` with batch subscriber."
+            raise SetupError(msg)
+
+        if workers_limit(max_workers) <= 1:
+            msg = "You should set `max_workers` greater than 1 to use `ordering`."
+            raise SetupError(msg)
+
+    elif workers_limit(max_workers) > 1 and effective_ack is not AckPolicy.ACK_FIRST:
         if len(topics) > 1:
             msg = "You must use a single topic with concurrent manual commit mode."
             raise SetupError(msg)
@@ -1,26 +1,42 @@
 import logging
+import time
+import zlib
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Sequence
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast
 
 import anyio
 from aiokafka import ConsumerRecord, TopicPartition
 from aiokafka.errors import ConsumerStoppedError, KafkaError, UnsupportedCodecError
 from typing_extensions import override
 
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    ConcurrencyLimiter,
+    workers_limit,
+)
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
 from faststream._internal.endpoint.subscriber.usecase import SubscriberUsecase
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream._internal.utils.path import compile_path
-from faststream.kafka.helpers import make_logging_listener
+from faststream.kafka.helpers import (
+    OffsetTracker,
+    RevokedOffsetsListener,
+    TrackedConsumer,
+    make_logging_listener,
+)
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage, KafkaRawMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
 from faststream.kafka.publisher.fake import KafkaFakePublisher
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
+    from anyio.streams.memory import (
+        MemoryObjectReceiveStream,
+        MemoryObjectSendStream,
+    )
 
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
@@ -460,3 +476,136 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
         message = await consumer.getone()
         message.consumer = consumer
         return cast("KafkaRawMessage", message)
+
+
+class ConcurrentKeyOrderedSubscriber(DefaultSubscriber):
+    """Processes records concurrently keeping the order within the same key.
+
+    Records are hashed by raw key bytes (or by partition) into `max_workers`
+    lanes. Every lane processes its records one by one, so records with the
+    same key are never processed concurrently, while different lanes run in
+    parallel using the single consumer connection.
+
+    With manual commit policies offsets are committed per partition up to the
+    lowest record which is still in flight. A nacked record partition is
+    rewound by `OffsetTracker` after its records being processed are finished.
+    """
+
+    def __init__(
+        self,
+        config: "KafkaSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[ConsumerRecord]",
+        max_workers: int | AdaptiveConcurrency,
+        ordering: Literal["key", "partition"],
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_workers = workers_limit(max_workers)
+        self.ordering = ordering
+        self.limiter = ConcurrencyLimiter.build(max_workers)
+
+        self._ack_first = config.ack_first
+        self._offsets: OffsetTracker | None = None
+
+        self._key_deserializer: Callable[[bytes], Any] | None = self._connection_args.get(
+            "key_deserializer"
+        )
+        self._listener = RevokedOffsetsListener(lambda: self._offsets, self._listener)
+
+        self._lanes: list[
+            MemoryObjectSendStream[tuple[ConsumerRecord, TrackedConsumer | None]]
+        ] = []
+        # records sent to lanes, but not taken by them yet
+        self._buffered = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of records allowed to be processed concurrently."""
+        return self.limiter.limit
+
+    async def start(self) -> None:
+        if self.calls:
+            # keys are deserialized after selecting the lane by their raw bytes
+            self._connection_args = {**self._connection_args, "key_deserializer": None}
+
+        await super().start()
+
+        if self.calls:
+            assert self.consumer, "You should start subscriber at first."
+
+            if not self._ack_first:
+                self._offsets = OffsetTracker(self.consumer)
+
+            for _ in range(self.max_workers):
+                send_stream, receive_stream = anyio.create_memory_object_stream[
+                    tuple[ConsumerRecord, TrackedConsumer | None]
+                ](max_buffer_size=self.max_workers)
+                self._lanes.append(send_stream)
+                self.add_task(self._serve_lane, (receive_stream,))
+
+    async def stop(self) -> None:
+        await super().stop()
+
+        for lane in self._lanes:
+            lane.close()
+
+        # undelivered records hold limiter slots
+        for _ in range(self._buffered):
+            self.limiter.release()
+
+        self._buffered = 0
+        self._lanes = []
+        self._offsets = None
+
+    def lane_for(self, record: "ConsumerRecord") -> int:
+        """Return index of the lane the record should be processed by."""
+        if self.ordering == "key" and record.key is not None:
+            return zlib.crc32(record.key) % self.max_workers
+        return hash((record.topic, record.partition)) % self.max_workers
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        tracked: TrackedConsumer | None = None
+        if self._offsets is not None:
+            # parser uses record consumer to build the message
+            msg.consumer = tracked = self._offsets.register(msg)
+
+        lane = self._lanes[self.lane_for(msg)]
+        if self._key_deserializer is not None:
+            msg.key = self._key_deserializer(msg.key)
+
+        await self.limiter.acquire()
+
+        self._buffered += 1
+        try:
+            await lane.send((msg, tracked))
+        except BaseException:
+            self._buffered -= 1
+            self.limiter.release()
+            raise
+
+    async def _serve_lane(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[tuple[ConsumerRecord, TrackedConsumer | None]]",
+    ) -> None:
+        async with receive_stream:
+            async for msg, tracked in receive_stream:
+                self._buffered -= 1
+
+                if tracked is not None and not tracked.tracker.start(tracked):
+                    # the record is redelivered after its partition rewind
+                    self.limiter.release()
+                    continue
+
+                started_at = time.perf_counter()
+                try:
+                    await self.consume(msg)
+                finally:
+                    self.limiter.release(time.perf_counter() - started_at)
+
+                    if tracked is not None:
+                        tracked.tracker.finish(tracked)
+
+                # commit processed record if it was not acked or nacked by the handler
+                if tracked is not None and not tracked.nacked:
+                    await tracked.commit()
@@ -1,11 +1,12 @@
 from .message import AckStatus, StreamMessage
 from .source_type import SourceType
-from .utils import decode_message, encode_message, gen_cor_id
+from .utils import decode_batch_message, decode_message, encode_message, gen_cor_id
 
 __all__ = (
     "AckStatus",
     "SourceType",
     "StreamMessage",
+    "decode_batch_message",
     "decode_message",
     "encode_message",
     "gen_cor_id",
@@ -70,6 +70,10 @@ class StreamMessage(Generic[MsgType]):
     def clear_cache(self) -> None:
         self.__decoded_caches.clear()
 
+    def _is_decoded(self) -> bool:
+        """Whether the message body is already decoded by the current decoder."""
+        return self.__decoder in self.__decoded_caches
+
     def __repr__(self) -> str:
         inner = ", ".join(
             filter(
@@ -2,6 +2,7 @@ import contextlib
 import json
 from collections.abc import Sequence
 from contextlib import suppress
+from itertools import starmap
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 from uuid import uuid4
 
@@ -24,9 +25,39 @@ def gen_cor_id() -> str:
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
+    return _decode_body(body, getattr(message, "content_type", None))
+
+
+def decode_batch_message(
+    message: "StreamMessage[Any]",
+    content_type_header: str = "content-type",
+    *,
+    content_types: Sequence[str | None] | None = None,
+) -> list["DecodedMessage"]:
+    """Decodes a batch message bodies by content types from its `batch_headers`.
+
+    Brokers keeping the content type out of the headers pass `content_types`
+    of the batch messages explicitly.
+    """
+    bodies = cast("Sequence[bytes]", message.body)
+    if content_types is None:
+        content_types = [h.get(content_type_header) for h in message.batch_headers]
+
+    if len(content_types) != len(bodies):
+        content_types = [message.content_type] * len(bodies)
+
+    return list(starmap(_decode_body, zip(bodies, content_types, strict=True)))
+
+
+def is_json_content_type(content_type: str | None) -> bool:
+    """Whether the body of the content type is decoded as JSON (or tried to be)."""
+    return not content_type or content_type.startswith(ContentTypes.JSON.value)
+
+
+def _decode_body(body: Any, content_type: Any) -> "DecodedMessage":
     m: DecodedMessage = body
 
-    if content_type := getattr(message, "content_type", False):
+    if content_type:
         with contextlib.suppress(ValueError):
             content_type = ContentTypes(cast("str", content_type))
 
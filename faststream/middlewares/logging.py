@@ -46,6 +46,7 @@ class _LoggingMiddleware(BaseMiddleware):
         super().__init__(msg, context=context)
         self.logger = logger
         self.source_type = SourceType.CONSUME
+        self.sampled = True
 
     async def consume_scope(
         self,
@@ -55,10 +56,13 @@ class _LoggingMiddleware(BaseMiddleware):
         source_type = self.source_type = msg.source_type
 
         if source_type is not SourceType.RESPONSE:
-            self.logger.log(
-                "Received",
-                extra=self.context.get_local("log_context", {}),
-            )
+            self.sampled = self.logger.sample_message()
+
+            if self.sampled:
+                self.logger.log(
+                    "Received",
+                    extra=self.context.get_local("log_context", {}),
+                )
 
         return await call_next(msg)
 
@@ -69,18 +73,20 @@ class _LoggingMiddleware(BaseMiddleware):
         exc_tb: Optional["TracebackType"] = None,
     ) -> bool:
         """Asynchronously called after processing."""
-        if self.source_type is not SourceType.RESPONSE:
+        if self.source_type is not SourceType.RESPONSE and (self.sampled or exc_type):
             c = self.context.get_local("log_context", {})
 
             if exc_type:
                 # TODO: move critical logging to `subscriber.consume()` method
                 if issubclass(exc_type, IgnoredException):
-                    self.logger.log(
-                        message=str(exc_val),
-                        extra=c,
-                    )
+                    if self.sampled:
+                        self.logger.log(
+                            message=str(exc_val),
+                            extra=c,
+                        )
 
                 else:
+                    # errors are logged even for messages not sampled
                     self.logger.log(
                         message=f"{exc_type.__name__}: {exc_val}",
                         log_level=logging.ERROR,
@@ -88,7 +94,8 @@ class _LoggingMiddleware(BaseMiddleware):
                         extra=c,
                     )
 
-            self.logger.log(message="Processed", extra=c)
+            if self.sampled:
+                self.logger.log(message="Processed", extra=c)
 
         await super().__aexit__(exc_type, exc_val, exc_tb)
 
@@ -40,6 +40,8 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.basic_types import LoggerProto, SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+    from faststream._internal.logger import LogQueue
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import BrokerMiddleware, CustomCallable
     from faststream.mqtt.message import MQTTMessage
@@ -67,6 +69,8 @@ class MQTTBroker(
         session_expiry_interval: int = 0,
         stripped_prefixes: tuple[str, ...] = _DEFAULT_STRIPPED_PREFIXES,
         graceful_timeout: float | None = 15.0,
+        start_concurrency: int = 1,
+        executor: Optional["SyncExecutor"] = None,
         decoder: Optional["CustomCallable"] = None,
         parser: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
@@ -84,6 +88,7 @@ class MQTTBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue: Optional["LogQueue"] = None,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -132,6 +137,7 @@ class MQTTBroker(
                 logger=make_mqtt_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    log_queue=log_queue,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -141,6 +147,8 @@ class MQTTBroker(
                 ),
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                start_concurrency=start_concurrency,
+                executor=executor,
                 ack_policy=ack_policy,
                 extra_context={
                     "broker": self,
@@ -6,6 +6,7 @@ from zmqtt import QoS
 
 from faststream._internal.broker.registrator import Registrator
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.middlewares import AckPolicy
 from faststream.mqtt.broker.config import MQTTBrokerConfig
 from faststream.mqtt.publisher.factory import create_publisher
@@ -15,10 +16,12 @@ if TYPE_CHECKING:
     import zmqtt  # noqa: F401
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.mqtt.publisher.usecase import MQTTPublisher
     from faststream.mqtt.subscriber.usecase import (
@@ -44,7 +47,9 @@ class MQTTRegistrator(Registrator["zmqtt.Message", MQTTBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = 1,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = 1,
         persistent: bool = True,
         # AsyncAPI information
         title: str | None = None,
@@ -65,6 +70,10 @@ class MQTTRegistrator(Registrator["zmqtt.Message", MQTTBrokerConfig]):
             parser: Custom parser to map raw messages to FastStream ones.
             decoder: Function to decode FastStream message bytes to Python objects.
             codec: Custom codec object.
+            filter_key: Function to get a message key to select handlers
+                registered with the same `key`.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             max_workers: Number of workers to process messages concurrently.
             persistent: Whether to retain the subscriber across broker restarts.
             title: AsyncAPI subscriber object title.
@@ -90,6 +99,8 @@ class MQTTRegistrator(Registrator["zmqtt.Message", MQTTBrokerConfig]):
             parser_=parser or self._parser,
             decoder_=decoder or self._decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
@@ -9,6 +9,7 @@ from faststream._internal.broker.router import (
     SubscriberRoute,
 )
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.middlewares import AckPolicy
 from faststream.mqtt.broker.config import MQTTBrokerConfig
 
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import BrokerMiddleware, CustomCallable
 
 
@@ -72,7 +74,8 @@ class MQTTRoute(SubscriberRoute):
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int = 1,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency = 1,
         persistent: bool = True,
         # AsyncAPI information
         title: str | None = None,
@@ -91,6 +94,7 @@ class MQTTRoute(SubscriberRoute):
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             max_workers=max_workers,
             title=title,
             description=description,
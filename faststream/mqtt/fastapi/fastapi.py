@@ -12,6 +12,7 @@ from typing_extensions import override
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream._internal.fastapi.router import StreamRouter
 from faststream.middlewares import AckPolicy
 from faststream.mqtt.broker.broker import MQTTBroker
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
     from starlette.types import ASGIApp, Lifespan
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import BrokerMiddleware, CustomCallable
     from faststream.mqtt.publisher.usecase import MQTTPublisher
@@ -160,6 +162,7 @@ class MQTTRouter(StreamRouter[zmqtt.Message]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         codec: Optional["CodecProto"] = None,
         max_workers: Literal[1] = 1,
         persistent: bool = True,
@@ -190,8 +193,9 @@ class MQTTRouter(StreamRouter[zmqtt.Message]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
         persistent: bool = True,
         # AsyncAPI information
         title: str | None = None,
@@ -220,8 +224,9 @@ class MQTTRouter(StreamRouter[zmqtt.Message]):
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         codec: Optional["CodecProto"] = None,
-        max_workers: int = 1,
+        max_workers: int | AdaptiveConcurrency = 1,
         persistent: bool = True,
         # AsyncAPI information
         title: str | None = None,
@@ -247,6 +252,7 @@ class MQTTRouter(StreamRouter[zmqtt.Message]):
                 dependencies=dependencies,
                 parser=parser,
                 decoder=decoder,
+                executor=executor,
                 codec=codec,
                 max_workers=max_workers,
                 persistent=persistent,
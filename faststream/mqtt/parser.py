@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 import zmqtt
 
 from faststream._internal._compat import json_loads
+from faststream._internal.parser import mark_json_decoder
 from faststream.message import StreamMessage, decode_message
 
 from .message import MQTTMessage
@@ -33,6 +34,7 @@ class MQTTBaseParser:
     async def parse_message(self, msg: zmqtt.Message) -> MQTTMessage:
         raise NotImplementedError
 
+    @mark_json_decoder
     async def decode_message(self, msg: "StreamMessage[Any]") -> "DecodedMessage":
         return decode_message(msg)
 
@@ -23,6 +23,7 @@ class MQTTPrometheusMiddleware(
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
         custom_labels: dict[str, str | Callable[[Any], str]] | None = None,
+        flush_interval: float | None = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=lambda _: MQTTMetricsSettingsProvider(),
@@ -31,4 +32,5 @@ class MQTTPrometheusMiddleware(
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
             custom_labels=custom_labels,
+            flush_interval=flush_interval,
         )
@@ -3,6 +3,10 @@ from typing import TYPE_CHECKING, Any
 from zmqtt import QoS
 
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.mqtt.path import compile_mqtt_path
 
 from .config import MQTTSubscriberConfig, MQTTSubscriberSpecificationConfig
@@ -25,7 +29,7 @@ def create_subscriber(
     ack_policy: "AckPolicy",
     no_reply: bool,
     config: "MQTTBrokerConfig",
-    max_workers: int = 1,
+    max_workers: int | AdaptiveConcurrency = 1,
     # AsyncAPI args
     title_: str | None = None,
     description_: str | None = None,
@@ -60,7 +64,7 @@ def create_subscriber(
         calls,
     )
 
-    if max_workers > 1:
+    if workers_limit(max_workers) > 1:
         return MQTTConcurrentSubscriber(
             subscriber_config,
             specification,
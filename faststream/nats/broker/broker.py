@@ -3,6 +3,7 @@ from collections.abc import Iterable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
     Optional,
     Union,
     cast,
@@ -42,6 +43,7 @@ from faststream.nats.publisher.producer import (
 )
 from faststream.nats.response import NatsPublishCommand
 from faststream.nats.security import parse_security
+from faststream.nats.subscriber.shared import SharedSubscriptions
 from faststream.nats.subscriber.usecases.basic import LogicSubscriber
 from faststream.response.publish_type import PublishType
 from faststream.specification.schema import BrokerSpec
@@ -50,6 +52,7 @@ from .logging import make_nats_logger_state
 from .registrator import NatsRegistrator
 
 if TYPE_CHECKING:
+    import asyncio
     from types import TracebackType
 
     from fast_depends.dependencies import Dependant
@@ -67,6 +70,8 @@ if TYPE_CHECKING:
     from typing_extensions import TypedDict
 
     from faststream._internal.basic_types import LoggerProto, SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+    from faststream._internal.logger import LogQueue
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import BrokerMiddleware, CustomCallable
     from faststream.nats.configs.broker import JsInitOptions
@@ -211,7 +216,10 @@ class NatsBroker(
         pending_size: int = DEFAULT_PENDING_SIZE,
         flush_timeout: float | None = None,
         js_options: Union["JsInitOptions", dict[str, Any], None] = None,
+        shared_subscriptions: bool = False,
         graceful_timeout: float | None = None,
+        start_concurrency: int = 1,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
@@ -227,6 +235,7 @@ class NatsBroker(
         tags: Iterable[Union["Tag", "TagDict"]] = (),
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue: Optional["LogQueue"] = None,
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
         provider: Optional["Provider"] = None,
@@ -297,8 +306,18 @@ class NatsBroker(
                 Max duration to wait for a forced flush to occur
             js_options:
                 JetStream initialization options.
+            shared_subscriptions:
+                Whether to combine core subscribers with the same first subject token
+                under one wildcard subscription and route messages to them locally.
+                Queue group subscribers always keep their own subscriptions: a shared
+                wildcard is balanced between all group members, so messages could be
+                delivered to an instance without a matching subscriber and lost.
             graceful_timeout:
                 Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            start_concurrency:
+                Number of subscribers started or stopped concurrently.
+            executor:
+                Executor to run sync handlers, filters, parsers and decoders of all subscribers.
             ack_policy:
                 Default acknowledgement policy for all subscribers. Individual subscribers can override.
             decoder:
@@ -329,6 +348,8 @@ class NatsBroker(
                 User specified logger to pass into Context and log service messages.
             log_level:
                 Service messages log level.
+            log_queue:
+                Queue to emit logs from a background thread and sample per-message logs.
             apply_types:
                 Whether to use FastDepends or not.
             serializer:
@@ -400,6 +421,9 @@ class NatsBroker(
                 producer=producer,
                 js_producer=js_producer,
                 js_options=js_options or {},
+                shared_subscriptions=SharedSubscriptions()
+                if shared_subscriptions
+                else None,
                 # both args
                 broker_middlewares=middlewares,
                 broker_parser=parser,
@@ -408,6 +432,7 @@ class NatsBroker(
                 logger=make_nats_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    log_queue=log_queue,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -418,6 +443,8 @@ class NatsBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                start_concurrency=start_concurrency,
+                executor=executor,
                 ack_policy=ack_policy,
                 extra_context={
                     "broker": self,
@@ -519,6 +546,7 @@ class NatsBroker(
         stream: None = None,
         timeout: float | None = None,
         schedule: Optional["Schedule"] = None,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -532,8 +560,23 @@ class NatsBroker(
         stream: str | None = None,
         timeout: float | None = None,
         schedule: Optional["Schedule"] = None,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        schedule: Optional["Schedule"] = None,
+        no_confirm: Literal[True] = ...,
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -545,7 +588,8 @@ class NatsBroker(
         stream: str | None = None,
         timeout: float | None = None,
         schedule: Optional["Schedule"] = None,
-    ) -> Optional["PubAck"]:
+        no_confirm: bool = False,
+    ) -> Union["asyncio.Future[PubAck]", "PubAck", None]:
         """Publish message directly.
 
         This method allows you to publish message in not AsyncAPI-documented way. You can use it in another frameworks
@@ -574,13 +618,16 @@ class NatsBroker(
                 Timeout to send message to NATS.
             schedule:
                 Schedule to publish message at a specific time.
+            no_confirm:
+                Do not wait for the stream PubAck. Has no effect without `stream`.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future[PubAck]` if you publishes a message to stream with `no_confirm=True`.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             correlation_id=correlation_id or gen_cor_id(),
             subject=subject,
             headers=headers,
@@ -589,15 +636,120 @@ class NatsBroker(
             timeout=timeout or 0.5,
             _publish_type=PublishType.PUBLISH,
             schedule=schedule,
+            no_confirm=no_confirm,
         )
 
-        result: PubAck | None
+        result: asyncio.Future[PubAck] | PubAck | None
         if stream:
             result = await super()._basic_publish(cmd, producer=self.config.js_producer)
         else:
             result = await super()._basic_publish(cmd, producer=self.config.producer)
         return result
 
+    @overload  # type: ignore[override]
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> None: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[False] = False,
+    ) -> list["PubAck"]: ...
+
+    @overload
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> "asyncio.Future[list[PubAck]]": ...
+
+    @override
+    async def publish_batch(
+        self,
+        *messages: "SendableMessage",
+        subject: str,
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: bool = False,
+    ) -> Union["asyncio.Future[list[PubAck]]", list["PubAck"], None]:
+        """Publish a messages batch without waiting for each message confirmation.
+
+        JetStream messages are sent one after another and their PubAcks are
+        awaited all together, limited by the `publish_async_max_pending` and
+        `publish_async_max_pending_bytes` JetStream options.
+
+        Args:
+            *messages:
+                Messages bodies to send.
+            subject:
+                NATS subject to send messages.
+            headers:
+                Message headers to store metainformation.
+                **content-type** and **correlation_id** will be set automatically by framework anyway.
+            reply_to:
+                NATS subject name to send response.
+            correlation_id:
+                Manual message **correlation_id** setter.
+                **correlation_id** is a useful option to trace messages.
+            stream:
+                This option validates that the target subject is in presented stream.
+                Can be omitted without any effect if you doesn't want PubAck frames.
+            timeout:
+                Timeout to wait for each message PubAck.
+            no_confirm:
+                Do not wait for the stream PubAcks. Has no effect without `stream`.
+
+        Returns:
+            `None` if you publishes regular messages.
+            `list[faststream.nats.PubAck]` if you publishes messages to stream.
+            `asyncio.Future[list[PubAck]]` if you publishes messages to stream with `no_confirm=True`.
+        """
+        message, extra_messages = NatsPublishCommand._parse_bodies(messages, batch=True)
+
+        cmd = NatsPublishCommand(
+            message,
+            messages=extra_messages,
+            correlation_id=correlation_id or gen_cor_id(),
+            subject=subject,
+            headers=headers,
+            reply_to=reply_to,
+            stream=stream,
+            timeout=timeout or 0.5,
+            no_confirm=no_confirm,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        producer = self.config.js_producer if stream else self.config.producer
+        result: (
+            asyncio.Future[list[PubAck]] | list[PubAck] | None
+        ) = await self._basic_publish_batch(cmd, producer=producer)
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -634,7 +786,7 @@ class NatsBroker(
             `faststream.nats.message.NatsMessage` object as an outer subscriber response.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             correlation_id=correlation_id or gen_cor_id(),
             subject=subject,
             headers=headers,
@@ -7,6 +7,7 @@ from typing_extensions import overload, override
 
 from faststream._internal.broker.registrator import Registrator
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 from faststream.nats.configs import NatsBrokerConfig
@@ -18,10 +19,12 @@ from faststream.nats.subscriber.factory import create_subscriber
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.nats.publisher.usecase import LogicPublisher
     from faststream.nats.subscriber.usecases import (
@@ -75,6 +78,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -114,8 +119,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -153,6 +160,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -192,8 +201,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -231,6 +242,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -270,8 +283,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -309,6 +324,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -348,6 +365,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -387,6 +406,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
         max_workers: None = None,
         ack_policy: AckPolicy = EMPTY,
@@ -426,8 +447,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -465,8 +488,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         persistent: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -509,6 +534,10 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             parser: Parser to map original **nats-py** Msg to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
             codec: Custom codec object.
+            filter_key: Function to get a message key to select handlers
+                registered with the same `key`.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             max_workers: Number of workers to process messages concurrently.
             ack_policy: Whether to `ack` message at start of consuming or not.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -559,6 +588,8 @@ class NatsRegistrator(Registrator[Msg, NatsBrokerConfig]):
             parser_=parser,
             decoder_=decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
@@ -10,6 +10,7 @@ from faststream._internal.broker.router import (
     SubscriberRoute,
 )
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.middlewares import AckPolicy
 from faststream.nats.configs import NatsBrokerConfig
 
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -116,7 +118,8 @@ class NatsRoute(SubscriberRoute):
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
-        max_workers: int | None = None,
+        executor: Optional["SyncExecutor"] = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         title: str | None = None,
@@ -170,6 +173,8 @@ class NatsRoute(SubscriberRoute):
                 Parser to map original **nats-py** Msg to FastStream one.
             decoder:
                 Function to decode FastStream msg bytes body to python objects.
+            executor:
+                Executor to run sync handlers, filters, parsers and decoders. Overrides the broker one.
             max_workers:
                 Number of workers to process messages concurrently.
             ack_policy:
@@ -208,6 +213,7 @@ class NatsRoute(SubscriberRoute):
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             ack_policy=ack_policy,
             no_reply=no_reply,
             title=title,
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from nats.aio.client import Client
 
     from faststream.nats.publisher.producer import NatsFastProducer
+    from faststream.nats.subscriber.shared import SharedSubscriptions
 
 
 class JsInitOptions(TypedDict, total=False):
@@ -20,6 +21,7 @@ class JsInitOptions(TypedDict, total=False):
     domain: str | None
     timeout: float
     publish_async_max_pending: int
+    publish_async_max_pending_bytes: int
 
 
 @dataclass(kw_only=True)
@@ -31,9 +33,13 @@ class NatsBrokerConfig(BrokerConfig):
     connection_state: BrokerState = field(default_factory=BrokerState)
     kv_declarer: KVBucketDeclarer = field(default_factory=KVBucketDeclarer)
     os_declarer: OSBucketDeclarer = field(default_factory=OSBucketDeclarer)
+    shared_subscriptions: "SharedSubscriptions | None" = None
 
     def connect(self, connection: "Client") -> None:
-        stream = connection.jetstream(**self.js_options)
+        js_options = dict(self.js_options)
+        # FastStream option, nats-py limits the pending messages count only
+        max_pending_bytes = js_options.pop("publish_async_max_pending_bytes", None)
+        stream = connection.jetstream(**js_options)
 
         self.producer.connect(
             connection,
@@ -45,6 +51,7 @@ class NatsBrokerConfig(BrokerConfig):
             stream,
             serializer=self.fd_config._serializer,
             codec=self.broker_codec or DefaultCodec(),
+            max_pending_bytes=max_pending_bytes,
         )
         self.kv_declarer.connect(stream)
         self.os_declarer.connect(stream)
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
+from faststream._internal.parser import mark_json_decoder
 from faststream._internal.utils.path import match_path
 from faststream.message import (
     StreamMessage,
@@ -32,6 +33,7 @@ class NatsBaseParser:
         path_re, _ = compile_nats_wildcard(pattern)
         self._path_re = path_re
 
+    @mark_json_decoder
     async def decode_message(
         self,
         msg: "StreamMessage[Any]",
@@ -46,12 +48,21 @@ class NatsParser(NatsBaseParser):
         super().__init__(pattern=pattern)
 
         self.is_ack_disabled = is_ack_disabled
+        self._path_params: tuple[tuple[int, str], ...] | None = None
+
+    def set_path_params(self, params: tuple[tuple[int, str], ...]) -> None:
+        """Take path params from the message subject tokens by their positions."""
+        self._path_params = params
 
     async def parse_message(
         self,
         message: "Msg",
     ) -> "StreamMessage[Msg]":
-        path = match_path(self._path_re, message.subject)
+        if self._path_params is None:
+            path = match_path(self._path_re, message.subject)
+        else:
+            tokens = message.subject.split(".")
+            path = {name: tokens[i] for i, name in self._path_params}
 
         headers = message.header or {}
 
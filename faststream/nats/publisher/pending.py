@@ -0,0 +1,94 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import anyio
+
+if TYPE_CHECKING:
+    from nats.js import JetStreamContext
+
+    from faststream.nats.schemas import PubAck
+
+
+class PendingAcks:
+    """Window of JetStream messages published without waiting for their PubAck.
+
+    The number of pending messages is limited by the `publish_async_max_pending`
+    JetStream option, their total payload size - by `max_bytes`. Publishing
+    waits for a free room in the window.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.pending_bytes = 0
+
+        self._futures: set[asyncio.Future[PubAck]] = set()
+        self._released: asyncio.Event | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._futures)
+
+    async def publish(
+        self,
+        js: "JetStreamContext",
+        *,
+        subject: str,
+        payload: bytes,
+        headers: dict[str, str],
+        stream: str | None,
+        timeout: float | None,
+    ) -> "asyncio.Future[PubAck]":
+        size = len(payload)
+        await self._reserve(size)
+
+        try:
+            ack = await js.publish_async(
+                subject=subject,
+                payload=payload,
+                headers=headers,
+                stream=stream,
+            )
+
+        except BaseException:
+            self._release(size)
+            raise
+
+        future = asyncio.ensure_future(self._wait_ack(ack, size, timeout))
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    async def wait_all(self) -> None:
+        """Wait for all pending messages to be acknowledged or failed."""
+        await asyncio.gather(*self._futures, return_exceptions=True)
+
+    async def _wait_ack(
+        self,
+        ack: "asyncio.Future[PubAck]",
+        size: int,
+        timeout: float | None,
+    ) -> "PubAck":
+        try:
+            # cancels `ack` on timeout to free its `publish_async_max_pending` slot
+            with anyio.fail_after(timeout):
+                return await ack
+
+        finally:
+            self._release(size)
+
+    async def _reserve(self, size: int) -> None:
+        if self.max_bytes is not None:
+            # a message larger than the window is sent alone
+            while self.pending_bytes and self.pending_bytes + size > self.max_bytes:
+                if self._released is None:
+                    self._released = asyncio.Event()
+                await self._released.wait()
+
+        self.pending_bytes += size
+
+    def _release(self, size: int) -> None:
+        self.pending_bytes -= size
+
+        if self._released is not None:
+            self._released.set()
+            self._released = None
@@ -1,6 +1,7 @@
 import asyncio
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import anyio
 import nats
@@ -9,9 +10,8 @@ from nats.js.api import Header
 from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
-from faststream._internal.parser import DefaultCodec
+from faststream._internal.parser import BatchCodecProto, DefaultCodec
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
 from faststream.nats.helpers.state import (
     ConnectedState,
     ConnectionState,
@@ -20,6 +20,8 @@ from faststream.nats.helpers.state import (
 from faststream.nats.parser import NatsParser
 from faststream.nats.response import NatsPublishCommand
 
+from .pending import PendingAcks
+
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
     from nats.aio.client import Client
@@ -35,24 +37,52 @@ if TYPE_CHECKING:
 
 
 class NatsFastProducer(ProducerProto[NatsPublishCommand]):
+    serializer: Optional["SerializerProto"]
+
     def connect(
         self,
         connection: Any,
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        *,
+        max_pending_bytes: int | None = None,
     ) -> None: ...
 
     def disconnect(self) -> None: ...
 
     @abstractmethod
-    async def publish(self, cmd: "NatsPublishCommand") -> Optional["PubAck"]: ...
+    async def publish(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> Union["asyncio.Future[PubAck]", "PubAck", None]: ...
 
     @abstractmethod
     async def request(self, cmd: "NatsPublishCommand") -> "Msg": ...
 
-    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> Any: ...
+
+    async def _encode_batch(
+        self,
+        cmd: "NatsPublishCommand",
+        *,
+        js: bool,
+    ) -> Iterator[tuple[bytes, dict[str, str]]]:
+        if isinstance(self.codec, BatchCodecProto):
+            encoded_batch = await self.codec.encode_batch(
+                cmd.batch_bodies, self.serializer
+            )
+        else:
+            encoded_batch = [
+                await self.codec.encode(msg, self.serializer) for msg in cmd.batch_bodies
+            ]
+
+        headers_to_send = cmd.headers_to_publish(js=js)
+
+        return (
+            (payload, {"content-type": content_type or "", **headers_to_send})
+            for payload, content_type in encoded_batch
+        )
 
 
 class NatsFastProducerImpl(NatsFastProducer):
@@ -80,6 +110,8 @@ class NatsFastProducerImpl(NatsFastProducer):
         connection: "Client",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        *,
+        max_pending_bytes: int | None = None,
     ) -> None:
         self.serializer = serializer
         self.codec = codec or DefaultCodec()
@@ -104,6 +136,22 @@ class NatsFastProducerImpl(NatsFastProducer):
             headers=headers_to_send,
         )
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        """Publish a batch of messages to a subject.
+
+        Core NATS has no publish confirmations, so messages are just written to
+        the connection buffer one after another.
+        """
+        connection = self.__state.connection
+        for payload, headers_to_send in await self._encode_batch(cmd, js=False):
+            await connection.publish(
+                subject=cmd.destination,
+                payload=payload,
+                reply=cmd.reply_to,
+                headers=headers_to_send,
+            )
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = await self.codec.encode(cmd.body, self.serializer)
@@ -141,22 +189,29 @@ class NatsJSFastProducer(NatsFastProducer):
         self._decoder = ParserComposition(decoder, default.decode_message)
 
         self.__state: ConnectionState[JetStreamContext] = EmptyConnectionState()
+        self.pending_acks = PendingAcks()
 
     def connect(
         self,
         connection: "JetStreamContext",
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        *,
+        max_pending_bytes: int | None = None,
     ) -> None:
         self.serializer = serializer
         self.codec = codec or DefaultCodec()
         self.__state = ConnectedState(connection)
+        self.pending_acks = PendingAcks(max_pending_bytes)
 
     def disconnect(self) -> None:
         self.__state = EmptyConnectionState()
 
     @override
-    async def publish(self, cmd: "NatsPublishCommand") -> "PubAck":
+    async def publish(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> "asyncio.Future[PubAck] | PubAck":
         payload, content_type = await self.codec.encode(cmd.body, self.serializer)
 
         headers_to_send = {
@@ -164,6 +219,16 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=True),
         }
 
+        if cmd.no_confirm:
+            return await self.pending_acks.publish(
+                self.__state.connection,
+                subject=cmd.destination,
+                payload=payload,
+                headers=headers_to_send,
+                stream=cmd.stream,
+                timeout=cmd.timeout,
+            )
+
         return await self.__state.connection.publish(
             subject=cmd.destination,
             payload=payload,
@@ -172,6 +237,33 @@ class NatsJSFastProducer(NatsFastProducer):
             timeout=cmd.timeout,
         )
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "NatsPublishCommand",
+    ) -> "asyncio.Future[list[PubAck]] | list[PubAck]":
+        """Publish a batch of messages to a stream without waiting for each PubAck.
+
+        Returns the list of PubAcks in the messages order. The first failed
+        acknowledgement is raised after all others are done.
+        """
+        futures = [
+            await self.pending_acks.publish(
+                self.__state.connection,
+                subject=cmd.destination,
+                payload=payload,
+                headers=headers_to_send,
+                stream=cmd.stream,
+                timeout=cmd.timeout,
+            )
+            for payload, headers_to_send in await self._encode_batch(cmd, js=True)
+        ]
+
+        result = asyncio.ensure_future(_gather_acks(futures))
+        if cmd.no_confirm:
+            return result
+        return await result
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = await self.codec.encode(cmd.body, self.serializer)
@@ -216,6 +308,8 @@ class FakeNatsFastProducer(NatsFastProducer):
         connection: Any,
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        *,
+        max_pending_bytes: int | None = None,
     ) -> None:
         raise NotImplementedError
 
@@ -232,5 +326,14 @@ class FakeNatsFastProducer(NatsFastProducer):
 
     @override
     async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
-        msg = "NATS doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+        raise NotImplementedError
+
+
+async def _gather_acks(futures: list["asyncio.Future[PubAck]"]) -> list["PubAck"]:
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+
+    return cast("list[PubAck]", results)
@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Union, cast
 
 from typing_extensions import overload, override
 
@@ -10,6 +10,8 @@ from faststream.nats.schemas.js_stream import compile_nats_wildcard
 from faststream.response.publish_type import PublishType
 
 if TYPE_CHECKING:
+    import asyncio
+
     from faststream._internal.basic_types import SendableMessage
     from faststream._internal.endpoint.publisher import PublisherSpecification
     from faststream._internal.producer import ProducerProto
@@ -61,6 +63,7 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: None = None,
         timeout: float | None = None,
+        no_confirm: bool = False,
     ) -> None: ...
 
     @overload
@@ -73,8 +76,22 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
+        no_confirm: Literal[False] = False,
     ) -> "PubAck": ...
 
+    @overload
+    async def publish(
+        self,
+        message: "SendableMessage",
+        subject: str = "",
+        headers: dict[str, str] | None = None,
+        reply_to: str = "",
+        correlation_id: str | None = None,
+        stream: str | None = None,
+        timeout: float | None = None,
+        no_confirm: Literal[True] = ...,
+    ) -> "asyncio.Future[PubAck]": ...
+
     @override
     async def publish(
         self,
@@ -85,7 +102,8 @@ class LogicPublisher(PublisherUsecase):
         correlation_id: str | None = None,
         stream: str | None = None,
         timeout: float | None = None,
-    ) -> Optional["PubAck"]:
+        no_confirm: bool = False,
+    ) -> Union["asyncio.Future[PubAck]", "PubAck", None]:
         """Publish message directly.
 
         Args:
@@ -107,10 +125,13 @@ class LogicPublisher(PublisherUsecase):
                 Can be omitted without any effect if you doesn't want PubAck frame.
             timeout:
                 Timeout to send message to NATS.
+            no_confirm:
+                Do not wait for the stream PubAck. Has no effect without `stream`.
 
         Returns:
             `None` if you publishes a regular message.
             `faststream.nats.PubAck` if you publishes a message to stream.
+            `asyncio.Future[PubAck]` if you publishes a message to stream with `no_confirm=True`.
         """
         cmd = NatsPublishCommand(
             message,
@@ -120,13 +141,14 @@ class LogicPublisher(PublisherUsecase):
             correlation_id=correlation_id or gen_cor_id(),
             stream=stream or getattr(self.stream, "name", None),
             timeout=timeout or self.timeout,
+            no_confirm=no_confirm,
             _publish_type=PublishType.PUBLISH,
         )
 
-        response: PubAck | None
+        response: asyncio.Future[PubAck] | PubAck | None
         if cmd.stream:
             response = cast(
-                "PubAck",
+                "asyncio.Future[PubAck] | PubAck",
                 await self._basic_publish(
                     cmd,
                     producer=self._outer_config.js_producer,
@@ -207,7 +229,7 @@ class LogicPublisher(PublisherUsecase):
             `faststream.nats.message.NatsMessage` object as an outer subscriber response.
         """
         cmd = NatsPublishCommand(
-            message=message,
+            message,
             subject=subject or self.subject,
             headers=self.headers | (headers or {}),
             timeout=timeout or self.timeout,
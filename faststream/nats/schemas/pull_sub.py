@@ -1,5 +1,7 @@
 from typing import Literal, Optional, Union, overload
 
+from faststream.exceptions import SetupError
+
 
 class PullSub:
     """A class to represent a NATS pull subscription.
@@ -9,11 +11,21 @@ class PullSub:
         timeout (:obj:`float`, optional): Wait this time for required batch size will be accumulated in stream
             in seconds (default is `5.0`).
         batch (bool): Whether to propagate consuming batch as iterable object to your handler (default is `False`).
+        heartbeat (:obj:`float`, optional): Idle heartbeat interval of fetch requests in seconds. Lets the client
+            detect a stalled fetch before its timeout (default is `None`).
+        high_watermark (:obj:`int`, optional): Enables pipelined fetching. Messages are fetched in background to keep
+            up to `high_watermark` messages fetched but not processed yet. Batch subscriber fetches the next batch
+            while the current one is processed (default is `None`).
+        low_watermark (:obj:`int`, optional): Number of fetched but not processed messages the buffer should drop
+            to before the next fetch request (default is `high_watermark // 2`).
     """
 
     __slots__ = (
         "batch",
         "batch_size",
+        "heartbeat",
+        "high_watermark",
+        "low_watermark",
         "timeout",
     )
 
@@ -22,10 +34,34 @@ class PullSub:
         batch_size: int = 1,
         timeout: float | None = 5.0,
         batch: bool = False,
+        *,
+        heartbeat: float | None = None,
+        high_watermark: int | None = None,
+        low_watermark: int | None = None,
     ) -> None:
+        if high_watermark is None:
+            if low_watermark is not None:
+                msg = "You should specify `high_watermark` to use `low_watermark`"
+                raise SetupError(msg)
+
+        else:
+            if low_watermark is None:
+                low_watermark = high_watermark // 2
+
+            if not 0 <= low_watermark < high_watermark:
+                msg = "`low_watermark` should be between 0 and `high_watermark`"
+                raise SetupError(msg)
+
         self.batch_size = batch_size
         self.batch = batch
         self.timeout = timeout
+        self.heartbeat = heartbeat
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+
+    @property
+    def pipelined(self) -> bool:
+        return self.high_watermark is not None
 
     @overload
     @classmethod
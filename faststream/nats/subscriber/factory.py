@@ -14,6 +14,10 @@ from nats.js.client import (
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber import SubscriberSpecification
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 
@@ -67,7 +71,7 @@ def create_subscriber(
     obj_watch: Optional["ObjWatch"],
     inbox_prefix: bytes,
     # custom args
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
     stream: Optional["JStream"],
     # Subscriber args
     ack_policy: "AckPolicy",
@@ -200,7 +204,7 @@ def create_subscriber(
         )
 
     if stream is None:
-        if max_workers > 1:
+        if workers_limit(max_workers) > 1:
             return ConcurrentCoreSubscriber(
                 **subscriber_options,
                 max_workers=max_workers,
@@ -212,7 +216,7 @@ def create_subscriber(
             queue=queue,
         )
 
-    if max_workers > 1:
+    if workers_limit(max_workers) > 1:
         if pull_sub is not None:
             return ConcurrentPullStreamSubscriber(
                 **subscriber_options,
@@ -268,7 +272,7 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
     kv_watch: Optional["KvWatch"],
     obj_watch: Optional["ObjWatch"],
     ack_policy: "AckPolicy",  # default EMPTY
-    max_workers: int,  # default 1
+    max_workers: int | AdaptiveConcurrency,  # default 1
     stream: Optional["JStream"],
 ) -> None:
     if ack_policy is not EMPTY:
@@ -350,7 +354,7 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
                     stacklevel=4,
                 )
 
-            if max_workers > 1:
+            if workers_limit(max_workers) > 1:
                 warnings.warn(
                     message="The `max_workers` option can be used only with JetStream (Pull/Push) or Core Subscription.",
                     category=RuntimeWarning,
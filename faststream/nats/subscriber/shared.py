@@ -0,0 +1,228 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import anyio
+
+from faststream._internal.utils.path import PARAM_REGEX
+
+if TYPE_CHECKING:
+    from nats.aio.client import Client
+    from nats.aio.msg import Msg
+    from nats.aio.subscription import Subscription
+
+T = TypeVar("T")
+
+PathParams = tuple[tuple[int, str], ...]
+
+
+def compile_subject(subject: str) -> tuple[str, PathParams] | None:
+    """Compile `logs.{user}.>` to `logs.*.>` subject and positions of its params.
+
+    Returns `None` for subjects with params not taking a whole token.
+    """
+    tokens = subject.split(".")
+
+    params: list[tuple[int, str]] = []
+    for i, token in enumerate(tokens):
+        if match := PARAM_REGEX.fullmatch(token):
+            params.append((i, match.group(1)))
+            tokens[i] = "*"
+
+        elif "{" in token:
+            return None
+
+    return ".".join(tokens), tuple(params)
+
+
+class SubjectTrie(Generic[T]):
+    """Tree of NATS subjects to find items subscribed to a message subject."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        self.children: dict[str, SubjectTrie[T]] = {}
+        self.items: list[T] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.items or self.children)
+
+    def add(self, subject: str, item: T) -> None:
+        node = self
+        for token in subject.split("."):
+            node = node.children.setdefault(token, SubjectTrie())
+        node.items.append(item)
+
+    def remove(self, subject: str, item: T) -> None:
+        self._remove(subject.split("."), 0, item)
+
+    def _remove(self, tokens: list[str], i: int, item: T) -> None:
+        if i == len(tokens):
+            if item in self.items:
+                self.items.remove(item)
+            return
+
+        if (child := self.children.get(tokens[i])) is not None:
+            child._remove(tokens, i + 1, item)
+            if not child:
+                del self.children[tokens[i]]
+
+    def match(self, subject: str) -> list[T]:
+        result: list[T] = []
+        self._match(subject.split("."), 0, result)
+        return result
+
+    def _match(self, tokens: list[str], i: int, result: list[T]) -> None:
+        if i == len(tokens):
+            result.extend(self.items)
+            return
+
+        if (tail := self.children.get(">")) is not None:
+            result.extend(tail.items)
+
+        if (child := self.children.get(tokens[i])) is not None:
+            child._match(tokens, i + 1, result)
+
+        if (child := self.children.get("*")) is not None:
+            child._match(tokens, i + 1, result)
+
+
+class SharedSubscriptions:
+    """Core subscriptions shared by subscribers of a broker.
+
+    Subscribers with the same first subject token share one `<token>.>`
+    wildcard subscription. Its messages are routed to the subscribers by a
+    subject trie.
+
+    Queue group subscribers are never shared: the server balances the whole
+    wildcard between the group members, so a message could be delivered to
+    an instance without a subscriber for its subject and lost.
+    """
+
+    def __init__(self) -> None:
+        self._groups: dict[str, _SharedGroup] = {}
+        self._lock: anyio.Lock | None = None
+
+    @staticmethod
+    def wildcard(subject: str) -> str | None:
+        """Shared subscription subject for the subscriber one, if it can be shared."""
+        root, sep, _ = subject.partition(".")
+        if not sep or root in {"*", ">"}:
+            return None
+        return f"{root}.>"
+
+    async def subscribe(
+        self,
+        connection: "Client",
+        subject: str,
+        *,
+        cb: Callable[["Msg"], Awaitable[None]],
+        max_pending: int = 0,
+    ) -> "SharedMember":
+        wildcard = self.wildcard(subject)
+        assert wildcard, f"`{subject}` subject can't be shared"
+
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if (group := self._groups.get(wildcard)) is None:
+                group = _SharedGroup()
+                await group.start(connection, wildcard)
+                self._groups[wildcard] = group
+
+            member = SharedMember(self, group, subject, cb, max_pending=max_pending)
+            group.trie.add(subject, member)
+            return member
+
+    @property
+    def subscriptions(self) -> int:
+        return len(self._groups)
+
+    async def remove(self, member: "SharedMember") -> None:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            group = member.group
+            group.trie.remove(member.subject, member)
+            await member.stop()
+
+            if not group.trie:
+                for key, g in tuple(self._groups.items()):
+                    if g is group:
+                        del self._groups[key]
+                await group.stop()
+
+
+class SharedMember:
+    """Subscriber part of a shared subscription.
+
+    Messages are processed by the member task, so a busy subscriber doesn't
+    block others until its buffer of `max_pending` messages is full.
+    """
+
+    def __init__(
+        self,
+        manager: SharedSubscriptions,
+        group: "_SharedGroup",
+        subject: str,
+        cb: Callable[["Msg"], Awaitable[None]],
+        *,
+        max_pending: int,
+    ) -> None:
+        self.group = group
+        self.subject = subject
+
+        self._manager = manager
+        self._cb = cb
+        self._queue: asyncio.Queue[Msg] = asyncio.Queue(max_pending)
+        self._task = asyncio.create_task(self._process_messages())
+
+    async def put(self, msg: "Msg") -> None:
+        # a slow subscriber pushes back on the whole shared subscription
+        await self._queue.put(msg)
+
+    async def unsubscribe(self) -> None:
+        await self._manager.remove(self)
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        # wakes up the dispatcher if it waits for a free room
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def _process_messages(self) -> None:
+        while True:
+            msg = await self._queue.get()
+            with suppress(Exception):
+                # errors are processed by the subscriber itself
+                await self._cb(msg)
+
+
+class _SharedGroup:
+    __slots__ = ("subscription", "trie")
+
+    def __init__(self) -> None:
+        self.trie: SubjectTrie[SharedMember] = SubjectTrie()
+        self.subscription: Subscription | None = None
+
+    async def start(self, connection: "Client", subject: str) -> None:
+        self.subscription = await connection.subscribe(
+            subject=subject,
+            cb=self.dispatch,
+        )
+
+    async def dispatch(self, msg: "Msg") -> None:
+        for member in self.trie.match(msg.subject):
+            await member.put(msg)
+
+    async def stop(self) -> None:
+        if self.subscription is not None:
+            with suppress(Exception):
+                await self.subscription.unsubscribe()
+            self.subscription = None
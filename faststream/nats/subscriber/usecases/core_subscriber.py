@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Optional
 
 from nats.errors import TimeoutError
@@ -7,6 +7,7 @@ from typing_extensions import override
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.nats.parser import NatsParser
+from faststream.nats.subscriber.shared import compile_subject
 
 from .basic import DefaultSubscriber
 
@@ -18,11 +19,12 @@ if TYPE_CHECKING:
     from faststream._internal.endpoint.subscriber.call_item import CallsCollection
     from faststream.message import StreamMessage
     from faststream.nats.message import NatsMessage
+    from faststream.nats.subscriber.adapters import Unsubscriptable
     from faststream.nats.subscriber.config import NatsSubscriberConfig
 
 
 class CoreSubscriber(DefaultSubscriber["Msg"]):
-    subscription: Optional["Subscription"]
+    subscription: Optional["Unsubscriptable"]
     _fetch_sub: Optional["Subscription"]
 
     def __init__(
@@ -33,7 +35,7 @@ class CoreSubscriber(DefaultSubscriber["Msg"]):
         *,
         queue: str,
     ) -> None:
-        parser = NatsParser(
+        parser = self._nats_parser = NatsParser(
             pattern=config.subject,
             is_ack_disabled=True,  # core subscriber has no ack policy
         )
@@ -115,10 +117,34 @@ class CoreSubscriber(DefaultSubscriber["Msg"]):
         if self.subscription:
             return
 
-        self.subscription = await self.connection.subscribe(
+        self.subscription = await self._subscribe(cb=self.consume)
+
+    async def _subscribe(
+        self,
+        cb: Callable[["Msg"], Awaitable[None]],
+    ) -> "Unsubscriptable":
+        shared = self._outer_config.shared_subscriptions
+
+        if (
+            shared is not None
+            and not self.queue
+            and not self.extra_options.get("max_msgs")
+            and (compiled := compile_subject(self.subject)) is not None
+            and shared.wildcard(compiled[0]) is not None
+        ):
+            subject, path_params = compiled
+            self._nats_parser.set_path_params(path_params)
+            return await shared.subscribe(
+                self.connection,
+                subject,
+                cb=cb,
+                max_pending=self.extra_options.get("pending_msgs_limit") or 0,
+            )
+
+        return await self.connection.subscribe(
             subject=self.clear_subject,
             queue=self.queue,
-            cb=self.consume,
+            cb=cb,
             **self.extra_options,
         )
 
@@ -147,9 +173,4 @@ class ConcurrentCoreSubscriber(ConcurrentMixin["Msg"], CoreSubscriber):
 
         self.start_consume_task()
 
-        self.subscription = await self.connection.subscribe(
-            subject=self.clear_subject,
-            queue=self.queue,
-            cb=self._put_msg,
-            **self.extra_options,
-        )
+        self.subscription = await self._subscribe(cb=self._put_msg)
@@ -1,4 +1,5 @@
-from collections.abc import AsyncIterator, Awaitable, Callable
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
 
@@ -17,6 +18,7 @@ from .basic import DefaultSubscriber
 from .stream_basic import StreamSubscriber
 
 if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectSendStream
     from nats.aio.msg import Msg
     from nats.js import JetStreamContext
 
@@ -55,6 +57,10 @@ class PullStreamSubscriber(
 
         self.pull_sub = pull_sub
 
+    @property
+    def _fetch_batch_size(self) -> int:
+        return self.pull_sub.batch_size
+
     @override
     async def _create_subscription(self) -> None:
         """Create NATS subscription and start consume task."""
@@ -75,12 +81,17 @@ class PullStreamSubscriber(
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription
 
+        if self.pull_sub.pipelined:
+            await self._consume_pipelined(cb)
+            return
+
         while self.running:  # pragma: no branch
             messages = []
             with suppress(TimeoutError, ConnectionClosedError, ServiceUnavailableError):
                 messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
+                    batch=self._fetch_batch_size,
                     timeout=self.pull_sub.timeout,
+                    heartbeat=self.pull_sub.heartbeat,
                 )
 
             if messages:
@@ -88,8 +99,62 @@ class PullStreamSubscriber(
                     for msg in messages:
                         tg.start_soon(cb, msg)
 
+    async def _consume_pipelined(
+        self,
+        cb: Callable[["Msg"], Awaitable["SendableMessage"]],
+    ) -> None:
+        """Fetch messages in background while already fetched ones are processed."""
+        assert self.subscription
+        assert self.pull_sub.high_watermark is not None
+        assert self.pull_sub.low_watermark is not None
+
+        high_watermark = self.pull_sub.high_watermark
+        low_watermark = self.pull_sub.low_watermark
+
+        # messages fetched but not processed by `cb` yet
+        buffered = 0
+        refill = asyncio.Event()
+        refill.set()
+
+        async def process(msg: "Msg") -> None:
+            nonlocal buffered
+            try:
+                await cb(msg)
+            finally:
+                buffered -= 1
+                if buffered <= low_watermark:
+                    refill.set()
+
+        async with anyio.create_task_group() as tg:
+            while self.running:  # pragma: no branch
+                await refill.wait()
+
+                messages = []
+                with suppress(
+                    TimeoutError, ConnectionClosedError, ServiceUnavailableError
+                ):
+                    messages = await self.subscription.fetch(
+                        batch=high_watermark - buffered,
+                        timeout=self.pull_sub.timeout,
+                        heartbeat=self.pull_sub.heartbeat,
+                    )
+
+                buffered += len(messages)
+                if buffered > low_watermark:
+                    refill.clear()
+
+                for msg in messages:
+                    tg.start_soon(process, msg)
+
 
 class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscriber):
+    @property
+    def _fetch_batch_size(self) -> int:
+        if self.limiter.adaptive:
+            # prefetch no more messages than workers are allowed to process
+            return self.limiter.limit
+        return self.pull_sub.batch_size
+
     @override
     async def _create_subscription(self) -> None:
         """Create NATS subscription and start consume task."""
@@ -224,12 +289,78 @@ class BatchPullStreamSubscriber(
         """Endless task consuming messages using NATS Pull subscriber."""
         assert self.subscription, "You should call `create_subscription` at first."
 
+        if self.pull_sub.pipelined:
+            await self._consume_pipelined()
+            return
+
         while self.running:  # pragma: no branch
             with suppress(TimeoutError, ConnectionClosedError, ServiceUnavailableError):
-                messages = await self.subscription.fetch(
-                    batch=self.pull_sub.batch_size,
-                    timeout=self.pull_sub.timeout,
-                )
+                messages = await self._fetch_batch()
 
                 if messages:
                     await self.consume(messages)
+
+    async def _consume_pipelined(self) -> None:
+        """Fetch the next batch while the current one is processed."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[list["Msg"]]()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._prefetch_batches, send_stream)
+
+            async with receive_stream:
+                async for messages in receive_stream:
+                    await self.consume(messages)
+
+                    if not self.running:
+                        break
+
+    async def _prefetch_batches(
+        self,
+        send_stream: "MemoryObjectSendStream[list[Msg]]",
+    ) -> None:
+        """Fetch batches one ahead of the consumer.
+
+        A fetch in progress is awaited on stop, so its messages are not left
+        unacknowledged until the `ack_wait` expires. A fetched batch the
+        consumer does not take anymore is nacked to be redelivered right away.
+        """
+        async with send_stream:
+            while self.running:  # pragma: no branch
+                messages: list[Msg] = []
+                with suppress(
+                    TimeoutError, ConnectionClosedError, ServiceUnavailableError
+                ):
+                    with anyio.CancelScope(shield=True):
+                        messages = await self._fetch_batch()
+
+                if not messages:
+                    continue
+
+                try:
+                    await send_stream.send(messages)
+
+                except anyio.BrokenResourceError:
+                    # the consumer is stopped
+                    await _nak_messages(messages)
+                    return
+
+                except anyio.get_cancelled_exc_class():
+                    with anyio.CancelScope(shield=True):
+                        await _nak_messages(messages)
+                    raise
+
+    async def _fetch_batch(self) -> list["Msg"]:
+        assert self.subscription, "You should call `create_subscription` at first."
+
+        return await self.subscription.fetch(
+            batch=self.pull_sub.batch_size,
+            timeout=self.pull_sub.timeout,
+            heartbeat=self.pull_sub.heartbeat,
+        )
+
+
+async def _nak_messages(messages: Iterable["Msg"]) -> None:
+    for msg in messages:
+        # the connection can be already closed on shutdown
+        with suppress(Exception):
+            await msg.nak()
@@ -175,6 +175,32 @@ class FakeProducer(NatsFastProducer):
 
             await self._execute_handler(msg, cmd.destination, handler)
 
+    @override
+    async def publish_batch(self, cmd: "NatsPublishCommand") -> None:
+        incoming = [
+            await build_message(
+                message=body,
+                subject=cmd.destination,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id,
+                reply_to=cmd.reply_to,
+                serializer=self.broker.config.fd_config._serializer,
+                codec=self.codec,
+            )
+            for body in cmd.batch_bodies
+        ]
+
+        for handler in _find_handler(
+            self.subscribers,
+            cmd.destination,
+            cmd.stream,
+        ):
+            if (pull := getattr(handler, "pull_sub", None)) and pull.batch:
+                await self._execute_handler(incoming, cmd.destination, handler)
+            else:
+                for msg in incoming:
+                    await self._execute_handler(msg, cmd.destination, handler)
+
     @override
     async def request(self, cmd: "NatsPublishCommand") -> "PatchedMessage":
         incoming = await build_message(
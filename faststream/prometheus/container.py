@@ -1,17 +1,54 @@
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Optional, cast
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Optional, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.registry import Collector
 
 if TYPE_CHECKING:
     from prometheus_client import CollectorRegistry
-    from prometheus_client.registry import Collector
+    from prometheus_client.metrics_core import Metric
+
+
+class FlushCollector(Collector):
+    """Registry collector flushing buffered metrics updates on scrape.
+
+    It yields no metrics itself and is registered before the FastStream
+    metrics, so the registry collects them already flushed.
+    """
+
+    _by_registry: "WeakKeyDictionary[CollectorRegistry, FlushCollector]" = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self) -> None:
+        self._managers: WeakSet[Any] = WeakSet()
+
+    @classmethod
+    def for_registry(cls, registry: "CollectorRegistry") -> "FlushCollector":
+        if (collector := cls._by_registry.get(registry)) is None:
+            collector = cls._by_registry[registry] = cls()
+            registry.register(collector)
+        return collector
+
+    def add(self, manager: Any) -> None:
+        self._managers.add(manager)
+
+    def describe(self) -> Iterable["Metric"]:
+        # prevents the registry from calling `collect` on registration
+        return ()
+
+    def collect(self) -> Iterable["Metric"]:
+        for manager in tuple(self._managers):
+            manager.flush()
+        return ()
 
 
 class MetricsContainer:
     __slots__ = (
         "_metrics_prefix",
         "_registry",
+        "flush_collector",
         "published_messages_duration_seconds",
         "published_messages_exceptions_total",
         "published_messages_total",
@@ -49,6 +86,9 @@ class MetricsContainer:
         self._registry = registry
         self._metrics_prefix = metrics_prefix
 
+        # should be registered before metrics to flush them before collecting
+        self.flush_collector = FlushCollector.for_registry(registry)
+
         received_messages_total_name = f"{metrics_prefix}_received_messages_total"
         self.received_messages_total = cast(
             "Counter",
@@ -1,9 +1,15 @@
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any
+
 from .container import MetricsContainer
 from .types import ProcessingStatus, PublishingStatus
 
 
 class MetricsManager:
-    __slots__ = ("_app_name", "_container")
+    __slots__ = ("__weakref__", "_app_name", "_children", "_container")
 
     def __init__(
         self, container: MetricsContainer, *, app_name: str = "faststream"
@@ -11,6 +17,22 @@ class MetricsManager:
         self._container = container
         self._app_name = app_name
 
+        # label-bound metric children, `.labels()` hashes and locks for every call
+        self._children: dict[tuple[Any, ...], Any] = {}
+
+    def _child(self, metric: Any, **labels: str) -> Any:
+        key = (metric, *labels.items())
+
+        if (child := self._children.get(key)) is None:
+            child = self._children[key] = self._make_child(
+                metric.labels(app_name=self._app_name, **labels),
+            )
+
+        return child
+
+    def _make_child(self, child: Any) -> Any:
+        return child
+
     def add_received_message(
         self,
         broker: str,
@@ -18,8 +40,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_total.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_messages_total,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -32,8 +54,8 @@ class MetricsManager:
         size: int,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_size_bytes.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_messages_size_bytes,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -46,8 +68,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_messages_in_process,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -60,8 +82,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_messages_in_process,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -75,8 +97,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_total.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_processed_messages_total,
             broker=broker,
             handler=handler,
             status=status.value,
@@ -90,8 +112,8 @@ class MetricsManager:
         handler: str,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_duration_seconds.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_processed_messages_duration_seconds,
             broker=broker,
             handler=handler,
             **custom_labels,
@@ -104,8 +126,8 @@ class MetricsManager:
         exception_type: str,
         **custom_labels: str,
     ) -> None:
-        self._container.received_processed_messages_exceptions_total.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.received_processed_messages_exceptions_total,
             broker=broker,
             handler=handler,
             exception_type=exception_type,
@@ -120,8 +142,8 @@ class MetricsManager:
         amount: int = 1,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_total.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.published_messages_total,
             broker=broker,
             destination=destination,
             status=status.value,
@@ -135,8 +157,8 @@ class MetricsManager:
         destination: str,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_duration_seconds.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.published_messages_duration_seconds,
             broker=broker,
             destination=destination,
             **custom_labels,
@@ -149,10 +171,102 @@ class MetricsManager:
         exception_type: str,
         **custom_labels: str,
     ) -> None:
-        self._container.published_messages_exceptions_total.labels(
-            app_name=self._app_name,
+        self._child(
+            self._container.published_messages_exceptions_total,
             broker=broker,
             destination=destination,
             exception_type=exception_type,
             **custom_labels,
         ).inc()
+
+
+class BufferedMetricsManager(MetricsManager):
+    """Metrics manager accumulating updates to flush them to metrics later.
+
+    Updates are flushed every `flush_interval` seconds by a background thread
+    and before each scrape of the container registry.
+    """
+
+    __slots__ = ("_flush_lock", "_flush_thread", "flush_interval")
+
+    def __init__(
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str = "faststream",
+        flush_interval: float,
+    ) -> None:
+        super().__init__(container, app_name=app_name)
+
+        self.flush_interval = flush_interval
+
+        self._flush_lock = threading.Lock()
+        self._flush_thread: threading.Thread | None = None
+
+        container.flush_collector.add(self)
+
+    def _make_child(self, child: Any) -> "_BufferedChild":
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self.flush_interval),
+                name="faststream-metrics-flush",
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+        return _BufferedChild(child)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            for child in tuple(self._children.values()):
+                child.flush()
+
+
+class _BufferedChild:
+    """Metric child proxy updated by the event loop only.
+
+    The flusher thread just reads its `total`, so there is no lock to take.
+    """
+
+    __slots__ = ("_child", "_flushed", "_observations", "_total")
+
+    def __init__(self, child: Any) -> None:
+        self._child = child
+        self._total: float = 0
+        self._flushed: float = 0
+        self._observations: deque[float] = deque()
+
+    def inc(self, amount: float = 1) -> None:
+        self._total += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._total -= amount
+
+    def observe(self, amount: float) -> None:
+        self._observations.append(amount)
+
+    def flush(self) -> None:
+        total = self._total
+        if delta := total - self._flushed:
+            self._flushed = total
+            # gauge deltas can be negative
+            self._child.inc(delta)
+
+        observations = self._observations
+        while observations:
+            self._child.observe(observations.popleft())
+
+
+def _flush_periodically(
+    manager_ref: "weakref.ref[BufferedMetricsManager]",
+    interval: float,
+) -> None:
+    while True:
+        time.sleep(interval)
+
+        if (manager := manager_ref()) is None:
+            return
+
+        manager.flush()
+        del manager
@@ -5,14 +5,14 @@ from typing import TYPE_CHECKING, Any, Generic
 from faststream._internal.constants import EMPTY
 from faststream._internal.middlewares import BaseMiddleware
 from faststream._internal.types import AnyMsg, BrokerMiddleware, PublishCommandType
-from faststream.exceptions import IgnoredException
+from faststream.exceptions import IgnoredException, SetupError
 from faststream.message import SourceType
 from faststream.prometheus.consts import (
     PROCESSING_STATUS_BY_ACK_STATUS,
     PROCESSING_STATUS_BY_HANDLER_EXCEPTION_MAP,
 )
 from faststream.prometheus.container import MetricsContainer
-from faststream.prometheus.manager import MetricsManager
+from faststream.prometheus.manager import BufferedMetricsManager, MetricsManager
 from faststream.prometheus.provider import MetricsSettingsProvider
 from faststream.prometheus.types import ProcessingStatus, PublishingStatus
 from faststream.response import PublishType
@@ -46,10 +46,15 @@ class PrometheusMiddleware(BrokerMiddleware[AnyMsg, PublishCommandType]):
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
         custom_labels: dict[str, str | Callable[[Any], str]] | None = None,
+        flush_interval: float | None = None,
     ) -> None:
         if app_name is EMPTY:
             app_name = metrics_prefix
 
+        if flush_interval is not None and flush_interval <= 0:
+            msg = "`flush_interval` should be greater than 0."
+            raise SetupError(msg)
+
         self._settings_provider_factory = settings_provider_factory
         self._metrics_container = MetricsContainer(
             registry,
@@ -57,9 +62,14 @@ class PrometheusMiddleware(BrokerMiddleware[AnyMsg, PublishCommandType]):
             received_messages_size_buckets=received_messages_size_buckets,
             custom_label_names=tuple((custom_labels or {}).keys()),
         )
-        self._metrics_manager = MetricsManager(
-            self._metrics_container,
-            app_name=app_name,
+        self._metrics_manager = (
+            MetricsManager(self._metrics_container, app_name=app_name)
+            if flush_interval is None
+            else BufferedMetricsManager(
+                self._metrics_container,
+                app_name=app_name,
+                flush_interval=flush_interval,
+            )
         )
         self._static_labels = {}
         self._dynamic_labels = {}
@@ -82,8 +92,11 @@ class PrometheusMiddleware(BrokerMiddleware[AnyMsg, PublishCommandType]):
             metrics_manager=self._metrics_manager,
             settings_provider_factory=self._settings_provider_factory,
             context=context,
-            custom_labels=self._static_labels
-            | {k: v(msg) for k, v in self._dynamic_labels.items()},
+            custom_labels=(
+                self._static_labels | {k: v(msg) for k, v in self._dynamic_labels.items()}
+                if self._dynamic_labels
+                else self._static_labels
+            ),
         )
 
 
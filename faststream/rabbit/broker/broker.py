@@ -57,6 +57,8 @@ if TYPE_CHECKING:
     from yarl import URL
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+    from faststream._internal.logger import LogQueue
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
@@ -64,6 +66,8 @@ if TYPE_CHECKING:
     )
     from faststream.rabbit.helpers import RabbitDeclarer
     from faststream.rabbit.message import RabbitMessage
+    from faststream.rabbit.publisher import RabbitPublisher
+    from faststream.rabbit.subscriber import RabbitSubscriber
     from faststream.rabbit.types import AioPikaSendableMessage
     from faststream.rabbit.utils import RabbitClientProperties
     from faststream.security import BaseSecurity
@@ -92,6 +96,8 @@ class RabbitBroker(
         app_id: str | None = SERVICE_NAME,
         # broker base args
         graceful_timeout: float | None = None,
+        start_concurrency: int = 1,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
@@ -109,6 +115,7 @@ class RabbitBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_queue: Optional["LogQueue"] = None,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
@@ -130,6 +137,8 @@ class RabbitBroker(
             default_channel: Default channel settings to use.
             app_id: Application name to mark outgoing messages by.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
+            start_concurrency: Number of subscribers started or stopped concurrently.
+            executor: Executor to run sync handlers, filters, parsers and decoders of all subscribers.
             ack_policy: Default acknowledgement policy for all subscribers. Individual subscribers can override.
             decoder: Custom decoder object.
             codec: Custom codec object.
@@ -146,6 +155,7 @@ class RabbitBroker(
             tags: AsyncAPI server tags.
             logger: User-specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_queue: Queue to emit logs from a background thread and sample per-message logs.
             apply_types: Whether to use FastDepends or not.
             serializer: FastDepends-compatible serializer to validate incoming messages.
             provider: Provider for FastDepends.
@@ -206,6 +216,7 @@ class RabbitBroker(
                 logger=make_rabbit_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    log_queue=log_queue,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
@@ -216,6 +227,8 @@ class RabbitBroker(
                 # subscriber args
                 broker_dependencies=dependencies,
                 graceful_timeout=graceful_timeout,
+                start_concurrency=start_concurrency,
+                executor=executor,
                 ack_policy=ack_policy,
                 extra_context={
                     "broker": self,
@@ -270,8 +283,48 @@ class RabbitBroker(
         """Connect broker to RabbitMQ and startup all subscribers."""
         await self.connect()
         await self.declare_queue(RABBIT_REPLY)
+
+        if self.config.broker_config.start_concurrency > 1:
+            # exchanges are shared by endpoints started concurrently, so
+            # declare them before to bind queues and to check passive ones
+            for exchange in self._endpoints_exchanges():
+                await self.declare_exchange(exchange)
+
         await super().start()
 
+    def _endpoints_exchanges(self) -> list["RabbitExchange"]:
+        subscribers = cast("list[RabbitSubscriber]", self.subscribers)
+        publishers = cast("list[RabbitPublisher]", self.publishers)
+
+        exchanges = [
+            *(
+                sub.exchange
+                for sub in subscribers
+                if sub.exchange is not None and sub.exchange.name and sub.queue.declare
+            ),
+            *(
+                pub.exchange
+                for pub in publishers
+                if pub.exchange is not None and pub.exchange.name
+            ),
+        ]
+
+        # declared exchanges go first to let passive ones find them
+        return sorted(exchanges, key=lambda e: not e.declare)
+
+    @override
+    def _subscribers_start_stages(self) -> Iterable[Sequence["RabbitSubscriber"]]:
+        subscribers = cast("list[RabbitSubscriber]", self.subscribers)
+
+        if self.config.broker_config.start_concurrency == 1:
+            return (subscribers,)
+
+        # passive queues can be declared by other subscribers
+        return (
+            [sub for sub in subscribers if sub.queue.declare],
+            [sub for sub in subscribers if not sub.queue.declare],
+        )
+
     @override
     async def publish(
         self,
@@ -22,10 +22,12 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType, TimeoutType
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.rabbit.publisher import RabbitPublisher
     from faststream.rabbit.subscriber import RabbitSubscriber
@@ -42,12 +44,17 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
         *,
         channel: Optional["Channel"] = None,
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout: float = 0.2,
         ack_policy: AckPolicy = EMPTY,
         # broker arguments
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         no_reply: bool = False,
         persistent: bool = True,
         # AsyncAPI information
@@ -62,11 +69,16 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             exchange (Union[str, RabbitExchange, None], optional): RabbitMQ exchange to bind queue to. Uses default exchange if not presented. **FastStream** declares exchange object automatically by default.
             channel (Optional[Channel], optional): Channel to use for consuming messages.
             consume_args (dict[str, Any] | None, optional): Extra consumer arguments to use in `queue.consume(...)` method.
+            batch (bool, optional): Whether to consume messages in batches or not. A batch is acknowledged by a single frame, so the subscriber uses its own channel by default.
+            max_records (int, optional): Number of messages to consume as one batch.
+            batch_timeout (float, optional): Seconds to wait for a batch filling since its first message.
             ack_policy (AckPolicy, optional): Acknowledgement policy for message processing.
             dependencies (Iterable[Dependant], optional): Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser (Optional[CustomCallable], optional): Parser to map original **IncomingMessage** Msg to FastStream one.
             decoder (Optional[CustomCallable], optional): Function to decode FastStream msg bytes body to python objects.
             codec (Optional[CodecProto], optional): Custom codec object.
+            filter_key (Optional[FilterKey], optional): Function to get a message key to select handlers registered with the same `key`.
+            executor (Optional[SyncExecutor], optional): Executor to run sync handlers, filters, parsers and decoders. Overrides the broker one.
             no_reply (bool, optional): Whether to disable **FastStream** RPC and Reply To auto responses or not.
             title (Optional[str], optional): AsyncAPI subscriber object title.
             description (Optional[str], optional): AsyncAPI subscriber object description. Uses decorated docstring as default.
@@ -81,6 +93,9 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             exchange=RabbitExchange.validate(exchange),
             consume_args=consume_args,
             channel=channel,
+            batch=batch,
+            max_records=max_records,
+            batch_timeout=batch_timeout,
             # subscriber args
             ack_policy=ack_policy,
             no_reply=no_reply,
@@ -98,6 +113,8 @@ class RabbitRegistrator(Registrator[IncomingMessage, RabbitBrokerConfig]):
             parser_=parser,
             decoder_=decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
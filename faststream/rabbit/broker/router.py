@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType, TimeoutType
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -147,10 +148,14 @@ class RabbitRoute(SubscriberRoute):
         *,
         publishers: Iterable[RabbitPublisher] = (),
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout: float = 0.2,
         # broker arguments
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -175,12 +180,20 @@ class RabbitRoute(SubscriberRoute):
                 RabbitMQ publishers to broadcast the handler result.
             consume_args:
                 Extra consumer arguments to use in `queue.consume(...)` method.
+            batch:
+                Whether to consume messages in batches or not.
+            max_records:
+                Number of messages to consume as one batch.
+            batch_timeout:
+                Seconds to wait for a batch filling since its first message.
             dependencies:
                 Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser:
                 Parser to map original **IncomingMessage** Msg to FastStream one.
             decoder:
                 Function to decode FastStream msg bytes body to python objects.
+            executor:
+                Executor to run sync handlers, filters, parsers and decoders. Overrides the broker one.
             ack_policy:
                 Acknowledgment policy for the subscriber (by default `MANUAL`).
             no_reply:
@@ -199,9 +212,13 @@ class RabbitRoute(SubscriberRoute):
             queue=queue,
             exchange=exchange,
             consume_args=consume_args,
+            batch=batch,
+            max_records=max_records,
+            batch_timeout=batch_timeout,
             dependencies=dependencies,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             ack_policy=ack_policy,
             no_reply=no_reply,
             title=title,
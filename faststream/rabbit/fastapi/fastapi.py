@@ -36,6 +36,7 @@ if TYPE_CHECKING:
     from yarl import URL
 
     from faststream._internal.basic_types import LoggerProto
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -324,10 +325,14 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
         *,
         channel: Optional["Channel"] = None,
         consume_args: dict[str, Any] | None = None,
+        batch: bool = False,
+        max_records: int = 10,
+        batch_timeout: float = 0.2,
         # broker arguments
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # AsyncAPI information
@@ -350,9 +355,13 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
                 exchange=exchange,
                 consume_args=consume_args,
                 channel=channel,
+                batch=batch,
+                max_records=max_records,
+                batch_timeout=batch_timeout,
                 dependencies=dependencies,
                 parser=parser,
                 decoder=decoder,
+                executor=executor,
                 ack_policy=ack_policy,
                 no_reply=no_reply,
                 title=title,
@@ -43,3 +43,42 @@ class RabbitMessage(StreamMessage[IncomingMessage]):
         if pika_message.locked:
             return
         await pika_message.reject(requeue=requeue)
+
+
+class RabbitBatchMessage(StreamMessage[tuple[IncomingMessage, ...]]):
+    """A message class for working with batches of RabbitMQ messages.
+
+    The whole batch is acknowledged, nack-ed or rejected by a single frame
+    with the `multiple` flag on the last message delivery tag.
+    """
+
+    async def ack(self) -> None:
+        """Acknowledge all messages of the batch."""
+        pika_message = self.raw_message[-1]
+        await super().ack()
+        if pika_message.locked:
+            return
+        await pika_message.ack(multiple=True)
+
+    async def nack(
+        self,
+        requeue: bool = True,
+    ) -> None:
+        """Negative Acknowledgment of all messages of the batch."""
+        pika_message = self.raw_message[-1]
+        await super().nack()
+        if pika_message.locked:
+            return
+        await pika_message.nack(multiple=True, requeue=requeue)
+
+    async def reject(
+        self,
+        requeue: bool = False,
+    ) -> None:
+        """Reject all messages of the batch."""
+        pika_message = self.raw_message[-1]
+        await super().reject()
+        if pika_message.locked:
+            return
+        # AMQP `basic.reject` has no `multiple` flag, `basic.nack` is the same otherwise
+        await pika_message.nack(multiple=True, requeue=requeue)
@@ -2,7 +2,9 @@ from opentelemetry.metrics import Meter, MeterProvider
 from opentelemetry.trace import TracerProvider
 
 from faststream.opentelemetry.middleware import TelemetryMiddleware
-from faststream.rabbit.opentelemetry.provider import RabbitTelemetrySettingsProvider
+from faststream.rabbit.opentelemetry.provider import (
+    telemetry_attributes_provider_factory,
+)
 from faststream.rabbit.response import RabbitPublishCommand
 
 
@@ -16,7 +18,7 @@ class RabbitTelemetryMiddleware(TelemetryMiddleware[RabbitPublishCommand]):
         include_messages_counters: bool = False,
     ) -> None:
         super().__init__(
-            settings_provider_factory=lambda _: RabbitTelemetrySettingsProvider(),
+            settings_provider_factory=telemetry_attributes_provider_factory,
             tracer_provider=tracer_provider,
             meter_provider=meter_provider,
             meter=meter,
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Union, cast
 
 from opentelemetry.semconv.trace import SpanAttributes
 
+from faststream._internal.types import MsgType
 from faststream.opentelemetry import TelemetrySettingsProvider
 from faststream.opentelemetry.consts import MESSAGING_DESTINATION_PUBLISH_NAME
 from faststream.rabbit.response import RabbitPublishCommand
@@ -12,14 +14,35 @@ if TYPE_CHECKING:
     from faststream.message import StreamMessage
 
 
-class RabbitTelemetrySettingsProvider(
-    TelemetrySettingsProvider["IncomingMessage", RabbitPublishCommand],
+class BaseRabbitTelemetrySettingsProvider(
+    TelemetrySettingsProvider[MsgType, RabbitPublishCommand],
 ):
     __slots__ = ("messaging_system",)
 
     def __init__(self) -> None:
         self.messaging_system = "rabbitmq"
 
+    def get_publish_attrs_from_cmd(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> dict[str, Any]:
+        return {
+            SpanAttributes.MESSAGING_SYSTEM: self.messaging_system,
+            SpanAttributes.MESSAGING_DESTINATION_NAME: cmd.exchange.name,
+            SpanAttributes.MESSAGING_RABBITMQ_DESTINATION_ROUTING_KEY: cmd.destination,
+            SpanAttributes.MESSAGING_MESSAGE_CONVERSATION_ID: cmd.correlation_id,
+        }
+
+    def get_publish_destination_name(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> str:
+        return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+
+
+class RabbitTelemetrySettingsProvider(
+    BaseRabbitTelemetrySettingsProvider["IncomingMessage"],
+):
     def get_consume_attrs_from_message(
         self,
         msg: "StreamMessage[IncomingMessage]",
@@ -42,19 +65,40 @@ class RabbitTelemetrySettingsProvider(
         routing_key = msg.raw_message.routing_key
         return f"{exchange}.{routing_key}"
 
-    def get_publish_attrs_from_cmd(
+
+class BatchRabbitTelemetrySettingsProvider(
+    BaseRabbitTelemetrySettingsProvider[tuple["IncomingMessage", ...]],
+):
+    def get_consume_attrs_from_message(
         self,
-        cmd: "RabbitPublishCommand",
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
     ) -> dict[str, Any]:
+        raw_message = msg.raw_message[0]
+
         return {
             SpanAttributes.MESSAGING_SYSTEM: self.messaging_system,
-            SpanAttributes.MESSAGING_DESTINATION_NAME: cmd.exchange.name,
-            SpanAttributes.MESSAGING_RABBITMQ_DESTINATION_ROUTING_KEY: cmd.destination,
-            SpanAttributes.MESSAGING_MESSAGE_CONVERSATION_ID: cmd.correlation_id,
+            SpanAttributes.MESSAGING_MESSAGE_ID: msg.message_id,
+            SpanAttributes.MESSAGING_MESSAGE_CONVERSATION_ID: msg.correlation_id,
+            SpanAttributes.MESSAGING_MESSAGE_PAYLOAD_SIZE_BYTES: len(
+                bytearray().join(cast("Sequence[bytes]", msg.body)),
+            ),
+            SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT: len(msg.raw_message),
+            SpanAttributes.MESSAGING_RABBITMQ_DESTINATION_ROUTING_KEY: raw_message.routing_key,
+            MESSAGING_DESTINATION_PUBLISH_NAME: raw_message.exchange,
         }
 
-    def get_publish_destination_name(
+    def get_consume_destination_name(
         self,
-        cmd: "RabbitPublishCommand",
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
     ) -> str:
-        return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+        raw_message = msg.raw_message[0]
+        exchange = raw_message.exchange or "default"
+        return f"{exchange}.{raw_message.routing_key}"
+
+
+def telemetry_attributes_provider_factory(
+    msg: Union["IncomingMessage", Sequence["IncomingMessage"], None],
+) -> RabbitTelemetrySettingsProvider | BatchRabbitTelemetrySettingsProvider:
+    if isinstance(msg, Sequence):
+        return BatchRabbitTelemetrySettingsProvider()
+    return RabbitTelemetrySettingsProvider()
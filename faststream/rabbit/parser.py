@@ -4,14 +4,15 @@ from typing import TYPE_CHECKING, Optional
 from aio_pika import Message
 from aio_pika.abc import DeliveryMode
 
-from faststream._internal.parser import DefaultCodec
+from faststream._internal.parser import DefaultCodec, mark_json_decoder
 from faststream._internal.utils.path import match_path
 from faststream.message import (
     StreamMessage,
+    decode_batch_message,
     decode_message,
     gen_cor_id,
 )
-from faststream.rabbit.message import RabbitMessage
+from faststream.rabbit.message import RabbitBatchMessage, RabbitMessage
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -49,6 +50,7 @@ class AioPikaParser:
             raw_message=message,
         )
 
+    @mark_json_decoder
     async def decode_message(
         self,
         msg: StreamMessage["IncomingMessage"],
@@ -56,6 +58,38 @@ class AioPikaParser:
         """Decode a message."""
         return decode_message(msg)
 
+    async def parse_batch(
+        self,
+        message: tuple["IncomingMessage", ...],
+    ) -> StreamMessage[tuple["IncomingMessage", ...]]:
+        """Parses a batch of incoming messages and returns a RabbitBatchMessage object."""
+        first = message[0]
+
+        batch_headers = [m.headers for m in message]
+        headers = batch_headers[0]
+
+        return RabbitBatchMessage(
+            body=[m.body for m in message],
+            headers=headers,
+            batch_headers=batch_headers,
+            reply_to=first.reply_to or "",
+            content_type=first.content_type,
+            message_id=first.message_id or gen_cor_id(),
+            correlation_id=first.correlation_id or gen_cor_id(),
+            path=match_path(self.pattern, first.routing_key or ""),
+            raw_message=message,
+        )
+
+    async def decode_batch(
+        self,
+        msg: StreamMessage[tuple["IncomingMessage", ...]],
+    ) -> "DecodedMessage":
+        """Decode a batch of messages."""
+        return decode_batch_message(
+            msg,
+            content_types=[m.content_type for m in msg.raw_message],
+        )
+
     @staticmethod
     async def encode_message(
         message: "AioPikaSendableMessage",
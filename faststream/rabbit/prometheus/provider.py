@@ -1,5 +1,7 @@
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Union, cast
 
+from faststream.message.message import MsgType
 from faststream.prometheus import (
     ConsumeAttrs,
     MetricsSettingsProvider,
@@ -12,14 +14,24 @@ if TYPE_CHECKING:
     from faststream.message.message import StreamMessage
 
 
-class RabbitMetricsSettingsProvider(
-    MetricsSettingsProvider["IncomingMessage", RabbitPublishCommand],
+class BaseRabbitMetricsSettingsProvider(
+    MetricsSettingsProvider[MsgType, RabbitPublishCommand],
 ):
     __slots__ = ("messaging_system",)
 
     def __init__(self) -> None:
         self.messaging_system = "rabbitmq"
 
+    def get_publish_destination_name_from_cmd(
+        self,
+        cmd: RabbitPublishCommand,
+    ) -> str:
+        return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+
+
+class RabbitMetricsSettingsProvider(
+    BaseRabbitMetricsSettingsProvider["IncomingMessage"],
+):
     def get_consume_attrs_from_message(
         self,
         msg: "StreamMessage[IncomingMessage]",
@@ -33,8 +45,27 @@ class RabbitMetricsSettingsProvider(
             "messages_count": 1,
         }
 
-    def get_publish_destination_name_from_cmd(
+
+class BatchRabbitMetricsSettingsProvider(
+    BaseRabbitMetricsSettingsProvider[tuple["IncomingMessage", ...]],
+):
+    def get_consume_attrs_from_message(
         self,
-        cmd: RabbitPublishCommand,
-    ) -> str:
-        return f"{cmd.exchange.name or 'default'}.{cmd.destination}"
+        msg: "StreamMessage[tuple[IncomingMessage, ...]]",
+    ) -> ConsumeAttrs:
+        raw_message = msg.raw_message[0]
+        exchange = raw_message.exchange or "default"
+
+        return {
+            "destination_name": f"{exchange}.{raw_message.routing_key}",
+            "message_size": len(bytearray().join(cast("Sequence[bytes]", msg.body))),
+            "messages_count": len(msg.raw_message),
+        }
+
+
+def settings_provider_factory(
+    msg: Union["IncomingMessage", Sequence["IncomingMessage"], None],
+) -> RabbitMetricsSettingsProvider | BatchRabbitMetricsSettingsProvider:
+    if isinstance(msg, Sequence):
+        return BatchRabbitMetricsSettingsProvider()
+    return RabbitMetricsSettingsProvider()
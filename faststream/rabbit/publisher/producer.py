@@ -1,4 +1,7 @@
+import asyncio
 from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -13,17 +16,15 @@ from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.parser import DefaultCodec
 from faststream._internal.producer import ProducerProto
 from faststream.exceptions import FeatureNotSupportedException, IncorrectState
+from faststream.message import gen_cor_id
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RABBIT_REPLY, RabbitExchange
 
 if TYPE_CHECKING:
-    from types import TracebackType
-
     import aiormq
     from aio_pika import IncomingMessage, RobustQueue
     from aio_pika.abc import AbstractIncomingMessage, TimeoutType
-    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
     from fast_depends.library.serializer import SerializerProto
 
     from faststream._internal.parser import CodecProto
@@ -124,6 +125,7 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         self.declarer = declarer
 
         self.__lock: LockState = LockUnset()
+        self.__rpc = _RPCMultiplexer()
         self.serializer: SerializerProto | None = None
         self.codec: CodecProto = DefaultCodec()
 
@@ -146,6 +148,8 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
 
     def disconnect(self) -> None:
         self.__lock = LockUnset()
+        self.__rpc.close()
+        self.__rpc = _RPCMultiplexer()
 
     @override
     async def publish(
@@ -165,22 +169,27 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
 
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
-        async with _RPCCallback(
-            self.__lock.lock,
-            await self.declarer.declare_queue(RABBIT_REPLY),
-        ) as response_queue:
-            with anyio.fail_after(cmd.timeout):
-                await self._publish(
-                    message=cmd.body,
-                    exchange=cmd.exchange,
-                    routing_key=cmd.destination,
-                    reply_to=RABBIT_REPLY.name,
-                    headers=cmd.headers,
-                    correlation_id=cmd.correlation_id,
-                    **cmd.publish_options,
-                    **cmd.message_options,
-                )
-                return await response_queue.receive()
+        rpc = self.__rpc
+
+        if not rpc.started:
+            async with self.__lock.lock:
+                if not rpc.started:
+                    await rpc.start(await self.declarer.declare_queue(RABBIT_REPLY))
+
+        correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with rpc.wait_response(correlation_id) as response, anyio.fail_after(cmd.timeout):
+            await self._publish(
+                message=cmd.body,
+                exchange=cmd.exchange,
+                routing_key=cmd.destination,
+                reply_to=RABBIT_REPLY.name,
+                headers=cmd.headers,
+                correlation_id=correlation_id,
+                **cmd.publish_options,
+                **cmd.message_options,
+            )
+            return await response
 
     async def _publish(
         self,
@@ -214,38 +223,68 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         )
 
 
-class _RPCCallback:
-    """A class provides an RPC lock."""
+class _RPCMultiplexer:
+    """Shares one direct reply-to consumer between all in-flight requests.
 
-    def __init__(self, lock: "anyio.Lock", callback_queue: "RobustQueue") -> None:
-        self.lock = lock
-        self.queue = callback_queue
+    Responses are routed to the waiting requests by `correlation_id`, so it
+    should be unique between the requests in flight.
+    """
 
-    async def __aenter__(self) -> "MemoryObjectReceiveStream[IncomingMessage]":
-        send_response_stream: MemoryObjectSendStream[AbstractIncomingMessage]
-        receive_response_stream: MemoryObjectReceiveStream[AbstractIncomingMessage]
+    __slots__ = ("consumer_tag", "futures")
+
+    def __init__(self) -> None:
+        self.futures: dict[str, asyncio.Future[IncomingMessage]] = {}
+        self.consumer_tag: str | None = None
 
-        (
-            send_response_stream,
-            receive_response_stream,
-        ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
+    @property
+    def started(self) -> bool:
+        return self.consumer_tag is not None
 
-        self.consumer_tag = await self.queue.consume(
-            callback=send_response_stream.send,
+    async def start(self, callback_queue: "RobustQueue") -> None:
+        self.consumer_tag = await callback_queue.consume(
+            callback=self._on_response,
             no_ack=True,
         )
 
-        return cast(
-            "MemoryObjectReceiveStream[IncomingMessage]",
-            receive_response_stream,
+    @contextmanager
+    def wait_response(
+        self,
+        correlation_id: str,
+    ) -> Iterator["asyncio.Future[IncomingMessage]"]:
+        if correlation_id in self.futures:
+            msg = f"Request with `correlation_id={correlation_id}` is already waiting for a response."
+            raise IncorrectState(msg)
+
+        future: asyncio.Future[IncomingMessage] = (
+            asyncio.get_running_loop().create_future()
         )
+        self.futures[correlation_id] = future
+        try:
+            yield future
+        finally:
+            self.futures.pop(correlation_id, None)
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None = None,
-        exc_val: BaseException | None = None,
-        exc_tb: Optional["TracebackType"] = None,
-    ) -> None:
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
+    def close(self) -> None:
+        """Fail all requests waiting for a response.
+
+        The reply consumer itself is closed with the broker channel.
+        """
+        self.consumer_tag = None
+
+        for future in self.futures.values():
+            if not future.done():
+                future.set_exception(
+                    IncorrectState("Broker was disconnected before the response."),
+                )
+
+        self.futures.clear()
+
+    async def _on_response(self, message: "AbstractIncomingMessage") -> None:
+        future = self.futures.get(message.correlation_id or "")
+
+        if future is None and not message.correlation_id and len(self.futures) == 1:
+            # responder dropped correlation_id, but there is no ambiguity
+            (future,) = self.futures.values()
+
+        if future is not None and not future.done():
+            future.set_result(cast("IncomingMessage", message))
@@ -1,18 +1,20 @@
 from typing import TYPE_CHECKING, Any, Optional
 
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream.exceptions import SetupError
+from faststream.rabbit.schemas import Channel
 
 from .config import (
     RabbitSubscriberConfig,
     RabbitSubscriberSpecificationConfig,
 )
 from .specification import RabbitSubscriberSpecification
-from .usecase import RabbitSubscriber
+from .usecase import RabbitBatchSubscriber, RabbitSubscriber
 
 if TYPE_CHECKING:
     from faststream.middlewares import AckPolicy
     from faststream.rabbit.configs import RabbitBrokerConfig
-    from faststream.rabbit.schemas import Channel, RabbitExchange, RabbitQueue
+    from faststream.rabbit.schemas import RabbitExchange, RabbitQueue
 
 
 def create_subscriber(
@@ -21,6 +23,9 @@ def create_subscriber(
     exchange: "RabbitExchange",
     consume_args: dict[str, Any] | None,
     channel: Optional["Channel"],
+    batch: bool,
+    max_records: int,
+    batch_timeout: float,
     # Subscriber args
     no_reply: bool,
     ack_policy: "AckPolicy",
@@ -31,6 +36,17 @@ def create_subscriber(
     description_: str | None,
     include_in_schema: bool,
 ) -> RabbitSubscriber:
+    _validate_input_for_misconfigure(
+        channel=channel,
+        batch=batch,
+        max_records=max_records,
+        batch_timeout=batch_timeout,
+    )
+
+    if batch and channel is None:
+        # batches are acknowledged with `multiple` flag, so they need an own channel
+        channel = Channel(prefetch_count=max_records * 2)
+
     subscriber_config = RabbitSubscriberConfig(
         no_reply=no_reply,
         consume_args=consume_args,
@@ -55,8 +71,47 @@ def create_subscriber(
         calls=calls,
     )
 
+    if batch:
+        return RabbitBatchSubscriber(
+            config=subscriber_config,
+            specification=specification,
+            calls=calls,
+            max_records=max_records,
+            batch_timeout=batch_timeout,
+        )
+
     return RabbitSubscriber(
         config=subscriber_config,
         specification=specification,
         calls=calls,
     )
+
+
+def _validate_input_for_misconfigure(
+    *,
+    channel: Optional["Channel"],
+    batch: bool,
+    max_records: int,
+    batch_timeout: float,
+) -> None:
+    if not batch:
+        return
+
+    if max_records < 1:
+        msg = "`max_records` should be greater than 0"
+        raise SetupError(msg)
+
+    if batch_timeout <= 0:
+        msg = "`batch_timeout` should be greater than 0"
+        raise SetupError(msg)
+
+    if (
+        channel is not None
+        and channel.prefetch_count
+        and channel.prefetch_count < max_records
+    ):
+        msg = (
+            "Batch subscriber channel `prefetch_count` should not be less than "
+            "`max_records`, otherwise batches are never filled"
+        )
+        raise SetupError(msg)
@@ -1,12 +1,13 @@
 import asyncio
 import contextlib
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber import SubscriberUsecase
+from faststream._internal.endpoint.subscriber.mixins import TasksMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.publisher.fake import RabbitFakePublisher
@@ -54,7 +55,7 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
 
         self.consume_args = config.consume_args or {}
 
-        self.__no_ack = config.ack_first
+        self._no_ack = config.ack_first
 
         self._consumer_tag: str | None = None
         self._queue_obj: RobustQueue | None = None
@@ -102,13 +103,17 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
         if self.calls:
             self._consumer_tag = await self._queue_obj.consume(
                 # NOTE: aio-pika expects AbstractIncomingMessage, not IncomingMessage
-                self.consume,  # type: ignore[arg-type]
-                no_ack=self.__no_ack,
+                self._consumer_callback(),  # type: ignore[arg-type]
+                no_ack=self._no_ack,
                 arguments=self.consume_args,
             )
 
         self._post_start()
 
+    def _consumer_callback(self) -> Callable[["IncomingMessage"], Awaitable[Any]]:
+        """Callback to pass delivered messages to."""
+        return self.consume
+
     async def stop(self) -> None:
         await super().stop()
 
@@ -230,3 +235,82 @@ class RabbitSubscriber(SubscriberUsecase["IncomingMessage"]):
             queue=self.queue,
             exchange=self.exchange,
         )
+
+
+class RabbitBatchSubscriber(TasksMixin, RabbitSubscriber):
+    """RabbitMQ subscriber consuming messages by batches.
+
+    Messages are collected up to `max_records` or for `batch_timeout` seconds
+    since the first one and processed as a single `StreamMessage`. The batch is
+    acknowledged with a single `multiple` frame, so the subscriber channel
+    should not be shared with other subscribers.
+    """
+
+    def __init__(
+        self,
+        config: "RabbitSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[Any]",
+        *,
+        max_records: int,
+        batch_timeout: float,
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        parser = AioPikaParser(pattern=config.queue.path_regex)
+        self._parser = parser.parse_batch
+        self._decoder = parser.decode_batch
+
+        self.max_records = max_records
+        self.batch_timeout = batch_timeout
+
+        self._buffer: asyncio.Queue[IncomingMessage] | None = None
+        self._batch: list[IncomingMessage] = []
+
+    @override
+    async def start(self) -> None:
+        self._buffer = asyncio.Queue()
+        await super().start()
+
+        if self.calls:
+            self.add_task(self._consume_batches)
+
+    @override
+    async def stop(self) -> None:
+        await super().stop()
+
+        if self._buffer is not None:
+            # return collected but not processed messages back to the queue
+            while not self._buffer.empty():
+                self._batch.append(self._buffer.get_nowait())
+
+            if not self._no_ack:
+                for msg in self._batch:
+                    with contextlib.suppress(Exception):
+                        await msg.nack(requeue=True)
+
+            self._batch = []
+            self._buffer = None
+
+    @override
+    def _consumer_callback(self) -> Callable[["IncomingMessage"], Awaitable[Any]]:
+        return self.consume_one
+
+    async def consume_one(self, msg: "IncomingMessage") -> None:
+        assert self._buffer is not None, "You should start subscriber at first."
+        # the buffer size is limited by the channel prefetch
+        self._buffer.put_nowait(msg)
+
+    async def _consume_batches(self) -> None:
+        assert self._buffer is not None, "You should start subscriber at first."
+        buffer = self._buffer
+
+        while self.running:
+            batch = self._batch = [await buffer.get()]
+
+            with anyio.move_on_after(self.batch_timeout):
+                while len(batch) < self.max_records:
+                    batch.append(await buffer.get())
+
+            self._batch = []
+            await self.consume(tuple(batch))
@@ -28,6 +28,7 @@ from faststream.rabbit.schemas import (
     RabbitExchange,
     RabbitQueue,
 )
+from faststream.rabbit.subscriber.usecase import RabbitBatchSubscriber
 
 if TYPE_CHECKING:
     from aio_pika.abc import DateType, HeadersType
@@ -325,7 +326,9 @@ class FakeProducer(AioPikaFastProducer):
         msg: PatchedMessage,
         handler: "RabbitSubscriber",
     ) -> "PatchedMessage":
-        result = await handler.process_message(msg)
+        result = await handler.process_message(
+            (msg,) if isinstance(handler, RabbitBatchSubscriber) else msg,  # type: ignore[arg-type]
+        )
         return await build_message(
             routing_key=msg.routing_key,
             message=result.body,
@@ -33,6 +33,7 @@ from faststream.redis.publisher.producer import RedisFastProducer
 from faststream.redis.response import RedisPublishCommand
 from faststream.redis.schemas.types import NON_CONNECTION_PARAMS
 from faststream.redis.security import parse_security
+from faststream.redis.subscriber.multiplexer import PubSubMultiplexer
 from faststream.response.publish_type import PublishType
 from faststream.specification.schema import BrokerSpec
 
@@ -111,6 +112,17 @@ class RedisBroker(
         connection_state = self._make_connection_state(connection_options, kwargs)
         producer = self._make_producer(connection_state, kwargs)
 
+        pubsub_shards = kwargs.get("pubsub_shards")
+        pubsub = (
+            PubSubMultiplexer(
+                producer.make_pubsub,
+                shards=pubsub_shards,
+                max_buffer_size=kwargs.get("pubsub_max_buffer_size", 1000),
+            )
+            if pubsub_shards is not None
+            else None
+        )
+
         super().__init__(
             **connection_options,
             routers=kwargs.get("routers", ()),
@@ -118,6 +130,7 @@ class RedisBroker(
                 connection=connection_state,
                 producer=producer,
                 message_format=self.message_format,
+                pubsub=pubsub,
                 broker_middlewares=kwargs.get("middlewares", ()),
                 broker_parser=kwargs.get("parser"),
                 broker_decoder=kwargs.get("decoder"),
@@ -125,6 +138,7 @@ class RedisBroker(
                 logger=make_redis_logger_state(
                     logger=kwargs.get("logger", EMPTY),
                     log_level=kwargs.get("log_level", logging.INFO),
+                    log_queue=kwargs.get("log_queue"),
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=kwargs.get("apply_types", True),
@@ -134,6 +148,8 @@ class RedisBroker(
                 ),
                 broker_dependencies=kwargs.get("dependencies", ()),
                 graceful_timeout=kwargs.get("graceful_timeout", 15.0),
+                start_concurrency=kwargs.get("start_concurrency", 1),
+                executor=kwargs.get("executor"),
                 ack_policy=kwargs.get("ack_policy", EMPTY),
                 extra_context={"broker": self},
             ),
@@ -100,13 +100,16 @@ class RedisClusterBroker(RedisBroker):
         async def _patched_start() -> None:
             if sub.subscription:
                 return
-            psub = state.pubsub()
-            sub.subscription = psub  # type: ignore[assignment]
-            if sub.channel.pattern:
-                await psub.psubscribe(sub.channel.name)
+            if (multiplexer := self.config.broker_config.pubsub) is not None:
+                sub.subscription = await multiplexer.subscribe(sub.channel)
             else:
-                await psub.subscribe(sub.channel.name)
-            await LogicSubscriber.start(sub, psub)
+                psub = state.pubsub()
+                sub.subscription = psub  # type: ignore[assignment]
+                if sub.channel.pattern:
+                    await psub.psubscribe(sub.channel.name)
+                else:
+                    await psub.subscribe(sub.channel.name)
+            await LogicSubscriber.start(sub, sub.subscription)
 
         sub.start = _patched_start  # type: ignore[method-assign]
         return sub
@@ -5,6 +5,7 @@ from typing_extensions import overload, override
 
 from faststream._internal.broker.registrator import Registrator
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 from faststream.redis.configs import RedisBrokerConfig
@@ -15,10 +16,12 @@ from faststream.redis.subscriber.factory import create_subscriber
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.parser import CodecProto
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
+        FilterKey,
     )
     from faststream.redis.parser import MessageFormat
     from faststream.redis.publisher.usecase import (
@@ -57,6 +60,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -80,6 +85,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -88,7 +95,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
     ) -> "ChannelConcurrentSubscriber": ...
 
     @overload
@@ -103,6 +110,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -125,6 +134,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -148,6 +159,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -156,7 +169,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
     ) -> "ListConcurrentSubscriber": ...
 
     @overload
@@ -171,6 +184,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -194,6 +209,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -217,6 +234,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -225,7 +244,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int = ...,
+        max_workers: int | AdaptiveConcurrency = ...,
     ) -> "StreamConcurrentSubscriber": ...
 
     @overload
@@ -240,6 +259,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -248,7 +269,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
     ) -> "LogicSubscriber": ...
 
     @override
@@ -263,6 +284,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
         codec: Optional["CodecProto"] = None,
+        filter_key: Optional["FilterKey[Any]"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         message_format: type["MessageFormat"] | None = None,
@@ -271,7 +294,7 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
     ) -> "LogicSubscriber":
         """Subscribe a handler to a RabbitMQ queue.
 
@@ -284,6 +307,10 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             parser: Parser to map original **IncomingMessage** Msg to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
             codec: Custom codec object.
+            filter_key: Function to get a message key to select handlers
+                registered with the same `key`.
+            executor: Executor to run sync handlers, filters, parsers and
+                decoders. Overrides the broker one.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
             message_format: Which format to use when parsing messages.
             persistent: Whether to make the subscriber persistent or not.
@@ -317,6 +344,8 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             parser_=parser or self._parser,
             decoder_=decoder or self._decoder,
             codec_=codec,
+            filter_key_=filter_key,
+            executor_=executor,
             dependencies_=dependencies,
         )
 
@@ -7,6 +7,7 @@ from faststream._internal.broker.router import (
     SubscriberRoute,
 )
 from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream.middlewares import AckPolicy
 from faststream.redis.configs.broker import RedisRouterConfig
 from faststream.redis.message import BaseMessage
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import SendableMessage
+    from faststream._internal.endpoint.subscriber.executor import SyncExecutor
     from faststream._internal.types import (
         BrokerMiddleware,
         CustomCallable,
@@ -94,12 +96,13 @@ class RedisRoute(SubscriberRoute):
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
         decoder: Optional["CustomCallable"] = None,
+        executor: Optional["SyncExecutor"] = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         title: str | None = None,
         description: str | None = None,
         include_in_schema: bool = True,
-        max_workers: int | None = None,
+        max_workers: int | AdaptiveConcurrency | None = None,
     ) -> None:
         """Initialize the RedisRoute.
 
@@ -120,6 +123,8 @@ class RedisRoute(SubscriberRoute):
                 Parser to map original **aio_pika.IncomingMessage** Msg to FastStream one.
             decoder:
                 Function to decode FastStream msg bytes body to python objects.
+            executor:
+                Executor to run sync handlers, filters, parsers and decoders. Overrides the broker one.
             ack_policy:
                 Acknowledgement policy of the handler.
             no_reply:
@@ -143,6 +148,7 @@ class RedisRoute(SubscriberRoute):
             max_workers=max_workers,
             parser=parser,
             decoder=decoder,
+            executor=executor,
             ack_policy=ack_policy,
             no_reply=no_reply,
             title=title,
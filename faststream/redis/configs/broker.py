@@ -14,6 +14,7 @@ if TYPE_CHECKING:
         RedisClusterFastProducer,
         RedisFastProducer,
     )
+    from faststream.redis.subscriber.multiplexer import PubSubMultiplexer
 
     from .state import ConnectionState
 
@@ -24,6 +25,7 @@ class RedisBrokerConfig(BrokerConfig):
     connection: "ConnectionState[Redis[bytes]] | ConnectionState[RedisCluster[bytes]]"
 
     message_format: type["MessageFormat"]
+    pubsub: "PubSubMultiplexer | None" = None
 
     async def connect(self) -> None:
         self.producer.connect(
@@ -32,6 +34,9 @@ class RedisBrokerConfig(BrokerConfig):
         await self.connection.connect()
 
     async def disconnect(self) -> None:
+        if self.pubsub is not None:
+            await self.pubsub.stop()
+        await self.producer.disconnect()
         await self.connection.disconnect()
 
 
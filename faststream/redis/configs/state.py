@@ -241,8 +241,11 @@ class _SyncPubSubProxy:
     async def psubscribe(self, pattern: str) -> None:
         await run_in_executor(self._pool, self._psub.psubscribe, pattern)
 
-    async def unsubscribe(self) -> None:
-        await run_in_executor(self._pool, self._psub.unsubscribe)
+    async def unsubscribe(self, *channels: str) -> None:
+        await run_in_executor(self._pool, self._psub.unsubscribe, *channels)
+
+    async def punsubscribe(self, *patterns: str) -> None:
+        await run_in_executor(self._pool, self._psub.punsubscribe, *patterns)
 
     async def get_message(
         self,
@@ -1,5 +1,6 @@
 from typing import (
     TYPE_CHECKING,
+    Any,
     Literal,
     Optional,
     TypeAlias,
@@ -9,6 +10,8 @@ from typing import (
 
 from typing_extensions import NotRequired, TypedDict, override
 
+from faststream._internal._compat import dump_json
+from faststream._internal.constants import EMPTY
 from faststream.message import StreamMessage as BrokerStreamMessage
 
 if TYPE_CHECKING:
@@ -81,11 +84,37 @@ class RedisListMessage(BrokerStreamMessage[DefaultListMessage]):
     """StreamMessage for single List message."""
 
 
-class RedisBatchListMessage(BrokerStreamMessage[BatchListMessage]):
-    """StreamMessage for single List message."""
+class _DecodedBatchMixin:
+    """Batch message with items already decoded by the parser.
+
+    JSON `body` of the whole batch is made only if it is requested.
+    """
 
     decoded_body: list["DecodedMessage"]
 
+    _body: Any = EMPTY
+    _dumped_body: bytes | None = None
+
+    @property
+    def body(self) -> Any:
+        if self._body is EMPTY:
+            self._body = self._dumped_body = dump_json(self.decoded_body)
+        return self._body
+
+    @body.setter
+    def body(self, value: Any) -> None:
+        self._body = value
+
+    def get_decoded_body(self) -> list["DecodedMessage"] | None:
+        """Decoded items, if the body was not replaced after parsing."""
+        if self._body is EMPTY or self._body is self._dumped_body:
+            return self.decoded_body
+        return None
+
+
+class RedisBatchListMessage(_DecodedBatchMixin, BrokerStreamMessage[BatchListMessage]):
+    """StreamMessage for single List message."""
+
 
 DATA_KEY = "__data__"
 bDATA_KEY = DATA_KEY.encode()  # noqa: N816
@@ -149,5 +178,8 @@ class RedisStreamMessage(_RedisStreamMessageMixin[DefaultStreamMessage]):
     pass
 
 
-class RedisBatchStreamMessage(_RedisStreamMessageMixin[BatchStreamMessage]):
-    decoded_body: list["DecodedMessage"]
+class RedisBatchStreamMessage(
+    _DecodedBatchMixin,
+    _RedisStreamMessageMixin[BatchStreamMessage],
+):
+    pass
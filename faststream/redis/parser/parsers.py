@@ -1,10 +1,12 @@
 from collections.abc import Mapping
+from contextlib import suppress
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Optional, Protocol, cast
 
 from faststream._internal._compat import dump_json, json_loads
 from faststream._internal.basic_types import DecodedMessage
 from faststream._internal.constants import EMPTY, ContentTypes
+from faststream._internal.parser import mark_json_decoder
 from faststream._internal.utils.path import match_path
 from faststream.message import decode_message, gen_cor_id
 from faststream.redis.message import (
@@ -50,7 +52,15 @@ class SimpleParser:
         message: Mapping[str, Any],
     ) -> "StreamMessage[Mapping[str, Any]]":
         data, headers, batch_headers = self._parse_data(message)
+        return self._build_message(message, data, headers, batch_headers)
 
+    def _build_message(
+        self,
+        message: Mapping[str, Any],
+        data: Any,
+        headers: dict[str, Any],
+        batch_headers: list[dict[str, Any]],
+    ) -> "StreamMessage[Mapping[str, Any]]":
         id_ = gen_cor_id()
 
         return self.msg_class(
@@ -72,9 +82,10 @@ class SimpleParser:
     def _parse_data(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    ) -> tuple[Any, dict[str, Any], list[dict[str, Any]]]:
         return (*self.config.message_format.parse(message["data"]), [])
 
+    @mark_json_decoder
     async def decode_message(
         self,
         msg: "StreamMessage[Any]",
@@ -90,31 +101,55 @@ class RedisListParser(SimpleParser):
     msg_class = RedisListMessage
 
 
-class RedisBatchListParser(SimpleParser):
-    msg_class = RedisBatchListMessage
+class _RedisBatchParser(SimpleParser):
+    msg_class: type["RedisBatchListMessage | RedisBatchStreamMessage"]
 
-    def _parse_data(
+    async def parse_message(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
-        body: list[Any] = []
+    ) -> "StreamMessage[Mapping[str, Any]]":
+        decoded_body: list[DecodedMessage] = []
         batch_headers: list[dict[str, Any]] = []
 
         for x in message["data"]:
-            msg_data, msg_headers = _decode_batch_body_item(x, self.config.message_format)
-            body.append(msg_data)
+            msg_data, msg_headers = self.config.message_format.parse(
+                self._get_item_data(x),
+            )
+            decoded_body.append(_decode_batch_body_item(msg_data))
             batch_headers.append(msg_headers)
 
         first_msg_headers = next(iter(batch_headers), {})
 
-        return (
-            dump_json(body),
+        # JSON body of the batch is made by the message only if it is requested
+        msg = self._build_message(
+            message,
+            EMPTY,
             {
                 **first_msg_headers,
                 "content-type": ContentTypes.JSON.value,
             },
             batch_headers,
         )
+        cast("RedisBatchListMessage", msg).decoded_body = decoded_body
+        return msg
+
+    def _get_item_data(self, item: Any) -> bytes:
+        return cast("bytes", item)
+
+    async def decode_message(
+        self,
+        msg: "StreamMessage[Any]",
+    ) -> DecodedMessage:
+        if (
+            decoded_body := cast("RedisBatchListMessage", msg).get_decoded_body()
+        ) is not None:
+            return decoded_body
+
+        return decode_message(msg)
+
+
+class RedisBatchListParser(_RedisBatchParser):
+    msg_class = RedisBatchListMessage
 
 
 class RedisStreamParser(SimpleParser):
@@ -131,42 +166,21 @@ class RedisStreamParser(SimpleParser):
         )
 
 
-class RedisBatchStreamParser(SimpleParser):
+class RedisBatchStreamParser(_RedisBatchParser):
     msg_class = RedisBatchStreamMessage
 
-    def _parse_data(
-        self,
-        message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
-        body: list[Any] = []
-        batch_headers: list[dict[str, Any]] = []
-
-        for x in message["data"]:
-            msg_data, msg_headers = _decode_batch_body_item(
-                x.get(bDATA_KEY, x),
-                self.config.message_format,
-            )
-
-            body.append(msg_data)
-            batch_headers.append(msg_headers)
-
-        first_msg_headers = next(iter(batch_headers), {})
+    def _get_item_data(self, item: dict[bytes, bytes]) -> bytes:
+        return cast("bytes", item.get(bDATA_KEY, item))
 
-        return (
-            dump_json(body),
-            {
-                **first_msg_headers,
-                "content-type": ContentTypes.JSON.value,
-            },
-            batch_headers,
-        )
 
+def _decode_batch_body_item(msg_body: Any) -> DecodedMessage:
+    if not isinstance(msg_body, bytes):
+        # raw stream entry fields
+        return cast("DecodedMessage", json_loads(dump_json(msg_body)))
 
-def _decode_batch_body_item(
-    msg_content: bytes, message_format: type["MessageFormat"]
-) -> tuple[Any, dict[str, Any]]:
-    msg_body, headers = message_format.parse(msg_content)
     try:
-        return json_loads(msg_body), headers
+        return cast("DecodedMessage", json_loads(msg_body))
     except Exception:
-        return msg_body, headers
+        with suppress(UnicodeDecodeError):
+            return msg_body.decode()
+        return msg_body
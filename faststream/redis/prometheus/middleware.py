@@ -21,6 +21,7 @@ class RedisPrometheusMiddleware(
         metrics_prefix: str = "faststream",
         received_messages_size_buckets: Sequence[float] | None = None,
         custom_labels: dict[str, str | Callable[[Any], str]] | None = None,
+        flush_interval: float | None = None,
     ) -> None:
         super().__init__(
             settings_provider_factory=settings_provider_factory,
@@ -29,4 +30,5 @@ class RedisPrometheusMiddleware(
             metrics_prefix=metrics_prefix,
             received_messages_size_buckets=received_messages_size_buckets,
             custom_labels=custom_labels,
+            flush_interval=flush_interval,
         )
@@ -0,0 +1,100 @@
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import Any
+
+import anyio
+
+from faststream._internal.utils.nuid import NUID
+
+
+class ReplyInbox:
+    """Long-lived reply subscription shared by all requests of a broker.
+
+    A single connection subscribes to the per-process `<prefix>*` pattern and
+    dispatches responses to the waiting requests by their reply channel.
+    """
+
+    poll_timeout = 1.0
+
+    def __init__(self, pubsub_factory: Callable[[], Any]) -> None:
+        self._pubsub_factory = pubsub_factory
+
+        self._nuid = NUID()
+        self.prefix = f"faststream.reply.{self._nuid.next().decode()}."
+
+        self._futures: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._lock: anyio.Lock | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._futures)
+
+    async def start(self) -> None:
+        if self._reader is not None and not self._reader.done():
+            return
+
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if self._reader is not None and not self._reader.done():
+                return
+
+            psub = self._pubsub_factory()
+            await psub.psubscribe(f"{self.prefix}*")
+            self._reader = asyncio.create_task(self._read_responses(psub))
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+    @contextmanager
+    def reply_channel(self) -> Iterator[tuple[str, "asyncio.Future[dict[str, Any]]"]]:
+        """Reserve a unique reply channel and a future for its response."""
+        channel = f"{self.prefix}{self._nuid.next().decode()}"
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        self._futures[channel] = future
+        try:
+            yield channel, future
+        finally:
+            self._futures.pop(channel, None)
+
+    async def _read_responses(self, psub: Any) -> None:
+        try:
+            while True:
+                msg = await psub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout,
+                )
+
+                if msg is None:
+                    continue
+
+                channel = msg["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+
+                future = self._futures.get(channel)
+                if future is not None and not future.done():
+                    # looks like a regular channel message for the parser
+                    future.set_result(msg | {"type": "message", "pattern": None})
+
+        except Exception as e:
+            # wake up waiting requests, the next one restarts the inbox
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(e)
+
+        finally:
+            with suppress(Exception):
+                await psub.punsubscribe()
+            with suppress(Exception):
+                await psub.aclose()
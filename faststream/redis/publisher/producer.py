@@ -1,4 +1,3 @@
-from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import anyio
@@ -7,13 +6,14 @@ from typing_extensions import override
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.parser import DefaultCodec
 from faststream._internal.producer import ProducerProto
-from faststream._internal.utils.nuid import NUID
 from faststream.redis.configs.state import RedisClusterConnectionState
 from faststream.redis.exceptions import UnreachablePathError
 from faststream.redis.message import DATA_KEY
 from faststream.redis.parser import RedisPubSubParser, SimpleParserConfig
 from faststream.redis.response import DestinationType, RedisPublishCommand
 
+from .inbox import ReplyInbox
+
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
     from redis.asyncio.client import Redis
@@ -40,8 +40,10 @@ class BaseRedisFastProducer(ProducerProto[RedisPublishCommand]):
         message_format: type["MessageFormat"],
         serializer: Optional["SerializerProto"],
         codec: Optional["CodecProto"] = None,
+        inbox: ReplyInbox | None = None,
     ) -> None:
         self._connection = connection
+        self._inbox = inbox or ReplyInbox(self.make_pubsub)
 
         default = RedisPubSubParser(SimpleParserConfig(message_format))
         self._parser = ParserComposition(
@@ -81,10 +83,40 @@ class BaseRedisFastProducer(ProducerProto[RedisPublishCommand]):
         if codec is not None:
             self.codec = codec
 
+    async def disconnect(self) -> None:
+        await self._inbox.stop()
+
+    def make_pubsub(self) -> Any:
+        return self._connection.client.pubsub()
+
     def _build_child(
         self, **kwargs: Any
     ) -> "RedisFastProducer | RedisClusterFastProducer":
-        return self.__class__(**kwargs)  # type: ignore[return-value]
+        # children share the reply subscription of the broker producer
+        return self.__class__(inbox=self._inbox, **kwargs)  # type: ignore[return-value]
+
+    async def _request(
+        self,
+        cmd: "RedisPublishCommand",
+        send: Any,
+    ) -> Any:
+        await self._inbox.start()
+
+        with (
+            self._inbox.reply_channel() as (reply_to, response),
+            anyio.fail_after(cmd.timeout),
+        ):
+            msg = await cmd.message_format.encode(
+                message=cmd.body,
+                reply_to=reply_to,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id or "",
+                serializer=self.serializer,
+                codec=self.codec,
+            )
+
+            await send(msg, cmd)
+            return await response
 
 
 class RedisFastProducer(BaseRedisFastProducer):
@@ -149,46 +181,7 @@ class RedisFastProducer(BaseRedisFastProducer):
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.client.pubsub()
-
-        try:
-            await psub.subscribe(reply_to)
-
-            msg = await cmd.message_format.encode(
-                message=cmd.body,
-                reply_to=reply_to,
-                headers=cmd.headers,
-                correlation_id=cmd.correlation_id or "",
-                serializer=self.serializer,
-                codec=self.codec,
-            )
-
-            await self.__publish(msg, cmd)
-
-            with anyio.fail_after(cmd.timeout) as scope:
-                # skip subscribe message
-                await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-                # get real response
-                response_msg = await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-            if scope.cancel_called:
-                raise TimeoutError
-
-            return response_msg
-
-        finally:
-            with suppress(Exception):
-                await psub.unsubscribe()
-                await psub.aclose()  # type: ignore[attr-defined]
+        return await self._request(cmd, self.__publish)
 
 
 class RedisClusterFastProducer(BaseRedisFastProducer):
@@ -207,9 +200,17 @@ class RedisClusterFastProducer(BaseRedisFastProducer):
     def cluster_state(self) -> RedisClusterConnectionState:
         return self._cluster_state
 
+    @override
+    def make_pubsub(self) -> Any:
+        return self._cluster_state.pubsub()
+
     @override
     def _build_child(self, **kwargs: Any) -> "RedisClusterFastProducer":
-        return RedisClusterFastProducer(cluster_state=self._cluster_state, **kwargs)
+        return RedisClusterFastProducer(
+            cluster_state=self._cluster_state,
+            inbox=self._inbox,
+            **kwargs,
+        )
 
     @override
     async def publish(self, cmd: "RedisPublishCommand") -> int | bytes:
@@ -240,52 +241,18 @@ class RedisClusterFastProducer(BaseRedisFastProducer):
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._cluster_state.pubsub()
-
-        try:
-            await psub.subscribe(reply_to)
+        return await self._request(cmd, self.__publish)
 
-            msg = await cmd.message_format.encode(
-                message=cmd.body,
-                reply_to=reply_to,
-                headers=cmd.headers,
-                correlation_id=cmd.correlation_id or "",
-                serializer=self.serializer,
-                codec=self.codec,
+    async def __publish(self, msg: bytes, cmd: "RedisPublishCommand") -> None:
+        if cmd.destination_type is DestinationType.Channel:
+            await self._cluster_state.sync_publish(cmd.destination, msg)
+        elif cmd.destination_type is DestinationType.List:
+            await self._connection.client.rpush(cmd.destination, msg)
+        elif cmd.destination_type is DestinationType.Stream:
+            await self._connection.client.xadd(
+                name=cmd.destination,
+                fields={DATA_KEY: msg},
+                maxlen=cmd.maxlen,
             )
-
-            if cmd.destination_type is DestinationType.Channel:
-                await self._cluster_state.sync_publish(cmd.destination, msg)
-            elif cmd.destination_type is DestinationType.List:
-                await self._connection.client.rpush(cmd.destination, msg)
-            elif cmd.destination_type is DestinationType.Stream:
-                await self._connection.client.xadd(
-                    name=cmd.destination,
-                    fields={DATA_KEY: msg},
-                    maxlen=cmd.maxlen,
-                )
-            else:
-                raise UnreachablePathError
-
-            with anyio.fail_after(cmd.timeout) as scope:
-                await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-                response_msg = await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=cmd.timeout or 0.0,
-                )
-
-            if scope.cancel_called:
-                raise TimeoutError
-
-            return response_msg
-
-        finally:
-            with suppress(Exception):
-                await psub.unsubscribe()
-                await psub.aclose()
+        else:
+            raise UnreachablePathError
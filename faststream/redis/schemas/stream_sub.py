@@ -39,11 +39,17 @@ class StreamSub(NameRequired):
             reclaimed by this consumer. Only applicable when using consumer groups.
 
             https://redis.io/docs/latest/commands/xautoclaim/
+        drain_pending:
+            If True, the consumer claims idle pending messages via XAUTOCLAIM until the
+            whole Pending Entries List is scanned, then switches to XREADGROUP for new
+            messages. The list is scanned again each time the stream has no new messages.
+            Requires `min_idle_time`.
     """
 
     __slots__ = (
         "batch",
         "consumer",
+        "drain_pending",
         "group",
         "last_id",
         "max_records",
@@ -66,11 +72,16 @@ class StreamSub(NameRequired):
         maxlen: int | None = None,
         max_records: int | None = None,
         min_idle_time: int | None = None,
+        drain_pending: bool = False,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             msg = "You should specify `group` and `consumer` both"
             raise SetupError(msg)
 
+        if drain_pending and min_idle_time is None:
+            msg = "You should specify `min_idle_time` to use `drain_pending`"
+            raise SetupError(msg)
+
         if last_id is None:
             last_id = ">" if group and consumer else "$"
 
@@ -108,6 +119,7 @@ class StreamSub(NameRequired):
         self.maxlen = maxlen
         self.max_records = max_records
         self.min_idle_time = min_idle_time
+        self.drain_pending = drain_pending
 
     def add_prefix(self, prefix: str) -> "StreamSub":
         new_stream = deepcopy(self)
@@ -10,6 +10,8 @@ from typing_extensions import Required, TypedDict
 
 from faststream._internal.basic_types import LoggerProto
 from faststream._internal.context.repository import ContextRepo
+from faststream._internal.endpoint.subscriber.executor import SyncExecutor
+from faststream._internal.logger import LogQueue
 from faststream._internal.parser import CodecProto
 from faststream._internal.types import BrokerMiddleware, CustomCallable
 from faststream.middlewares import AckPolicy
@@ -66,6 +68,13 @@ class RedisBrokerParams(RedisConnectionParams, total=False):
     graceful_timeout: Annotated[
         float | None, "Graceful shutdown timeout. Defaults to ``15.0``."
     ]
+    start_concurrency: Annotated[
+        int, "Number of subscribers started or stopped concurrently. Defaults to ``1``."
+    ]
+    executor: Annotated[
+        SyncExecutor | None,
+        "Executor to run sync handlers, filters, parsers and decoders. Defaults to ``None``.",
+    ]
     ack_policy: Annotated[
         AckPolicy, "Default acknowledgement policy. Defaults to ``EMPTY``."
     ]
@@ -89,6 +98,18 @@ class RedisBrokerParams(RedisConnectionParams, total=False):
         type[MessageFormat],
         "Message serialization format. Defaults to ``BinaryMessageFormatV1``.",
     ]
+    pubsub_shards: Annotated[
+        int | None,
+        "Number of Pub/Sub connections shared by all channel subscribers. "
+        "By default each channel subscriber uses its own connection. "
+        "A shared subscriber with a full buffer drops its oldest messages. "
+        "Defaults to ``None``.",
+    ]
+    pubsub_max_buffer_size: Annotated[
+        int,
+        "Messages buffered per channel subscriber on a shared Pub/Sub connection. "
+        "Has no effect without ``pubsub_shards``. Defaults to ``1000``.",
+    ]
     security: Annotated[BaseSecurity | None, "Security options. Defaults to ``None``."]
     specification_url: Annotated[
         str | None, "AsyncAPI server address. Defaults to ``None``."
@@ -101,6 +122,10 @@ class RedisBrokerParams(RedisConnectionParams, total=False):
     tags: Annotated[Iterable[Tag | TagDict], "AsyncAPI tags. Defaults to ``()``."]
     logger: Annotated[LoggerProto, "Custom logger. Defaults to ``EMPTY``."]
     log_level: Annotated[int, "Service log level. Defaults to ``logging.INFO``."]
+    log_queue: Annotated[
+        LogQueue | None,
+        "Queue to emit logs from a background thread and sample per-message logs. Defaults to ``None``.",
+    ]
     apply_types: Annotated[bool, "Use FastDepends type casting. Defaults to ``True``."]
     serializer: Annotated[SerializerProto, "Custom serializer. Defaults to ``EMPTY``."]
     provider: Annotated[Provider | None, "FastDepends provider. Defaults to ``None``."]
@@ -150,6 +175,8 @@ SENTINEL_PARAMS = frozenset({
 
 NON_CONNECTION_PARAMS = frozenset({
     "graceful_timeout",
+    "start_concurrency",
+    "executor",
     "ack_policy",
     "decoder",
     "codec",
@@ -158,6 +185,8 @@ NON_CONNECTION_PARAMS = frozenset({
     "middlewares",
     "routers",
     "message_format",
+    "pubsub_shards",
+    "pubsub_max_buffer_size",
     "specification_url",
     "protocol",
     "protocol_version",
@@ -165,6 +194,7 @@ NON_CONNECTION_PARAMS = frozenset({
     "tags",
     "logger",
     "log_level",
+    "log_queue",
     "apply_types",
     "serializer",
     "provider",
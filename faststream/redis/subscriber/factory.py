@@ -3,6 +3,10 @@ from typing import TYPE_CHECKING, Any, TypeAlias, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrency,
+    workers_limit,
+)
 from faststream.exceptions import SetupError
 from faststream.middlewares import AckPolicy
 from faststream.redis.schemas import INCORRECT_SETUP_MSG, ListSub, PubSub, StreamSub
@@ -48,7 +52,7 @@ def create_subscriber(
     title_: str | None = None,
     description_: str | None = None,
     include_in_schema: bool = True,
-    max_workers: int = 1,
+    max_workers: int | AdaptiveConcurrency = 1,
 ) -> SubscriberType:
     _validate_input_for_misconfigure(
         channel=channel,
@@ -88,7 +92,7 @@ def create_subscriber(
 
         subscriber_config._ack_policy = AckPolicy.MANUAL
 
-        if max_workers > 1:
+        if workers_limit(max_workers) > 1:
             return ChannelConcurrentSubscriber(
                 subscriber_config,
                 specification,
@@ -110,7 +114,7 @@ def create_subscriber(
             # TODO: raise warning if max_workers in `_validate_input_for_misconfigure`
             return StreamBatchSubscriber(subscriber_config, specification, calls)
 
-        if max_workers > 1:
+        if workers_limit(max_workers) > 1:
             return StreamConcurrentSubscriber(
                 subscriber_config,
                 specification,
@@ -132,7 +136,7 @@ def create_subscriber(
             # TODO: raise warning if max_workers in `_validate_input_for_misconfigure`
             return ListBatchSubscriber(subscriber_config, specification, calls)
 
-        if max_workers > 1:
+        if workers_limit(max_workers) > 1:
             return ListConcurrentSubscriber(
                 subscriber_config,
                 specification,
@@ -151,12 +155,12 @@ def _validate_input_for_misconfigure(
     list: Union["ListSub", str, None],
     stream: Union["StreamSub", str, None],
     ack_policy: AckPolicy,
-    max_workers: int,
+    max_workers: int | AdaptiveConcurrency,
     message_format: type["MessageFormat"] | None,
 ) -> None:
     validate_options(channel=channel, list=list, stream=stream)
 
-    if stream and ack_policy is AckPolicy.MANUAL and max_workers > 1:
+    if stream and ack_policy is AckPolicy.MANUAL and workers_limit(max_workers) > 1:
         msg = "Max workers not work with manual no_ack mode."
         raise SetupError(msg)
 
@@ -0,0 +1,311 @@
+import asyncio
+import time
+import zlib
+from collections.abc import Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from faststream.exceptions import SetupError
+
+if TYPE_CHECKING:
+    from faststream.redis.schemas import PubSub
+
+
+class PubSubMultiplexer:
+    """Pub/Sub connections shared by all channel subscribers of a broker.
+
+    Channels and patterns are distributed between `shards` connections by
+    their names. Each connection is read by a single task, which dispatches
+    messages to the subscribers by the channel name or the matched pattern.
+    """
+
+    def __init__(
+        self,
+        pubsub_factory: Callable[[], Any],
+        *,
+        shards: int = 1,
+        max_buffer_size: int = 1000,
+    ) -> None:
+        if shards < 1:
+            msg = "`pubsub_shards` should be greater than 0"
+            raise SetupError(msg)
+
+        if max_buffer_size < 1:
+            msg = "`pubsub_max_buffer_size` should be greater than 0"
+            raise SetupError(msg)
+
+        self._shards = tuple(
+            _PubSubShard(pubsub_factory, max_buffer_size=max_buffer_size)
+            for _ in range(shards)
+        )
+
+    @property
+    def connections(self) -> int:
+        return sum(shard.connected for shard in self._shards)
+
+    async def subscribe(self, channel: "PubSub") -> "SharedSubscription":
+        """Subscribe to the channel or pattern on a shared connection."""
+        shard = self._shards[zlib.crc32(channel.name.encode()) % len(self._shards)]
+        subscription = SharedSubscription(
+            shard,
+            channel.name,
+            is_pattern=bool(channel.pattern),
+        )
+        await shard.add(subscription)
+        return subscription
+
+    async def stop(self) -> None:
+        for shard in self._shards:
+            await shard.close()
+
+
+class SharedSubscription:
+    """Channel subscription on a shared connection.
+
+    Implements the part of the `redis.asyncio.client.PubSub` interface used by
+    channel subscribers. Messages are buffered up to the shard buffer size:
+    a subscriber with a full buffer drops its oldest messages instead of
+    blocking the other subscribers of the shard.
+    """
+
+    report_interval = 60.0
+
+    def __init__(
+        self,
+        shard: "_PubSubShard",
+        name: str,
+        *,
+        is_pattern: bool,
+    ) -> None:
+        self.name = name
+        self.is_pattern = is_pattern
+
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._reported_at: float | None = None
+
+        self._shard = shard
+        self._queue: asyncio.Queue[dict[str, Any] | Exception] = asyncio.Queue(
+            shard.max_buffer_size,
+        )
+
+    async def get_message(
+        self,
+        ignore_subscribe_messages: bool = True,
+        timeout: float | None = 0.0,
+    ) -> dict[str, Any] | None:
+        try:
+            item = self._queue.get_nowait()
+
+        except asyncio.QueueEmpty:
+            if not timeout:
+                return None
+
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        if isinstance(item, Exception):
+            raise item
+
+        return item
+
+    async def unsubscribe(self) -> None:
+        await self._shard.remove(self)
+
+    async def aclose(self) -> None:
+        await self._shard.remove(self)
+
+    def put(self, message: dict[str, Any]) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(message)
+
+    def report_dropped(self) -> int:
+        """Number of messages dropped since the last report.
+
+        The first drop is reported right away, the next ones at most once per
+        `report_interval` seconds.
+        """
+        dropped = self.dropped - self._reported_dropped
+        if not dropped:
+            return 0
+
+        now = time.monotonic()
+        if (
+            self._reported_at is not None
+            and now - self._reported_at < self.report_interval
+        ):
+            return 0
+
+        self._reported_dropped, self._reported_at = self.dropped, now
+        return dropped
+
+    def put_error(self, error: Exception) -> None:
+        with suppress(asyncio.QueueFull):
+            self._queue.put_nowait(error)
+
+    def clear(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class _PubSubShard:
+    """Single Pub/Sub connection with its subscriptions and reader task."""
+
+    poll_timeout = 1.0
+    error_backoff = 5.0
+
+    def __init__(
+        self,
+        pubsub_factory: Callable[[], Any],
+        *,
+        max_buffer_size: int,
+    ) -> None:
+        self._pubsub_factory = pubsub_factory
+        self.max_buffer_size = max_buffer_size
+
+        self.channels: dict[str, list[SharedSubscription]] = {}
+        self.patterns: dict[str, list[SharedSubscription]] = {}
+
+        self._psub: Any = None
+        self._reader: asyncio.Task[None] | None = None
+        self._lock: anyio.Lock | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._psub is not None
+
+    async def add(self, subscription: SharedSubscription) -> None:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if self._psub is None:
+                self._psub = self._pubsub_factory()
+
+            subscriptions = self.patterns if subscription.is_pattern else self.channels
+
+            if subscription.name not in subscriptions:
+                if subscription.is_pattern:
+                    await self._psub.psubscribe(subscription.name)
+                else:
+                    await self._psub.subscribe(subscription.name)
+
+            subscriptions.setdefault(subscription.name, []).append(subscription)
+
+            if self._reader is None:
+                self._reader = asyncio.create_task(self._read_messages(self._psub))
+
+    async def remove(self, subscription: SharedSubscription) -> None:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            subscriptions = self.patterns if subscription.is_pattern else self.channels
+
+            same = subscriptions.get(subscription.name)
+            if same is None or subscription not in same:
+                return
+
+            same.remove(subscription)
+            subscription.clear()
+
+            if same:
+                return
+
+            del subscriptions[subscription.name]
+
+            if not self.channels and not self.patterns:
+                await self._close()
+
+            elif subscription.is_pattern:
+                await self._psub.punsubscribe(subscription.name)
+
+            else:
+                await self._psub.unsubscribe(subscription.name)
+
+    async def close(self) -> None:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            for subscription in (
+                *(s for same in self.channels.values() for s in same),
+                *(s for same in self.patterns.values() for s in same),
+            ):
+                subscription.clear()
+
+            self.channels.clear()
+            self.patterns.clear()
+            await self._close()
+
+    async def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+        if self._psub is not None:
+            with suppress(Exception):
+                await self._psub.aclose()
+            self._psub = None
+
+    async def _reconnect(self) -> Any:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if self._psub is not None:
+                with suppress(Exception):
+                    await self._psub.aclose()
+
+            self._psub = psub = self._pubsub_factory()
+
+            if self.channels:
+                await psub.subscribe(*self.channels)
+            if self.patterns:
+                await psub.psubscribe(*self.patterns)
+
+            return psub
+
+    async def _read_messages(self, psub: Any) -> None:
+        while True:
+            try:
+                if psub is None:
+                    psub = await self._reconnect()
+
+                msg = await psub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout,
+                )
+
+            except Exception as e:
+                # subscribers log the error, the connection is recreated after the backoff
+                for same in (*self.channels.values(), *self.patterns.values()):
+                    for subscription in same:
+                        subscription.put_error(e)
+
+                psub = None
+                await anyio.sleep(self.error_backoff)
+                continue
+
+            if msg is None:
+                continue
+
+            if msg["type"] == "pmessage":
+                key, subscriptions = msg["pattern"], self.patterns
+            else:
+                key, subscriptions = msg["channel"], self.channels
+
+            if isinstance(key, bytes):
+                key = key.decode()
+
+            for subscription in subscriptions.get(key, ()):
+                subscription.put(msg)
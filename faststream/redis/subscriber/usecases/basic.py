@@ -11,6 +11,7 @@ from faststream._internal.endpoint.subscriber import (
     SubscriberSpecification,
     SubscriberUsecase,
 )
+from faststream._internal.endpoint.subscriber.limiter import AdaptiveConcurrency
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
 from faststream.redis.message import (
     UnifyRedisDict,
@@ -143,7 +144,7 @@ class ConcurrentSubscriber(
         config: "RedisSubscriberConfig",
         specification: "SubscriberSpecification[Any, Any]",
         calls: "CallsCollection[Any]",
-        max_workers: int,
+        max_workers: int | AdaptiveConcurrency,
     ) -> None:
         super().__init__(config, specification, calls, max_workers=max_workers)
 
@@ -1,10 +1,8 @@
+import logging
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
 import anyio
-from redis.asyncio.client import (
-    PubSub as RPubSub,
-)
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
@@ -16,10 +14,13 @@ from faststream.redis.message import (
 from faststream.redis.parser import (
     RedisPubSubParser,
 )
+from faststream.redis.subscriber.multiplexer import SharedSubscription
 
 from .basic import LogicSubscriber
 
 if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub as RPubSub
+
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
     from faststream._internal.endpoint.subscriber.call_item import (
         CallsCollection,
@@ -47,7 +48,7 @@ class ChannelSubscriber(LogicSubscriber):
         super().__init__(config, specification, calls)
 
         self._channel = config.channel_sub
-        self.subscription: RPubSub | None = None
+        self.subscription: RPubSub | SharedSubscription | None = None
 
     @property
     def channel(self) -> "PubSub":
@@ -67,14 +68,18 @@ class ChannelSubscriber(LogicSubscriber):
         if self.subscription:
             return
 
-        self.subscription = psub = self._client.pubsub()
+        if (multiplexer := self._outer_config.pubsub) is not None:
+            self.subscription = await multiplexer.subscribe(self.channel)
 
-        if self.channel.pattern:
-            await psub.psubscribe(self.channel.name)
         else:
-            await psub.subscribe(self.channel.name)
+            self.subscription = psub = self._client.pubsub()
 
-        await super().start(psub)
+            if self.channel.pattern:
+                await psub.psubscribe(self.channel.name)
+            else:
+                await psub.subscribe(self.channel.name)
+
+        await super().start(self.subscription)
 
     async def stop(self) -> None:
         await super().stop()
@@ -151,12 +156,25 @@ class ChannelSubscriber(LogicSubscriber):
             )
             yield msg
 
-    async def _get_message(self, psub: RPubSub) -> PubSubMessage | None:
+    async def _get_message(
+        self,
+        psub: "RPubSub | SharedSubscription",
+    ) -> PubSubMessage | None:
         raw_msg = await psub.get_message(
             ignore_subscribe_messages=True,
             timeout=self.channel.polling_interval,
         )
 
+        if isinstance(psub, SharedSubscription) and (dropped := psub.report_dropped()):
+            self._log(
+                log_level=logging.WARNING,
+                message=(
+                    f"Subscriber buffer is full, {dropped} oldest messages were dropped. "
+                    "Consider increasing the `pubsub_max_buffer_size` broker option."
+                ),
+                extra=self.get_log_context(None),
+            )
+
         if raw_msg:
             return PubSubMessage(
                 type=raw_msg["type"],
@@ -167,7 +185,7 @@ class ChannelSubscriber(LogicSubscriber):
 
         return None
 
-    async def _get_msgs(self, psub: RPubSub) -> None:
+    async def _get_msgs(self, psub: "RPubSub | SharedSubscription") -> None:
         if msg := await self._get_message(psub):
             await self.consume_one(msg)
 
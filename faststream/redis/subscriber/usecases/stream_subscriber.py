@@ -2,7 +2,7 @@ import asyncio
 import logging
 import math
 from collections.abc import AsyncIterator, Awaitable, Callable
-from typing import TYPE_CHECKING, Any, Optional, TypeAlias
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, cast
 
 import anyio
 from redis.exceptions import ResponseError
@@ -68,6 +68,7 @@ class _StreamHandlerMixin(LogicSubscriber):
         self.last_id = config.stream_sub.last_id
         self.min_idle_time = config.stream_sub.min_idle_time
         self.autoclaim_start_id = b"0-0"
+        self._pending_drained = False
 
     @property
     def stream_sub(self) -> "StreamSub":
@@ -140,38 +141,47 @@ class _StreamHandlerMixin(LogicSubscriber):
                 if "already exists" not in str(e):
                     raise
 
+            def read_new(
+                _: str,
+            ) -> Awaitable[ReadResponse]:
+                return client.xreadgroup(
+                    groupname=stream.group,
+                    consumername=stream.consumer,
+                    streams={stream.name: stream.last_id},
+                    count=stream.max_records,
+                    block=stream.polling_interval,
+                    noack=stream.no_ack,
+                )
+
+            stream_name = stream.name.encode()
+
             if stream.min_idle_time is None:
+                read = read_new
 
-                def read(
-                    _: str,
-                ) -> Awaitable[ReadResponse]:
-                    return client.xreadgroup(
-                        groupname=stream.group,
-                        consumername=stream.consumer,
-                        streams={stream.name: stream.last_id},
-                        count=stream.max_records,
-                        block=stream.polling_interval,
-                        noack=stream.no_ack,
-                    )
+            elif stream.drain_pending:
+
+                async def read(last_id: str) -> ReadResponse:
+                    if not self._pending_drained:
+                        messages = await self._autoclaim(count=stream.max_records)
+
+                        # the whole PEL is scanned, switch to new messages
+                        self._pending_drained = self.autoclaim_start_id == b"0-0"
+
+                        if messages:
+                            return ((stream_name, messages),)
+
+                    response = await read_new(last_id)
+                    if not response:
+                        # stream is idle, look for abandoned messages again
+                        self._pending_drained = False
+                    return response
 
             else:
 
                 async def read(_: str) -> ReadResponse:
-                    stream_message = await client.xautoclaim(
-                        name=self.stream_sub.name,
-                        groupname=self.stream_sub.group,
-                        consumername=self.stream_sub.consumer,
-                        min_idle_time=self.min_idle_time,
-                        start_id=self.autoclaim_start_id,
-                        count=1,
-                    )
-                    stream_name = self.stream_sub.name.encode()
-                    (next_id, messages, *_) = stream_message
+                    messages = await self._autoclaim(count=stream.max_records)
 
-                    # Update start_id for next call
-                    self.autoclaim_start_id = next_id
-
-                    if next_id == b"0-0" and not messages:
+                    if self.autoclaim_start_id == b"0-0" and not messages:
                         await asyncio.sleep(stream.polling_interval / 1000)  # ms to s
                         return ()
 
@@ -190,6 +200,27 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         await super().start(read)
 
+    async def _autoclaim(
+        self,
+        count: int | None,
+    ) -> tuple[tuple[Offset, dict[bytes, bytes]], ...]:
+        """Claim up to `count` idle pending messages continuing the PEL scan."""
+        response = await self._client.xautoclaim(
+            name=self.stream_sub.name,
+            groupname=self.stream_sub.group,
+            consumername=self.stream_sub.consumer,
+            min_idle_time=self.min_idle_time,
+            start_id=self.autoclaim_start_id,
+            count=count,
+        )
+        (next_id, messages, *_) = cast(
+            "tuple[Offset, list[tuple[Offset, dict[bytes, bytes]]]]",
+            response,
+        )
+        # Update start_id for next call
+        self.autoclaim_start_id = next_id
+        return tuple(messages)
+
     @override
     async def get_one(
         self,
@@ -213,17 +244,7 @@ class _StreamHandlerMixin(LogicSubscriber):
 
                 ((stream_name, ((message_id, raw_message),)),) = stream_message
             else:
-                stream_message = await self._client.xautoclaim(
-                    name=self.stream_sub.name,
-                    groupname=self.stream_sub.group,
-                    consumername=self.stream_sub.consumer,
-                    min_idle_time=self.min_idle_time,
-                    start_id=self.autoclaim_start_id,
-                    count=1,
-                )
-                (next_id, messages, *_) = stream_message
-                # Update start_id for next call
-                self.autoclaim_start_id = next_id
+                messages = await self._autoclaim(count=1)
                 if not messages:
                     return None
                 stream_name = self.stream_sub.name.encode()
@@ -275,63 +296,63 @@ class _StreamHandlerMixin(LogicSubscriber):
         while True:
             if self.stream_sub.group and self.stream_sub.consumer:
                 if self.min_idle_time is None:
-                    stream_message = await self._client.xreadgroup(
-                        groupname=self.stream_sub.group,
-                        consumername=self.stream_sub.consumer,
-                        streams={self.stream_sub.name: self.last_id},
-                        block=math.ceil(timeout * 1000),
-                        count=1,
+                    stream_message = cast(
+                        "ReadResponse",
+                        await self._client.xreadgroup(
+                            groupname=self.stream_sub.group,
+                            consumername=self.stream_sub.consumer,
+                            streams={self.stream_sub.name: self.last_id},
+                            block=math.ceil(timeout * 1000),
+                            count=1,
+                        ),
                     )
                     if not stream_message:
                         continue
 
-                    ((stream_name, ((message_id, raw_message),)),) = stream_message
+                    ((stream_name, messages),) = stream_message
                 else:
-                    stream_message = await self._client.xautoclaim(
-                        name=self.stream_sub.name,
-                        groupname=self.stream_sub.group,
-                        consumername=self.stream_sub.consumer,
-                        min_idle_time=self.min_idle_time,
-                        start_id=self.autoclaim_start_id,
-                        count=1,
+                    # claimed messages are owned by the consumer already,
+                    # so yield them all one by one
+                    messages = await self._autoclaim(
+                        count=self.stream_sub.max_records,
                     )
-                    (next_id, messages, *_) = stream_message
-                    # Update start_id for next call
-                    self.autoclaim_start_id = next_id
                     if not messages:
                         continue
                     stream_name = self.stream_sub.name.encode()
-                    ((message_id, raw_message),) = messages
             else:
-                stream_message = await self._client.xread(
-                    {self.stream_sub.name: self.last_id},
-                    block=math.ceil(timeout * 1000),
-                    count=1,
+                stream_message = cast(
+                    "ReadResponse",
+                    await self._client.xread(
+                        {self.stream_sub.name: self.last_id},
+                        block=math.ceil(timeout * 1000),
+                        count=1,
+                    ),
                 )
                 if not stream_message:
                     continue
 
-                ((stream_name, ((message_id, raw_message),)),) = stream_message
+                ((stream_name, messages),) = stream_message
 
-            self.last_id = message_id.decode()
+            for message_id, raw_message in messages:
+                self.last_id = message_id.decode()
 
-            redis_incoming_msg = DefaultStreamMessage(
-                type="stream",
-                channel=stream_name.decode(),
-                message_ids=[message_id],
-                data=raw_message,
-            )
+                redis_incoming_msg = DefaultStreamMessage(
+                    type="stream",
+                    channel=stream_name.decode(),
+                    message_ids=[message_id],
+                    data=raw_message,
+                )
 
-            msg: RedisStreamMessage = await process_msg(  # type: ignore[assignment]
-                msg=redis_incoming_msg,
-                middlewares=(
-                    m(redis_incoming_msg, context=context)
-                    for m in self._broker_middlewares
-                ),
-                parser=async_parser,
-                decoder=async_decoder,
-            )
-            yield msg
+                msg: RedisStreamMessage = await process_msg(  # type: ignore[assignment]
+                    msg=redis_incoming_msg,
+                    middlewares=(
+                        m(redis_incoming_msg, context=context)
+                        for m in self._broker_middlewares
+                    ),
+                    parser=async_parser,
+                    decoder=async_decoder,
+                )
+                yield msg
 
 
 class StreamSubscriber(_StreamHandlerMixin):
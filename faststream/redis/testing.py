@@ -222,6 +222,10 @@ class FakeProducer(RedisFastProducer):
             config=self._fake_config,
         )
 
+    @override
+    async def disconnect(self) -> None:
+        pass
+
     @override
     async def publish(self, cmd: "RedisPublishCommand") -> int | bytes:
         body = await build_message(
@@ -310,6 +310,50 @@ class BrokerConsumeTestcase(MultibrokerTestcase, BaseTestcaseConfig):
         mock.handler.assert_called_once_with({"msg": "hello"})
         mock.handler2.assert_called_once_with("hello")
 
+    async def test_consume_with_filter_key(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        consume = asyncio.Event()
+        consume2 = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            filter_key=lambda m: m.content_type,
+        )
+
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub(key="application/json")
+        async def handler(m) -> None:
+            mock.handler(m)
+            consume.set()
+
+        @sub(key="text/plain")
+        async def handler2(m) -> None:
+            mock.handler2(m)
+            consume2.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish({"msg": "hello"}, queue)),
+                    asyncio.create_task(br.publish("hello", queue)),
+                    asyncio.create_task(consume.wait()),
+                    asyncio.create_task(consume2.wait()),
+                ),
+                timeout=self.timeout,
+            )
+
+        assert consume.is_set()
+        assert consume2.is_set()
+        mock.handler.assert_called_once_with({"msg": "hello"})
+        mock.handler2.assert_called_once_with("hello")
+
     async def test_consume_validate_false(
         self, queue: str, mock: MagicMock, event: asyncio.Event
     ) -> None:
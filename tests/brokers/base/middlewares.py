@@ -243,6 +243,33 @@ class MiddlewaresOrderTestcase(BaseTestcaseConfig):
         call_order = [c.args[0] for c in mock.call_args_list]
         assert call_order == ["outer", "middle", "inner"], call_order
 
+    async def test_middleware_added_after_start(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class Middleware(BaseMiddleware):
+            async def consume_scope(self, call_next, cmd):
+                mock()
+                return await call_next(cmd)
+
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg):
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish(None, queue)
+            assert not mock.called
+
+            br.add_middleware(Middleware)
+
+            await br.publish(None, queue)
+            mock.assert_called_once()
+
 
 @pytest.mark.asyncio()
 class LocalMiddlewareTestcase(BaseTestcaseConfig):
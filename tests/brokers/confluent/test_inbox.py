@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from faststream.confluent.helpers.admin import CreateResult
+from faststream.confluent.publisher.inbox import ReplyInbox
+from faststream.exceptions import IncorrectState
+
+
+class FakeConsumer:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.start = AsyncMock()
+        self.stop = AsyncMock()
+
+    async def getone(self, timeout: float = 0.1) -> Any:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def reply(self, correlation_id: str, value: bytes) -> None:
+        msg = MagicMock()
+        msg.value.return_value = value
+        msg.headers.return_value = [("correlation_id", correlation_id.encode())]
+        self.queue.put_nowait(msg)
+
+
+def build_inbox() -> tuple[ReplyInbox, FakeConsumer, MagicMock]:
+    consumer = FakeConsumer()
+    admin = MagicMock()
+    admin.create_topics.side_effect = lambda topics, **kwargs: [
+        CreateResult(t, None) for t in topics
+    ]
+    return (
+        ReplyInbox(lambda **kwargs: consumer, admin, replication_factor=3),
+        consumer,
+        admin,
+    )
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_concurrent_requests_share_reply_topic() -> None:
+    inbox, consumer, admin = build_inbox()
+
+    async def request(i: int) -> bytes:
+        await inbox.start()
+        async with inbox.wait_response(str(i)) as response:
+            consumer.reply(str(i), str(i).encode())
+            return (await response).value()
+
+    try:
+        results = await asyncio.gather(*(request(i) for i in range(10)))
+    finally:
+        await inbox.stop()
+
+    assert results == [str(i).encode() for i in range(10)]
+    admin.create_topics.assert_called_once_with([inbox.topic], replication_factor=3)
+    consumer.start.assert_awaited_once()
+    consumer.stop.assert_awaited_once()
+    admin.delete_topics.assert_called_once_with([inbox.topic])
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_timed_out_request_is_forgotten() -> None:
+    inbox, consumer, _ = build_inbox()
+    await inbox.start()
+
+    try:
+        with pytest.raises(TimeoutError), anyio.fail_after(0.05):
+            async with inbox.wait_response("1") as response:
+                await response
+
+        assert inbox.in_flight == 0
+
+        # late response for the timed out request is dropped
+        consumer.reply("1", b"late")
+
+        async with inbox.wait_response("2") as response:
+            consumer.reply("2", b"fresh")
+            assert (await response).value() == b"fresh"
+
+    finally:
+        await inbox.stop()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_topic_creation_error() -> None:
+    inbox, _, admin = build_inbox()
+    admin.create_topics.side_effect = lambda topics, **kwargs: [
+        CreateResult(t, ValueError("denied")) for t in topics
+    ]
+
+    with pytest.raises(ValueError, match="denied"):
+        await inbox.start()
+
+    await inbox.stop()
+    admin.delete_topics.assert_not_called()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_duplicate_correlation_id_rejected() -> None:
+    inbox, consumer, _ = build_inbox()
+    await inbox.start()
+
+    try:
+        async with inbox.wait_response("1") as response:
+            with pytest.raises(IncorrectState):
+                async with inbox.wait_response("1"):
+                    pass
+
+            consumer.reply("1", b"response")
+            assert (await response).value() == b"response"
+
+    finally:
+        await inbox.stop()
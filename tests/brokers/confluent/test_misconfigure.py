@@ -52,3 +52,13 @@ def test_use_only_confluent_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.confluent()
+def test_wrong_prefetch(queue: str) -> None:
+    broker = KafkaBroker()
+
+    broker.subscriber(queue, prefetch=1)
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, prefetch=0)
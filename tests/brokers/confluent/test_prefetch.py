@@ -0,0 +1,240 @@
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+
+from faststream.confluent.helpers.client import AsyncConfluentConsumer
+from faststream.confluent.helpers.config import ConfluentFastConfig
+
+
+def make_message(offset: int, partition: int = 0) -> MagicMock:
+    msg = MagicMock()
+    msg.error.return_value = None
+    msg.topic.return_value = "topic"
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    return msg
+
+
+class FakeConsumer:
+    def __init__(self, messages: list[Any]) -> None:
+        self.messages = messages
+        self.paused = False
+        self.resumes = 0
+        self.consume_calls = 0
+        self.committed: list[Any] = []
+        self.seek = MagicMock()
+        self.assign = MagicMock()
+        self.callbacks: dict[str, Any] = {}
+
+    def subscribe(self, topics: list[str], **callbacks: Any) -> None:
+        self.callbacks = callbacks
+
+    def assignment(self) -> list[Any]:
+        return [MagicMock(topic="topic", partition=0)]
+
+    def pause(self, partitions: list[Any]) -> None:
+        self.paused = True
+
+    def resume(self, partitions: list[Any]) -> None:
+        self.paused = False
+        self.resumes += 1
+
+    def consume(self, num_messages: int, timeout: float) -> list[Any]:
+        self.consume_calls += 1
+        if self.paused or not self.messages:
+            time.sleep(timeout)
+            return []
+
+        batch = self.messages[:num_messages]
+        del self.messages[:num_messages]
+        return batch
+
+    def commit(self, offsets: list[Any], asynchronous: bool) -> None:
+        self.committed.extend(offsets)
+
+    def close(self) -> None:
+        pass
+
+
+def build_consumer(
+    messages: list[Any],
+    prefetch: int,
+) -> tuple[AsyncConfluentConsumer, FakeConsumer]:
+    admin = MagicMock()
+    admin.create_topics.return_value = []
+
+    consumer = AsyncConfluentConsumer(
+        "topic",
+        config=ConfluentFastConfig(),
+        logger=MagicMock(),
+        admin_service=admin,
+        partitions=(),
+        enable_auto_commit=False,
+        prefetch=prefetch,
+    )
+    consumer.consumer = fake = FakeConsumer(messages)  # type: ignore[assignment]
+    return consumer, fake
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_messages_fetched_by_batches() -> None:
+    messages = [make_message(i) for i in range(100)]
+    consumer, fake = build_consumer(messages.copy(), prefetch=50)
+
+    await consumer.start()
+    try:
+        received = [await consumer.getone(timeout=1) for _ in range(90)]
+        received.extend(await consumer.getmany(timeout=1, max_records=10))
+    finally:
+        await consumer.stop()
+
+    assert received == messages
+    assert fake.consume_calls < 10
+
+
+async def wait_for(condition: Any) -> None:
+    with anyio.fail_after(3):
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_pause_full_buffer() -> None:
+    consumer, fake = build_consumer([make_message(i) for i in range(100)], prefetch=10)
+
+    await consumer.start()
+    try:
+        await wait_for(lambda: fake.paused)
+        assert len(fake.messages) == 90
+
+        # resumed after the buffer is drained to the half
+        await consumer.getmany(timeout=1, max_records=4)
+        await asyncio.sleep(0.2)
+        assert fake.resumes == 0
+
+        await consumer.getone(timeout=1)
+        await wait_for(lambda: fake.resumes == 1)
+
+    finally:
+        await consumer.stop()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_commit_delivered_messages_only() -> None:
+    consumer, fake = build_consumer([make_message(i) for i in range(10)], prefetch=10)
+
+    await consumer.start()
+    try:
+        await consumer.getmany(timeout=1, max_records=3)
+        await wait_for(lambda: not fake.messages)
+
+        await consumer.commit()
+
+    finally:
+        await consumer.stop()
+
+    (offset,) = fake.committed
+    assert (offset.topic, offset.partition, offset.offset) == ("topic", 0, 3)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_seek_drops_fetched_messages() -> None:
+    messages = [make_message(i, partition=i % 2) for i in range(10)]
+    consumer, fake = build_consumer(messages.copy(), prefetch=10)
+
+    await consumer.start()
+    try:
+        first = await consumer.getone(timeout=1)
+        await wait_for(lambda: not fake.messages)
+
+        await consumer.seek("topic", 0, 0)
+        rest = await consumer.getmany(timeout=1, max_records=10)
+
+    finally:
+        await consumer.stop()
+
+    fake.seek.assert_called_once()
+    assert first is messages[0]
+    assert rest == tuple(messages[1::2])
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("callback", ("on_revoke", "on_lost"))
+async def test_revoked_partitions_forgotten(callback: str) -> None:
+    messages = [make_message(i, partition=i % 2) for i in range(10)]
+    consumer, fake = build_consumer(messages.copy(), prefetch=10)
+    user_callback = MagicMock()
+    setattr(consumer, f"_{callback}", user_callback)
+
+    await consumer.start()
+    try:
+        await consumer.getmany(timeout=1, max_records=2)
+        await wait_for(lambda: not fake.messages)
+
+        revoked = [MagicMock(topic="topic", partition=0)]
+        fake.callbacks[callback](fake, revoked)
+
+        rest = await consumer.getmany(timeout=1, max_records=10)
+        await consumer.commit()
+
+    finally:
+        await consumer.stop()
+
+    user_callback.assert_called_once_with(fake, revoked)
+    assert rest == tuple(messages[3::2])
+    (offset,) = fake.committed
+    assert (offset.topic, offset.partition, offset.offset) == ("topic", 1, 10)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_pause_assigned_while_buffer_full() -> None:
+    consumer, fake = build_consumer([make_message(i) for i in range(20)], prefetch=10)
+    user_callback = MagicMock()
+    consumer._on_assign = user_callback
+
+    await consumer.start()
+    try:
+        await wait_for(lambda: fake.paused)
+
+        fake.pause = MagicMock()  # type: ignore[method-assign]
+        assigned = [MagicMock(topic="topic", partition=1)]
+        fake.callbacks["on_assign"](fake, assigned)
+
+    finally:
+        await consumer.stop()
+
+    user_callback.assert_called_once_with(fake, assigned)
+    fake.assign.assert_called_once_with(assigned)
+    fake.pause.assert_called_once_with(assigned)
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+async def test_full_buffer_not_overfilled() -> None:
+    messages = [make_message(i, partition=i % 2) for i in range(30)]
+    consumer, fake = build_consumer(messages.copy(), prefetch=10)
+    # partitions are not paused, e.g. assigned after the pause
+    fake.pause = MagicMock()  # type: ignore[method-assign]
+
+    await consumer.start()
+    try:
+        await wait_for(lambda: fake.consume_calls > 3)
+        assert len(consumer._buffer) == 10
+
+    finally:
+        await consumer.stop()
+
+    fake.pause.assert_called()
+    # the first message consumed into the full buffer is fetched again
+    (tp,), _ = fake.seek.call_args_list[0]
+    assert (tp.topic, tp.partition, tp.offset) == ("topic", 0, 10)
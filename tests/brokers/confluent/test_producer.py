@@ -0,0 +1,123 @@
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from confluent_kafka import KafkaError, KafkaException
+
+from faststream.confluent.helpers.client import AsyncConfluentProducer
+from faststream.confluent.helpers.config import ConfluentFastConfig
+
+
+class FakeProducer:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.pending: list[tuple[Any, Any]] = []
+        self.produced: list[dict[str, Any]] = []
+        self.fail_offsets: set[int] = set()
+
+    def produce(self, topic: str, on_delivery: Any, **kwargs: Any) -> None:
+        msg = MagicMock()
+        msg.error.return_value = None
+        msg.offset.return_value = len(self.produced)
+
+        self.produced.append({"topic": topic, **kwargs})
+        self.pending.append((msg, on_delivery))
+
+    def poll(self, timeout: float) -> int:
+        if not self.pending:
+            time.sleep(timeout)
+        return self.flush()
+
+    def flush(self) -> int:
+        pending, self.pending = self.pending, []
+        for msg, on_delivery in pending:
+            if msg.offset() in self.fail_offsets:
+                on_delivery(KafkaError(KafkaError._MSG_TIMED_OUT), msg)
+            else:
+                on_delivery(None, msg)
+        return len(pending)
+
+
+@pytest.fixture()
+def fake_producer() -> Iterator[type[FakeProducer]]:
+    with patch("faststream.confluent.helpers.client.Producer", FakeProducer):
+        yield FakeProducer
+
+
+def build_producer() -> tuple[AsyncConfluentProducer, FakeProducer]:
+    producer = AsyncConfluentProducer(logger=MagicMock(), config=ConfluentFastConfig())
+    return producer, producer.producer  # type: ignore[return-value]
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("fake_producer")
+async def test_send() -> None:
+    producer, fake = build_producer()
+
+    try:
+        msg = await producer.send("topic", value="hello", key="key", partition=1)
+    finally:
+        await producer.stop()
+
+    assert msg.offset() == 0
+    assert fake.produced == [
+        {
+            "topic": "topic",
+            "value": b"hello",
+            "key": b"key",
+            "headers": None,
+            "partition": 1,
+        },
+    ]
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("fake_producer")
+async def test_send_batch() -> None:
+    producer, fake = build_producer()
+
+    batch = producer.create_batch()
+    for i in range(1000):
+        batch.append(value=str(i).encode())
+
+    try:
+        await producer.send_batch(batch, "topic", partition=None)
+    finally:
+        await producer.stop()
+
+    assert [m["value"] for m in fake.produced] == [str(i).encode() for i in range(1000)]
+    assert not fake.pending
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("fake_producer")
+async def test_send_batch_delivery_error() -> None:
+    producer, fake = build_producer()
+    fake.fail_offsets.add(5)
+
+    batch = producer.create_batch()
+    for i in range(10):
+        batch.append(value=str(i).encode())
+
+    try:
+        with pytest.raises(KafkaException):
+            await producer.send_batch(batch, "topic", partition=None)
+    finally:
+        await producer.stop()
+
+
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("fake_producer")
+async def test_stop_resolves_pending_messages() -> None:
+    producer, _ = build_producer()
+
+    future = await producer.send("topic", value=b"hello", no_confirm=True)
+    await producer.stop()
+
+    assert future.done()
+    assert future.result().offset() == 0
@@ -5,7 +5,7 @@ import pytest
 from faststream import BaseMiddleware
 from tests.brokers.base.requests import RequestsTestcase
 
-from .basic import ConfluentMemoryTestcaseConfig
+from .basic import ConfluentMemoryTestcaseConfig, ConfluentTestcaseConfig
 
 
 class Mid(BaseMiddleware):
@@ -17,6 +17,23 @@ class Mid(BaseMiddleware):
         return await call_next(msg)
 
 
+class RealMid(BaseMiddleware):
+    async def on_receive(self) -> None:
+        self.msg.set_value(self.msg.value() * 2)
+
+    async def consume_scope(self, call_next, msg):
+        msg.body *= 2
+        return await call_next(msg)
+
+
+@pytest.mark.connected()
+@pytest.mark.confluent()
+@pytest.mark.asyncio()
+class TestRealRequests(ConfluentTestcaseConfig, RequestsTestcase):
+    def get_middleware(self, **kwargs: Any):
+        return RealMid
+
+
 @pytest.mark.confluent()
 @pytest.mark.asyncio()
 class TestRequestTestClient(ConfluentMemoryTestcaseConfig, RequestsTestcase):
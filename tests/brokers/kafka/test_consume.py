@@ -540,6 +540,40 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
                 )
                 assert mock.mock.call_count == 2
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_concurrent_consume_key_ordered(self, queue: str) -> None:
+        consume_broker = self.get_broker(apply_types=True)
+
+        processed: dict[bytes, list[int]] = {b"a": [], b"b": []}
+        done = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue,
+            max_workers=4,
+            ordering="key",
+            ack_policy=AckPolicy.ACK,
+            group_id="service_1",
+            auto_offset_reset="earliest",
+        )
+        async def handler(msg: int, message: KafkaMessage) -> None:
+            # later messages are faster to catch reordering
+            await asyncio.sleep((5 - msg) / 50)
+            processed[message.raw_message.key].append(msg)
+            if sum(map(len, processed.values())) == 10:
+                done.set()
+
+        async with self.patch_broker(consume_broker) as broker:
+            for i in range(5):
+                await broker.publish(i, queue, key=b"a")
+                await broker.publish(i, queue, key=b"b")
+
+            await broker.start()
+            await asyncio.wait_for(done.wait(), timeout=10)
+
+        assert processed == {b"a": [0, 1, 2, 3, 4], b"b": [0, 1, 2, 3, 4]}
+
 
 @pytest.mark.asyncio()
 @pytest.mark.slow()
@@ -0,0 +1,153 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.kafka import KafkaBroker
+from faststream.kafka.publisher.inbox import ReplyInbox
+
+
+class FakeConsumer:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.start = AsyncMock()
+        self.stop = AsyncMock()
+        self.position = AsyncMock(return_value=0)
+        self.assign = MagicMock()
+
+    async def getone(self) -> Any:
+        return await self.queue.get()
+
+    def reply(self, correlation_id: str, value: bytes) -> None:
+        self.queue.put_nowait(
+            SimpleNamespace(
+                value=value,
+                headers=[("correlation_id", correlation_id.encode())],
+            )
+        )
+
+
+def build_inbox() -> tuple[ReplyInbox, FakeConsumer, AsyncMock]:
+    consumer = FakeConsumer()
+    admin = AsyncMock()
+    admin.create_topics.return_value = SimpleNamespace(topic_errors=[])
+    return (
+        ReplyInbox(lambda **kwargs: consumer, admin, replication_factor=3),
+        consumer,
+        admin,
+    )
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_concurrent_requests_share_reply_topic() -> None:
+    inbox, consumer, admin = build_inbox()
+
+    async def request(i: int) -> bytes:
+        await inbox.start()
+        async with inbox.wait_response(str(i)) as response:
+            consumer.reply(str(i), str(i).encode())
+            return (await response).value
+
+    try:
+        results = await asyncio.gather(*(request(i) for i in range(10)))
+    finally:
+        await inbox.stop()
+
+    assert results == [str(i).encode() for i in range(10)]
+    admin.create_topics.assert_awaited_once()
+    (new_topic,) = admin.create_topics.await_args.args[0]
+    assert new_topic.replication_factor == 3
+    consumer.start.assert_awaited_once()
+    consumer.stop.assert_awaited_once()
+    admin.delete_topics.assert_awaited_once_with([inbox.topic])
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_timed_out_request_is_forgotten() -> None:
+    inbox, consumer, _ = build_inbox()
+    await inbox.start()
+
+    try:
+        with pytest.raises(TimeoutError), anyio.fail_after(0.05):
+            async with inbox.wait_response("1") as response:
+                await response
+
+        assert inbox.in_flight == 0
+
+        # late response for the timed out request is dropped
+        consumer.reply("1", b"late")
+
+        async with inbox.wait_response("2") as response:
+            consumer.reply("2", b"fresh")
+            assert (await response).value == b"fresh"
+
+    finally:
+        await inbox.stop()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_reader_failure_wakes_up_requests() -> None:
+    inbox, consumer, _ = build_inbox()
+    await inbox.start()
+
+    try:
+        async with inbox.wait_response("1") as response:
+            consumer.queue.put_nowait(SimpleNamespace())  # broken record
+            with pytest.raises(AttributeError):
+                await response
+
+        # the next request restarts the reader
+        await inbox.start()
+        assert consumer.start.await_count == 2
+
+    finally:
+        await inbox.stop()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_duplicate_correlation_id_rejected() -> None:
+    inbox, consumer, _ = build_inbox()
+    await inbox.start()
+
+    try:
+        async with inbox.wait_response("1") as response:
+            with pytest.raises(IncorrectState):
+                async with inbox.wait_response("1"):
+                    pass
+
+            consumer.reply("1", b"response")
+            assert (await response).value == b"response"
+
+    finally:
+        await inbox.stop()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_max_in_flight() -> None:
+    consumer = FakeConsumer()
+    inbox = ReplyInbox(lambda **kwargs: consumer, AsyncMock(), max_in_flight=1)
+
+    async with inbox.wait_response("1"):
+        # the next request waits for a free slot
+        with pytest.raises(TimeoutError), anyio.fail_after(0.05):
+            async with inbox.wait_response("2"):
+                pass
+
+    async with inbox.wait_response("2"):
+        assert inbox.in_flight == 1
+
+
+@pytest.mark.kafka()
+def test_broker_reply_max_in_flight() -> None:
+    broker = KafkaBroker(reply_max_in_flight=8)
+
+    assert broker.config.broker_config.reply_max_in_flight == 8
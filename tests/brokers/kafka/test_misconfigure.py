@@ -8,6 +8,7 @@ from faststream.kafka import KafkaBroker, KafkaRouter, TopicPartition
 from faststream.kafka.subscriber.usecase import (
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentKeyOrderedSubscriber,
 )
 from faststream.nats import NatsRouter
 from faststream.rabbit import RabbitRouter
@@ -88,6 +89,41 @@ def test_max_workers_configuration(queue: str) -> None:
         )
 
 
+@pytest.mark.kafka()
+@pytest.mark.parametrize(
+    "ack_policy",
+    (
+        pytest.param(AckPolicy.ACK_FIRST, id="ack first"),
+        pytest.param(AckPolicy.ACK, id="manual commit"),
+    ),
+)
+def test_ordered_max_workers_configuration(queue: str, ack_policy: AckPolicy) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(
+        queue,
+        queue + "1",
+        max_workers=3,
+        ordering="key",
+        ack_policy=ack_policy,
+    )
+    assert isinstance(sub, ConcurrentKeyOrderedSubscriber)
+
+
+@pytest.mark.kafka()
+def test_ordering_misconfiguration(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, max_workers=3, ordering="offset")
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, batch=True, ordering="key")
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, ordering="key")
+
+
 @pytest.mark.kafka()
 def test_use_only_kafka_router() -> None:
     broker = KafkaBroker()
@@ -0,0 +1,187 @@
+import zlib
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from faststream.kafka import KafkaBroker
+from faststream.kafka.helpers import OffsetTracker, RevokedOffsetsListener
+
+
+def make_record(offset: int, partition: int = 0) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_commit_lowest_processed_offset() -> None:
+    consumer = MagicMock(commit=AsyncMock())
+    tracker = OffsetTracker(consumer)
+
+    records = [make_record(i) for i in range(3)]
+    tracked = [tracker.register(r) for r in records]
+
+    await tracked[2].commit()
+    await tracked[1].commit()
+    consumer.commit.assert_not_called()
+
+    await tracked[0].commit()
+    consumer.commit.assert_called_once_with({TopicPartition("topic", 0): 3})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_partitions_are_tracked_independently() -> None:
+    consumer = MagicMock(commit=AsyncMock())
+    tracker = OffsetTracker(consumer)
+
+    first, second = tracker.register(make_record(0)), tracker.register(make_record(1))
+    other = tracker.register(make_record(10, partition=1))
+
+    await other.commit()
+    await second.commit()
+
+    consumer.commit.assert_called_once_with({TopicPartition("topic", 1): 11})
+
+    await first.commit()
+    await first.commit()
+
+    assert consumer.commit.call_count == 2
+    consumer.commit.assert_called_with({TopicPartition("topic", 0): 2})
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_nacked_record_blocks_commit() -> None:
+    consumer = MagicMock(commit=AsyncMock())
+    tracker = OffsetTracker(consumer)
+
+    nacked, processed = tracker.register(make_record(0)), tracker.register(make_record(1))
+
+    nacked.seek(TopicPartition("topic", 0), 0)
+    await processed.commit()
+
+    assert nacked.nacked
+    consumer.seek.assert_called_once_with(TopicPartition("topic", 0), 0)
+    consumer.commit.assert_not_called()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_rewind_after_active_records() -> None:
+    consumer = MagicMock(commit=AsyncMock())
+    tracker = OffsetTracker(consumer)
+    tp = TopicPartition("topic", 0)
+
+    earlier, nacked, active, later = (tracker.register(make_record(i)) for i in range(4))
+
+    assert tracker.start(nacked)
+    assert tracker.start(active)
+
+    nacked.seek(tp, 1)
+    consumer.pause.assert_called_once_with(tp)
+
+    # consumed before the nacked record, so it is not redelivered
+    assert tracker.start(earlier)
+    # redelivered after the rewind
+    assert not tracker.start(later)
+
+    for tracked in (nacked, active, earlier):
+        consumer.seek.assert_not_called()
+        tracker.finish(tracked)
+
+    consumer.seek.assert_called_once_with(tp, 1)
+    consumer.resume.assert_called_once_with(tp)
+
+    # redelivered records are processed again
+    assert tracker.start(tracker.register(make_record(2)))
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_revoked_partitions_forgotten() -> None:
+    consumer = MagicMock(commit=AsyncMock())
+    tracker = OffsetTracker(consumer)
+    user_listener = MagicMock(on_partitions_revoked=AsyncMock())
+    listener = RevokedOffsetsListener(lambda: tracker, user_listener)
+
+    pending = tracker.register(make_record(0))
+    tracker.register(make_record(1))
+
+    revoked = {TopicPartition("topic", 0)}
+    await listener.on_partitions_revoked(revoked)
+
+    user_listener.on_partitions_revoked.assert_awaited_once_with(revoked)
+    assert tracker.committable(TopicPartition("topic", 0)) is None
+
+    await pending.commit()
+    consumer.commit.assert_not_called()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_buffered_records_release_limiter_on_stop() -> None:
+    broker = KafkaBroker()
+
+    @broker.subscriber("topic", max_workers=2, ordering="partition")
+    async def handler(msg: bytes) -> None: ...
+
+    subscriber = broker.subscribers[0]
+
+    # lanes are not served to keep records buffered
+    send_stream, receive_stream = anyio.create_memory_object_stream(2)
+    subscriber._lanes = [send_stream, send_stream]
+
+    await subscriber.consume_one(make_record(0))
+    await subscriber.consume_one(make_record(1))
+    assert subscriber.limiter.active == 2
+
+    await subscriber.stop()
+    receive_stream.close()
+
+    assert subscriber.limiter.active == 0
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_lane_selected_by_raw_key() -> None:
+    broker = KafkaBroker()
+
+    @broker.subscriber(
+        "topic",
+        max_workers=4,
+        ordering="key",
+        key_deserializer=lambda key: {"key": key},
+    )
+    async def handler(msg: bytes) -> None: ...
+
+    subscriber = broker.subscribers[0]
+
+    send_stream, receive_stream = anyio.create_memory_object_stream(4)
+    subscriber._lanes = [send_stream] * 4
+
+    record = make_record(0)
+    record.key = b"user"
+    assert subscriber.lane_for(record) == zlib.crc32(b"user") % 4
+
+    await subscriber.consume_one(record)
+
+    # unhashable key is deserialized after the lane selection
+    received, _ = receive_stream.receive_nowait()
+    assert received.key == {"key": b"user"}
+
+    send_stream.close()
+    receive_stream.close()
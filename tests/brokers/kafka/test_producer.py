@@ -0,0 +1,171 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiokafka import AIOKafkaProducer, TopicPartition
+from aiokafka.structs import RecordMetadata
+
+from faststream.kafka import BatchRecordMetadata, KafkaPublishMessage
+from faststream.kafka.exceptions import BatchBufferOverflowException
+from faststream.kafka.publisher.producer import AioKafkaFastProducerImpl
+from faststream.kafka.publisher.state import RealProducer
+from faststream.kafka.response import KafkaPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeBatch:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.records: list[dict[str, Any]] = []
+
+    def append(self, **record: Any) -> object | None:
+        if len(self.records) >= self.capacity or record["value"] == b"too large":
+            return None
+        self.records.append(record)
+        return object()
+
+
+def build_producer(capacity: int) -> tuple[AioKafkaFastProducerImpl, MagicMock]:
+    sent: list[tuple[FakeBatch, int | None]] = []
+
+    async def send_batch(
+        batch: FakeBatch,
+        topic: str,
+        *,
+        partition: int | None,
+    ) -> "asyncio.Future[Any]":
+        sent.append((batch, partition))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(
+            RecordMetadata(
+                topic,
+                partition,
+                TopicPartition(topic, partition),
+                len(sent),  # offset is the sending order
+                -1,
+                0,
+                0,
+            )
+        )
+        return future
+
+    kafka_producer = MagicMock()
+    kafka_producer.sent = sent
+    kafka_producer.create_batch.side_effect = lambda: FakeBatch(capacity)
+    kafka_producer.send_batch = send_batch
+    kafka_producer.partitions_for = AsyncMock()
+    kafka_producer._serialize = lambda key, value, headers: (key, value)
+    kafka_producer._partition = lambda topic, partition, key, *_: int(key) % 2
+
+    producer = AioKafkaFastProducerImpl(parser=None, decoder=None)
+    producer._producer = RealProducer(kafka_producer)
+    return producer, kafka_producer
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_publish_batch_rolls_over_full_batches() -> None:
+    producer, kafka_producer = build_producer(capacity=2)
+
+    result = await producer.publish_batch(
+        KafkaPublishCommand(
+            *range(5),
+            topic="test",
+            _publish_type=PublishType.PUBLISH,
+        )
+    )
+
+    assert [len(b.records) for b, _ in kafka_producer.sent] == [2, 2, 1]
+    assert {p for _, p in kafka_producer.sent} == {None}
+    assert isinstance(result, BatchRecordMetadata)
+    assert isinstance(result, RecordMetadata)
+    assert result.offset == 1  # fields of the first sent batch
+    assert [b.offset for b in result.batches] == [1, 2, 3]
+    kafka_producer.partitions_for.assert_not_awaited()
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_publish_batch_groups_keyed_messages_by_partition() -> None:
+    producer, kafka_producer = build_producer(capacity=10)
+
+    future = await producer.publish_batch(
+        KafkaPublishCommand(
+            *(KafkaPublishMessage(i, key=str(i).encode()) for i in range(5)),
+            topic="test",
+            no_confirm=True,
+            _publish_type=PublishType.PUBLISH,
+        )
+    )
+
+    assert isinstance(future, asyncio.Future)
+    result = await future
+    assert result.partition == 0
+    assert [(b.partition, b.offset) for b in result.batches] == [(0, 1), (1, 2)]
+
+    sent = {p: [r["key"] for r in b.records] for b, p in kafka_producer.sent}
+    assert sent == {0: [b"0", b"2", b"4"], 1: [b"1", b"3"]}
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_publish_batch_overflow_sends_nothing() -> None:
+    producer, kafka_producer = build_producer(capacity=2)
+
+    with pytest.raises(BatchBufferOverflowException) as exc:
+        await producer.publish_batch(
+            KafkaPublishCommand(
+                *range(3),
+                b"too large",
+                topic="test",
+                _publish_type=PublishType.PUBLISH,
+            )
+        )
+
+    assert exc.value.message_position == 3
+    assert kafka_producer.sent == []
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_publish_batch_explicit_partition() -> None:
+    producer, kafka_producer = build_producer(capacity=10)
+
+    await producer.publish_batch(
+        KafkaPublishCommand(
+            *(KafkaPublishMessage(i, key=str(i).encode()) for i in range(5)),
+            topic="test",
+            partition=3,
+            _publish_type=PublishType.PUBLISH,
+        )
+    )
+
+    assert [(len(b.records), p) for b, p in kafka_producer.sent] == [(5, 3)]
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_publish_batch_without_partitioner() -> None:
+    producer, kafka_producer = build_producer(capacity=10)
+    # private aiokafka API is not available
+    del kafka_producer._serialize
+    del kafka_producer._partition
+
+    await producer.publish_batch(
+        KafkaPublishCommand(
+            *(KafkaPublishMessage(i, key=str(i).encode()) for i in range(5)),
+            topic="test",
+            _publish_type=PublishType.PUBLISH,
+        )
+    )
+
+    assert [(len(b.records), p) for b, p in kafka_producer.sent] == [(5, None)]
+    kafka_producer.partitions_for.assert_not_awaited()
+
+
+@pytest.mark.kafka()
+def test_supported_aiokafka_has_partitioner() -> None:
+    # private API used by `publish_batch` key routing
+    assert hasattr(AIOKafkaProducer, "_serialize")
+    assert hasattr(AIOKafkaProducer, "_partition")
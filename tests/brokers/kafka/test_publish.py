@@ -7,7 +7,6 @@ from aiokafka.structs import RecordMetadata
 
 from faststream import Context
 from faststream.kafka import KafkaPublishMessage, KafkaResponse
-from faststream.kafka.exceptions import BatchBufferOverflowException
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 from .basic import KafkaTestcaseConfig
@@ -166,22 +165,32 @@ class TestPublish(KafkaTestcaseConfig, BrokerPublishTestcase):
             assert isinstance(record_metadata_future, asyncio.Future)
 
     @pytest.mark.asyncio()
-    async def test_raise_buffer_overflow_exception(
+    async def test_publish_batch_splits_overflowed_batch(
         self,
         queue: str,
-        mock: MagicMock,
     ) -> None:
         pub_broker = self.get_broker(max_batch_size=16)
 
+        msgs_queue = asyncio.Queue(maxsize=2)
+
         @pub_broker.subscriber(queue)
-        async def handler(m) -> None:
-            pass
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
 
         async with self.patch_broker(pub_broker) as br:
             await br.start()
-            with pytest.raises(BatchBufferOverflowException) as e:
-                await br.publish_batch(1, "Hello, world!", topic=queue, no_confirm=True)
-            assert e.value.message_position == 1
+
+            record_metadata = await br.publish_batch(1, "Hello, world!", topic=queue)
+            result, _ = await asyncio.wait(
+                (
+                    asyncio.create_task(msgs_queue.get()),
+                    asyncio.create_task(msgs_queue.get()),
+                ),
+                timeout=3,
+            )
+
+        assert {1, "Hello, world!"} == {r.result() for r in result}
+        assert isinstance(record_metadata, RecordMetadata)
 
     @pytest.mark.asyncio()
     async def test_can_explicitly_publish_on_partition_0_from_publisher(
@@ -5,7 +5,7 @@ import pytest
 from faststream import BaseMiddleware
 from tests.brokers.base.requests import RequestsTestcase
 
-from .basic import KafkaMemoryTestcaseConfig
+from .basic import KafkaMemoryTestcaseConfig, KafkaTestcaseConfig
 
 
 class Mid(BaseMiddleware):
@@ -17,8 +17,18 @@ class Mid(BaseMiddleware):
         return await call_next(msg)
 
 
-@pytest.mark.kafka()
 @pytest.mark.asyncio()
-class TestRequestTestClient(KafkaMemoryTestcaseConfig, RequestsTestcase):
+class KafkaRequestsTestcase(RequestsTestcase):
     def get_middleware(self, **kwargs: Any):
         return Mid
+
+
+@pytest.mark.connected()
+@pytest.mark.kafka()
+class TestRealRequests(KafkaTestcaseConfig, KafkaRequestsTestcase):
+    pass
+
+
+@pytest.mark.kafka()
+class TestRequestTestClient(KafkaMemoryTestcaseConfig, KafkaRequestsTestcase):
+    pass
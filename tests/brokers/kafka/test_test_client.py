@@ -2,6 +2,7 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel, TypeAdapter
 
 from faststream import AckPolicy, BaseMiddleware, Context
 from faststream.kafka import TopicPartition
@@ -198,6 +199,27 @@ class TestTestclient(KafkaMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_validated_per_record(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker(apply_types=True)
+
+        class User(BaseModel):
+            name: str
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg: list[User]) -> None:
+            assert msg == [User(name="John"), User(name="Mike")]
+
+        with patch.object(TypeAdapter, "validate_json", autospec=True) as validate:
+            async with self.patch_broker(broker) as br:
+                await br.publish_batch({"name": "John"}, {"name": "Mike"}, topic=queue)
+                m.mock.assert_called_once_with([{"name": "John"}, {"name": "Mike"}])
+
+        # records are not joined into a single JSON array
+        validate.assert_not_called()
+
     async def test_batch_publisher_mock(
         self,
         queue: str,
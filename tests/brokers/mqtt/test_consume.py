@@ -17,6 +17,11 @@ class TestConsume(MQTTTestcaseConfig, BrokerRealConsumeTestcase):
             pytest.skip("content_type filtering not supported in MQTT 3.1.1")
         await super().test_consume_with_filter(queue, mock)
 
+    async def test_consume_with_filter_key(self, queue, mock):
+        if self.version == "3.1.1":
+            pytest.skip("content_type filtering not supported in MQTT 3.1.1")
+        await super().test_consume_with_filter_key(queue, mock)
+
     @pytest.mark.asyncio()
     async def test_iteration(
         self,
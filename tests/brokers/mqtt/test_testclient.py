@@ -20,6 +20,11 @@ class TestTestclient(MQTTMemoryTestcaseConfig, BrokerTestclientTestcase):
             pytest.skip(_SKIP_V311)
         await super().test_consume_with_filter(queue, mock)
 
+    async def test_consume_with_filter_key(self, queue, mock):
+        if self.version == "3.1.1":
+            pytest.skip(_SKIP_V311)
+        await super().test_consume_with_filter_key(queue, mock)
+
     async def test_response(self, queue, mock):
         if self.version == "3.1.1":
             pytest.skip(_SKIP_V311)
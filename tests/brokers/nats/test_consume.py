@@ -150,6 +150,37 @@ class TestConsume(NatsTestcaseConfig, BrokerRealConsumeTestcase):
             assert event.is_set()
             mock.assert_called_once_with("hello")
 
+    async def test_consume_pull_pipelined(
+        self,
+        queue: str,
+        stream: JStream,
+        mock,
+    ) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            stream=stream,
+            pull_sub=PullSub(timeout=0.5, high_watermark=10),
+        )
+        def subscriber(m) -> None:
+            mock(m)
+            if mock.call_count == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(3):
+                await br.publish(i, queue)
+
+            await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+
+            assert event.is_set()
+            assert sorted(c.args[0] for c in mock.call_args_list) == [0, 1, 2]
+
     async def test_consume_batch(
         self,
         queue: str,
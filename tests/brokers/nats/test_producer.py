@@ -0,0 +1,135 @@
+import asyncio
+from typing import Any
+
+import anyio
+import pytest
+from nats.js.errors import NoStreamResponseError
+
+from faststream.nats.publisher.pending import PendingAcks
+from faststream.nats.publisher.producer import NatsJSFastProducer
+from faststream.nats.response import NatsPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeJetStream:
+    def __init__(self) -> None:
+        self.acks: list[asyncio.Future[Any]] = []
+        self.published: list[bytes] = []
+
+    async def publish_async(
+        self,
+        subject: str,
+        payload: bytes,
+        headers: dict[str, str],
+        stream: str | None,
+    ) -> "asyncio.Future[Any]":
+        future = asyncio.get_running_loop().create_future()
+        self.published.append(payload)
+        self.acks.append(future)
+        return future
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pending_bytes_window() -> None:
+    js = FakeJetStream()
+    window = PendingAcks(max_bytes=10)
+
+    first = await window.publish(
+        js, subject="test", payload=b"x" * 6, headers={}, stream=None, timeout=None
+    )
+    assert window.pending_bytes == 6
+
+    second = asyncio.create_task(
+        window.publish(
+            js, subject="test", payload=b"y" * 6, headers={}, stream=None, timeout=None
+        ),
+    )
+    await asyncio.sleep(0.01)
+    assert js.published == [b"x" * 6], "window is full"
+
+    js.acks[0].set_result(1)
+    assert await first == 1
+
+    await asyncio.wait_for(second, timeout=1)
+    assert js.published == [b"x" * 6, b"y" * 6]
+    assert window.pending_bytes == 6
+    assert window.pending == 1
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pending_ack_timeout() -> None:
+    js = FakeJetStream()
+    window = PendingAcks()
+
+    future = await window.publish(
+        js, subject="test", payload=b"1", headers={}, stream=None, timeout=0.01
+    )
+
+    with pytest.raises(TimeoutError):
+        await future
+
+    # ack is cancelled to free the nats-py pending slot
+    assert js.acks[0].cancelled()
+    assert window.pending_bytes == 0
+    assert window.pending == 0
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_batch() -> None:
+    js = FakeJetStream()
+    producer = NatsJSFastProducer(parser=None, decoder=None)
+    producer.connect(js, serializer=None)
+
+    async def ack() -> None:
+        while len(js.acks) < 3:
+            await anyio.lowlevel.checkpoint()
+
+        for i, future in enumerate(reversed(js.acks)):
+            future.set_result(i)
+
+    ack_task = asyncio.create_task(ack())
+
+    result = await producer.publish_batch(
+        NatsPublishCommand(
+            "a",
+            messages=("b", "c"),
+            subject="test",
+            stream="test",
+            _publish_type=PublishType.PUBLISH,
+        ),
+    )
+    await ack_task
+
+    assert js.published == [b"a", b"b", b"c"]
+    assert result == [2, 1, 0]
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_publish_batch_surfaces_failed_ack() -> None:
+    js = FakeJetStream()
+    producer = NatsJSFastProducer(parser=None, decoder=None)
+    producer.connect(js, serializer=None)
+
+    result = await producer.publish_batch(
+        NatsPublishCommand(
+            "a",
+            messages=("b",),
+            subject="test",
+            stream="test",
+            no_confirm=True,
+            _publish_type=PublishType.PUBLISH,
+        ),
+    )
+    assert isinstance(result, asyncio.Future)
+
+    js.acks[0].set_exception(NoStreamResponseError)
+    js.acks[1].set_result(1)
+
+    with pytest.raises(NoStreamResponseError):
+        await result
+
+    assert producer.pending_acks.pending == 0
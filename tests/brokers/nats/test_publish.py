@@ -121,3 +121,35 @@ async def test_publish_with_schedule(
 
     assert event.is_set()
     mock.assert_called_once_with({"type": "do_something"})
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+@pytest.mark.connected()
+async def test_publish_batch_to_stream(queue: str, mock: MagicMock) -> None:
+    event = asyncio.Event()
+
+    broker = NatsBroker(js_options={"publish_async_max_pending_bytes": 1024})
+
+    @broker.subscriber(queue, stream=queue)
+    async def handle(body: int) -> None:
+        mock(body)
+        if mock.call_count == 10:
+            event.set()
+
+    async with broker:
+        await broker.start()
+
+        acks = await broker.publish_batch(
+            *range(10),
+            subject=queue,
+            stream=queue,
+            timeout=3,
+        )
+
+        future = await broker.publish(10, queue, stream=queue, no_confirm=True)
+
+        await asyncio.wait_for(event.wait(), timeout=3)
+
+        assert [a.seq for a in acks] == list(range(1, 11))
+        assert (await future).seq == 11
@@ -0,0 +1,191 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.nats import JStream, NatsBroker, PullSub
+
+
+class FakeSubscription:
+    def __init__(self) -> None:
+        self.fetched: list[int] = []
+        self.counter = 0
+
+    async def fetch(
+        self,
+        batch: int,
+        timeout: float | None,
+        heartbeat: float | None,
+    ) -> list[int]:
+        await asyncio.sleep(0)
+        self.fetched.append(batch)
+        messages = list(range(self.counter, self.counter + batch))
+        self.counter += batch
+        return messages
+
+
+class FakeMsg:
+    def __init__(self, index: int, naked: list[int]) -> None:
+        self.index = index
+        self.naked = naked
+
+    async def nak(self) -> None:
+        self.naked.append(self.index)
+
+
+class FakeBatchSubscription(FakeSubscription):
+    def __init__(self, fetch_delay: float = 0) -> None:
+        super().__init__()
+        self.fetch_delay = fetch_delay
+        self.naked: list[int] = []
+
+    async def fetch(  # type: ignore[override]
+        self,
+        batch: int,
+        timeout: float | None,
+        heartbeat: float | None,
+    ) -> list[FakeMsg]:
+        await asyncio.sleep(self.fetch_delay)
+        indexes = await super().fetch(batch, timeout, heartbeat)
+        return [FakeMsg(i, self.naked) for i in indexes]
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    ("options", "low_watermark"),
+    (
+        pytest.param({}, None, id="disabled"),
+        pytest.param({"high_watermark": 10}, 5, id="default low"),
+        pytest.param({"high_watermark": 10, "low_watermark": 0}, 0, id="zero low"),
+    ),
+)
+def test_watermarks(options: dict[str, Any], low_watermark: int | None) -> None:
+    pull_sub = PullSub(**options)
+    assert pull_sub.low_watermark == low_watermark
+    assert pull_sub.pipelined is bool(options)
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"low_watermark": 1}, id="without high"),
+        pytest.param({"high_watermark": 5, "low_watermark": 5}, id="equal"),
+        pytest.param({"high_watermark": 0}, id="zero high"),
+    ),
+)
+def test_watermarks_misconfigure(options: dict[str, Any]) -> None:
+    with pytest.raises(SetupError):
+        PullSub(**options)
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pipelined_fetch_keeps_buffer_filled() -> None:
+    broker = NatsBroker()
+    subscriber = broker.subscriber(
+        "test",
+        stream=JStream("test"),
+        pull_sub=PullSub(high_watermark=4, low_watermark=2),
+    )
+
+    processed: list[int] = []
+    release, enough, done = asyncio.Event(), asyncio.Event(), asyncio.Event()
+
+    async def cb(msg: int) -> None:
+        if msg == 0:
+            # slow message does not stall the others
+            await release.wait()
+            done.set()
+
+        processed.append(msg)
+        if len(processed) >= 10:
+            enough.set()
+
+    subscriber.subscription = subscription = FakeSubscription()
+    subscriber.running = True
+
+    task = asyncio.create_task(subscriber._consume_pull(cb))
+    try:
+        await asyncio.wait_for(enough.wait(), timeout=3)
+
+        # the slow message stays in the buffer, so fetches fill the rest of it
+        assert subscription.fetched[0] == 4
+        assert max(subscription.fetched[1:]) == 3
+        assert 0 not in processed
+
+        release.set()
+        await asyncio.wait_for(done.wait(), timeout=3)
+
+    finally:
+        subscriber.running = False
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pipelined_batch_overlaps_fetch() -> None:
+    broker = NatsBroker()
+    subscriber = broker.subscriber(
+        "test",
+        stream=JStream("test"),
+        pull_sub=PullSub(3, batch=True, high_watermark=6),
+    )
+
+    subscription = FakeBatchSubscription()
+    fetched_during_consume: list[int] = []
+
+    async def consume(messages: list[FakeMsg]) -> None:
+        await asyncio.sleep(0.01)
+        fetched_during_consume.append(len(subscription.fetched))
+        if len(fetched_during_consume) == 2:
+            subscriber.running = False
+
+    subscriber.subscription = subscription
+    subscriber.consume = consume
+    subscriber.running = True
+
+    await asyncio.wait_for(subscriber._consume_pull(), timeout=3)
+
+    # the next batch is already fetched while the current one is processed
+    assert fetched_during_consume == [2, 3]
+    # the batch prefetched for a stopped consumer is redelivered
+    assert subscription.naked == [6, 7, 8]
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_pipelined_batch_pending_fetch_nacked_on_cancel() -> None:
+    broker = NatsBroker()
+    subscriber = broker.subscriber(
+        "test",
+        stream=JStream("test"),
+        pull_sub=PullSub(2, batch=True, high_watermark=4),
+    )
+
+    subscription = FakeBatchSubscription(fetch_delay=0.1)
+    consumed: list[list[int]] = []
+    started = asyncio.Event()
+
+    async def consume(messages: list[FakeMsg]) -> None:
+        consumed.append([m.index for m in messages])
+        started.set()
+        await asyncio.sleep(10)
+
+    subscriber.subscription = subscription
+    subscriber.consume = consume
+    subscriber.running = True
+
+    task = asyncio.create_task(subscriber._consume_pull())
+    await asyncio.wait_for(started.wait(), timeout=3)
+
+    # the next batch fetch is in progress
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert consumed == [[0, 1]]
+    assert subscription.naked == [2, 3]
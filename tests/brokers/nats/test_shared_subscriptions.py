@@ -0,0 +1,126 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from nats.aio.msg import Msg
+
+from faststream.nats import NatsBroker, NatsMessage
+from faststream.nats.subscriber.shared import SubjectTrie, compile_subject
+
+
+class FakeSubscription:
+    def __init__(
+        self,
+        subject: str,
+        queue: str,
+        cb: Callable[[Msg], Awaitable[None]],
+    ) -> None:
+        self.subject = subject
+        self.queue = queue
+        self.cb = cb
+        self.active = True
+
+    async def unsubscribe(self) -> None:
+        self.active = False
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.subscriptions: list[FakeSubscription] = []
+
+    async def subscribe(
+        self,
+        subject: str,
+        queue: str = "",
+        cb: Any = None,
+        **kwargs: Any,
+    ) -> FakeSubscription:
+        sub = FakeSubscription(subject, queue, cb)
+        self.subscriptions.append(sub)
+        return sub
+
+    def jetstream(self, **kwargs: Any) -> MagicMock:
+        return MagicMock()
+
+    async def drain(self) -> None:
+        pass
+
+    async def publish(self, subject: str, data: bytes, **kwargs: Any) -> None:
+        for sub in self.subscriptions:
+            trie = SubjectTrie[FakeSubscription]()
+            trie.add(sub.subject, sub)
+            if sub.active and trie.match(subject):
+                await sub.cb(Msg(self, subject=subject, data=data))  # type: ignore[arg-type]
+
+
+def test_subject_trie() -> None:
+    trie = SubjectTrie[str]()
+    for subject in ("a.b.c", "a.*.c", "a.>", "a.b.*", "x.y"):
+        trie.add(subject, subject)
+
+    assert set(trie.match("a.b.c")) == {"a.b.c", "a.*.c", "a.>", "a.b.*"}
+    assert set(trie.match("a.z.c")) == {"a.*.c", "a.>"}
+    assert trie.match("a") == []
+    assert trie.match("x.y.z") == []
+
+    for subject in ("a.b.c", "a.*.c", "a.>", "a.b.*"):
+        trie.remove(subject, subject)
+
+    assert trie.match("a.b.c") == []
+    assert list(trie.children) == ["x"]
+
+
+def test_compile_subject() -> None:
+    assert compile_subject("logs.{user}.*.{level}") == (
+        "logs.*.*.*",
+        ((1, "user"), (3, "level")),
+    )
+    assert compile_subject("logs.a{user}") is None
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_shared_subscriptions() -> None:
+    client = FakeClient()
+    broker = NatsBroker(shared_subscriptions=True)
+
+    received: dict[str, list[Any]] = {}
+    event = asyncio.Event()
+
+    def store(name: str) -> Callable[..., Awaitable[None]]:
+        async def handler(body: str, msg: NatsMessage) -> None:
+            received.setdefault(name, []).append((body, msg.path))
+            if sum(map(len, received.values())) == 4:
+                event.set()
+
+        return handler
+
+    broker.subscriber("logs.{user}.info")(store("info"))
+    broker.subscriber("logs.>")(store("all"))
+    broker.subscriber("logs.*.error", queue="workers")(store("error"))
+    broker.subscriber("single")(store("single"))
+
+    with patch("nats.connect", return_value=client):
+        await broker.start()
+
+        assert sorted((s.subject, s.queue) for s in client.subscriptions) == [
+            ("logs.*.error", "workers"),
+            ("logs.>", ""),
+            ("single", ""),
+        ]
+
+        await client.publish("logs.john.info", b"hi")
+        await client.publish("logs.john.error", b"oops")
+        await asyncio.wait_for(event.wait(), timeout=3)
+
+        await broker.stop()
+
+    assert "single" not in received
+    assert sorted(received["all"]) == [("hi", {}), ("oops", {})]
+    assert received["info"] == [("hi", {"user": "john"})]
+    assert received["error"] == [("oops", {})]
+
+    assert not any(s.active for s in client.subscriptions)
+    assert broker.config.broker_config.shared_subscriptions.subscriptions == 0
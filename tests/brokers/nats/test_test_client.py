@@ -45,6 +45,29 @@ class TestTestclient(NatsMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish("Hi!", queue, stream="test")
             assert not m.mock.called
 
+    @pytest.mark.asyncio()
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        pub_broker = self.get_broker(apply_types=False)
+
+        @pub_broker.subscriber(queue, stream="test")
+        async def m(msg) -> None: ...
+
+        @pub_broker.subscriber(
+            queue,
+            stream="test",
+            pull_sub=PullSub(batch=True),
+        )
+        async def batch(msg) -> None: ...
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.publish_batch("a", "b", subject=queue, stream="test")
+
+            assert [c.args for c in m.mock.call_args_list] == [("a",), ("b",)]
+            batch.mock.assert_called_once_with(["a", "b"])
+
     @pytest.mark.connected()
     async def test_with_real_testclient(
         self,
@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.rabbit import RabbitExchange
+from faststream.rabbit.publisher.producer import AioPikaFastProducerImpl
+from faststream.rabbit.response import RabbitPublishCommand
+from faststream.response import PublishType
+
+
+class FakeReplyDeclarer:
+    """Replies to every published message through the reply-to consumer."""
+
+    def __init__(self, reply: bool = True) -> None:
+        self.reply = reply
+        self.callback: Any = None
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.queue = MagicMock(consume=AsyncMock(side_effect=self._consume))
+        self.exchange = MagicMock(publish=AsyncMock(side_effect=self._publish))
+
+    async def _consume(self, callback: Any, no_ack: bool) -> str:
+        self.callback = callback
+        return "consumer-tag"
+
+    async def _publish(self, message: Any, **kwargs: Any) -> None:
+        if not self.reply:
+            return
+
+        async def reply() -> None:
+            # answer requests in reverse order
+            await asyncio.sleep(0.01 * (3 - int(message.body)))
+            await self.callback(
+                MagicMock(correlation_id=message.correlation_id, body=message.body),
+            )
+
+        task = asyncio.create_task(reply())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def declare_queue(self, *args: Any, **kwargs: Any) -> MagicMock:
+        return self.queue
+
+    async def declare_exchange(self, *args: Any, **kwargs: Any) -> MagicMock:
+        return self.exchange
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_concurrent_requests_share_reply_consumer() -> None:
+    declarer = FakeReplyDeclarer()
+    producer = AioPikaFastProducerImpl(declarer=declarer, parser=None, decoder=None)
+    producer.connect()
+
+    responses = await asyncio.gather(
+        *(
+            producer.request(
+                RabbitPublishCommand(
+                    str(i),
+                    routing_key="queue",
+                    exchange=RabbitExchange(),
+                    timeout=3,
+                    _publish_type=PublishType.REQUEST,
+                ),
+            )
+            for i in range(3)
+        )
+    )
+
+    assert [r.body for r in responses] == [b"0", b"1", b"2"]
+    declarer.queue.consume.assert_awaited_once()
+
+
+def make_request(body: str, correlation_id: str | None = None) -> RabbitPublishCommand:
+    return RabbitPublishCommand(
+        body,
+        routing_key="queue",
+        exchange=RabbitExchange(),
+        correlation_id=correlation_id,
+        timeout=None,
+        _publish_type=PublishType.REQUEST,
+    )
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_duplicate_correlation_id_rejected() -> None:
+    producer = AioPikaFastProducerImpl(
+        declarer=FakeReplyDeclarer(reply=False),
+        parser=None,
+        decoder=None,
+    )
+    producer.connect()
+
+    first = asyncio.create_task(producer.request(make_request("0", "1")))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(IncorrectState):
+        await producer.request(make_request("1", "1"))
+
+    assert not first.done()
+    first.cancel()
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_disconnect_fails_waiting_requests() -> None:
+    producer = AioPikaFastProducerImpl(
+        declarer=FakeReplyDeclarer(reply=False),
+        parser=None,
+        decoder=None,
+    )
+    producer.connect()
+
+    request = asyncio.create_task(producer.request(make_request("0")))
+    await asyncio.sleep(0.01)
+
+    producer.disconnect()
+
+    with pytest.raises(IncorrectState):
+        await asyncio.wait_for(request, timeout=1)
@@ -0,0 +1,164 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import aiormq
+import anyio
+import pytest
+from aio_pika import IncomingMessage
+from pamqp import commands as spec
+from pamqp.header import ContentHeader
+
+from faststream import AckPolicy
+from faststream.rabbit import RabbitBroker, TestRabbitBroker
+from faststream.rabbit.annotations import RabbitMessage
+from faststream.rabbit.parser import AioPikaParser
+from faststream.rabbit.subscriber.usecase import RabbitBatchSubscriber
+
+
+def make_channel() -> MagicMock:
+    channel = MagicMock(is_closed=False)
+    channel.basic_ack = AsyncMock()
+    channel.basic_nack = AsyncMock()
+    return channel
+
+
+def make_message(
+    body: Any,
+    delivery_tag: int,
+    channel: MagicMock,
+    content_type: str = "application/json",
+) -> IncomingMessage:
+    return IncomingMessage(
+        aiormq.abc.DeliveredMessage(
+            delivery=spec.Basic.Deliver(
+                routing_key="test",
+                delivery_tag=delivery_tag,
+            ),
+            header=ContentHeader(
+                properties=spec.Basic.Properties(content_type=content_type),
+            ),
+            body=str(body).encode(),
+            channel=channel,
+        ),
+    )
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_batch_testclient() -> None:
+    broker = RabbitBroker()
+
+    @broker.subscriber("test", batch=True)
+    async def handler(body: list[int], msg: RabbitMessage) -> None:
+        assert msg.batch_headers == [msg.headers]
+
+    async with TestRabbitBroker(broker):
+        await broker.publish(1, "test")
+        handler.mock.assert_called_once_with([1])
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_decode_batch_by_message_content_types() -> None:
+    channel = make_channel()
+    parser = AioPikaParser()
+
+    msg = await parser.parse_batch((
+        make_message(1, 1, channel),
+        make_message("1", 2, channel, content_type="text/plain"),
+        make_message('{"a": 1}', 3, channel),
+    ))
+
+    assert await parser.decode_batch(msg) == [1, "1", {"a": 1}]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("ack_policy", "error", "method", "kwargs"),
+    (
+        pytest.param(AckPolicy.REJECT_ON_ERROR, None, "basic_ack", {}, id="ack"),
+        pytest.param(
+            AckPolicy.REJECT_ON_ERROR,
+            ValueError,
+            "basic_nack",
+            {"requeue": False},
+            id="reject",
+        ),
+        pytest.param(
+            AckPolicy.NACK_ON_ERROR,
+            ValueError,
+            "basic_nack",
+            {"requeue": True},
+            id="nack",
+        ),
+    ),
+)
+async def test_batch_collected(
+    ack_policy: AckPolicy,
+    error: type[Exception] | None,
+    method: str,
+    kwargs: dict[str, Any],
+) -> None:
+    broker = RabbitBroker()
+
+    batches: list[list[int]] = []
+
+    sub = broker.subscriber(
+        "test",
+        batch=True,
+        max_records=3,
+        batch_timeout=0.05,
+        ack_policy=ack_policy,
+    )
+    assert isinstance(sub, RabbitBatchSubscriber)
+
+    @sub
+    async def handler(body: list[int]) -> None:
+        batches.append(body)
+        if error:
+            raise error
+
+    async with TestRabbitBroker(broker, connect_only=False), sub:
+        channel = make_channel()
+        for i in range(5):
+            await sub.consume_one(make_message(i, i + 1, channel))
+
+        frames = getattr(channel, method)
+        with anyio.fail_after(3):
+            while frames.await_count < 2:  # noqa: ASYNC110
+                await asyncio.sleep(0.01)
+
+    # full batch and the rest one by timeout
+    assert batches == [[0, 1, 2], [3, 4]]
+
+    # single frame per batch for the last delivery tag
+    assert frames.await_args_list == [
+        ((), {"delivery_tag": 3, "multiple": True, **kwargs}),
+        ((), {"delivery_tag": 5, "multiple": True, **kwargs}),
+    ]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_collected_messages_requeued_on_stop() -> None:
+    broker = RabbitBroker()
+
+    sub = broker.subscriber("test", batch=True, max_records=10, batch_timeout=10)
+
+    @sub
+    async def handler(body: list[int]) -> None: ...
+
+    async with TestRabbitBroker(broker, connect_only=False), sub:
+        channel = make_channel()
+        await sub.consume_one(make_message(1, 1, channel))
+        await asyncio.sleep(0.01)
+
+        handler.mock.assert_not_called()
+
+    channel.basic_nack.assert_awaited_once_with(
+        delivery_tag=1,
+        multiple=False,
+        requeue=True,
+    )
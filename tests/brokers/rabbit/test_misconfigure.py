@@ -1,8 +1,10 @@
+from typing import Any
+
 import pytest
 
 from faststream.exceptions import SetupError
 from faststream.nats import NatsRouter
-from faststream.rabbit import RabbitBroker, RabbitRouter
+from faststream.rabbit import Channel, RabbitBroker, RabbitRouter
 
 
 @pytest.mark.rabbit()
@@ -17,3 +19,22 @@ def test_use_only_rabbit_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.rabbit()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"max_records": 0}, id="max_records"),
+        pytest.param({"batch_timeout": 0}, id="batch_timeout"),
+        pytest.param(
+            {"max_records": 10, "channel": Channel(prefetch_count=5)},
+            id="prefetch",
+        ),
+    ),
+)
+def test_wrong_batch_options(options: dict[str, Any]) -> None:
+    broker = RabbitBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("test", batch=True, **options)
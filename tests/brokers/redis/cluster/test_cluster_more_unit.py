@@ -18,6 +18,24 @@ from faststream.redis.response import RedisPublishCommand
 from faststream.response.publish_type import PublishType
 
 
+def _reply_pubsub(producer: RedisFastProducer) -> AsyncMock:
+    """Pubsub mock answering "resp" to the awaiting request."""
+    answered: set[str] = set()
+
+    async def get_message(**kwargs: Any) -> dict[str, Any] | None:
+        for channel in tuple(producer._inbox._futures):
+            if channel not in answered:
+                answered.add(channel)
+                return {"channel": channel.encode(), "data": "resp"}
+
+        await anyio.sleep(0.01)
+        return None
+
+    psub = AsyncMock()
+    psub.get_message = get_message
+    return psub
+
+
 class TestRedisClusterConnectionStateUnit:
     """Unit tests for RedisClusterConnectionState (no cluster needed)."""
 
@@ -283,12 +301,7 @@ class TestClusterFastProducerUnit:
         producer: RedisFastProducer,
         mock_cluster_state: AsyncMock,
     ) -> None:
-        psub = AsyncMock()
-        psub.subscribe = AsyncMock()
-        psub.get_message = AsyncMock(side_effect=[None, "resp"])
-        psub.unsubscribe = AsyncMock()
-        psub.aclose = AsyncMock()
-        mock_cluster_state.pubsub.return_value = psub
+        mock_cluster_state.pubsub.return_value = _reply_pubsub(producer)
 
         cmd = RedisPublishCommand(
             b"hello",
@@ -297,7 +310,8 @@ class TestClusterFastProducerUnit:
             _publish_type=PublishType.REQUEST,
         )
         result = await producer.request(cmd)
-        assert result == "resp"
+        await producer.disconnect()
+        assert result["data"] == "resp"
         mock_cluster_state.sync_publish.assert_awaited_once()
 
     @pytest.mark.asyncio()
@@ -307,12 +321,7 @@ class TestClusterFastProducerUnit:
         mock_cluster_state: AsyncMock,
         mock_client: AsyncMock,
     ) -> None:
-        psub = AsyncMock()
-        psub.subscribe = AsyncMock()
-        psub.get_message = AsyncMock(side_effect=[None, "resp"])
-        psub.unsubscribe = AsyncMock()
-        psub.aclose = AsyncMock()
-        mock_cluster_state.pubsub.return_value = psub
+        mock_cluster_state.pubsub.return_value = _reply_pubsub(producer)
 
         cmd = RedisPublishCommand(
             b"hello",
@@ -321,7 +330,8 @@ class TestClusterFastProducerUnit:
             _publish_type=PublishType.REQUEST,
         )
         result = await producer.request(cmd)
-        assert result == "resp"
+        await producer.disconnect()
+        assert result["data"] == "resp"
         mock_client.rpush.assert_awaited_once()
 
     @pytest.mark.asyncio()
@@ -331,12 +341,7 @@ class TestClusterFastProducerUnit:
         mock_cluster_state: AsyncMock,
         mock_client: AsyncMock,
     ) -> None:
-        psub = AsyncMock()
-        psub.subscribe = AsyncMock()
-        psub.get_message = AsyncMock(side_effect=[None, "resp"])
-        psub.unsubscribe = AsyncMock()
-        psub.aclose = AsyncMock()
-        mock_cluster_state.pubsub.return_value = psub
+        mock_cluster_state.pubsub.return_value = _reply_pubsub(producer)
 
         cmd = RedisPublishCommand(
             b"hello",
@@ -346,7 +351,8 @@ class TestClusterFastProducerUnit:
             _publish_type=PublishType.REQUEST,
         )
         result = await producer.request(cmd)
-        assert result == "resp"
+        await producer.disconnect()
+        assert result["data"] == "resp"
         mock_client.xadd.assert_awaited_once()
 
     @pytest.mark.asyncio()
@@ -375,6 +381,7 @@ class TestClusterFastProducerUnit:
         )
         with pytest.raises(TimeoutError):
             await producer.request(cmd)
+        await producer.disconnect()
 
     @pytest.mark.asyncio()
     async def test_request_unreachable(
@@ -383,12 +390,7 @@ class TestClusterFastProducerUnit:
         mock_cluster_state: AsyncMock,
     ) -> None:
         """No matching destination_type → UnreachablePathError."""
-        psub = AsyncMock()
-        psub.subscribe = AsyncMock()
-        psub.get_message = AsyncMock(side_effect=[None, "resp"])
-        psub.unsubscribe = AsyncMock()
-        psub.aclose = AsyncMock()
-        mock_cluster_state.pubsub.return_value = psub
+        mock_cluster_state.pubsub.return_value = _reply_pubsub(producer)
 
         cmd = RedisPublishCommand(
             b"hello",
@@ -399,6 +401,7 @@ class TestClusterFastProducerUnit:
         cmd.destination_type = None  # type: ignore[assignment]
         with pytest.raises(UnreachablePathError):
             await producer.request(cmd)
+        await producer.disconnect()
 
 
 class TestClusterBrokerPing:
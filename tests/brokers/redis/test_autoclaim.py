@@ -291,6 +291,68 @@ class TestAutoClaim(RedisTestcaseConfig, BrokerRealConsumeTestcase):
                 assert xautoclaim.mock.called
                 assert not xreadgroup.mock.called
 
+    @pytest.mark.slow()
+    async def test_consume_stream_batch_drain_pending(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        """Verify that pending messages are claimed in bulk before reading new ones."""
+        consume_broker = self.get_broker(apply_types=True)
+        received = asyncio.Event()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="drain_group",
+                consumer="drain_consumer",
+                batch=True,
+                max_records=10,
+                min_idle_time=1,
+                drain_pending=True,
+            ),
+        )
+        async def handler(msg: list) -> None:
+            mock(msg)
+            if mock.call_count == 2:
+                received.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            for i in range(5):
+                await br.publish(f"pending{i}", stream=queue)
+
+            with suppress(Exception):
+                await br._connection.xgroup_create(
+                    queue, "drain_group", id="0", mkstream=True
+                )
+
+            # Read but don't ack to make all messages pending
+            await br._connection.xreadgroup(
+                groupname="drain_group",
+                consumername="temp",
+                streams={queue: ">"},
+                count=10,
+            )
+
+            await asyncio.sleep(0.1)
+
+            with patch.object(
+                Redis, "xautoclaim", spy_decorator(Redis.xautoclaim)
+            ) as xautoclaim:
+                await br.start()
+                await br.publish("new", stream=queue)
+
+                await asyncio.wait(
+                    (asyncio.create_task(received.wait()),),
+                    timeout=3,
+                )
+
+                assert received.is_set()
+                # whole backlog is claimed by a single XAUTOCLAIM call
+                assert mock.call_args_list[0].args[0] == [f"pending{i}" for i in range(5)]
+                assert mock.call_args_list[1].args[0] == ["new"]
+                assert xautoclaim.mock.call_args.kwargs["count"] == 10
+
     @pytest.mark.slow()
     async def test_xautoclaim_with_deleted_messages(
         self,
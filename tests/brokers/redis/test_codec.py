@@ -1,5 +1,11 @@
+from typing import Any
+from unittest.mock import MagicMock
+
 import pytest
 
+from faststream import Context
+from faststream._internal.parser import DefaultCodec
+from faststream.redis import ListSub, StreamSub
 from tests.brokers.base.codec import CodecTestcase
 
 from .basic import RedisMemoryTestcaseConfig
@@ -9,3 +15,58 @@ from .basic import RedisMemoryTestcaseConfig
 @pytest.mark.asyncio()
 class TestRedisCodec(RedisMemoryTestcaseConfig, CodecTestcase):
     pass
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("destination", "sub"),
+    (
+        pytest.param("list", ListSub, id="list"),
+        pytest.param("stream", StreamSub, id="stream"),
+    ),
+)
+class TestRedisBatchCodec(RedisMemoryTestcaseConfig):
+    async def test_batch_body_is_json(
+        self,
+        mock: MagicMock,
+        queue: str,
+        destination: str,
+        sub: type[ListSub | StreamSub],
+    ) -> None:
+        broker = self.get_broker(apply_types=True)
+
+        @broker.subscriber(**{destination: sub(queue, batch=True)})
+        async def handle(m: list[Any], message: Any = Context()) -> None:
+            mock(m)
+            mock.body(message.body)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish({"key": 1}, **{destination: queue})
+
+        mock.assert_called_once_with([{"key": 1}])
+        mock.body.assert_called_once_with(b'[{"key":1}]')
+
+    async def test_codec_decodes_batch_body(
+        self,
+        mock: MagicMock,
+        queue: str,
+        destination: str,
+        sub: type[ListSub | StreamSub],
+    ) -> None:
+        class Codec(DefaultCodec):
+            async def decode(self, msg: Any) -> Any:
+                mock.body(msg.body)
+                return await super().decode(msg)
+
+        broker = self.get_broker(codec=Codec())
+
+        @broker.subscriber(**{destination: sub(queue, batch=True)})
+        async def handle(m: list[str]) -> None:
+            mock(m)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hi", **{destination: queue})
+
+        mock.body.assert_called_once_with(b'["hi"]')
+        mock.assert_called_once_with(["hi"])
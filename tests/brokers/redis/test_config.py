@@ -4,6 +4,7 @@ import pytest
 
 from faststream import AckPolicy
 from faststream._internal.constants import EMPTY
+from faststream.exceptions import SetupError
 from faststream.redis import ListSub, PubSub, RedisBroker, RedisRouter, StreamSub
 from faststream.redis.subscriber.config import RedisSubscriberConfig
 
@@ -81,6 +82,17 @@ def test_stream_with_group_and_min_idle_time() -> None:
     assert config.ack_policy is AckPolicy.REJECT_ON_ERROR
 
 
+@pytest.mark.redis()
+def test_stream_drain_pending_requires_min_idle_time() -> None:
+    with pytest.raises(SetupError, match="`min_idle_time`"):
+        StreamSub(
+            "test_stream",
+            group="test_group",
+            consumer="test_consumer",
+            drain_pending=True,
+        )
+
+
 @pytest.mark.redis()
 def test_broker_ack_policy() -> None:
     broker = RedisBroker(ack_policy=AckPolicy.ACK)
@@ -101,6 +101,41 @@ class TestConsume(RedisTestcaseConfig, BrokerRealConsumeTestcase):
 
         mock.assert_called_once_with("hello")
 
+    async def test_consume_shared_pubsub(
+        self,
+        mock: MagicMock,
+        queue: str,
+    ) -> None:
+        consume_broker = self.get_broker(pubsub_shards=2)
+
+        events = [asyncio.Event() for _ in range(3)]
+
+        for i in range(2):
+
+            @consume_broker.subscriber(f"{queue}.{i}")
+            async def handler(msg: str, i: int = i) -> None:
+                mock(msg)
+                events[i].set()
+
+        @consume_broker.subscriber(PubSub(f"{queue}.*", pattern=True))
+        async def pattern_handler(msg: str) -> None:
+            mock(msg)
+            events[2].set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            assert br.config.broker_config.pubsub.connections <= 2
+
+            await br.publish("hello", f"{queue}.1")
+            await asyncio.wait(
+                [asyncio.create_task(events[i].wait()) for i in (1, 2)],
+                timeout=3,
+            )
+
+        assert not events[0].is_set()
+        assert mock.call_count == 2
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     async def test_concurrent_consume_channel(
         self,
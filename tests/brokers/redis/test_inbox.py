@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import anyio
+import pytest
+
+from faststream.redis.publisher.inbox import ReplyInbox
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.psubscribe = AsyncMock()
+        self.punsubscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def get_message(self, timeout: float, **kwargs: Any) -> Any:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def reply(self, channel: str, data: bytes) -> None:
+        self.queue.put_nowait({
+            "type": "pmessage",
+            "channel": channel.encode(),
+            "data": data,
+        })
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_concurrent_requests_share_subscription() -> None:
+    psub = FakePubSub()
+    inbox = ReplyInbox(lambda: psub)
+
+    async def request(i: int) -> bytes:
+        await inbox.start()
+        with inbox.reply_channel() as (channel, response):
+            assert channel.startswith(inbox.prefix)
+            psub.reply(channel, str(i).encode())
+            msg = await response
+            assert msg["type"] == "message"
+            return msg["data"]
+
+    try:
+        results = await asyncio.gather(*(request(i) for i in range(10)))
+    finally:
+        await inbox.stop()
+
+    assert results == [str(i).encode() for i in range(10)]
+    psub.psubscribe.assert_awaited_once_with(f"{inbox.prefix}*")
+    psub.punsubscribe.assert_awaited_once()
+    psub.aclose.assert_awaited_once()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_timed_out_request_is_forgotten() -> None:
+    psub = FakePubSub()
+    inbox = ReplyInbox(lambda: psub)
+    await inbox.start()
+
+    try:
+        with (
+            pytest.raises(TimeoutError),
+            inbox.reply_channel() as (channel, response),
+            anyio.fail_after(0.05),
+        ):
+            await response
+
+        assert inbox.in_flight == 0
+
+        # late response for the timed out request is dropped
+        psub.reply(channel, b"late")
+
+        with inbox.reply_channel() as (channel, response):
+            psub.reply(channel, b"fresh")
+            assert (await response)["data"] == b"fresh"
+
+    finally:
+        await inbox.stop()
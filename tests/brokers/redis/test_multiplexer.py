@@ -0,0 +1,279 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.redis import PubSub, RedisBroker
+from faststream.redis.subscriber.multiplexer import PubSubMultiplexer
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.subscribe = AsyncMock()
+        self.psubscribe = AsyncMock()
+        self.unsubscribe = AsyncMock()
+        self.punsubscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def get_message(self, timeout: float, **kwargs: Any) -> Any:
+        try:
+            msg = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        if isinstance(msg, Exception):
+            raise msg
+        return msg
+
+    def message(self, channel: str, data: bytes) -> None:
+        self.queue.put_nowait({
+            "type": "message",
+            "pattern": None,
+            "channel": channel.encode(),
+            "data": data,
+        })
+
+    def pmessage(self, pattern: str, channel: str, data: bytes) -> None:
+        self.queue.put_nowait({
+            "type": "pmessage",
+            "pattern": pattern.encode(),
+            "channel": channel.encode(),
+            "data": data,
+        })
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_dispatch_by_channel_and_pattern() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub)
+
+    first = await multiplexer.subscribe(PubSub("first"))
+    second = await multiplexer.subscribe(PubSub("second"))
+    pattern = await multiplexer.subscribe(PubSub("test.*"))
+
+    try:
+        psub.message("second", b"2")
+        psub.message("first", b"1")
+        psub.pmessage("test.*", "test.name", b"3")
+
+        assert (await first.get_message(timeout=1))["data"] == b"1"
+        assert (await second.get_message(timeout=1))["data"] == b"2"
+        assert (await pattern.get_message(timeout=1))["channel"] == b"test.name"
+
+        assert await first.get_message(timeout=0.01) is None
+
+    finally:
+        await multiplexer.stop()
+
+    assert multiplexer.connections == 0
+    assert psub.subscribe.await_count == 2
+    psub.psubscribe.assert_awaited_once_with("test.*")
+    psub.aclose.assert_awaited_once()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_same_channel_subscribed_once() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub)
+
+    first = await multiplexer.subscribe(PubSub("channel"))
+    second = await multiplexer.subscribe(PubSub("channel"))
+
+    try:
+        psub.message("channel", b"hello")
+
+        assert (await first.get_message(timeout=1))["data"] == b"hello"
+        assert (await second.get_message(timeout=1))["data"] == b"hello"
+
+        await first.unsubscribe()
+        psub.unsubscribe.assert_not_awaited()
+
+        await second.unsubscribe()
+
+    finally:
+        await multiplexer.stop()
+
+    psub.subscribe.assert_awaited_once_with("channel")
+    # the last subscription closes the connection
+    psub.aclose.assert_awaited_once()
+    assert multiplexer.connections == 0
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_unsubscribe_at_runtime() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub)
+
+    first = await multiplexer.subscribe(PubSub("first"))
+    pattern = await multiplexer.subscribe(PubSub("test.*"))
+
+    try:
+        await pattern.unsubscribe()
+        psub.punsubscribe.assert_awaited_once_with("test.*")
+
+        psub.pmessage("test.*", "test.name", b"lost")
+        psub.message("first", b"1")
+
+        assert (await first.get_message(timeout=1))["data"] == b"1"
+        assert multiplexer.connections == 1
+
+    finally:
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_shards() -> None:
+    connections: list[FakePubSub] = []
+
+    def factory() -> FakePubSub:
+        connections.append(FakePubSub())
+        return connections[-1]
+
+    multiplexer = PubSubMultiplexer(factory, shards=4)
+
+    try:
+        await asyncio.gather(
+            *(multiplexer.subscribe(PubSub(f"channel-{i}")) for i in range(32))
+        )
+
+        assert multiplexer.connections == len(connections) > 1
+        assert sum(c.subscribe.await_count for c in connections) == 32
+
+    finally:
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_read_error_is_raised_to_subscribers() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub)
+
+    subscription = await multiplexer.subscribe(PubSub("channel"))
+
+    try:
+        psub.queue.put_nowait(ConnectionError("lost"))
+
+        with pytest.raises(ConnectionError):
+            await subscription.get_message(timeout=1)
+
+    finally:
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_read_error_recreates_connection() -> None:
+    connections: list[FakePubSub] = []
+    reconnected = asyncio.Event()
+
+    def factory() -> FakePubSub:
+        connections.append(FakePubSub())
+        if len(connections) > 1:
+            reconnected.set()
+        return connections[-1]
+
+    multiplexer = PubSubMultiplexer(factory)
+    multiplexer._shards[0].error_backoff = 0
+
+    channel = await multiplexer.subscribe(PubSub("channel"))
+    pattern = await multiplexer.subscribe(PubSub("logs.*", pattern=True))
+
+    try:
+        broken = connections[0]
+        broken.queue.put_nowait(ConnectionError("lost"))
+
+        with pytest.raises(ConnectionError):
+            await channel.get_message(timeout=1)
+
+        await asyncio.wait_for(reconnected.wait(), 1)
+
+        broken.aclose.assert_awaited_once()
+        fresh = connections[1]
+        fresh.subscribe.assert_awaited_once_with("channel")
+        fresh.psubscribe.assert_awaited_once_with("logs.*")
+
+        fresh.message("channel", b"1")
+        assert (await channel.get_message(timeout=1))["data"] == b"1"
+
+    finally:
+        await channel.aclose()
+        await pattern.aclose()
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_slow_subscriber_drops_oldest_messages() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub, max_buffer_size=1)
+
+    slow = await multiplexer.subscribe(PubSub("slow"))
+    fast = await multiplexer.subscribe(PubSub("fast"))
+
+    try:
+        for i in range(3):
+            psub.message("slow", str(i).encode())
+        psub.message("fast", b"fast")
+
+        # the full buffer does not block other subscribers
+        assert (await fast.get_message(timeout=1))["data"] == b"fast"
+
+        assert (await slow.get_message(timeout=1))["data"] == b"2"
+        assert slow.dropped == 2
+
+    finally:
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_dropped_messages_reported_periodically() -> None:
+    psub = FakePubSub()
+    multiplexer = PubSubMultiplexer(lambda: psub, max_buffer_size=1)
+
+    subscription = await multiplexer.subscribe(PubSub("test"))
+
+    try:
+        assert subscription.report_dropped() == 0
+
+        for _ in range(3):
+            subscription.put({"data": b""})
+        assert subscription.report_dropped() == 2  # the first report is immediate
+
+        subscription.put({"data": b""})
+        assert subscription.report_dropped() == 0  # too early for the next one
+
+        subscription.report_interval = 0
+        assert subscription.report_dropped() == 1
+
+    finally:
+        await multiplexer.stop()
+
+
+@pytest.mark.redis()
+def test_broker_option() -> None:
+    assert RedisBroker().config.broker_config.pubsub is None
+    assert RedisBroker(pubsub_shards=2).config.broker_config.pubsub is not None
+
+    with pytest.raises(SetupError):
+        RedisBroker(pubsub_shards=0)
+
+    with pytest.raises(SetupError):
+        RedisBroker(pubsub_shards=1, pubsub_max_buffer_size=0)
+
+
+@pytest.mark.redis()
+def test_broker_buffer_size_option() -> None:
+    broker = RedisBroker(pubsub_shards=1, pubsub_max_buffer_size=10)
+
+    pubsub = broker.config.broker_config.pubsub
+    assert pubsub is not None
+    assert all(shard.max_buffer_size == 10 for shard in pubsub._shards)
@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.active, self.max_active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+def make_broker(subscribers: int, **kwargs: int) -> RedisBroker:
+    broker = RedisBroker(**kwargs)
+    for i in range(subscribers):
+        broker.subscriber(f"channel-{i}")
+    return broker
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("start_concurrency", "expected"),
+    (
+        pytest.param(1, 1, id="sequential"),
+        pytest.param(3, 3, id="concurrent"),
+        pytest.param(100, 10, id="all"),
+    ),
+)
+async def test_start_stop_concurrency(start_concurrency: int, expected: int) -> None:
+    broker = make_broker(10, start_concurrency=start_concurrency)
+
+    start, stop = Tracker(), Tracker()
+
+    with (
+        patch("faststream.redis.subscriber.usecases.ChannelSubscriber.start", start),
+        patch("faststream.redis.subscriber.usecases.ChannelSubscriber.stop", stop),
+    ):
+        await broker.start()
+        await broker.stop()
+
+    assert start.calls == stop.calls == 10
+    assert start.max_active == stop.max_active == expected
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_start_error_waits_others() -> None:
+    broker = make_broker(3, start_concurrency=3)
+
+    started = Tracker()
+    calls = 0
+
+    async def start(_: object) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "first failed"
+            raise ValueError(msg)
+        await started()
+
+    with (
+        patch("faststream.redis.subscriber.usecases.ChannelSubscriber.start", start),
+        pytest.raises(ValueError, match="first failed"),
+    ):
+        await broker.start()
+
+    assert started.calls == 2
+    assert started.active == 0
+
+    await broker.stop()
+
+
+@pytest.mark.redis()
+def test_misconfigure() -> None:
+    with pytest.raises(SetupError):
+        RedisBroker(start_concurrency=0)
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from typing import Annotated, Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import Depends
+
+from faststream._internal.fastapi import route
+from faststream._internal.fastapi.get_dependant import get_fastapi_native_dependant
+from faststream.redis import TestRedisBroker
+from faststream.redis.fastapi import RedisRouter
+
+
+def sync_gen() -> Iterator[int]:
+    yield 1
+
+
+async def async_gen() -> AsyncIterator[int]:
+    yield 1
+
+
+class CallableGen:
+    def __call__(self) -> Iterator[int]:
+        yield 1
+
+
+def plain(value: Annotated[int, Depends(sync_gen)]) -> int:
+    return value
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected"),
+    (
+        pytest.param(lambda: 1, False, id="plain"),
+        pytest.param(sync_gen, True, id="sync_gen"),
+        pytest.param(async_gen, True, id="async_gen"),
+        pytest.param(CallableGen(), True, id="callable_gen"),
+        pytest.param(partial(sync_gen), True, id="partial"),
+        pytest.param(plain, True, id="nested"),
+    ),
+)
+def test_has_generator_dependency(dependency: Any, expected: bool) -> None:
+    async def handler(dep: Annotated[Any, Depends(dependency)]) -> None: ...
+
+    dependant = get_fastapi_native_dependant(handler, ())
+
+    assert route._has_generator_dependency(dependant) is expected
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("result", "serialized"),
+    (
+        pytest.param(None, False, id="none"),
+        pytest.param("hi", False, id="str"),
+        pytest.param({"key": "value"}, True, id="dict"),
+    ),
+)
+async def test_response_serialization_skipped(result: Any, serialized: bool) -> None:
+    router = RedisRouter()
+
+    @router.subscriber("test")
+    async def handler(msg: str) -> Any:
+        return result
+
+    with patch.object(
+        route,
+        "serialize_response",
+        AsyncMock(side_effect=lambda response_content, **kwargs: response_content),
+    ) as serialize:
+        async with TestRedisBroker(router.broker) as br:
+            await br.publish("hi", "test")
+
+    assert serialize.called is serialized
@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import pytest
 
-from faststream.message.utils import decode_message
+from faststream.message.utils import decode_batch_message, decode_message
 
 
 @dataclass
@@ -12,6 +12,13 @@ class _MessageStub:
     content_type: str | None = None
 
 
+@dataclass
+class _BatchMessageStub:
+    body: list[bytes]
+    batch_headers: list[dict[str, str]] = field(default_factory=list)
+    content_type: str | None = None
+
+
 def test_decode_text_ok() -> None:
     msg: Any = _MessageStub(b"faststream", "text/plain")
 
@@ -60,3 +67,50 @@ def test_unknown_content_type_ok(content_type: str) -> None:
 )
 def test_no_content_type_ok(body: Any, expected: bytes | dict[str, str]) -> None:
     assert decode_message(body) == expected
+
+
+@pytest.mark.parametrize(
+    ("body", "headers", "expected"),
+    (
+        pytest.param(
+            [b'{"key": "value"}', b"1", b'"a"'],
+            [{"content-type": "application/json"}, {}, {}],
+            [{"key": "value"}, 1, "a"],
+            id="json",
+        ),
+        pytest.param(
+            [b"1", b"text", b"raw"],
+            [{}, {"content-type": "text/plain"}, {}],
+            [1, "text", b"raw"],
+            id="mixed",
+        ),
+        pytest.param(
+            [b"1,2", b"3"],
+            [{}, {}],
+            [b"1,2", 3],
+            id="broken_item",
+        ),
+        pytest.param(
+            [b'"a', b'b",1'],
+            [{}, {}],
+            [b'"a', b'b",1'],
+            id="broken_items_not_merged",
+        ),
+        pytest.param([b""], [{}], [b""], id="empty_item"),
+        pytest.param([], [], [], id="empty"),
+    ),
+)
+def test_decode_batch(
+    body: list[bytes],
+    headers: list[dict[str, str]],
+    expected: list[Any],
+) -> None:
+    msg: Any = _BatchMessageStub(body, headers)
+
+    assert decode_batch_message(msg) == expected
+
+
+def test_decode_batch_without_headers() -> None:
+    msg: Any = _BatchMessageStub([b"1", b"2"], content_type="text/plain")
+
+    assert decode_batch_message(msg) == ["1", "2"]
@@ -5,7 +5,7 @@ import pytest
 from prometheus_client import CollectorRegistry
 
 from faststream import Context
-from faststream.redis import ListSub, RedisBroker
+from faststream.redis import ListSub, RedisBroker, TestRedisBroker
 from faststream.redis.prometheus.middleware import RedisPrometheusMiddleware
 from tests.brokers.redis.test_consume import TestConsume as ConsumeCase
 from tests.brokers.redis.test_publish import TestPublish as PublishCase
@@ -85,3 +85,34 @@ class TestConsumeWithPrometheus(ConsumeCase):
             apply_types=apply_types,
             **kwargs,
         )
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_buffered_metrics() -> None:
+    registry = CollectorRegistry()
+    broker = RedisBroker(
+        middlewares=(RedisPrometheusMiddleware(registry=registry, flush_interval=60),),
+    )
+
+    @broker.subscriber("test")
+    async def handler(msg: str) -> None: ...
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish("hi", "test")
+        await br.publish("hi", "test")
+
+    labels = {
+        "app_name": "faststream",
+        "broker": "redis",
+        "handler": "test",
+    }
+    # buffered updates are flushed by the registry scrape
+    assert registry.get_sample_value("faststream_received_messages_total", labels) == 2
+    assert (
+        registry.get_sample_value(
+            "faststream_received_processed_messages_total",
+            {**labels, "status": "acked"},
+        )
+        == 2
+    )
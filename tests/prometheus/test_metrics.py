@@ -1,11 +1,13 @@
 import random
+import time
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from prometheus_client import CollectorRegistry
 
 from faststream.prometheus.container import MetricsContainer
-from faststream.prometheus.manager import MetricsManager
+from faststream.prometheus.manager import BufferedMetricsManager, MetricsManager
 from faststream.prometheus.types import ProcessingStatus, PublishingStatus
 from tests.prometheus.utils import (
     get_published_messages_duration_seconds_metric,
@@ -454,3 +456,90 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+
+class TestCaseBufferedMetrics:
+    @staticmethod
+    def create_metrics_manager(
+        registry: CollectorRegistry,
+        flush_interval: float = 60,
+    ) -> BufferedMetricsManager:
+        container = MetricsContainer(
+            registry,
+            metrics_prefix="fs",
+            custom_label_names=["foo"],
+        )
+        return BufferedMetricsManager(
+            container,
+            app_name="youtube",
+            flush_interval=flush_interval,
+        )
+
+    def test_children_cached(self) -> None:
+        manager = TestCaseMetrics.create_metrics_manager(
+            app_name="youtube",
+            metrics_prefix="fs",
+            custom_label_names=["foo"],
+        )
+
+        with patch.object(
+            manager._container.received_messages_total,
+            "labels",
+            wraps=manager._container.received_messages_total.labels,
+        ) as labels:
+            for _ in range(3):
+                manager.add_received_message(broker="rabbit", handler="q", foo="bar")
+            manager.add_received_message(broker="rabbit", handler="q", foo="baz")
+
+        assert labels.call_count == 2
+
+    def test_flushed_on_scrape(self) -> None:
+        registry = CollectorRegistry()
+        manager = self.create_metrics_manager(registry)
+
+        manager.add_received_message(broker="rabbit", handler="q", amount=2, foo="bar")
+        manager.add_received_message_in_process(broker="rabbit", handler="q", foo="bar")
+        manager.remove_received_message_in_process(
+            broker="rabbit", handler="q", foo="bar"
+        )
+        manager.observe_received_messages_size(
+            broker="rabbit", handler="q", size=10, foo="bar"
+        )
+
+        # not flushed yet
+        metric = manager._container.received_messages_total
+        assert metric.collect()[0].samples[0].value == 0
+
+        expected = get_received_messages_metric(
+            app_name="youtube",
+            metrics_prefix="fs",
+            queue="q",
+            broker="rabbit",
+            messages_amount=2,
+            custom_labels={"foo": "bar"},
+        )
+
+        real_metrics = {m.name: m for m in registry.collect()}
+
+        assert real_metrics["fs_received_messages"] == expected
+        assert real_metrics["fs_received_messages_in_process"].samples[0].value == 0
+        size_samples = {
+            sample.name: sample.value
+            for sample in real_metrics["fs_received_messages_size_bytes"].samples
+        }
+        assert size_samples["fs_received_messages_size_bytes_count"] == 1
+        assert size_samples["fs_received_messages_size_bytes_sum"] == 10
+
+    def test_flushed_periodically(self) -> None:
+        registry = CollectorRegistry()
+        manager = self.create_metrics_manager(registry, flush_interval=0.01)
+
+        manager.add_received_message(broker="rabbit", handler="q", foo="bar")
+
+        # collected from the metric itself, not flushing the registry
+        metric = manager._container.received_messages_total
+        deadline = time.monotonic() + 3
+        while metric.collect()[0].samples[0].value != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert metric.collect()[0].samples[0].value == 1
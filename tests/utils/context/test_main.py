@@ -134,6 +134,20 @@ def test_scope(context: ContextRepo) -> None:
     assert context.get("key2") is None
 
 
+def test_scopes(context: ContextRepo) -> None:
+    @apply_types(context__=context)
+    def use(key=Context(), key2=Context()) -> None:
+        assert key == 1
+        assert key2 == 2
+
+    with context.scope("key", 0):
+        with context.scopes((("key", 1), ("key2", 2))):
+            use()
+
+        assert context.get("key") == 0
+        assert context.get("key2") is None
+
+
 def test_default(context: ContextRepo) -> None:
     @apply_types(context__=context)
     def use(
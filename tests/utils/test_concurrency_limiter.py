@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from faststream import AdaptiveConcurrency
+from faststream._internal.endpoint.subscriber.limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiter,
+    workers_limit,
+)
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker
+
+
+@pytest.mark.asyncio()
+async def test_limit() -> None:
+    limiter = ConcurrencyLimiter(2)
+    active = max_active = 0
+
+    async def func() -> None:
+        nonlocal active, max_active
+
+        await limiter.acquire()
+        active += 1
+        max_active = max(active, max_active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        limiter.release()
+
+    await asyncio.gather(*(func() for _ in range(6)))
+
+    assert max_active == 2
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio()
+async def test_cancelled_waiter_passes_wake_up() -> None:
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, timeout=1)
+    assert limiter.active == 1
+
+
+@pytest.mark.asyncio()
+async def test_limit_increase_wakes_up_waiters() -> None:
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(4))
+    await limiter.acquire()
+
+    waiters = [asyncio.create_task(limiter.acquire()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # fast message grows the limit to 2 and wakes up both slots
+    limiter.release(0.01)
+
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+    assert limiter.limit == 2
+    assert limiter.active == 2
+
+
+def test_adaptive_increase() -> None:
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(3, min_workers=1))
+
+    assert limiter.limit == 1
+
+    for _ in range(10):
+        limiter.active += 1
+        limiter.release(0.01)
+
+    assert limiter.limit == 3
+
+
+def test_adaptive_decrease() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(16, min_workers=2, backoff_ratio=0.5),
+    )
+    limiter.limit = 8
+
+    for _ in range(8):
+        limiter.active += 1
+        limiter.release(0.01)
+    assert limiter.limit == 9
+
+    for _ in range(9):
+        limiter.active += 1
+        limiter.release(1.0)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.active += 1
+        limiter.release(1.0)
+    assert limiter.limit == 2
+
+
+def test_build() -> None:
+    assert not ConcurrencyLimiter.build(5).adaptive
+    assert ConcurrencyLimiter.build(AdaptiveConcurrency(5)).adaptive
+
+
+@pytest.mark.parametrize(
+    ("max_workers", "options"),
+    (
+        pytest.param(2, {"min_workers": 3}, id="min greater than max"),
+        pytest.param(2, {"min_workers": 0}, id="zero min"),
+        pytest.param(2, {"latency_tolerance": 0.5}, id="tolerance"),
+        pytest.param(2, {"backoff_ratio": 1}, id="backoff"),
+        pytest.param(2, {"baseline_windows": 0}, id="baseline windows"),
+    ),
+)
+def test_adaptive_misconfigure(max_workers: int, options: dict[str, float]) -> None:
+    with pytest.raises(SetupError):
+        AdaptiveConcurrency(max_workers, **options)
+
+
+def test_workers_limit() -> None:
+    assert workers_limit(4) == 4
+    assert workers_limit(AdaptiveConcurrency(8, min_workers=2)) == 8
+
+
+def test_baseline_follows_lasting_latency() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(16, min_workers=2, baseline_windows=3),
+    )
+
+    def window(latency: float) -> None:
+        for _ in range(limiter.limit):
+            limiter.active += 1
+            limiter.release(latency)
+
+    window(0.01)
+    assert limiter.limit == 3
+
+    # a slow window is compared with the fast one
+    window(1.0)
+    assert limiter.limit == 2
+
+    window(1.0)
+    assert limiter.limit == 2
+
+    # the fast window is expired, so the slow latency is the new baseline
+    window(1.0)
+    assert limiter.limit == 3
+
+
+def test_subscriber_option() -> None:
+    broker = RedisBroker()
+    subscriber = broker.subscriber(
+        "test",
+        max_workers=AdaptiveConcurrency(4, min_workers=2),
+    )
+
+    assert subscriber.max_workers == 4
+    assert subscriber.concurrency_limit == 2
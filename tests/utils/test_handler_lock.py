@@ -4,31 +4,31 @@ import anyio
 import pytest
 from anyio.abc import TaskStatus
 
-from faststream._internal.endpoint.subscriber.utils import MultiLock
+from faststream._internal.endpoint.subscriber.utils import InFlightTracker
 
 
 @pytest.mark.asyncio()
 async def test_base() -> None:
-    lock = MultiLock()
+    lock = InFlightTracker()
 
     with lock:
         assert not lock.empty
-        assert lock.qsize == 1
+        assert lock.in_flight == 1
 
         with lock:
             assert not lock.empty
-            assert lock.qsize == 2
+            assert lock.in_flight == 2
 
         assert not lock.empty
-        assert lock.qsize == 1
+        assert lock.in_flight == 1
 
     assert lock.empty
-    assert lock.qsize == 0
+    assert lock.in_flight == 0
 
 
 @pytest.mark.asyncio()
 async def test_wait_correct() -> None:
-    lock = MultiLock()
+    lock = InFlightTracker()
 
     async def func() -> None:
         with lock:
@@ -38,12 +38,12 @@ async def test_wait_correct() -> None:
         task_status.started()
 
         assert not lock.empty
-        assert lock.qsize == 1
+        assert lock.in_flight == 1
 
         await lock.wait_release(5)
 
         assert lock.empty
-        assert lock.qsize == 0
+        assert lock.in_flight == 0
 
     async with anyio.create_task_group() as tg:
         tg.start_soon(func)
@@ -52,7 +52,7 @@ async def test_wait_correct() -> None:
 
 @pytest.mark.asyncio()
 async def test_nowait_correct() -> None:
-    lock = MultiLock()
+    lock = InFlightTracker()
 
     async def func() -> None:
         with lock:
@@ -62,13 +62,84 @@ async def test_nowait_correct() -> None:
         task_status.started()
 
         assert not lock.empty
-        assert lock.qsize == 1
+        assert lock.in_flight == 1
 
         await lock.wait_release()
 
         assert not lock.empty
-        assert lock.qsize == 1
+        assert lock.in_flight == 1
 
     async with anyio.create_task_group() as tg:
         tg.start_soon(func)
         await tg.start(check)
+
+
+@pytest.mark.asyncio()
+async def test_metrics() -> None:
+    lock = InFlightTracker()
+
+    async def func() -> None:
+        with lock:
+            await asyncio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(func)
+
+        await asyncio.sleep(0)
+        assert lock.in_flight == 3
+
+        await lock.wait_release(5)
+
+    assert lock.in_flight == 0
+    assert lock.high_water_mark == 3
+    assert 0 < lock.drain_time < 5
+
+
+@pytest.mark.asyncio()
+async def test_wait_timeout() -> None:
+    lock = InFlightTracker()
+
+    with lock:
+        await lock.wait_release(0.01)
+
+        assert lock.in_flight == 1
+        assert lock.drain_time >= 0.01
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_waiters() -> None:
+    lock = InFlightTracker()
+
+    async def func() -> None:
+        with lock:
+            await asyncio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(func)
+        await asyncio.sleep(0)
+
+        with anyio.fail_after(1):
+            await asyncio.gather(lock.wait_release(5), lock.wait_release(5))
+
+    assert lock.in_flight == 0
+
+
+@pytest.mark.asyncio()
+async def test_wait_after_reacquire() -> None:
+    lock = InFlightTracker()
+
+    async def func() -> None:
+        with lock:
+            await asyncio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(func)
+        await asyncio.sleep(0)
+        await lock.wait_release(5)
+
+    with lock:
+        await lock.wait_release(0.01)
+
+        assert lock.in_flight == 1
+        assert lock.drain_time >= 0.01
@@ -0,0 +1,98 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream._internal.constants import EMPTY
+from faststream._internal.endpoint.subscriber.call_item import (
+    HandlerItem,
+    HandlersIndex,
+)
+from faststream.exceptions import SetupError
+from faststream.message import StreamMessage
+
+
+def make_item(key: Any = EMPTY) -> HandlerItem[Any]:
+    item = HandlerItem[Any](
+        handler=MagicMock(),
+        filter=MagicMock(),
+        item_parser=None,
+        item_decoder=None,
+        dependencies=(),
+        key=key,
+    )
+
+    async def parser(msg: Any) -> StreamMessage[Any]:
+        return StreamMessage(raw_message=msg, body=b"", headers=msg)
+
+    async def decoder(msg: StreamMessage[Any]) -> Any:
+        return msg.body
+
+    item.item_parser = parser
+    item.item_decoder = decoder
+    return item
+
+
+@pytest.mark.asyncio()
+async def test_select_by_key() -> None:
+    first, fallback, second, other_first = calls = [
+        make_item("first"),
+        make_item(),
+        make_item("second"),
+        make_item("first"),
+    ]
+
+    index = HandlersIndex(calls, lambda m: m.headers.get("type"))
+
+    # registration order is kept
+    assert await index.select({"type": "first"}, {}) == (first, fallback, other_first)
+    assert await index.select({"type": "second"}, {}) == (fallback, second)
+    assert await index.select({}, {}) == (fallback,)
+
+
+@pytest.mark.asyncio()
+async def test_async_filter_key() -> None:
+    first, fallback = calls = [make_item("first"), make_item()]
+
+    async def filter_key(msg: StreamMessage[Any]) -> Any:
+        return msg.headers.get("type")
+
+    index = HandlersIndex(calls, filter_key)
+
+    assert await index.select({"type": "first"}, {}) == (first, fallback)
+    assert await index.select({}, {}) == (fallback,)
+
+
+@pytest.mark.asyncio()
+async def test_message_parsed_once() -> None:
+    item = make_item("key")
+    cache: dict[Any, Any] = {}
+
+    index = HandlersIndex([item], lambda m: m.headers["type"])
+    await index.select({"type": "key"}, cache)
+
+    assert list(cache) == [item.item_parser]
+
+
+def test_build_without_keys() -> None:
+    assert HandlersIndex.build([make_item()], lambda m: m.headers) is None
+    assert HandlersIndex.build([make_item("key")], None) is None
+    assert HandlersIndex.build([make_item("key")], lambda m: m.headers) is not None
+
+
+def test_key_without_filter_key() -> None:
+    from faststream.nats import NatsBroker
+
+    sub = NatsBroker().subscriber("test")
+
+    with pytest.raises(SetupError):
+        sub(key="key")
+
+
+def test_unhashable_key() -> None:
+    from faststream.nats import NatsBroker
+
+    sub = NatsBroker().subscriber("test", filter_key=lambda m: m.headers)
+
+    with pytest.raises(SetupError):
+        sub(key=["key"])
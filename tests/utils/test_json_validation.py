@@ -0,0 +1,246 @@
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import msgspec
+import pytest
+from fast_depends import dependency_provider
+from fast_depends.core import build_call_model
+from fast_depends.msgspec import MsgSpecSerializer
+from fast_depends.pydantic import PydanticSerializer
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from faststream import Context
+from faststream._internal.di.config import FastDependsConfig, _build_json_validator
+from faststream._internal.parser import DefaultCodec, is_json_decoder
+from faststream._internal.utils.functions import to_async
+from faststream.message import StreamMessage, decode_batch_message, decode_message
+from faststream.redis import RedisBroker, TestRedisBroker
+from faststream.redis.parser import RedisBatchListParser, RedisPubSubParser
+
+
+class User(BaseModel):
+    name: str
+    age: int
+
+
+class StrictEvent(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+    ts: datetime
+
+
+class StrictFieldEvent(BaseModel):
+    ts: datetime = Field(strict=True)
+
+
+class UserStruct(msgspec.Struct):
+    name: str
+    age: int
+
+
+def build_validator(func: Any, serializer: Any) -> Any:
+    dependent = build_call_model(
+        func,
+        serializer_cls=serializer,
+        dependency_provider=dependency_provider,
+    )
+    return _build_json_validator(dependent, serializer)
+
+
+@pytest.mark.parametrize(
+    ("annotation", "serializer"),
+    (
+        pytest.param(User, PydanticSerializer(), id="model"),
+        pytest.param(list[User], PydanticSerializer(), id="generic"),
+        pytest.param(UserStruct, MsgSpecSerializer(), id="struct"),
+    ),
+)
+def test_validator_built(annotation: Any, serializer: Any) -> None:
+    async def handler(body: annotation) -> None: ...  # type: ignore[valid-type]
+
+    validator = build_validator(handler, serializer)
+
+    assert validator is not None
+    data = b'{"name": "John", "age": 1}'
+    if annotation == list[User]:
+        assert validator(b"[" + data + b"]") == [User(name="John", age=1)]
+    else:
+        assert validator(data) == annotation(name="John", age=1)
+
+
+def test_validator_not_built() -> None:
+    async def str_handler(body: str) -> None: ...
+
+    async def many_params(name: str, age: int) -> None: ...
+
+    async def struct_handler(body: UserStruct) -> None: ...
+
+    assert build_validator(str_handler, PydanticSerializer()) is None
+    assert build_validator(many_params, PydanticSerializer()) is None
+    assert build_validator(struct_handler, PydanticSerializer()) is None
+    assert build_validator(struct_handler, None) is None
+
+
+@pytest.mark.parametrize(
+    ("annotation", "serializer"),
+    (
+        pytest.param(StrictEvent, PydanticSerializer(), id="strict config"),
+        pytest.param(StrictFieldEvent, PydanticSerializer(), id="strict field"),
+        pytest.param(list[StrictEvent], PydanticSerializer(), id="strict generic"),
+        pytest.param(
+            User,
+            PydanticSerializer(ConfigDict(strict=True)),
+            id="serializer config",
+        ),
+    ),
+)
+def test_validator_not_built_for_strict(annotation: Any, serializer: Any) -> None:
+    async def handler(body: annotation) -> None: ...  # type: ignore[valid-type]
+
+    assert build_validator(handler, serializer) is None
+
+
+@pytest.mark.parametrize(
+    ("decoder", "expected"),
+    (
+        pytest.param(RedisPubSubParser().decode_message, True, id="parser"),
+        pytest.param(DefaultCodec().decode, True, id="codec"),
+        pytest.param(RedisBatchListParser().decode_message, False, id="batch parser"),
+        pytest.param(to_async(decode_message), False, id="custom"),
+    ),
+)
+def test_json_decoder_marked(decoder: Any, expected: bool) -> None:
+    assert is_json_decoder(decoder) is expected
+
+
+@pytest.mark.asyncio()
+async def test_strict_model_validated_as_python() -> None:
+    broker = RedisBroker()
+
+    @broker.subscriber("test")
+    async def handler(body: StrictEvent) -> None: ...
+
+    async with TestRedisBroker(broker):
+        # JSON mode would accept the string
+        with pytest.raises(ValidationError):
+            await broker.publish({"ts": "2024-01-01T00:00:00"}, "test")
+
+
+decoder = to_async(decode_message)
+
+
+def make_message(body: bytes) -> StreamMessage[Any]:
+    message = StreamMessage(raw_message=None, body=body)
+    message.set_decoder(decoder)
+    return message
+
+
+async def call_with_validation(handler: Any, message: StreamMessage[Any]) -> None:
+    built = FastDependsConfig().build_call(handler, validate_json=True)
+    await built.wrapped_call(message)
+
+
+@pytest.mark.asyncio()
+async def test_handler_gets_model() -> None:
+    received: list[Any] = []
+
+    async def handler(body: User) -> None:
+        received.append(body)
+
+    message = make_message(b'{"name": "John", "age": 1}')
+
+    with patch.object(
+        User,
+        "model_validate_json",
+        wraps=User.model_validate_json,
+    ) as validate:
+        await call_with_validation(handler, message)
+
+    validate.assert_called_once()
+    assert received == [User(name="John", age=1)]
+    # message decoding is still the regular one
+    assert await message.decode() == {"name": "John", "age": 1}
+
+
+@pytest.mark.asyncio()
+async def test_decoded_message_not_validated_again() -> None:
+    received: list[Any] = []
+
+    async def handler(body: User) -> None:
+        received.append(body)
+
+    message = make_message(b'{"name": "John", "age": 1}')
+    # decoded by a filter or a middleware
+    await message.decode()
+
+    with patch.object(
+        User,
+        "model_validate_json",
+        wraps=User.model_validate_json,
+    ) as validate:
+        await call_with_validation(handler, message)
+
+    validate.assert_not_called()
+    assert received == [User(name="John", age=1)]
+
+
+@pytest.mark.asyncio()
+async def test_batch_records_decoded_separately() -> None:
+    received: list[Any] = []
+
+    async def handler(body: list[str | bytes | int]) -> None:
+        received.append(body)
+
+    # broken records are valid JSON array items after joining
+    message: StreamMessage[Any] = StreamMessage(
+        raw_message=None,
+        body=[b'"a', b'b",1'],
+        batch_headers=[{}, {}],
+    )
+    message.set_decoder(to_async(decode_batch_message))
+
+    await call_with_validation(handler, message)
+
+    assert received == [[b'"a', b'b",1']]
+
+
+@pytest.mark.asyncio()
+async def test_testclient_gets_model() -> None:
+    broker = RedisBroker()
+
+    @broker.subscriber("test")
+    async def handler(body: User, message: Any = Context()) -> None:
+        assert body == User(name="John", age=1)
+
+    async with TestRedisBroker(broker):
+        await broker.publish({"name": "John", "age": 1}, "test")
+        handler.mock.assert_called_once_with({"name": "John", "age": 1})
+
+
+@pytest.mark.asyncio()
+async def test_custom_decoder_used() -> None:
+    broker = RedisBroker()
+
+    async def decoder(msg: Any) -> Any:
+        return {"name": "Mike", "age": 2}
+
+    @broker.subscriber("test", decoder=decoder)
+    async def handler(body: User) -> None:
+        assert body == User(name="Mike", age=2)
+
+    async with TestRedisBroker(broker):
+        await broker.publish({"name": "John", "age": 1}, "test")
+        handler.mock.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_invalid_body_error() -> None:
+    broker = RedisBroker()
+
+    @broker.subscriber("test")
+    async def handler(body: User) -> None: ...
+
+    async with TestRedisBroker(broker):
+        with pytest.raises(ValidationError):
+            await broker.publish({"name": "John"}, "test")
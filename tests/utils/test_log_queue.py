@@ -0,0 +1,152 @@
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from faststream import LogQueue
+from faststream._internal.context import ContextRepo
+from faststream._internal.logger import DefaultLoggerStorage, make_logger_state
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker, TestRedisBroker
+
+
+@pytest.fixture(autouse=True)
+def enable_logging() -> Iterator[None]:
+    # other tests can leave logging disabled globally
+    disabled = logging.root.manager.disable
+    logging.disable(logging.NOTSET)
+    yield
+    logging.disable(disabled)
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def make_logger() -> tuple[logging.Logger, RecordsHandler]:
+    logger = logging.Logger("test-log-queue", level=logging.DEBUG)  # noqa: LOG001
+    handler = RecordsHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        pytest.param({"max_size": 0}, id="max_size"),
+        pytest.param({"sample_rate": 1.5}, id="sample_rate"),
+        pytest.param({"rate_limit": 0}, id="rate_limit"),
+    ),
+)
+def test_wrong_options(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(SetupError):
+        LogQueue(**kwargs)
+
+
+def test_logs_emitted_in_thread() -> None:
+    logger, handler = make_logger()
+    log_queue = LogQueue()
+
+    try:
+        msg = "oops"
+        raise ValueError(msg)
+    except ValueError as e:
+        log_queue.put(logger, logging.ERROR, "error", exc_info=e, extra={"key": 1})
+
+    log_queue.put(logger, logging.INFO, "info")
+    log_queue.flush()
+
+    assert [r.getMessage() for r in handler.records] == ["error", "info"]
+    assert handler.records[0].key == 1  # type: ignore[attr-defined]
+    assert handler.records[0].exc_info[0] is ValueError  # type: ignore[index]
+    assert handler.threads == {"faststream-log-queue"}
+
+
+def test_overflow_keeps_errors() -> None:
+    logger, handler = make_logger()
+    log_queue = LogQueue(max_size=1)
+
+    # the queue is never processed
+    with patch.object(log_queue, "_ensure_thread"):
+        log_queue.put(logger, logging.INFO, "queued")
+        log_queue.put(logger, logging.INFO, "dropped")
+        log_queue.put(logger, logging.ERROR, "error")
+
+    assert [r.getMessage() for r in handler.records] == ["error"]
+    assert log_queue.dropped == 1
+
+
+def test_sampling() -> None:
+    log_queue = LogQueue(sample_rate=0)
+
+    assert not log_queue.sample()
+    assert log_queue.dropped == 2
+
+
+def test_rate_limit() -> None:
+    log_queue = LogQueue(rate_limit=2)
+
+    with patch("faststream._internal.logger.queue.time.monotonic", return_value=0):
+        log_queue._last_refill = 0
+        assert [log_queue.sample() for _ in range(3)] == [True, True, False]
+
+    with patch("faststream._internal.logger.queue.time.monotonic", return_value=0.5):
+        assert log_queue.sample()
+
+    assert log_queue.dropped == 2
+
+
+@pytest.mark.asyncio()
+async def test_logger_state_queued() -> None:
+    logger, handler = make_logger()
+    state = make_logger_state(
+        logger=logger,
+        log_level=logging.INFO,
+        default_storage_cls=DefaultLoggerStorage,
+        log_queue=LogQueue(),
+    )
+    state._setup(ContextRepo())
+
+    state.log("hi")
+    await state.flush()
+
+    assert [r.getMessage() for r in handler.records] == ["hi"]
+    assert handler.threads == {"faststream-log-queue"}
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_broker_sampled_logs() -> None:
+    log_queue = LogQueue(sample_rate=0)
+    broker = RedisBroker(log_queue=log_queue)
+
+    @broker.subscriber("test")
+    async def handler(msg: str) -> None:
+        if msg == "error":
+            raise ValueError(msg)
+
+    async with TestRedisBroker(broker) as br:
+        # test client logger mock
+        logger = br.config.logger.logger.logger
+
+        await br.publish("hi", "test")
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            await br.publish("error", "test")
+
+        messages = [c.args[1] for c in logger.log.call_args_list]
+
+    assert "Received" not in messages
+    assert "Processed" not in messages
+    assert "ValueError: error" in messages
+    assert log_queue.dropped == 4
@@ -0,0 +1,86 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream import BaseMiddleware, Context
+from faststream.redis import RedisBroker, RedisRouter, TestRedisBroker
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_compiled_once() -> None:
+    broker = RedisBroker()
+
+    @broker.subscriber("in")
+    async def handler(msg: Any) -> None: ...
+
+    async with TestRedisBroker(broker) as br:
+        subscriber = br.subscribers[0]
+
+        await br.publish(None, "in")
+        pipeline = subscriber._pipeline
+
+        await br.publish(None, "in")
+        assert subscriber._pipeline is pipeline
+
+
+@pytest.mark.asyncio()
+async def test_other_broker_changes_ignored() -> None:
+    broker = RedisBroker()
+    other_broker = RedisBroker()
+
+    @broker.subscriber("in")
+    async def handler(msg: Any) -> None: ...
+
+    async with TestRedisBroker(broker) as br:
+        subscriber = br.subscribers[0]
+
+        await br.publish(None, "in")
+        pipeline = subscriber._pipeline
+
+        other_broker.add_middleware(BaseMiddleware)
+
+        await br.publish(None, "in")
+        assert subscriber._pipeline is pipeline
+
+
+@pytest.mark.asyncio()
+async def test_router_middleware_added_after_start() -> None:
+    mock = MagicMock()
+
+    class Middleware(BaseMiddleware):
+        async def on_receive(self) -> None:
+            mock()
+
+    broker = RedisBroker()
+    router = RedisRouter()
+
+    @router.subscriber("in")
+    async def handler(msg: Any) -> None: ...
+
+    broker.include_router(router)
+
+    async with TestRedisBroker(broker) as br:
+        await br.publish(None, "in")
+        assert not mock.called
+
+        router.add_middleware(Middleware)
+
+        await br.publish(None, "in")
+        mock.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_extra_context_changed_after_start() -> None:
+    broker = RedisBroker()
+
+    @broker.subscriber("in")
+    async def handler(msg: Any, key: Any = Context(default=None)) -> Any:
+        return key
+
+    async with TestRedisBroker(broker) as br:
+        assert await (await br.request(None, "in")).decode() == b""
+
+        br.config.broker_config.extra_context["key"] = 1
+
+        assert await (await br.request(None, "in")).decode() == 1
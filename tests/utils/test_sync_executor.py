@@ -0,0 +1,211 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from faststream import SyncExecutor
+from faststream.exceptions import SetupError
+from faststream.kafka import KafkaBroker, KafkaRoute, KafkaRouter, TestKafkaBroker
+from faststream.redis import (
+    RedisBroker,
+    RedisRoute,
+    RedisRouter,
+    TestRedisBroker,
+)
+
+
+def thread_name(*args: Any) -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio()
+async def test_thread_pool() -> None:
+    with ThreadPoolExecutor(2, thread_name_prefix="test-pool") as pool:
+        executor = SyncExecutor(pool)
+
+        name = await executor.to_async(thread_name)()
+
+    assert name.startswith("test-pool")
+    assert executor.stats.calls == 1
+    assert executor.stats.pending == 0
+    assert executor.stats.max_pending == 1
+
+
+@pytest.mark.asyncio()
+async def test_process_pool() -> None:
+    with ProcessPoolExecutor(1) as pool:
+        executor = SyncExecutor(pool)
+
+        assert await executor.run(pow, 2, 10) == 1024
+
+    assert executor.stats.calls == 1
+    assert executor.stats.wait_time >= 0
+
+
+@pytest.mark.asyncio()
+async def test_inline() -> None:
+    executor = SyncExecutor()
+
+    assert await executor.to_async(thread_name)() == threading.current_thread().name
+    assert executor.stats.calls == 1
+    assert executor.stats.avg_wait_time == 0
+
+
+@pytest.mark.asyncio()
+async def test_async_function_is_not_wrapped() -> None:
+    async def func() -> None: ...
+
+    assert SyncExecutor().to_async(func) is func
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+@pytest.mark.parametrize("level", ("broker", "subscriber"))
+async def test_subscriber_executor(level: str) -> None:
+    names: dict[str, str] = {}
+
+    def decoder(msg: Any) -> Any:
+        names["decoder"] = thread_name()
+        return msg.body.decode()
+
+    def msg_filter(msg: Any) -> bool:
+        names["filter"] = thread_name()
+        return True
+
+    with ThreadPoolExecutor(1, thread_name_prefix="test-pool") as pool:
+        executor = SyncExecutor(pool)
+
+        if level == "broker":
+            broker = RedisBroker(executor=executor)
+            sub = broker.subscriber("test", decoder=decoder)
+        else:
+            broker = RedisBroker()
+            sub = broker.subscriber("test", decoder=decoder, executor=executor)
+
+        @sub(filter=msg_filter)
+        def handler(msg: str) -> None:
+            names["handler"] = thread_name()
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish("hello", "test")
+
+    assert names.keys() == {"decoder", "filter", "handler"}
+    assert all(name.startswith("test-pool") for name in names.values()), names
+    assert executor.stats.calls == 3
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("broker_cls", "router_cls", "route_cls", "test_cls"),
+    (
+        pytest.param(
+            RedisBroker,
+            RedisRouter,
+            RedisRoute,
+            TestRedisBroker,
+            marks=pytest.mark.redis(),
+        ),
+        pytest.param(
+            KafkaBroker,
+            KafkaRouter,
+            KafkaRoute,
+            TestKafkaBroker,
+            marks=pytest.mark.kafka(),
+        ),
+    ),
+)
+async def test_route_executor(
+    broker_cls: Any,
+    router_cls: Any,
+    route_cls: Any,
+    test_cls: Any,
+) -> None:
+    names: dict[str, str] = {}
+
+    def handler(msg: str) -> None:
+        names["handler"] = thread_name()
+
+    with ThreadPoolExecutor(1, thread_name_prefix="test-pool") as pool:
+        executor = SyncExecutor(pool)
+
+        broker = broker_cls()
+        broker.include_router(
+            router_cls(handlers=(route_cls(handler, "test", executor=executor),)),
+        )
+
+        async with test_cls(broker) as br:
+            await br.publish("hello", "test")
+
+    assert names["handler"].startswith("test-pool"), names
+    assert executor.stats.calls == 1
+
+
+process_executor = SyncExecutor()
+process_broker = RedisBroker()
+
+
+@process_broker.subscriber("test", executor=process_executor)
+def double(msg: int) -> int:
+    return msg * 2
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_process_pool_handler() -> None:
+    with ProcessPoolExecutor(1) as pool:
+        process_executor.pool = pool
+        try:
+            async with TestRedisBroker(process_broker) as br:
+                result = await br.request(21, "test")
+        finally:
+            process_executor.pool = None
+
+    assert await result.decode() == 42
+    assert process_executor.stats.calls == 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_process_pool_not_picklable_handler() -> None:
+    broker = RedisBroker()
+
+    with ProcessPoolExecutor(1) as pool:
+
+        @broker.subscriber("test", executor=SyncExecutor(pool))
+        def handler(msg: Any) -> None: ...
+
+        with pytest.raises(SetupError):
+            async with TestRedisBroker(broker):
+                pass
+
+
+@pytest.mark.asyncio()
+@pytest.mark.redis()
+async def test_process_pool_runs_helpers_in_threads() -> None:
+    names: dict[str, str] = {}
+
+    def decoder(msg: Any) -> Any:
+        names["decoder"] = thread_name()
+        return msg.body.decode()
+
+    def msg_filter(msg: Any) -> bool:
+        names["filter"] = thread_name()
+        return True
+
+    broker = RedisBroker()
+
+    with ProcessPoolExecutor(1) as pool:
+        sub = broker.subscriber(
+            "test",
+            decoder=decoder,
+            executor=SyncExecutor(pool),
+        )
+
+        @sub(filter=msg_filter)
+        async def handler(msg: str) -> None: ...
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish("hello", "test")
+
+    assert names.keys() == {"decoder", "filter"}